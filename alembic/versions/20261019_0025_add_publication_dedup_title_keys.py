@@ -0,0 +1,35 @@
+"""Add precomputed near-duplicate title keys to publications.
+
+Revision ID: 20261019_0025
+Revises: 20260226_0024
+Create Date: 2026-10-19 09:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0025"
+down_revision: str | Sequence[str] | None = "20260226_0024"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "publications",
+        sa.Column("dedup_title_text", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "publications",
+        sa.Column("dedup_title_tokens", postgresql.ARRAY(sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("publications", "dedup_title_tokens")
+    op.drop_column("publications", "dedup_title_text")
@@ -0,0 +1,42 @@
+"""Add composite indexes backing keyset pagination of publication lists.
+
+Revision ID: 20261019_0026
+Revises: 20261019_0025
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0026"
+down_revision: str | Sequence[str] | None = "20261019_0025"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_scholar_publications_scholar_created",
+        "scholar_publications",
+        ["scholar_profile_id", "created_at", "publication_id"],
+    )
+    op.create_index(
+        "ix_publications_citation_count_id",
+        "publications",
+        ["citation_count", "id"],
+    )
+    op.create_index(
+        "ix_publications_year_sort_id",
+        "publications",
+        [sa.text("coalesce(year, 2147483647)"), "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_publications_year_sort_id", table_name="publications")
+    op.drop_index("ix_publications_citation_count_id", table_name="publications")
+    op.drop_index("ix_scholar_publications_scholar_created", table_name="scholar_publications")
@@ -0,0 +1,49 @@
+"""Add a generated full-text search vector to publications.
+
+Revision ID: 20261019_0027
+Revises: 20261019_0026
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0027"
+down_revision: str | Sequence[str] | None = "20261019_0026"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Frozen copy of app.db.models.PUBLICATION_SEARCH_VECTOR_SQL at this revision.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title_raw, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(venue_text, '')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(author_text, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "publications",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_publications_search_vector",
+        "publications",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_publications_search_vector", table_name="publications")
+    op.drop_column("publications", "search_vector")
@@ -0,0 +1,189 @@
+"""Add the denormalized per-user publication feed.
+
+Revision ID: 20261019_0028
+Revises: 20261019_0027
+Create Date: 2026-10-19 16:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0028"
+down_revision: str | Sequence[str] | None = "20261019_0027"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Recompute the feed rows of the given (user, publication) pairs from their links.
+_SYNC_PAIRS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION user_publication_feed_sync_pairs(pair_user_ids integer[], pair_publication_ids integer[])
+RETURNS void LANGUAGE sql AS $$
+    WITH pairs AS (
+        SELECT DISTINCT pair.user_id, pair.publication_id
+        FROM unnest(pair_user_ids, pair_publication_ids) AS pair(user_id, publication_id)
+    ),
+    expected AS (
+        SELECT
+            pairs.user_id,
+            pairs.publication_id,
+            bool_or(NOT link.is_read) AS is_unread,
+            bool_or(link.is_favorite) AS is_favorite,
+            min(link.created_at) AS first_seen_at,
+            max(link.first_seen_run_id) AS newest_run_id
+        FROM pairs
+        JOIN scholar_profiles AS sp ON sp.user_id = pairs.user_id
+        JOIN scholar_publications AS link
+          ON link.scholar_profile_id = sp.id AND link.publication_id = pairs.publication_id
+        GROUP BY pairs.user_id, pairs.publication_id
+    ),
+    removed AS (
+        DELETE FROM user_publication_feed AS feed
+        USING pairs
+        WHERE feed.user_id = pairs.user_id
+          AND feed.publication_id = pairs.publication_id
+          AND NOT EXISTS (
+              SELECT 1 FROM expected
+              WHERE expected.user_id = feed.user_id AND expected.publication_id = feed.publication_id
+          )
+    )
+    INSERT INTO user_publication_feed AS feed (
+        user_id, publication_id, is_unread, is_favorite, first_seen_at, newest_run_id
+    )
+    SELECT user_id, publication_id, is_unread, is_favorite, first_seen_at, newest_run_id FROM expected
+    ON CONFLICT (user_id, publication_id) DO UPDATE SET
+        is_unread = EXCLUDED.is_unread,
+        is_favorite = EXCLUDED.is_favorite,
+        first_seen_at = EXCLUDED.first_seen_at,
+        newest_run_id = EXCLUDED.newest_run_id
+    WHERE (feed.is_unread, feed.is_favorite, feed.first_seen_at, feed.newest_run_id)
+        IS DISTINCT FROM (EXCLUDED.is_unread, EXCLUDED.is_favorite, EXCLUDED.first_seen_at, EXCLUDED.newest_run_id)
+$$
+"""
+
+# Recompute every feed row of the given users (rebuilds and scholar deletion).
+_SYNC_USERS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION user_publication_feed_sync_users(target_user_ids integer[])
+RETURNS void LANGUAGE sql AS $$
+    DELETE FROM user_publication_feed AS feed
+    WHERE feed.user_id = ANY(target_user_ids)
+      AND NOT EXISTS (
+          SELECT 1
+          FROM scholar_publications AS link
+          JOIN scholar_profiles AS sp ON sp.id = link.scholar_profile_id
+          WHERE sp.user_id = feed.user_id AND link.publication_id = feed.publication_id
+      );
+    SELECT user_publication_feed_sync_pairs(array_agg(sp.user_id), array_agg(link.publication_id))
+    FROM scholar_publications AS link
+    JOIN scholar_profiles AS sp ON sp.id = link.scholar_profile_id
+    WHERE sp.user_id = ANY(target_user_ids);
+$$
+"""
+
+_LINKS_TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION user_publication_feed_links_changed()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM user_publication_feed_sync_pairs(array_agg(sp.user_id), array_agg(link.publication_id))
+        FROM new_links AS link
+        JOIN scholar_profiles AS sp ON sp.id = link.scholar_profile_id;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        -- Links removed by a scholar profile cascade no longer resolve to a user;
+        -- the scholar_profiles trigger resyncs those users instead.
+        PERFORM user_publication_feed_sync_pairs(array_agg(sp.user_id), array_agg(link.publication_id))
+        FROM old_links AS link
+        JOIN scholar_profiles AS sp ON sp.id = link.scholar_profile_id;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+_PROFILES_TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION user_publication_feed_profiles_deleted()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM user_publication_feed_sync_users(array_agg(DISTINCT old_profiles.user_id))
+    FROM old_profiles;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_publication_feed",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("publication_id", sa.Integer(), nullable=False),
+        sa.Column("is_unread", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("is_favorite", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("first_seen_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("newest_run_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_user_publication_feed_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["publication_id"],
+            ["publications.id"],
+            name=op.f("fk_user_publication_feed_publication_id_publications"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["newest_run_id"],
+            ["crawl_runs.id"],
+            name=op.f("fk_user_publication_feed_newest_run_id_crawl_runs"),
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("user_id", "publication_id", name=op.f("pk_user_publication_feed")),
+    )
+    op.create_index(
+        "ix_user_publication_feed_user_facets",
+        "user_publication_feed",
+        ["user_id", "is_unread", "is_favorite", "newest_run_id"],
+    )
+    op.execute(_SYNC_PAIRS_FUNCTION_SQL)
+    op.execute(_SYNC_USERS_FUNCTION_SQL)
+    op.execute(_LINKS_TRIGGER_FUNCTION_SQL)
+    op.execute(_PROFILES_TRIGGER_FUNCTION_SQL)
+    for event, transition in (
+        ("INSERT", "NEW TABLE AS new_links"),
+        ("UPDATE", "OLD TABLE AS old_links NEW TABLE AS new_links"),
+        ("DELETE", "OLD TABLE AS old_links"),
+    ):
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_scholar_publications_feed_{event.lower()}
+            AFTER {event} ON scholar_publications
+            REFERENCING {transition}
+            FOR EACH STATEMENT EXECUTE FUNCTION user_publication_feed_links_changed()
+            """
+        )
+    op.execute(
+        """
+        CREATE TRIGGER trg_scholar_profiles_feed_delete
+        AFTER DELETE ON scholar_profiles
+        REFERENCING OLD TABLE AS old_profiles
+        FOR EACH STATEMENT EXECUTE FUNCTION user_publication_feed_profiles_deleted()
+        """
+    )
+    op.execute("SELECT user_publication_feed_sync_users(ARRAY(SELECT id FROM users))")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_scholar_profiles_feed_delete ON scholar_profiles")
+    for event in ("insert", "update", "delete"):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_scholar_publications_feed_{event} ON scholar_publications")
+    op.execute("DROP FUNCTION IF EXISTS user_publication_feed_profiles_deleted()")
+    op.execute("DROP FUNCTION IF EXISTS user_publication_feed_links_changed()")
+    op.execute("DROP FUNCTION IF EXISTS user_publication_feed_sync_users(integer[])")
+    op.execute("DROP FUNCTION IF EXISTS user_publication_feed_sync_pairs(integer[], integer[])")
+    op.drop_index("ix_user_publication_feed_user_facets", table_name="user_publication_feed")
+    op.drop_table("user_publication_feed")
@@ -0,0 +1,31 @@
+"""Index publications by normalized title for set-based import matching.
+
+Revision ID: 20261019_0029
+Revises: 20261019_0028
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0029"
+down_revision: str | Sequence[str] | None = "20261019_0028"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Hash rather than btree: normalized titles have no length cap and are only
+    # ever compared for equality.
+    op.create_index(
+        "ix_publications_title_normalized",
+        "publications",
+        ["title_normalized"],
+        postgresql_using="hash",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_publications_title_normalized", table_name="publications")
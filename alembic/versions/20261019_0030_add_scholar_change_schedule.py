@@ -0,0 +1,50 @@
+"""Track per-scholar first-page change history for adaptive scheduling.
+
+Revision ID: 20261019_0030
+Revises: 20261019_0029
+Create Date: 2026-10-19 20:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0030"
+down_revision: str | Sequence[str] | None = "20261019_0029"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "scholar_profiles",
+        sa.Column("change_check_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "scholar_profiles",
+        sa.Column("change_unchanged_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "scholar_profiles",
+        sa.Column("no_change_streak", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "scholar_profiles",
+        sa.Column("last_change_dt", sa.DateTime(timezone=True), nullable=True),
+    )
+    # NULL means never checked under the adaptive schedule, which counts as due.
+    op.add_column(
+        "scholar_profiles",
+        sa.Column("last_change_check_dt", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("scholar_profiles", "last_change_check_dt")
+    op.drop_column("scholar_profiles", "last_change_dt")
+    op.drop_column("scholar_profiles", "no_change_streak")
+    op.drop_column("scholar_profiles", "change_unchanged_count")
+    op.drop_column("scholar_profiles", "change_check_count")
@@ -0,0 +1,80 @@
+"""Index archived Scholar profile pages for offline re-parsing.
+
+Revision ID: 20261019_0031
+Revises: 20261019_0030
+Create Date: 2026-10-19 21:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0031"
+down_revision: str | Sequence[str] | None = "20261019_0030"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scholar_page_archive_entries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("scholar_profile_id", sa.Integer(), nullable=False),
+        sa.Column("crawl_run_id", sa.Integer(), nullable=True),
+        sa.Column("cstart", sa.Integer(), nullable=False),
+        sa.Column("page_size", sa.Integer(), nullable=False),
+        sa.Column("body_sha256", sa.String(length=64), nullable=False),
+        sa.Column("codec", sa.String(length=16), nullable=False, server_default=sa.text("'gzip'")),
+        sa.Column("raw_bytes", sa.Integer(), nullable=False),
+        sa.Column("stored_bytes", sa.Integer(), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("requested_url", sa.Text(), nullable=False),
+        sa.Column("final_url", sa.Text(), nullable=True),
+        sa.Column("parse_state", sa.String(length=32), nullable=False),
+        sa.Column("parse_state_reason", sa.String(length=128), nullable=True),
+        sa.Column(
+            "fetched_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(
+            ["scholar_profile_id"],
+            ["scholar_profiles.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["crawl_run_id"],
+            ["crawl_runs.id"],
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_scholar_page_archive_entries")),
+    )
+    op.create_index(
+        "ix_scholar_page_archive_scholar_cstart_fetched",
+        "scholar_page_archive_entries",
+        ["scholar_profile_id", "cstart", "fetched_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_scholar_page_archive_body_sha256",
+        "scholar_page_archive_entries",
+        ["body_sha256"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_scholar_page_archive_fetched_at",
+        "scholar_page_archive_entries",
+        ["fetched_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scholar_page_archive_fetched_at", table_name="scholar_page_archive_entries")
+    op.drop_index("ix_scholar_page_archive_body_sha256", table_name="scholar_page_archive_entries")
+    op.drop_index("ix_scholar_page_archive_scholar_cstart_fetched", table_name="scholar_page_archive_entries")
+    op.drop_table("scholar_page_archive_entries")
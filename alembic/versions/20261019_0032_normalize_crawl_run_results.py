@@ -0,0 +1,263 @@
+"""Move per-scholar run results and run summaries out of crawl_runs.error_log.
+
+Revision ID: 20261019_0032
+Revises: 20261019_0031
+Create Date: 2026-10-19 23:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0032"
+down_revision: str | Sequence[str] | None = "20261019_0031"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "crawl_runs",
+        sa.Column("succeeded_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "crawl_runs",
+        sa.Column("failed_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "crawl_runs",
+        sa.Column("partial_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "crawl_runs",
+        sa.Column(
+            "summary",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+
+    op.create_table(
+        "crawl_run_scholar_results",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("crawl_run_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("scholar_profile_id", sa.Integer(), nullable=True),
+        sa.Column("scholar_id", sa.String(length=64), nullable=False),
+        sa.Column("state", sa.String(length=64), nullable=False),
+        sa.Column("state_reason", sa.Text(), nullable=True),
+        sa.Column("outcome", sa.String(length=16), nullable=False),
+        sa.Column("attempt_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("publication_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("start_cstart", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("pages_fetched", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("pages_attempted", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("has_more_remaining", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("pagination_truncated_reason", sa.Text(), nullable=True),
+        sa.Column("articles_range", sa.Text(), nullable=True),
+        sa.Column("has_show_more_button", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("skipped_no_change", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("initial_page_fingerprint_sha256", sa.String(length=64), nullable=True),
+        sa.Column("continuation_cstart", sa.Integer(), nullable=True),
+        sa.Column("continuation_enqueued", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("continuation_reason", sa.Text(), nullable=True),
+        sa.Column("continuation_cleared", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column(
+            "warnings",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("debug", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(
+            ["crawl_run_id"],
+            ["crawl_runs.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["scholar_profile_id"],
+            ["scholar_profiles.id"],
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_crawl_run_scholar_results")),
+        sa.UniqueConstraint("crawl_run_id", "position", name="uq_crawl_run_scholar_results_run_position"),
+    )
+    op.create_index(
+        "ix_crawl_run_scholar_results_scholar_profile",
+        "crawl_run_scholar_results",
+        ["scholar_profile_id"],
+        unique=False,
+    )
+
+    # Legacy entries were written by the API process and are trusted to be
+    # objects, but numbers and booleans are cast defensively so one malformed
+    # row cannot abort the upgrade.
+    op.execute(
+        """
+        INSERT INTO crawl_run_scholar_results (
+            crawl_run_id,
+            position,
+            scholar_profile_id,
+            scholar_id,
+            state,
+            state_reason,
+            outcome,
+            attempt_count,
+            publication_count,
+            start_cstart,
+            pages_fetched,
+            pages_attempted,
+            has_more_remaining,
+            pagination_truncated_reason,
+            articles_range,
+            has_show_more_button,
+            skipped_no_change,
+            initial_page_fingerprint_sha256,
+            continuation_cstart,
+            continuation_enqueued,
+            continuation_reason,
+            continuation_cleared,
+            warnings,
+            error,
+            debug,
+            created_at
+        )
+        SELECT
+            cr.id,
+            (entry.ordinality - 1)::integer,
+            sp.id,
+            LEFT(COALESCE(NULLIF(BTRIM(entry.value ->> 'scholar_id'), ''), 'unknown'), 64),
+            LEFT(COALESCE(NULLIF(BTRIM(entry.value ->> 'state'), ''), 'unknown'), 64),
+            NULLIF(BTRIM(entry.value ->> 'state_reason'), ''),
+            LEFT(COALESCE(NULLIF(BTRIM(entry.value ->> 'outcome'), ''), 'failed'), 16),
+            CASE WHEN entry.value ->> 'attempt_count' ~ '^-?[0-9]{1,9}$'
+                THEN (entry.value ->> 'attempt_count')::integer ELSE 0 END,
+            CASE WHEN entry.value ->> 'publication_count' ~ '^-?[0-9]{1,9}$'
+                THEN (entry.value ->> 'publication_count')::integer ELSE 0 END,
+            CASE WHEN entry.value ->> 'start_cstart' ~ '^-?[0-9]{1,9}$'
+                THEN (entry.value ->> 'start_cstart')::integer ELSE 0 END,
+            CASE WHEN entry.value ->> 'pages_fetched' ~ '^-?[0-9]{1,9}$'
+                THEN (entry.value ->> 'pages_fetched')::integer ELSE 0 END,
+            CASE WHEN entry.value ->> 'pages_attempted' ~ '^-?[0-9]{1,9}$'
+                THEN (entry.value ->> 'pages_attempted')::integer ELSE 0 END,
+            CASE WHEN jsonb_typeof(entry.value -> 'has_more_remaining') = 'boolean'
+                THEN (entry.value ->> 'has_more_remaining')::boolean ELSE false END,
+            NULLIF(BTRIM(entry.value ->> 'pagination_truncated_reason'), ''),
+            NULLIF(BTRIM(entry.value ->> 'articles_range'), ''),
+            CASE WHEN jsonb_typeof(entry.value -> 'has_show_more_button') = 'boolean'
+                THEN (entry.value ->> 'has_show_more_button')::boolean ELSE false END,
+            CASE WHEN jsonb_typeof(entry.value -> 'skipped_no_change') = 'boolean'
+                THEN (entry.value ->> 'skipped_no_change')::boolean ELSE false END,
+            LEFT(NULLIF(BTRIM(entry.value ->> 'initial_page_fingerprint_sha256'), ''), 64),
+            CASE WHEN entry.value ->> 'continuation_cstart' ~ '^-?[0-9]{1,9}$'
+                THEN (entry.value ->> 'continuation_cstart')::integer END,
+            CASE WHEN jsonb_typeof(entry.value -> 'continuation_enqueued') = 'boolean'
+                THEN (entry.value ->> 'continuation_enqueued')::boolean ELSE false END,
+            NULLIF(BTRIM(entry.value ->> 'continuation_reason'), ''),
+            CASE WHEN jsonb_typeof(entry.value -> 'continuation_cleared') = 'boolean'
+                THEN (entry.value ->> 'continuation_cleared')::boolean ELSE false END,
+            CASE WHEN jsonb_typeof(entry.value -> 'warnings') = 'array'
+                THEN entry.value -> 'warnings' ELSE '[]'::jsonb END,
+            NULLIF(BTRIM(entry.value ->> 'error'), ''),
+            CASE WHEN jsonb_typeof(entry.value -> 'debug') = 'object'
+                THEN entry.value -> 'debug' END,
+            COALESCE(cr.end_dt, cr.start_dt)
+        FROM crawl_runs AS cr
+        CROSS JOIN LATERAL jsonb_array_elements(
+            CASE WHEN jsonb_typeof(cr.error_log -> 'scholar_results') = 'array'
+                THEN cr.error_log -> 'scholar_results' ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS entry(value, ordinality)
+        LEFT JOIN scholar_profiles AS sp
+            ON entry.value ->> 'scholar_profile_id' ~ '^[0-9]{1,9}$'
+            AND sp.id = (entry.value ->> 'scholar_profile_id')::integer
+        WHERE jsonb_typeof(entry.value) = 'object'
+        """
+    )
+    op.execute(
+        """
+        UPDATE crawl_runs
+        SET
+            summary = CASE WHEN jsonb_typeof(error_log -> 'summary') = 'object'
+                THEN error_log -> 'summary' ELSE '{}'::jsonb END,
+            succeeded_count = CASE WHEN error_log #>> '{summary,succeeded_count}' ~ '^[0-9]{1,9}$'
+                THEN (error_log #>> '{summary,succeeded_count}')::integer ELSE 0 END,
+            failed_count = CASE WHEN error_log #>> '{summary,failed_count}' ~ '^[0-9]{1,9}$'
+                THEN (error_log #>> '{summary,failed_count}')::integer ELSE 0 END,
+            partial_count = CASE WHEN error_log #>> '{summary,partial_count}' ~ '^[0-9]{1,9}$'
+                THEN (error_log #>> '{summary,partial_count}')::integer ELSE 0 END,
+            error_log = error_log - 'scholar_results' - 'summary' - 'meta'
+        WHERE error_log ?| ARRAY['scholar_results', 'summary', 'meta']
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE crawl_runs AS cr
+        SET error_log = cr.error_log
+            || jsonb_build_object('summary', cr.summary)
+            || jsonb_build_object('scholar_results', COALESCE(results.scholar_results, '[]'::jsonb))
+            || CASE WHEN cr.idempotency_key IS NOT NULL
+                THEN jsonb_build_object('meta', jsonb_build_object('idempotency_key', cr.idempotency_key))
+                ELSE '{}'::jsonb END
+        FROM (
+            SELECT
+                run.id AS crawl_run_id,
+                (
+                    SELECT jsonb_agg(
+                        jsonb_strip_nulls(
+                            jsonb_build_object(
+                                'scholar_profile_id', COALESCE(r.scholar_profile_id, 0),
+                                'scholar_id', r.scholar_id,
+                                'state', r.state,
+                                'state_reason', r.state_reason,
+                                'outcome', r.outcome,
+                                'attempt_count', r.attempt_count,
+                                'publication_count', r.publication_count,
+                                'start_cstart', r.start_cstart,
+                                'pages_fetched', r.pages_fetched,
+                                'pages_attempted', r.pages_attempted,
+                                'has_more_remaining', r.has_more_remaining,
+                                'pagination_truncated_reason', r.pagination_truncated_reason,
+                                'articles_range', r.articles_range,
+                                'has_show_more_button', r.has_show_more_button,
+                                'skipped_no_change', r.skipped_no_change,
+                                'initial_page_fingerprint_sha256', r.initial_page_fingerprint_sha256,
+                                'continuation_cstart', r.continuation_cstart,
+                                'continuation_enqueued', r.continuation_enqueued,
+                                'continuation_reason', r.continuation_reason,
+                                'continuation_cleared', r.continuation_cleared,
+                                'warnings', r.warnings,
+                                'error', r.error
+                            )
+                        ) || jsonb_build_object('debug', r.debug)
+                        ORDER BY r.position
+                    )
+                    FROM crawl_run_scholar_results AS r
+                    WHERE r.crawl_run_id = run.id
+                ) AS scholar_results
+            FROM crawl_runs AS run
+            WHERE run.end_dt IS NOT NULL
+        ) AS results
+        WHERE results.crawl_run_id = cr.id
+        """
+    )
+    op.drop_index("ix_crawl_run_scholar_results_scholar_profile", table_name="crawl_run_scholar_results")
+    op.drop_table("crawl_run_scholar_results")
+    op.drop_column("crawl_runs", "summary")
+    op.drop_column("crawl_runs", "partial_count")
+    op.drop_column("crawl_runs", "failed_count")
+    op.drop_column("crawl_runs", "succeeded_count")
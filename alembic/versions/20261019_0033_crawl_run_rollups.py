@@ -0,0 +1,74 @@
+"""Add daily crawl run rollups kept after run history retention.
+
+Revision ID: 20261019_0033
+Revises: 20261019_0032
+Create Date: 2026-10-19 23:30:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0033"
+down_revision: str | Sequence[str] | None = "20261019_0032"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+run_trigger_type_ref = postgresql.ENUM(
+    "manual",
+    "scheduled",
+    name="run_trigger_type",
+    create_type=False,
+)
+
+COUNT_COLUMNS = (
+    "run_count",
+    "success_run_count",
+    "partial_failure_run_count",
+    "failed_run_count",
+    "canceled_run_count",
+    "scholar_count",
+    "new_pub_count",
+    "succeeded_count",
+    "failed_count",
+    "partial_count",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crawl_run_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("trigger_type", run_trigger_type_ref, nullable=False),
+        *(sa.Column(name, sa.Integer(), nullable=False, server_default=sa.text("0")) for name in COUNT_COLUMNS),
+        sa.Column("first_start_dt", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_start_dt", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_crawl_run_rollups")),
+        sa.UniqueConstraint(
+            "user_id",
+            "period_start",
+            "trigger_type",
+            name="uq_crawl_run_rollups_user_period_trigger",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("crawl_run_rollups")
@@ -0,0 +1,29 @@
+"""Index publication dedup title tokens for incremental near-duplicate scans.
+
+Revision ID: 20261019_0034
+Revises: 20261019_0033
+Create Date: 2026-10-19 23:45:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0034"
+down_revision: str | Sequence[str] | None = "20261019_0033"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_publications_dedup_title_tokens",
+        "publications",
+        ["dedup_title_tokens"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_publications_dedup_title_tokens", table_name="publications")
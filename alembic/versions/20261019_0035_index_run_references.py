@@ -0,0 +1,34 @@
+"""Index the columns that reference crawl runs with ON DELETE SET NULL.
+
+Revision ID: 20261019_0035
+Revises: 20261019_0034
+Create Date: 2026-10-19 23:55:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0035"
+down_revision: str | Sequence[str] | None = "20261019_0034"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Run retention clears these references in batches before deleting the runs.
+RUN_REFERENCE_INDEXES = (
+    ("ix_scholar_publications_first_seen_run_id", "scholar_publications", "first_seen_run_id"),
+    ("ix_user_publication_feed_newest_run_id", "user_publication_feed", "newest_run_id"),
+    ("ix_scholar_page_archive_crawl_run_id", "scholar_page_archive_entries", "crawl_run_id"),
+    ("ix_ingestion_queue_last_run_id", "ingestion_queue_items", "last_run_id"),
+)
+
+
+def upgrade() -> None:
+    for index_name, table_name, column_name in RUN_REFERENCE_INDEXES:
+        op.create_index(index_name, table_name, [column_name])
+
+
+def downgrade() -> None:
+    for index_name, table_name, _column_name in reversed(RUN_REFERENCE_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,89 @@
+"""Serialize publication feed recomputes per (user, publication).
+
+Revision ID: 20261019_0036
+Revises: 20261019_0035
+Create Date: 2026-10-20 00:05:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0036"
+down_revision: str | Sequence[str] | None = "20261019_0035"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Two writers on links of the same (user, publication) each recomputed the
+# feed row from their own snapshot, so the last commit won with a stale
+# aggregate. The function now takes a transaction-level advisory lock per pair
+# (in sorted order) first; the recompute is a separate statement, so under
+# READ COMMITTED it sees whatever the previous lock holder committed.
+_LOCK_PAIRS_SQL = """
+    SELECT pg_advisory_xact_lock((pair.user_id::bigint << 32) | pair.publication_id::bigint)
+    FROM (
+        SELECT DISTINCT locked.user_id, locked.publication_id
+        FROM unnest(pair_user_ids, pair_publication_ids) AS locked(user_id, publication_id)
+        ORDER BY locked.user_id, locked.publication_id
+    ) AS pair;
+"""
+
+_RECOMPUTE_PAIRS_SQL = """
+    WITH pairs AS (
+        SELECT DISTINCT pair.user_id, pair.publication_id
+        FROM unnest(pair_user_ids, pair_publication_ids) AS pair(user_id, publication_id)
+    ),
+    expected AS (
+        SELECT
+            pairs.user_id,
+            pairs.publication_id,
+            bool_or(NOT link.is_read) AS is_unread,
+            bool_or(link.is_favorite) AS is_favorite,
+            min(link.created_at) AS first_seen_at,
+            max(link.first_seen_run_id) AS newest_run_id
+        FROM pairs
+        JOIN scholar_profiles AS sp ON sp.user_id = pairs.user_id
+        JOIN scholar_publications AS link
+          ON link.scholar_profile_id = sp.id AND link.publication_id = pairs.publication_id
+        GROUP BY pairs.user_id, pairs.publication_id
+    ),
+    removed AS (
+        DELETE FROM user_publication_feed AS feed
+        USING pairs
+        WHERE feed.user_id = pairs.user_id
+          AND feed.publication_id = pairs.publication_id
+          AND NOT EXISTS (
+              SELECT 1 FROM expected
+              WHERE expected.user_id = feed.user_id AND expected.publication_id = feed.publication_id
+          )
+    )
+    INSERT INTO user_publication_feed AS feed (
+        user_id, publication_id, is_unread, is_favorite, first_seen_at, newest_run_id
+    )
+    SELECT user_id, publication_id, is_unread, is_favorite, first_seen_at, newest_run_id FROM expected
+    ON CONFLICT (user_id, publication_id) DO UPDATE SET
+        is_unread = EXCLUDED.is_unread,
+        is_favorite = EXCLUDED.is_favorite,
+        first_seen_at = EXCLUDED.first_seen_at,
+        newest_run_id = EXCLUDED.newest_run_id
+    WHERE (feed.is_unread, feed.is_favorite, feed.first_seen_at, feed.newest_run_id)
+        IS DISTINCT FROM (EXCLUDED.is_unread, EXCLUDED.is_favorite, EXCLUDED.first_seen_at, EXCLUDED.newest_run_id)
+"""
+
+
+def _sync_pairs_function_sql(body: str) -> str:
+    return f"""
+CREATE OR REPLACE FUNCTION user_publication_feed_sync_pairs(pair_user_ids integer[], pair_publication_ids integer[])
+RETURNS void LANGUAGE sql VOLATILE AS $$
+{body}
+$$
+"""
+
+
+def upgrade() -> None:
+    op.execute(_sync_pairs_function_sql(_LOCK_PAIRS_SQL + _RECOMPUTE_PAIRS_SQL))
+
+
+def downgrade() -> None:
+    op.execute(_sync_pairs_function_sql(_RECOMPUTE_PAIRS_SQL))
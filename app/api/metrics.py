@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import metrics
+from app.api.deps import get_api_admin_user
+from app.db.models import IngestionQueueItem, PublicationPdfJob, User
+from app.db.session import get_db_session, get_engine
+from app.http.clients import http_client_stats
+
+router = APIRouter(tags=["metrics"])
+
+_QUEUE_STATUSES = {
+    "ingestion": ("queued", "retrying", "dropped"),
+    "pdf": ("queued", "running", "resolved", "failed"),
+}
+
+
+async def _sample_queue_depths(db_session: AsyncSession) -> None:
+    counts: dict[tuple[str, str], int] = {}
+    for queue, model in (("ingestion", IngestionQueueItem), ("pdf", PublicationPdfJob)):
+        result = await db_session.execute(select(model.status, func.count()).group_by(model.status))
+        counts.update({(queue, str(status)): int(count) for status, count in result.all()})
+    metrics.QUEUE_ITEMS.clear()
+    for queue, statuses in _QUEUE_STATUSES.items():
+        for status in statuses:
+            metrics.QUEUE_ITEMS.set(counts.get((queue, status), 0), queue=queue, status=status)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics(
+    db_session: AsyncSession = Depends(get_db_session),
+    _admin_user: User = Depends(get_api_admin_user),
+) -> Response:
+    await _sample_queue_depths(db_session)
+    metrics.sample_db_pool(get_engine().pool)
+    metrics.sample_http_clients(http_client_stats())
+    return Response(content=metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
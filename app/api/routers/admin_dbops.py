@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, Path, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,8 +10,10 @@ from app.api.deps import get_api_admin_user, get_api_current_user
 from app.api.errors import ApiException
 from app.api.responses import success_payload
 from app.api.schemas import (
+    AdminCrawlScheduleEnvelope,
     AdminDbIntegrityEnvelope,
     AdminDbRepairJobsEnvelope,
+    AdminPageArchiveEnvelope,
     AdminPdfQueueBulkEnqueueEnvelope,
     AdminPdfQueueEnvelope,
     AdminPdfQueueRequeueEnvelope,
@@ -28,6 +31,8 @@ from app.services.dbops import (
     run_publication_link_repair,
     run_publication_near_duplicate_repair,
 )
+from app.services.ingestion.crawl_schedule import crawl_schedule_summary
+from app.services.ingestion.page_archive import archive_usage
 from app.services.publications import application as publication_service
 
 logger = logging.getLogger(__name__)
@@ -148,6 +153,48 @@ async def get_integrity_report(
     return success_payload(request, data=report)
 
 
+@router.get(
+    "/crawl-schedule",
+    response_model=AdminCrawlScheduleEnvelope,
+)
+async def get_crawl_schedule(
+    request: Request,
+    db_session: AsyncSession = Depends(get_db_session),
+    admin_user: User = Depends(get_api_admin_user),
+):
+    summary = await crawl_schedule_summary(db_session, now=datetime.now(UTC))
+    structured_log(
+        logger,
+        "info",
+        "api.admin.db.crawl_schedule_viewed",
+        admin_user_id=int(admin_user.id),
+        scholar_count=summary["scholar_count"],
+        due_count=summary["due_count"],
+    )
+    return success_payload(request, data=summary)
+
+
+@router.get(
+    "/page-archive",
+    response_model=AdminPageArchiveEnvelope,
+)
+async def get_page_archive_usage(
+    request: Request,
+    db_session: AsyncSession = Depends(get_db_session),
+    admin_user: User = Depends(get_api_admin_user),
+):
+    usage = await archive_usage(db_session)
+    structured_log(
+        logger,
+        "info",
+        "api.admin.db.page_archive_viewed",
+        admin_user_id=int(admin_user.id),
+        entry_count=usage["entry_count"],
+        stored_bytes=usage["stored_bytes"],
+    )
+    return success_payload(request, data=usage)
+
+
 @router.get(
     "/repair-jobs",
     response_model=AdminDbRepairJobsEnvelope,
@@ -367,6 +414,7 @@ async def trigger_publication_near_duplicate_repair(
             max_clusters=int(payload.max_clusters),
             selected_cluster_keys=list(payload.selected_cluster_keys),
             requested_by=_requested_by_value(payload=payload, admin_user=admin_user),
+            incremental=bool(payload.incremental),
         )
     except ValueError as exc:
         raise ApiException(
@@ -380,6 +428,7 @@ async def trigger_publication_near_duplicate_repair(
         "api.admin.db.dedup_repair_triggered",
         admin_user_id=int(admin_user.id),
         dry_run=bool(payload.dry_run),
+        incremental=bool(payload.incremental),
         selected_cluster_count=len(payload.selected_cluster_keys),
         job_id=int(result["job_id"]),
         status=result["status"],
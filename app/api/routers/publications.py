@@ -26,7 +26,6 @@ from app.logging_utils import structured_log
 from app.services.publication_identifiers import application as identifier_service
 from app.services.publications import application as publication_service
 from app.services.scholars import application as scholar_service
-from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +73,7 @@ def _serialize_publication_item(item) -> dict[str, object]:
         "is_favorite": item.is_favorite,
         "first_seen_at": item.first_seen_at,
         "is_new_in_latest_run": item.is_new_in_latest_run,
+        "search_snippet": item.search_snippet,
     }
 
 
@@ -93,41 +93,24 @@ async def _publication_counts(
     db_session: AsyncSession,
     *,
     user_id: int,
+    latest_run_id: int | None,
     selected_scholar_id: int | None,
     favorite_only: bool,
     search: str | None,
     snapshot_before: datetime | None,
+    pinned_snapshot: bool,
 ) -> tuple[int, int, int, int]:
-    unread_count = await publication_service.count_unread_for_user(
+    counts = await publication_service.get_publication_facet_counts_for_user(
         db_session,
         user_id=user_id,
-        scholar_profile_id=selected_scholar_id,
-        favorite_only=favorite_only,
-        snapshot_before=snapshot_before,
-    )
-    favorites_count = await publication_service.count_favorite_for_user(
-        db_session,
-        user_id=user_id,
-        scholar_profile_id=selected_scholar_id,
-        snapshot_before=snapshot_before,
-    )
-    latest_count = await publication_service.count_latest_for_user(
-        db_session,
-        user_id=user_id,
-        scholar_profile_id=selected_scholar_id,
-        favorite_only=favorite_only,
-        snapshot_before=snapshot_before,
-    )
-    total_count = await publication_service.count_for_user(
-        db_session,
-        user_id=user_id,
-        mode=publication_service.MODE_ALL,
+        latest_run_id=latest_run_id,
         scholar_profile_id=selected_scholar_id,
         favorite_only=favorite_only,
         search=search,
         snapshot_before=snapshot_before,
+        pinned_snapshot=pinned_snapshot,
     )
-    return unread_count, favorites_count, latest_count, total_count
+    return counts.unread_count, counts.favorites_count, counts.latest_count, counts.total_count
 
 
 async def _list_publications_for_request(
@@ -143,7 +126,9 @@ async def _list_publications_for_request(
     limit: int,
     offset: int,
     snapshot_before: datetime | None,
-) -> tuple[str, int | None, list]:
+    latest_run_id: int | None,
+    after: publication_service.PublicationCursor | None,
+) -> tuple[str, int | None, publication_service.PublicationListPage]:
     resolved_mode = publication_service.resolve_publication_view_mode(mode)
     selected_scholar_id = scholar_profile_id
     await _require_selected_profile(
@@ -151,9 +136,10 @@ async def _list_publications_for_request(
         user_id=current_user.id,
         selected_scholar_id=selected_scholar_id,
     )
-    publications = await publication_service.list_for_user(
+    page = await publication_service.list_page_for_user(
         db_session,
         user_id=current_user.id,
+        latest_run_id=latest_run_id,
         mode=resolved_mode,
         scholar_profile_id=selected_scholar_id,
         favorite_only=favorite_only,
@@ -163,19 +149,9 @@ async def _list_publications_for_request(
         limit=limit,
         offset=offset,
         snapshot_before=snapshot_before,
+        after=after,
     )
-    await publication_service.schedule_missing_pdf_enrichment_for_user(
-        db_session,
-        user_id=current_user.id,
-        request_email=current_user.email,
-        items=publications,
-        max_items=settings.unpaywall_max_items_per_request,
-    )
-    hydrated = await publication_service.hydrate_pdf_enrichment_state(
-        db_session,
-        items=publications,
-    )
-    return resolved_mode, selected_scholar_id, hydrated
+    return resolved_mode, selected_scholar_id, page
 
 
 def _resolve_publications_snapshot(
@@ -199,6 +175,31 @@ def _resolve_publications_snapshot(
     return normalized, normalized.isoformat()
 
 
+def _resolve_publications_cursor(
+    *,
+    cursor: str | None,
+    sort_by: str,
+    sort_dir: str,
+) -> publication_service.PublicationCursor | None:
+    if cursor is None:
+        return None
+    try:
+        decoded = publication_service.decode_publication_cursor(cursor)
+    except publication_service.InvalidPublicationCursorError as exc:
+        raise ApiException(
+            status_code=400,
+            code="invalid_cursor",
+            message="Invalid publications page cursor.",
+        ) from exc
+    if decoded.sort_by != sort_by or decoded.sort_dir != sort_dir:
+        raise ApiException(
+            status_code=400,
+            code="invalid_cursor",
+            message="Publications page cursor does not match the requested sort.",
+        )
+    return decoded
+
+
 def _resolve_publications_paging(
     *,
     page: int,
@@ -224,8 +225,10 @@ def _publications_list_data(
     publications: list,
     page: int,
     page_size: int,
-    offset: int,
     snapshot: str,
+    has_next: bool,
+    has_prev: bool,
+    next_cursor: str | None,
 ) -> dict[str, object]:
     return {
         "mode": mode,
@@ -239,8 +242,9 @@ def _publications_list_data(
         "page": int(page),
         "page_size": int(page_size),
         "snapshot": snapshot,
-        "has_prev": int(offset) > 0,
-        "has_next": int(offset) + int(page_size) < int(total_count),
+        "has_prev": has_prev,
+        "has_next": has_next,
+        "next_cursor": next_cursor,
         "publications": [_serialize_publication_item(item) for item in publications],
     }
 
@@ -329,16 +333,11 @@ async def _favorite_publication_state(
             code="publication_not_found",
             message="Publication not found.",
         )
-    hydrated = await publication_service.hydrate_pdf_enrichment_state(
-        db_session,
-        items=[publication],
-    )
-    current = hydrated[0] if hydrated else publication
     identifiers = await identifier_service.overlay_publication_items_with_display_identifiers(
         db_session,
-        items=[current],
+        items=[publication],
     )
-    return identifiers[0] if identifiers else current
+    return identifiers[0] if identifiers else publication
 
 
 @router.get(
@@ -351,13 +350,16 @@ async def list_publications(
     favorite_only: bool = Query(default=False),
     scholar_profile_id: int | None = Query(default=None, ge=1),
     search: str | None = Query(default=None, min_length=1, max_length=200),
-    sort_by: Literal["first_seen", "title", "year", "citations", "scholar", "pdf_status"] = Query(default="first_seen"),
+    sort_by: Literal["first_seen", "title", "year", "citations", "scholar", "pdf_status", "relevance"] = Query(
+        default="first_seen"
+    ),
     sort_dir: Literal["asc", "desc"] = Query(default="desc"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=100, ge=1, le=500),
     limit: int | None = Query(default=None, ge=1, le=1000),
     offset: int | None = Query(default=None, ge=0),
     snapshot: str | None = Query(default=None, min_length=1, max_length=64),
+    cursor: str | None = Query(default=None, min_length=1, max_length=1024),
     db_session: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_api_current_user),
 ):
@@ -369,26 +371,33 @@ async def list_publications(
     )
     snapshot_before, snapshot_cursor = _resolve_publications_snapshot(snapshot=snapshot)
     normalized_search = (search or "").strip() or None
-    resolved_mode, selected_scholar_id, publications = await _list_publications_for_request(
+    resolved_sort_by = publication_service.resolve_publication_sort(sort_by, search=normalized_search)
+    after = _resolve_publications_cursor(cursor=cursor, sort_by=resolved_sort_by, sort_dir=sort_dir)
+    latest_run_id = await publication_service.get_latest_run_id_for_user(db_session, user_id=current_user.id)
+    resolved_mode, selected_scholar_id, list_page = await _list_publications_for_request(
         db_session,
         current_user=current_user,
         mode=mode,
         favorite_only=favorite_only,
         scholar_profile_id=scholar_profile_id,
         search=normalized_search,
-        sort_by=sort_by,
+        sort_by=resolved_sort_by,
         sort_dir=sort_dir,
         limit=resolved_limit,
         offset=resolved_offset,
         snapshot_before=snapshot_before,
+        latest_run_id=latest_run_id,
+        after=after,
     )
     unread_count, favorites_count, latest_count, total_count = await _publication_counts(
         db_session,
         user_id=current_user.id,
+        latest_run_id=latest_run_id,
         selected_scholar_id=selected_scholar_id,
         favorite_only=favorite_only,
         search=normalized_search,
         snapshot_before=snapshot_before,
+        pinned_snapshot=snapshot is not None,
     )
     data = _publications_list_data(
         mode=resolved_mode,
@@ -398,11 +407,13 @@ async def list_publications(
         favorites_count=favorites_count,
         latest_count=latest_count,
         total_count=total_count,
-        publications=publications,
+        publications=list_page.items,
         page=resolved_page,
         page_size=resolved_limit,
-        offset=resolved_offset,
         snapshot=snapshot_cursor,
+        has_next=list_page.has_next if after is not None else resolved_offset + resolved_limit < total_count,
+        has_prev=after is not None or resolved_offset > 0,
+        next_cursor=list_page.next_cursor,
     )
     return success_payload(request, data=data)
 
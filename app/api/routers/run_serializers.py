@@ -4,7 +4,6 @@ import re
 from typing import Any
 
 from app.api.errors import ApiException
-from app.services.runs import application as run_service
 
 IDEMPOTENCY_HEADER = "Idempotency-Key"
 IDEMPOTENCY_MAX_LENGTH = 128
@@ -53,7 +52,6 @@ def normalize_idempotency_key(raw_value: str | None) -> str | None:
 
 
 def serialize_run(run) -> dict[str, Any]:
-    summary = run_service.extract_run_summary(run.error_log)
     return {
         "id": int(run.id),
         "trigger_type": run.trigger_type.value,
@@ -62,8 +60,8 @@ def serialize_run(run) -> dict[str, Any]:
         "end_dt": run.end_dt,
         "scholar_count": int(run.scholar_count or 0),
         "new_publication_count": int(run.new_pub_count or 0),
-        "failed_count": int(summary["failed_count"]),
-        "partial_count": int(summary["partial_count"]),
+        "failed_count": int(run.failed_count or 0),
+        "partial_count": int(run.partial_count or 0),
     }
 
 
@@ -157,42 +155,22 @@ def _normalize_debug(value: Any) -> dict[str, Any] | None:
     }
 
 
-def normalize_scholar_result(value: Any) -> dict[str, Any]:
-    if not isinstance(value, dict):
-        return {
-            "scholar_profile_id": 0,
-            "scholar_id": "unknown",
-            "state": "unknown",
-            "state_reason": None,
-            "outcome": "failed",
-            "attempt_count": 0,
-            "publication_count": 0,
-            "start_cstart": 0,
-            "continuation_cstart": None,
-            "continuation_enqueued": False,
-            "continuation_cleared": False,
-            "warnings": [],
-            "error": None,
-            "debug": None,
-        }
-    warnings = value.get("warnings")
+def serialize_scholar_result(row) -> dict[str, Any]:
     return {
-        "scholar_profile_id": _int_value(value.get("scholar_profile_id"), 0),
-        "scholar_id": _str_value(value.get("scholar_id")) or "unknown",
-        "state": _str_value(value.get("state")) or "unknown",
-        "state_reason": _str_value(value.get("state_reason")),
-        "outcome": _str_value(value.get("outcome")) or "failed",
-        "attempt_count": _int_value(value.get("attempt_count"), 0),
-        "publication_count": _int_value(value.get("publication_count"), 0),
-        "start_cstart": _int_value(value.get("start_cstart"), 0),
-        "continuation_cstart": (
-            _int_value(value.get("continuation_cstart")) if value.get("continuation_cstart") is not None else None
-        ),
-        "continuation_enqueued": _bool_value(value.get("continuation_enqueued"), False),
-        "continuation_cleared": _bool_value(value.get("continuation_cleared"), False),
-        "warnings": [str(item) for item in (warnings if isinstance(warnings, list) else [])],
-        "error": _str_value(value.get("error")),
-        "debug": _normalize_debug(value.get("debug")),
+        "scholar_profile_id": int(row.scholar_profile_id or 0),
+        "scholar_id": _str_value(row.scholar_id) or "unknown",
+        "state": _str_value(row.state) or "unknown",
+        "state_reason": _str_value(row.state_reason),
+        "outcome": _str_value(row.outcome) or "failed",
+        "attempt_count": int(row.attempt_count or 0),
+        "publication_count": int(row.publication_count or 0),
+        "start_cstart": int(row.start_cstart or 0),
+        "continuation_cstart": (int(row.continuation_cstart) if row.continuation_cstart is not None else None),
+        "continuation_enqueued": bool(row.continuation_enqueued),
+        "continuation_cleared": bool(row.continuation_cleared),
+        "warnings": [str(item) for item in (row.warnings if isinstance(row.warnings, list) else [])],
+        "error": _str_value(row.error),
+        "debug": _normalize_debug(row.debug),
     }
 
 
@@ -203,14 +181,13 @@ def manual_run_payload_from_run(
     reused_existing_run: bool,
     safety_state: dict[str, Any],
 ) -> dict[str, Any]:
-    summary = run_service.extract_run_summary(run.error_log)
     return {
         "run_id": int(run.id),
         "status": run.status.value,
         "scholar_count": int(run.scholar_count or 0),
-        "succeeded_count": int(summary["succeeded_count"]),
-        "failed_count": int(summary["failed_count"]),
-        "partial_count": int(summary["partial_count"]),
+        "succeeded_count": int(run.succeeded_count or 0),
+        "failed_count": int(run.failed_count or 0),
+        "partial_count": int(run.partial_count or 0),
         "new_publication_count": int(run.new_pub_count or 0),
         "reused_existing_run": reused_existing_run,
         "idempotency_key": idempotency_key,
@@ -4,7 +4,7 @@ import asyncio
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Header, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,9 +23,9 @@ from app.api.routers.run_manual import (
 from app.api.routers.run_serializers import (
     IDEMPOTENCY_HEADER,
     normalize_idempotency_key,
-    normalize_scholar_result,
     serialize_queue_item,
     serialize_run,
+    serialize_scholar_result,
 )
 from app.api.runtime_deps import get_ingestion_service
 from app.api.schemas import (
@@ -41,7 +41,8 @@ from app.db.session import get_db_session, get_session_factory
 from app.logging_utils import structured_log
 from app.services.ingestion import application as ingestion_service
 from app.services.runs import application as run_service
-from app.services.runs.events import event_generator
+from app.services.runs.cancellation import run_cancellation
+from app.services.runs.events import event_generator, parse_last_event_id
 from app.services.settings import application as user_settings_service
 from app.settings import settings
 
@@ -112,10 +113,7 @@ async def get_run(
             code="run_not_found",
             message="Run not found.",
         )
-    error_log = run.error_log if isinstance(run.error_log, dict) else {}
-    scholar_results = error_log.get("scholar_results")
-    if not isinstance(scholar_results, list):
-        scholar_results = []
+    scholar_results = await run_service.list_scholar_results_for_run(db_session, run_id=int(run.id))
     safety_state = await load_safety_state(
         db_session,
         user_id=current_user.id,
@@ -124,8 +122,8 @@ async def get_run(
         request,
         data={
             "run": serialize_run(run),
-            "summary": run_service.extract_run_summary(error_log),
-            "scholar_results": [normalize_scholar_result(item) for item in scholar_results],
+            "summary": run_service.extract_run_summary(run.summary),
+            "scholar_results": [serialize_scholar_result(item) for item in scholar_results],
             "safety_state": safety_state,
         },
     )
@@ -156,6 +154,7 @@ async def cancel_run(
     if run.status in ACTIVE_RUN_STATUSES:
         run.status = RunStatus.CANCELED
         await db_session.commit()
+        run_cancellation.cancel(int(run.id))
         await db_session.refresh(run)
     else:
         raise ApiException(
@@ -165,10 +164,7 @@ async def cancel_run(
             details={"run_id": int(run.id), "status": run.status.value},
         )
 
-    error_log = run.error_log if isinstance(run.error_log, dict) else {}
-    scholar_results = error_log.get("scholar_results")
-    if not isinstance(scholar_results, list):
-        scholar_results = []
+    scholar_results = await run_service.list_scholar_results_for_run(db_session, run_id=int(run.id))
 
     safety_state = await load_safety_state(
         db_session,
@@ -179,8 +175,8 @@ async def cancel_run(
         request,
         data={
             "run": serialize_run(run),
-            "summary": run_service.extract_run_summary(error_log),
-            "scholar_results": [normalize_scholar_result(item) for item in scholar_results],
+            "summary": run_service.extract_run_summary(run.summary),
+            "scholar_results": [serialize_scholar_result(item) for item in scholar_results],
             "safety_state": safety_state,
         },
     )
@@ -219,7 +215,6 @@ def _spawn_background_execution(
     scholars: list,
     start_cstart_map: dict,
     user_settings: Any,
-    idempotency_key: str | None,
 ) -> None:
     from app.db.background_session import background_session
 
@@ -240,7 +235,6 @@ def _spawn_background_execution(
             alert_blocked_failure_threshold=settings.ingestion_alert_blocked_failure_threshold,
             alert_network_failure_threshold=settings.ingestion_alert_network_failure_threshold,
             alert_retry_scheduled_threshold=settings.ingestion_alert_retry_scheduled_threshold,
-            idempotency_key=idempotency_key,
         )
     )
     _background_tasks.add(task)
@@ -288,7 +282,6 @@ async def run_manual(
             scholars=scholars,
             start_cstart_map=start_cstart_map,
             user_settings=user_settings,
-            idempotency_key=idempotency_key,
         )
         return success_payload(
             request,
@@ -465,6 +458,7 @@ async def clear_queue_item(
 @router.get("/{run_id}/stream")
 async def stream_run_events(
     run_id: int,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
     current_user: User = Depends(get_api_current_user),
 ):
     session_factory = get_session_factory()
@@ -480,4 +474,7 @@ async def stream_run_events(
             code="run_not_found",
             message="Run not found.",
         )
-    return StreamingResponse(event_generator(run_id), media_type="text/event-stream")
+    return StreamingResponse(
+        event_generator(run_id, last_event_id=parse_last_event_id(last_event_id)),
+        media_type="text/event-stream",
+    )
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, File, Query, Request, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import ClientDisconnect
 
 from app.api.deps import get_api_current_user
 from app.api.errors import ApiException
@@ -23,6 +27,7 @@ from app.api.schemas import (
     DataImportEnvelope,
     DataImportRequest,
     MessageEnvelope,
+    PortabilityJobEnvelope,
     ScholarBulkCountEnvelope,
     ScholarBulkIdsRequest,
     ScholarBulkToggleRequest,
@@ -32,9 +37,10 @@ from app.api.schemas import (
     ScholarSearchEnvelope,
     ScholarsListEnvelope,
 )
-from app.db.models import User
-from app.db.session import get_db_session
+from app.db.models import DataRepairJob, User
+from app.db.session import get_db_session, get_session_factory
 from app.logging_utils import structured_log
+from app.services.dbops.application import REPAIR_STATUS_COMPLETED
 from app.services.portability import application as import_export_service
 from app.services.scholar.source import ScholarSource
 from app.services.scholars import application as scholar_service
@@ -82,6 +88,26 @@ async def list_scholars(
     )
 
 
+async def _stream_ndjson_export(
+    *,
+    user_id: int,
+    scholar_profile_ids: list[int] | None,
+    compress: bool,
+) -> AsyncIterator[bytes]:
+    # The stream outlives the request-scoped session, so it holds its own.
+    session_factory = get_session_factory()
+    async with session_factory() as db_session:
+        chunks = import_export_service.iter_user_export_ndjson(
+            db_session,
+            user_id=user_id,
+            scholar_profile_ids=scholar_profile_ids,
+        )
+        if compress:
+            chunks = import_export_service.gzip_chunks(chunks)
+        async for chunk in chunks:
+            yield chunk
+
+
 @router.get(
     "/export",
     response_model=DataExportEnvelope,
@@ -89,10 +115,28 @@ async def list_scholars(
 async def export_scholars_and_publications(
     request: Request,
     ids: str | None = Query(None, description="Comma-separated scholar profile IDs to export"),
+    export_format: str = Query(
+        "json",
+        alias="format",
+        pattern="^(json|ndjson)$",
+        description="`ndjson` streams one record per line instead of a single JSON envelope",
+    ),
+    compress: bool = Query(False, alias="gzip", description="Gzip the NDJSON stream"),
     db_session: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_api_current_user),
 ):
     scholar_profile_ids = _parse_ids_param(ids)
+    if export_format == "ndjson":
+        filename = f"scholarr-export-{datetime.now(UTC):%Y%m%d}.ndjson" + (".gz" if compress else "")
+        return StreamingResponse(
+            _stream_ndjson_export(
+                user_id=current_user.id,
+                scholar_profile_ids=scholar_profile_ids,
+                compress=compress,
+            ),
+            media_type="application/gzip" if compress else "application/x-ndjson",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
     data = await import_export_service.export_user_data(
         db_session,
         user_id=current_user.id,
@@ -201,6 +245,232 @@ async def import_scholars_and_publications(
     return success_payload(request, data=result)
 
 
+def _serialize_portability_job(job: DataRepairJob) -> dict[str, object]:
+    summary = dict(job.summary or {})
+    is_export = job.job_name == import_export_service.PORTABILITY_EXPORT_JOB_NAME
+    return {
+        "id": int(job.id),
+        "kind": "export" if is_export else "import",
+        "status": job.status,
+        "phase": summary.get("phase"),
+        "rows_total": summary.get("rows_total"),
+        "rows_done": int(summary.get("rows_done") or 0),
+        "rows_per_second": summary.get("rows_per_second"),
+        "eta_seconds": summary.get("eta_seconds"),
+        "counters": summary.get("counters"),
+        "attempt": int(summary.get("attempt") or 0),
+        "error": job.error_text,
+        "download_ready": is_export and job.status == REPAIR_STATUS_COMPLETED,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+async def _require_portability_job(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    job_id: int,
+    job_name: str,
+) -> DataRepairJob:
+    job = await import_export_service.get_user_portability_job(
+        db_session,
+        user_id=user_id,
+        job_id=job_id,
+        job_name=job_name,
+    )
+    if job is None:
+        raise ApiException(
+            status_code=404,
+            code="portability_job_not_found",
+            message="Job not found.",
+        )
+    return job
+
+
+async def _create_portability_job(
+    db_session: AsyncSession,
+    *,
+    current_user: User,
+    job_name: str,
+    scope: dict[str, object] | None = None,
+) -> DataRepairJob:
+    try:
+        return await import_export_service.create_portability_job(
+            db_session,
+            user_id=current_user.id,
+            job_name=job_name,
+            requested_by=current_user.email,
+            scope=scope,
+        )
+    except import_export_service.PortabilityJobConflictError as exc:
+        raise ApiException(
+            status_code=409,
+            code="portability_job_in_progress",
+            message=str(exc),
+        ) from exc
+
+
+async def _start_portability_job(
+    db_session: AsyncSession,
+    *,
+    job: DataRepairJob,
+    summary: dict[str, object] | None = None,
+) -> DataRepairJob:
+    try:
+        return await import_export_service.start_portability_job(db_session, job=job, summary=summary)
+    except import_export_service.PortabilityJobConflictError as exc:
+        raise ApiException(
+            status_code=409,
+            code="portability_job_interrupted",
+            message=str(exc),
+        ) from exc
+
+
+@router.post(
+    "/import-jobs",
+    response_model=PortabilityJobEnvelope,
+    status_code=202,
+)
+async def create_import_job(
+    request: Request,
+    db_session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_api_current_user),
+):
+    max_bytes = settings.portability_upload_max_bytes
+    declared_length = request.headers.get("content-length", "")
+    if declared_length.isdigit() and int(declared_length) > max_bytes:
+        raise ApiException(
+            status_code=413,
+            code="import_upload_too_large",
+            message=f"Upload exceeds max size ({max_bytes} bytes).",
+        )
+    job = await _create_portability_job(
+        db_session,
+        current_user=current_user,
+        job_name=import_export_service.PORTABILITY_IMPORT_JOB_NAME,
+    )
+    try:
+        upload_bytes = await import_export_service.spool_import_upload(job, request.stream(), max_bytes=max_bytes)
+    except ClientDisconnect:
+        await import_export_service.fail_portability_job(db_session, job=job, error_text="Upload was interrupted.")
+        raise
+    except import_export_service.ImportExportError as exc:
+        await import_export_service.fail_portability_job(db_session, job=job, error_text=str(exc))
+        too_large = isinstance(exc, import_export_service.ImportUploadTooLargeError)
+        raise ApiException(
+            status_code=413 if too_large else 400,
+            code="import_upload_too_large" if too_large else "invalid_import_payload",
+            message=str(exc),
+        ) from exc
+    job = await _start_portability_job(db_session, job=job, summary={"upload_bytes": upload_bytes})
+    structured_log(
+        logger,
+        "info",
+        "api.scholars.import_job_created",
+        user_id=current_user.id,
+        job_id=int(job.id),
+        upload_bytes=upload_bytes,
+    )
+    return success_payload(request, data=_serialize_portability_job(job))
+
+
+@router.get(
+    "/import-jobs/{job_id}",
+    response_model=PortabilityJobEnvelope,
+)
+async def get_import_job(
+    job_id: int,
+    request: Request,
+    db_session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_api_current_user),
+):
+    job = await _require_portability_job(
+        db_session,
+        user_id=current_user.id,
+        job_id=job_id,
+        job_name=import_export_service.PORTABILITY_IMPORT_JOB_NAME,
+    )
+    return success_payload(request, data=_serialize_portability_job(job))
+
+
+@router.post(
+    "/export-jobs",
+    response_model=PortabilityJobEnvelope,
+    status_code=202,
+)
+async def create_export_job(
+    request: Request,
+    ids: str | None = Query(None, description="Comma-separated scholar profile IDs to export"),
+    compress: bool = Query(False, alias="gzip", description="Gzip the NDJSON file"),
+    db_session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_api_current_user),
+):
+    job = await _create_portability_job(
+        db_session,
+        current_user=current_user,
+        job_name=import_export_service.PORTABILITY_EXPORT_JOB_NAME,
+        scope={"scholar_profile_ids": _parse_ids_param(ids), "gzip": compress},
+    )
+    job = await _start_portability_job(db_session, job=job)
+    structured_log(logger, "info", "api.scholars.export_job_created", user_id=current_user.id, job_id=int(job.id))
+    return success_payload(request, data=_serialize_portability_job(job))
+
+
+@router.get(
+    "/export-jobs/{job_id}",
+    response_model=PortabilityJobEnvelope,
+)
+async def get_export_job(
+    job_id: int,
+    request: Request,
+    db_session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_api_current_user),
+):
+    job = await _require_portability_job(
+        db_session,
+        user_id=current_user.id,
+        job_id=job_id,
+        job_name=import_export_service.PORTABILITY_EXPORT_JOB_NAME,
+    )
+    return success_payload(request, data=_serialize_portability_job(job))
+
+
+@router.get("/export-jobs/{job_id}/download")
+async def download_export_job(
+    job_id: int,
+    db_session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_api_current_user),
+):
+    job = await _require_portability_job(
+        db_session,
+        user_id=current_user.id,
+        job_id=job_id,
+        job_name=import_export_service.PORTABILITY_EXPORT_JOB_NAME,
+    )
+    if job.status != REPAIR_STATUS_COMPLETED:
+        raise ApiException(
+            status_code=409,
+            code="export_not_ready",
+            message="Export job has not completed.",
+        )
+    path = import_export_service.portability_job_path(job)
+    if not path.is_file():
+        raise ApiException(
+            status_code=404,
+            code="export_file_missing",
+            message="Export file is no longer available.",
+        )
+    compress = bool(job.scope.get("gzip"))
+    finished_at = job.finished_at or datetime.now(UTC)
+    return FileResponse(
+        path,
+        media_type="application/gzip" if compress else "application/x-ndjson",
+        filename=f"scholarr-export-{finished_at:%Y%m%d}.ndjson" + (".gz" if compress else ""),
+    )
+
+
 @router.post(
     "",
     response_model=ScholarEnvelope,
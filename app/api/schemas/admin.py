@@ -111,6 +111,54 @@ class AdminDbIntegrityEnvelope(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class AdminCrawlScheduleData(BaseModel):
+    enabled: bool
+    backoff_factor: float
+    max_interval_minutes: int
+    scholar_count: int
+    due_count: int
+    backed_off_count: int
+    first_page_check_count: int
+    unchanged_check_count: int
+    unchanged_ratio: float
+    requests_per_day_fixed: float
+    requests_per_day_adaptive: float
+    requests_per_day_saved: float
+    saved_ratio: float
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AdminCrawlScheduleEnvelope(BaseModel):
+    data: AdminCrawlScheduleData
+    meta: ApiMeta
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AdminPageArchiveData(BaseModel):
+    enabled: bool
+    retention_days: int
+    keep_latest: int
+    entry_count: int
+    layout_changed_entry_count: int
+    blob_count: int
+    raw_bytes: int
+    stored_bytes: int
+    compression_ratio: float
+    oldest_fetched_at: datetime | None = None
+    newest_fetched_at: datetime | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AdminPageArchiveEnvelope(BaseModel):
+    data: AdminPageArchiveData
+    meta: ApiMeta
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class AdminDbRepairJobData(BaseModel):
     id: int
     job_name: str
@@ -277,6 +325,7 @@ class AdminRepairPublicationNearDuplicatesRequest(BaseModel):
     max_year_delta: int = Field(default=1, ge=0, le=5)
     max_clusters: int = Field(default=25, ge=1, le=200)
     selected_cluster_keys: list[str] = Field(default_factory=list, max_length=200)
+    incremental: bool = False
     requested_by: str | None = None
     confirmation_text: str | None = None
 
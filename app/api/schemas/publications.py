@@ -36,6 +36,7 @@ class PublicationItemData(BaseModel):
     is_favorite: bool = False
     first_seen_at: datetime
     is_new_in_latest_run: bool
+    search_snippet: str | None = None
 
     model_config = ConfigDict(extra="forbid")
 
@@ -54,6 +55,7 @@ class PublicationsListData(BaseModel):
     snapshot: str
     has_next: bool = False
     has_prev: bool = False
+    next_cursor: str | None = None
     publications: list[PublicationItemData]
 
     model_config = ConfigDict(extra="forbid")
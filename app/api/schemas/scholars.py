@@ -187,3 +187,30 @@ class DataImportEnvelope(BaseModel):
     meta: ApiMeta
 
     model_config = ConfigDict(extra="forbid")
+
+
+class PortabilityJobData(BaseModel):
+    id: int
+    kind: str
+    status: str
+    phase: str | None = None
+    rows_total: int | None = None
+    rows_done: int = 0
+    rows_per_second: float | None = None
+    eta_seconds: float | None = None
+    counters: dict[str, int] | None = None
+    attempt: int = 0
+    error: str | None = None
+    download_ready: bool = False
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class PortabilityJobEnvelope(BaseModel):
+    data: PortabilityJobData
+    meta: ApiMeta
+
+    model_config = ConfigDict(extra="forbid")
@@ -4,7 +4,9 @@ Background tasks (ingestion, PDF resolution, scheduler) acquire a semaphore
 permit before checking out a database connection.  The semaphore cap is
 ``pool_size + max_overflow - reserved_for_api``, which guarantees that at
 least *reserved_for_api* connections remain available for API request
-handlers at all times.
+handlers at all times. With ``RUN_EVENTS_BACKEND=postgres`` the run event
+bus keeps a listening and a notifying connection open for the life of the
+process, so those come out of the background budget too.
 """
 
 from __future__ import annotations
@@ -24,17 +26,36 @@ logger = logging.getLogger(__name__)
 
 _semaphore: asyncio.Semaphore | None = None
 
+# Listener plus notifier of the Postgres run event bus (app.services.runs.event_bus_postgres).
+_RUN_EVENT_BUS_CONNECTIONS = 2
 
-def _build_semaphore() -> asyncio.Semaphore:
+
+def _run_event_bus_connections() -> int:
+    backend = (settings.run_events_backend or "").strip().lower()
+    return _RUN_EVENT_BUS_CONNECTIONS if backend == "postgres" else 0
+
+
+def _pool_budget() -> tuple[int, int, int]:
     pool_capacity = max(1, settings.database_pool_size) + max(0, settings.database_pool_max_overflow)
     reserved = max(0, settings.database_reserved_api_connections)
-    limit = max(1, pool_capacity - reserved)
+    return pool_capacity, reserved, _run_event_bus_connections()
+
+
+def background_session_limit() -> int:
+    pool_capacity, reserved, event_bus = _pool_budget()
+    return max(1, pool_capacity - reserved - event_bus)
+
+
+def _build_semaphore() -> asyncio.Semaphore:
+    pool_capacity, reserved, event_bus = _pool_budget()
+    limit = background_session_limit()
     structured_log(
         logger,
         "info",
         "db.background_semaphore_initialized",
         pool_capacity=pool_capacity,
         reserved_for_api=reserved,
+        reserved_for_run_events=event_bus,
         background_limit=limit,
     )
     return asyncio.Semaphore(limit)
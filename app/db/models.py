@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from enum import StrEnum
 
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Computed,
+    Date,
     DateTime,
     Enum,
     Float,
@@ -18,11 +20,17 @@ from sqlalchemy import (
     func,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
+PUBLICATION_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title_raw, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(venue_text, '')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(author_text, '')), 'C')"
+)
+
 
 class RunTriggerType(StrEnum):
     MANUAL = "manual"
@@ -130,6 +138,11 @@ class ScholarProfile(Base):
     last_run_status: Mapped[RunStatus | None] = mapped_column(
         RUN_STATUS_DB_ENUM,
     )
+    change_check_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    change_unchanged_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    no_change_streak: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    last_change_dt: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_change_check_dt: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
@@ -162,11 +175,118 @@ class CrawlRun(Base):
     scholar_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
     new_pub_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
     idempotency_key: Mapped[str | None] = mapped_column(String(128))
+    succeeded_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    partial_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    # Failure breakdowns, retry counts and alert flags; per-scholar detail lives
+    # in crawl_run_scholar_results.
+    summary: Mapped[dict] = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     error_log: Mapped[dict] = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
+class CrawlRunScholarResult(Base):
+    # One row per scholar a run processed, in processing order. The debug
+    # context (URLs, attempt and page logs, body excerpt) is only loaded on request.
+    __tablename__ = "crawl_run_scholar_results"
+    __table_args__ = (
+        UniqueConstraint("crawl_run_id", "position", name="uq_crawl_run_scholar_results_run_position"),
+        Index("ix_crawl_run_scholar_results_scholar_profile", "scholar_profile_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    crawl_run_id: Mapped[int] = mapped_column(ForeignKey("crawl_runs.id", ondelete="CASCADE"), nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    scholar_profile_id: Mapped[int | None] = mapped_column(ForeignKey("scholar_profiles.id", ondelete="SET NULL"))
+    scholar_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    state: Mapped[str] = mapped_column(String(64), nullable=False)
+    state_reason: Mapped[str | None] = mapped_column(Text)
+    outcome: Mapped[str] = mapped_column(String(16), nullable=False)
+    attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    publication_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    start_cstart: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    pages_fetched: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    pages_attempted: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    has_more_remaining: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    pagination_truncated_reason: Mapped[str | None] = mapped_column(Text)
+    articles_range: Mapped[str | None] = mapped_column(Text)
+    has_show_more_button: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    skipped_no_change: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    initial_page_fingerprint_sha256: Mapped[str | None] = mapped_column(String(64))
+    continuation_cstart: Mapped[int | None] = mapped_column(Integer)
+    continuation_enqueued: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    continuation_reason: Mapped[str | None] = mapped_column(Text)
+    continuation_cleared: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    warnings: Mapped[list] = mapped_column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
+    error: Mapped[str | None] = mapped_column(Text)
+    debug: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class CrawlRunRollup(Base):
+    # Per-user daily totals of crawl runs removed by retention, so run counts
+    # and failure rates stay reportable after the run rows are gone.
+    __tablename__ = "crawl_run_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "period_start",
+            "trigger_type",
+            name="uq_crawl_run_rollups_user_period_trigger",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    trigger_type: Mapped[RunTriggerType] = mapped_column(RUN_TRIGGER_TYPE_DB_ENUM, nullable=False)
+    run_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    success_run_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    partial_failure_run_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    failed_run_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    canceled_run_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    scholar_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    new_pub_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    succeeded_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    partial_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    first_start_dt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_start_dt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class ScholarPageArchiveEntry(Base):
+    # One row per archived page fetch; the compressed body lives on disk under
+    # INGESTION_PAGE_ARCHIVE_DIR keyed by body_sha256, shared by identical captures.
+    __tablename__ = "scholar_page_archive_entries"
+    __table_args__ = (
+        Index("ix_scholar_page_archive_scholar_cstart_fetched", "scholar_profile_id", "cstart", "fetched_at"),
+        Index("ix_scholar_page_archive_body_sha256", "body_sha256"),
+        Index("ix_scholar_page_archive_fetched_at", "fetched_at"),
+        Index("ix_scholar_page_archive_crawl_run_id", "crawl_run_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    scholar_profile_id: Mapped[int] = mapped_column(
+        ForeignKey("scholar_profiles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    crawl_run_id: Mapped[int | None] = mapped_column(ForeignKey("crawl_runs.id", ondelete="SET NULL"))
+    cstart: Mapped[int] = mapped_column(Integer, nullable=False)
+    page_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    body_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    codec: Mapped[str] = mapped_column(String(16), nullable=False, server_default=text("'gzip'"))
+    raw_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    stored_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    status_code: Mapped[int | None] = mapped_column(Integer)
+    requested_url: Mapped[str] = mapped_column(Text, nullable=False)
+    final_url: Mapped[str | None] = mapped_column(Text)
+    parse_state: Mapped[str] = mapped_column(String(32), nullable=False)
+    parse_state_reason: Mapped[str | None] = mapped_column(String(128))
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
 class Publication(Base):
     __tablename__ = "publications"
     __table_args__ = (
@@ -177,6 +297,11 @@ class Publication(Base):
             unique=True,
             postgresql_where=text("cluster_id IS NOT NULL"),
         ),
+        Index("ix_publications_citation_count_id", "citation_count", "id"),
+        Index("ix_publications_year_sort_id", text("coalesce(year, 2147483647)"), "id"),
+        Index("ix_publications_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_publications_dedup_title_tokens", "dedup_title_tokens", postgresql_using="gin"),
+        Index("ix_publications_title_normalized", "title_normalized", postgresql_using="hash"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -191,6 +316,15 @@ class Publication(Base):
     pub_url: Mapped[str | None] = mapped_column(Text)
     pdf_url: Mapped[str | None] = mapped_column(Text)
     canonical_title_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    # Precomputed near-duplicate keys; NULL until written by ingestion or the backfill job.
+    dedup_title_text: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
+    dedup_title_tokens: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True, deferred=True)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(PUBLICATION_SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+        deferred=True,
+    )
     openalex_enriched: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
     openalex_last_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -308,6 +442,8 @@ class ScholarPublication(Base):
     __table_args__ = (
         Index("ix_scholar_publications_is_read", "is_read"),
         Index("ix_scholar_publications_is_favorite", "is_favorite"),
+        Index("ix_scholar_publications_scholar_created", "scholar_profile_id", "created_at", "publication_id"),
+        Index("ix_scholar_publications_first_seen_run_id", "first_seen_run_id"),
     )
 
     scholar_profile_id: Mapped[int] = mapped_column(
@@ -324,6 +460,37 @@ class ScholarPublication(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
+class UserPublicationFeed(Base):
+    # One row per (user, publication) aggregated over the user's scholar links.
+    # Kept in sync by statement triggers on scholar_publications (migration 0028),
+    # serialized per (user, publication) by an advisory lock (migration 0036).
+    # Only the unscoped unread/favorite/total facet counts read it.
+    __tablename__ = "user_publication_feed"
+    __table_args__ = (
+        Index(
+            "ix_user_publication_feed_user_facets",
+            "user_id",
+            "is_unread",
+            "is_favorite",
+            "newest_run_id",
+        ),
+        Index("ix_user_publication_feed_newest_run_id", "newest_run_id"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    publication_id: Mapped[int] = mapped_column(
+        ForeignKey("publications.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    is_unread: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    is_favorite: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    first_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    newest_run_id: Mapped[int | None] = mapped_column(ForeignKey("crawl_runs.id", ondelete="SET NULL"))
+
+
 class IngestionQueueItem(Base):
     __tablename__ = "ingestion_queue_items"
     __table_args__ = (
@@ -338,6 +505,7 @@ class IngestionQueueItem(Base):
         ),
         Index("ix_ingestion_queue_next_attempt", "next_attempt_dt"),
         Index("ix_ingestion_queue_status_next_attempt", "status", "next_attempt_dt"),
+        Index("ix_ingestion_queue_last_run_id", "last_run_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
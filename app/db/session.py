@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 
 from app.logging_utils import structured_log
+from app.metrics import instrument_engine
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,7 @@ def get_engine() -> AsyncEngine:
             engine_kwargs["pool_timeout"] = max(1, int(settings.database_pool_timeout_seconds))
 
         _engine = create_async_engine(settings.database_url, **engine_kwargs)
+        instrument_engine(_engine.sync_engine)
         structured_log(
             logger,
             "info",
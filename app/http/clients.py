@@ -0,0 +1,246 @@
+"""Application-scoped outbound HTTP clients for metadata upstreams.
+
+OpenAlex, arXiv and Unpaywall (including the landing-page crawls it drives)
+each get one long-lived ``httpx.AsyncClient`` with its own connection limits,
+default timeout and user agent, so repeated lookups reuse keep-alive
+connections and TLS sessions instead of opening a fresh client per call.
+Clients are created in the app lifespan (or lazily on first use in scripts
+and tests) and closed on shutdown.
+
+Per-host statistics count requests and newly opened connections through the
+httpcore ``trace`` request extension; a request that did not open a TCP
+connection was served from the pool. Response latency per upstream and status
+class feeds ``scholarr_upstream_request_duration_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpcore
+import httpx
+
+from app import metrics
+from app.logging_utils import structured_log
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_OPENALEX = "openalex"
+UPSTREAM_ARXIV = "arxiv"
+UPSTREAM_UNPAYWALL = "unpaywall"
+DEFAULT_USER_AGENT = "scholar-scraper/1.0"
+OPENALEX_DEFAULT_TIMEOUT_SECONDS = 10.0
+MAX_TRACKED_HOSTS = 256
+OTHER_HOSTS_KEY = "(other)"
+_STARTED_EXTENSION = "scholarr.started"
+
+
+@dataclass(frozen=True)
+class UpstreamClientProfile:
+    name: str
+    timeout_seconds: float
+    max_connections: int
+
+
+@dataclass
+class _HostStats:
+    origin: httpcore.Origin | None
+    requests: int = 0
+    new_connections: int = 0
+
+
+_clients: dict[str, httpx.AsyncClient] = {}
+_clients_loop: asyncio.AbstractEventLoop | None = None
+_host_stats: dict[str, dict[str, _HostStats]] = {}
+
+
+def _profiles() -> dict[str, UpstreamClientProfile]:
+    return {
+        UPSTREAM_OPENALEX: UpstreamClientProfile(
+            name=UPSTREAM_OPENALEX,
+            timeout_seconds=OPENALEX_DEFAULT_TIMEOUT_SECONDS,
+            max_connections=max(int(settings.openalex_http_max_connections), 1),
+        ),
+        UPSTREAM_ARXIV: UpstreamClientProfile(
+            name=UPSTREAM_ARXIV,
+            timeout_seconds=max(float(settings.arxiv_timeout_seconds), 0.5),
+            max_connections=max(int(settings.arxiv_http_max_connections), 1),
+        ),
+        UPSTREAM_UNPAYWALL: UpstreamClientProfile(
+            name=UPSTREAM_UNPAYWALL,
+            timeout_seconds=max(float(settings.unpaywall_timeout_seconds), 0.5),
+            max_connections=max(int(settings.unpaywall_http_max_connections), 1),
+        ),
+    }
+
+
+def _origin(url: httpx.URL) -> httpcore.Origin:
+    return httpcore.Origin(
+        scheme=url.raw_scheme,
+        host=url.raw_host,
+        port=url.port or (443 if url.scheme == "https" else 80),
+    )
+
+
+def _stats_for(name: str, url: httpx.URL) -> _HostStats:
+    per_host = _host_stats.setdefault(name, {})
+    host = url.host
+    stats = per_host.get(host)
+    if stats is not None:
+        return stats
+    if len(per_host) >= MAX_TRACKED_HOSTS:
+        # Landing-page crawls reach an open-ended set of publisher hosts.
+        return per_host.setdefault(OTHER_HOSTS_KEY, _HostStats(origin=None))
+    stats = _HostStats(origin=_origin(url))
+    per_host[host] = stats
+    return stats
+
+
+def _request_hook(name: str):
+    async def _on_request(request: httpx.Request) -> None:
+        stats = _stats_for(name, request.url)
+        stats.requests += 1
+
+        async def _trace(event_name: str, _info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.new_connections += 1
+
+        request.extensions["trace"] = _trace
+        request.extensions[_STARTED_EXTENSION] = time.perf_counter()
+
+    return _on_request
+
+
+def _response_hook(name: str):
+    async def _on_response(response: httpx.Response) -> None:
+        # Hooks run once headers arrive; redirects are observed per hop.
+        started = response.request.extensions.get(_STARTED_EXTENSION)
+        if started is not None:
+            metrics.UPSTREAM_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                upstream=name,
+                status=metrics.status_class(response.status_code),
+            )
+
+    return _on_response
+
+
+def _build_client(profile: UpstreamClientProfile) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=profile.max_connections,
+        max_keepalive_connections=profile.max_connections,
+        keepalive_expiry=max(float(settings.upstream_http_keepalive_expiry_seconds), 0.0),
+    )
+    return httpx.AsyncClient(
+        timeout=profile.timeout_seconds,
+        limits=limits,
+        follow_redirects=True,
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+        event_hooks={"request": [_request_hook(profile.name)], "response": [_response_hook(profile.name)]},
+    )
+
+
+def _discard_clients(clients: dict[str, httpx.AsyncClient], loop: asyncio.AbstractEventLoop | None) -> None:
+    open_clients = {name: client for name, client in clients.items() if not client.is_closed}
+    if not open_clients:
+        return
+    # A pool can only be closed on the loop that opened its connections.
+    closing = False
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        for client in open_clients.values():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        closing = True
+    structured_log(
+        logger,
+        "warning",
+        "upstream_http.clients_replaced_on_new_loop",
+        clients=sorted(open_clients),
+        closed_on_previous_loop=closing,
+        stats={name: http_client_stats().get(name, {}) for name in open_clients},
+    )
+
+
+def _ensure_clients() -> dict[str, httpx.AsyncClient]:
+    global _clients, _clients_loop
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        # Pools are bound to the loop that opened their connections.
+        _discard_clients(_clients, _clients_loop)
+        _clients = {}
+        _clients_loop = loop
+    return _clients
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """Return the shared client for upstream ``name``, creating it if needed."""
+    profiles = _profiles()
+    if name not in profiles:
+        raise KeyError(f"Unknown upstream HTTP client: {name!r}")
+    clients = _ensure_clients()
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        client = _build_client(profiles[name])
+        clients[name] = client
+    return client
+
+
+async def start_http_clients() -> None:
+    for name in _profiles():
+        get_http_client(name)
+    structured_log(
+        logger,
+        "info",
+        "upstream_http.clients_started",
+        clients={name: profile.max_connections for name, profile in _profiles().items()},
+    )
+
+
+async def close_http_clients() -> None:
+    global _clients, _clients_loop
+    clients = _clients
+    _clients = {}
+    _clients_loop = None
+    if not clients:
+        return
+    summary = http_client_stats()
+    for client in clients.values():
+        if not client.is_closed:
+            await client.aclose()
+    structured_log(logger, "info", "upstream_http.clients_closed", stats=summary)
+
+
+def _open_connections(client: httpx.AsyncClient | None, origin: httpcore.Origin | None) -> int:
+    # httpx does not expose its transport's pool, but httpcore's pool and
+    # connection objects are public API.
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    if pool is None or origin is None:
+        return 0
+    return sum(
+        1 for connection in pool.connections if connection.can_handle_request(origin) and not connection.is_closed()
+    )
+
+
+def http_client_stats() -> dict[str, dict[str, dict[str, float | int]]]:
+    """Per upstream and host: open connections, requests and connection reuse ratio."""
+    report: dict[str, dict[str, dict[str, float | int]]] = {}
+    for name, per_host in _host_stats.items():
+        client = _clients.get(name)
+        report[name] = {}
+        for host, stats in per_host.items():
+            reused = max(stats.requests - stats.new_connections, 0)
+            report[name][host] = {
+                "open_connections": _open_connections(client, stats.origin),
+                "requests": stats.requests,
+                "new_connections": stats.new_connections,
+                "reuse_ratio": round(reused / stats.requests, 4) if stats.requests else 0.0,
+            }
+    return report
+
+
+def reset_http_client_stats() -> None:
+    _host_stats.clear()
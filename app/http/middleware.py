@@ -8,6 +8,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from app import metrics
 from app.logging_context import set_request_id
 from app.logging_utils import structured_log
 
@@ -42,6 +43,27 @@ DEFAULT_CSP_DOCS_POLICY = (
 logger = logging.getLogger(__name__)
 
 
+def _route_template(request: Request) -> str:
+    # The router stores the matched route in the shared ASGI scope; labelling by
+    # its template keeps path parameters out of the metric series.
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "(unmatched)"
+
+
+def _observe_request(
+    request: Request,
+    *,
+    status_code: int,
+    seconds: float,
+    db_time: metrics.DbTime | None,
+) -> None:
+    route = _route_template(request)
+    metrics.HTTP_REQUEST_SECONDS.observe(seconds, method=request.method, route=route, status=str(status_code))
+    if db_time is not None:
+        metrics.HTTP_REQUEST_DB_SECONDS.observe(db_time.seconds, method=request.method, route=route)
+        metrics.HTTP_REQUEST_DB_STATEMENTS.observe(db_time.statements, method=request.method, route=route)
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     def __init__(
         self,
@@ -71,9 +93,12 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             )
 
         try:
-            response = await call_next(request)
+            with metrics.track_db_time() as db_time:
+                response = await call_next(request)
         except Exception:
-            duration_ms = int((time.perf_counter() - start) * 1000)
+            elapsed = time.perf_counter() - start
+            duration_ms = int(elapsed * 1000)
+            _observe_request(request, status_code=500, seconds=elapsed, db_time=None)
             structured_log(
                 logger,
                 "exception",
@@ -84,7 +109,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             )
             raise
         else:
-            duration_ms = int((time.perf_counter() - start) * 1000)
+            elapsed = time.perf_counter() - start
+            duration_ms = int(elapsed * 1000)
+            _observe_request(request, status_code=response.status_code, seconds=elapsed, db_time=db_time)
             response.headers[REQUEST_ID_HEADER] = request_id
             if should_log:
                 structured_log(
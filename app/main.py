@@ -11,8 +11,10 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from app.api.errors import register_api_exception_handlers
 from app.api.media import router as media_router
+from app.api.metrics import router as metrics_router
 from app.api.router import router as api_router
 from app.db.session import check_database, close_engine
+from app.http.clients import close_http_clients, start_http_clients
 from app.http.middleware import (
     RequestLoggingMiddleware,
     SecurityHeadersMiddleware,
@@ -22,6 +24,9 @@ from app.logging_config import configure_logging, parse_redact_fields
 from app.logging_utils import structured_log
 from app.security.csrf import CSRFMiddleware
 from app.services.ingestion.scheduler import SchedulerService
+from app.services.runs.events import start_run_events, stop_run_events
+from app.services.scholar.http_client import close_scholar_http_client
+from app.services.scholar.parse_executor import start_parse_executor, stop_parse_executor
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -46,6 +51,7 @@ scheduler_service = SchedulerService(
     continuation_max_delay_seconds=settings.ingestion_continuation_max_delay_seconds,
     continuation_max_attempts=settings.ingestion_continuation_max_attempts,
     queue_batch_size=settings.scheduler_queue_batch_size,
+    max_concurrent_runs=settings.scheduler_max_concurrent_runs,
 )
 
 
@@ -101,9 +107,16 @@ async def lifespan(_: FastAPI):
             error=str(exc),
         )
 
+    await start_http_clients()
+    await start_parse_executor()
+    await start_run_events()
     await scheduler_service.start()
     yield
     await scheduler_service.stop()
+    await stop_run_events()
+    await stop_parse_executor()
+    await close_scholar_http_client()
+    await close_http_clients()
     await close_engine()
 
 
@@ -141,6 +154,7 @@ app.add_middleware(
 )
 app.include_router(api_router)
 app.include_router(media_router)
+app.include_router(metrics_router)
 
 
 @app.get("/healthz")
@@ -0,0 +1,375 @@
+"""Process-local latency histograms and gauges in the Prometheus text format.
+
+Instrumented code observes into the module-level metrics below and the
+admin-only ``GET /metrics`` endpoint renders them. Values live in this process
+and reset on restart, so with several workers or replicas each reports its own
+series. Label values must come from small fixed sets (route templates,
+upstream names, outcomes), never from ids or URLs.
+"""
+
+from __future__ import annotations
+
+import abc
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Network calls and rate-limit waits run from milliseconds to minutes.
+SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: list[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+
+class _Metric(abc.ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, *, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _label_pairs(self, key: tuple[str, ...]) -> list[tuple[str, str]]:
+        return list(zip(self.labelnames, key, strict=True))
+
+    @abc.abstractmethod
+    def _samples(self) -> list[str]: ...
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+
+@dataclass
+class _HistogramSeries:
+    bucket_counts: list[int]
+    total: float = 0.0
+
+
+_observations: ContextVar[dict[str, list[float]] | None] = ContextVar("observations", default=None)
+
+
+@contextmanager
+def collect_observations() -> Iterator[dict[str, list[float]]]:
+    """Keep every histogram observation of the current task (and tasks it starts) while open.
+
+    Values are grouped by metric name, for callers such as benchmarks that
+    need exact percentiles rather than bucket counts.
+    """
+    collected: dict[str, list[float]] = {}
+    token = _observations.set(collected)
+    try:
+        yield collected
+    finally:
+        _observations.reset(token)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames=labelnames)
+        self._buckets = tuple(sorted(float(bound) for bound in buckets))
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        collected = _observations.get()
+        if collected is not None:
+            collected.setdefault(self.name, []).append(value)
+        # Buckets are upper-inclusive; the last slot is the implicit +Inf bucket.
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _HistogramSeries(bucket_counts=[0] * (len(self._buckets) + 1))
+                self._series[key] = series
+            series.bucket_counts[index] += 1
+            series.total += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            snapshot = [(key, list(series.bucket_counts), series.total) for key, series in self._series.items()]
+        lines: list[str] = []
+        for key, bucket_counts, total in sorted(snapshot):
+            pairs = self._label_pairs(key)
+            cumulative = 0
+            for bound, count in zip((*self._buckets, math.inf), bucket_counts, strict=True):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels([*pairs, ('le', _format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {cumulative}")
+        return lines
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, *, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames=labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def clear(self) -> None:
+        """Forget every series, so label sets missing from the next sample disappear."""
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            snapshot = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self._label_pairs(key))} {_format_value(value)}" for key, value in snapshot
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register[MetricT: _Metric](self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_http_request_duration_seconds",
+        "API request latency until the response starts, by route template.",
+        labelnames=("method", "route", "status"),
+    )
+)
+HTTP_REQUEST_DB_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_http_request_db_seconds",
+        "Time spent executing SQL statements per API request.",
+        labelnames=("method", "route"),
+    )
+)
+HTTP_REQUEST_DB_STATEMENTS = REGISTRY.register(
+    Histogram(
+        "scholarr_http_request_db_statements",
+        "SQL statements executed per API request.",
+        labelnames=("method", "route"),
+        buckets=COUNT_BUCKETS,
+    )
+)
+SCHOLAR_FETCH_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_scholar_fetch_duration_seconds",
+        "Google Scholar fetch latency by outcome, excluding the wait for a request slot.",
+        labelnames=("outcome",),
+        buckets=SLOW_BUCKETS,
+    )
+)
+SCHOLAR_PARSE_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_scholar_parse_duration_seconds",
+        "Scholar page parse time, in the worker pool or inline.",
+        labelnames=("mode",),
+    )
+)
+SCHOLAR_PARSE_QUEUE_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_scholar_parse_queue_wait_seconds",
+        "Wait between submitting a page to the parse pool and a worker starting on it.",
+    )
+)
+INGESTION_PAGE_DEDUPE_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_ingestion_page_dedupe_duration_seconds",
+        "Time to drop candidates of one fetched profile page already seen earlier in the crawl.",
+    )
+)
+INGESTION_PAGE_UPSERT_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_ingestion_page_upsert_duration_seconds",
+        "Time to upsert the publications of one fetched profile page.",
+    )
+)
+INGESTION_ENRICHMENT_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_ingestion_enrichment_duration_seconds",
+        "Time to enrich the publications discovered by one run, inline or in the background.",
+        labelnames=("mode",),
+        buckets=SLOW_BUCKETS,
+    )
+)
+UPSTREAM_REQUEST_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_upstream_request_duration_seconds",
+        "Metadata upstream call latency by upstream and status class (2xx, 4xx, 5xx or error).",
+        labelnames=("upstream", "status"),
+        buckets=SLOW_BUCKETS,
+    )
+)
+UPSTREAM_SLOT_WAIT_SECONDS = REGISTRY.register(
+    Histogram(
+        "scholarr_upstream_slot_wait_seconds",
+        "Time spent waiting for a rate-limit slot before calling an upstream.",
+        labelnames=("upstream",),
+        buckets=SLOW_BUCKETS,
+    )
+)
+QUEUE_ITEMS = REGISTRY.register(
+    Gauge(
+        "scholarr_queue_items",
+        "Ingestion continuation and PDF resolution queue items by status, sampled at scrape time.",
+        labelnames=("queue", "status"),
+    )
+)
+DB_POOL_CONNECTIONS = REGISTRY.register(
+    Gauge(
+        "scholarr_db_pool_connections",
+        "Database pool connections by state, sampled at scrape time.",
+        labelnames=("state",),
+    )
+)
+
+UPSTREAM_HTTP_OPEN_CONNECTIONS = REGISTRY.register(
+    Gauge(
+        "scholarr_upstream_http_open_connections",
+        "Open pooled connections of each shared upstream HTTP client by host, sampled at scrape time.",
+        labelnames=("upstream", "host"),
+    )
+)
+UPSTREAM_HTTP_REQUESTS = REGISTRY.register(
+    Gauge(
+        "scholarr_upstream_http_requests",
+        "Requests sent by each shared upstream HTTP client by host since the process started.",
+        labelnames=("upstream", "host"),
+    )
+)
+UPSTREAM_HTTP_REUSE_RATIO = REGISTRY.register(
+    Gauge(
+        "scholarr_upstream_http_connection_reuse_ratio",
+        "Share of upstream requests by host that reused a pooled connection instead of opening one.",
+        labelnames=("upstream", "host"),
+    )
+)
+
+
+def status_class(status_code: int | None) -> str:
+    if status_code is None:
+        return "error"
+    return f"{int(status_code) // 100}xx"
+
+
+@dataclass
+class DbTime:
+    seconds: float = 0.0
+    statements: int = 0
+
+
+_db_time: ContextVar[DbTime | None] = ContextVar("db_time", default=None)
+
+
+@contextmanager
+def track_db_time() -> Iterator[DbTime]:
+    """Accumulate SQL execution time of the current task (and tasks it starts) while open."""
+    tracker = DbTime()
+    token = _db_time.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _db_time.reset(token)
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    if context is not None and _db_time.get() is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    tracker = _db_time.get()
+    started = getattr(context, "_metrics_started", None)
+    if tracker is None or started is None:
+        return
+    tracker.seconds += time.perf_counter() - started
+    tracker.statements += 1
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Feed statement timings of ``engine`` into the active ``track_db_time`` block."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def sample_db_pool(pool: Any) -> None:
+    DB_POOL_CONNECTIONS.clear()
+    # NullPool (used in tests and local runs) keeps no connections to report.
+    if not hasattr(pool, "checkedout"):
+        return
+    DB_POOL_CONNECTIONS.set(pool.checkedout(), state="checked_out")
+    DB_POOL_CONNECTIONS.set(pool.checkedin(), state="idle")
+    DB_POOL_CONNECTIONS.set(max(pool.overflow(), 0), state="overflow")
+
+
+def sample_http_clients(stats: dict[str, dict[str, dict[str, float | int]]]) -> None:
+    """Publish ``app.http.clients.http_client_stats()`` (hosts are capped there)."""
+    for gauge in (UPSTREAM_HTTP_OPEN_CONNECTIONS, UPSTREAM_HTTP_REQUESTS, UPSTREAM_HTTP_REUSE_RATIO):
+        gauge.clear()
+    for upstream, per_host in stats.items():
+        for host, values in per_host.items():
+            UPSTREAM_HTTP_OPEN_CONNECTIONS.set(values["open_connections"], upstream=upstream, host=host)
+            UPSTREAM_HTTP_REQUESTS.set(values["requests"], upstream=upstream, host=host)
+            UPSTREAM_HTTP_REUSE_RATIO.set(values["reuse_ratio"], upstream=upstream, host=host)
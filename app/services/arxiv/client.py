@@ -5,6 +5,7 @@ from collections.abc import Awaitable, Callable
 
 import httpx
 
+from app.http.clients import UPSTREAM_ARXIV, get_http_client
 from app.logging_utils import structured_log
 from app.services.arxiv.cache import (
     build_query_fingerprint,
@@ -231,8 +232,8 @@ async def _request_arxiv_feed(
     async def _fetch() -> httpx.Response:
         timeout_value = _timeout_seconds(timeout_seconds)
         headers = {"User-Agent": f"scholar-scraper/1.0 (mailto:{_contact_email(request_email)})"}
-        async with httpx.AsyncClient(timeout=timeout_value, follow_redirects=True, headers=headers) as client:
-            return await client.get(_ARXIV_API_URL, params=params)  # type: ignore[arg-type]
+        client = get_http_client(UPSTREAM_ARXIV)
+        return await client.get(_ARXIV_API_URL, params=params, headers=headers, timeout=timeout_value)  # type: ignore[arg-type]
 
     return await run_with_global_arxiv_limit(
         fetch=_fetch,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -10,6 +11,7 @@ import httpx
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import metrics
 from app.db.models import ArxivRuntimeState
 from app.db.session import get_session_factory
 from app.logging_utils import structured_log
@@ -68,6 +70,7 @@ async def _run_serialized_fetch(
     source_path: str,
 ) -> tuple[httpx.Response, bool]:
     session_factory = get_session_factory()
+    wait_started = time.perf_counter()
     async with session_factory() as lock_session:
         await _acquire_arxiv_lock(lock_session)
         try:
@@ -81,6 +84,7 @@ async def _run_serialized_fetch(
 
             if wait_seconds > 0:
                 await asyncio.sleep(wait_seconds)
+            metrics.UPSTREAM_SLOT_WAIT_SECONDS.observe(time.perf_counter() - wait_started, upstream="arxiv")
             response = await fetch()
 
             async with session_factory() as db_session, db_session.begin():
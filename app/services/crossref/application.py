@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 from crossref.restful import Etiquette, Works
 
+from app import metrics
 from app.logging_utils import structured_log
 from app.services.doi.normalize import normalize_doi
 from app.settings import settings
@@ -310,7 +311,26 @@ def _fetch_items_sync(
     email: str | None,
     min_interval_seconds: float,
 ) -> list[dict]:
-    _rate_limit_wait(min_interval_seconds)
+    with metrics.UPSTREAM_SLOT_WAIT_SECONDS.time(upstream="crossref"):
+        _rate_limit_wait(min_interval_seconds)
+    started = time.perf_counter()
+    try:
+        items = _query_items_sync(query=query, author=author, date_range=date_range, max_rows=max_rows, email=email)
+    except Exception:
+        metrics.UPSTREAM_REQUEST_SECONDS.observe(time.perf_counter() - started, upstream="crossref", status="error")
+        raise
+    metrics.UPSTREAM_REQUEST_SECONDS.observe(time.perf_counter() - started, upstream="crossref", status="2xx")
+    return items
+
+
+def _query_items_sync(
+    *,
+    query: str,
+    author: str | None,
+    date_range: tuple[str, str] | None,
+    max_rows: int,
+    email: str | None,
+) -> list[dict]:
     works = _works_client(email)
     params = {"bibliographic": query}
     if author:
@@ -362,6 +382,8 @@ async def discover_doi_for_publication(
     max_rows: int = 10,
     email: str | None = None,
 ) -> str | None:
+    if not settings.crossref_enabled:
+        return None
     title = (item.title or "").strip()
     query = _normalized_query(title)
     if not query:
@@ -1,13 +1,24 @@
 from app.services.dbops.application import run_publication_link_repair
+from app.services.dbops.dedup_key_backfill import run_publication_dedup_key_backfill
 from app.services.dbops.integrity import collect_integrity_report
 from app.services.dbops.near_duplicate_repair import (
     run_publication_near_duplicate_repair,
 )
+from app.services.dbops.page_archive_prune import run_page_archive_prune
+from app.services.dbops.page_archive_reparse import run_page_archive_reparse
+from app.services.dbops.publication_feed_rebuild import run_publication_feed_rebuild
 from app.services.dbops.query import list_repair_jobs
+from app.services.dbops.retention import db_retention_due, run_db_retention
 
 __all__ = [
     "collect_integrity_report",
+    "db_retention_due",
     "list_repair_jobs",
+    "run_db_retention",
+    "run_page_archive_prune",
+    "run_page_archive_reparse",
+    "run_publication_dedup_key_backfill",
+    "run_publication_feed_rebuild",
     "run_publication_link_repair",
     "run_publication_near_duplicate_repair",
 ]
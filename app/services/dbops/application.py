@@ -185,6 +185,8 @@ async def _reset_scholar_tracking_state(
             baseline_completed=False,
             last_initial_page_fingerprint_sha256=None,
             last_initial_page_checked_at=None,
+            no_change_streak=0,
+            last_change_check_dt=None,
             last_run_dt=None,
             last_run_status=None,
         )
@@ -0,0 +1,168 @@
+"""Backfill of the near-duplicate title keys on existing publications.
+
+Publications are filled in keyset batches, each committed on its own with the
+job's progress, so no row lock outlives one batch. A failed run keeps the
+batches it completed, and the next run picks up the rows still missing keys.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import DataRepairJob, Publication
+from app.services.dbops.application import (
+    REPAIR_STATUS_COMPLETED,
+    REPAIR_STATUS_FAILED,
+    REPAIR_STATUS_PLANNED,
+    REPAIR_STATUS_RUNNING,
+)
+from app.services.ingestion.fingerprints import near_duplicate_title_keys
+
+DEDUP_KEY_BACKFILL_JOB_NAME = "backfill_publication_dedup_keys"
+DEDUP_KEY_BACKFILL_DEFAULT_BATCH_SIZE = 1000
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _normalized_batch_size(value: int) -> int:
+    return max(1, min(int(value), 10_000))
+
+
+async def _create_job(
+    db_session: AsyncSession,
+    *,
+    requested_by: str | None,
+    scope: dict[str, Any],
+    dry_run: bool,
+) -> DataRepairJob:
+    job = DataRepairJob(
+        job_name=DEDUP_KEY_BACKFILL_JOB_NAME,
+        requested_by=(requested_by or "").strip() or None,
+        scope=scope,
+        dry_run=bool(dry_run),
+        status=REPAIR_STATUS_PLANNED,
+        summary={},
+    )
+    db_session.add(job)
+    await db_session.flush()
+    job.status = REPAIR_STATUS_RUNNING
+    job.started_at = _utcnow()
+    # Committed up front: publications are updated in separately committed batches.
+    await db_session.commit()
+    return job
+
+
+async def _count_missing_keys(db_session: AsyncSession) -> int:
+    result = await db_session.execute(
+        select(func.count()).select_from(Publication).where(Publication.dedup_title_text.is_(None))
+    )
+    return int(result.scalar_one() or 0)
+
+
+async def _backfill_batch(
+    db_session: AsyncSession,
+    *,
+    after_id: int,
+    batch_size: int,
+) -> tuple[int, int]:
+    """Fill one keyset page of publications; return (rows updated, last id seen)."""
+    result = await db_session.execute(
+        select(Publication.id, Publication.title_raw)
+        .where(Publication.id > after_id, Publication.dedup_title_text.is_(None))
+        .order_by(Publication.id.asc())
+        .limit(batch_size)
+    )
+    rows = result.all()
+    if not rows:
+        return 0, after_id
+    values = []
+    for publication_id, title_raw in rows:
+        canonical_text, tokens = near_duplicate_title_keys(str(title_raw or ""))
+        values.append(
+            {
+                "id": int(publication_id),
+                "dedup_title_text": canonical_text,
+                "dedup_title_tokens": tokens,
+            }
+        )
+    await db_session.execute(update(Publication), values)
+    return len(values), int(rows[-1][0])
+
+
+async def _complete_job(
+    db_session: AsyncSession,
+    *,
+    job: DataRepairJob,
+    scope: dict[str, Any],
+    summary: dict[str, Any],
+) -> dict[str, Any]:
+    job.status = REPAIR_STATUS_COMPLETED
+    job.finished_at = _utcnow()
+    job.summary = summary
+    await db_session.commit()
+    return {
+        "job_id": int(job.id),
+        "status": job.status,
+        "scope": scope,
+        "summary": summary,
+    }
+
+
+async def _fail_job(db_session: AsyncSession, *, job_id: int, error: Exception) -> None:
+    await db_session.rollback()
+    job = await db_session.get(DataRepairJob, job_id)
+    if job is None:
+        return
+    # The summary keeps the progress of the last committed batch.
+    job.status = REPAIR_STATUS_FAILED
+    job.error_text = str(error)
+    job.finished_at = _utcnow()
+    await db_session.commit()
+
+
+async def run_publication_dedup_key_backfill(
+    db_session: AsyncSession,
+    *,
+    dry_run: bool = True,
+    batch_size: int = DEDUP_KEY_BACKFILL_DEFAULT_BATCH_SIZE,
+    requested_by: str | None = None,
+) -> dict[str, Any]:
+    """Store near-duplicate title keys on publications that do not have them yet."""
+    bounded_batch_size = _normalized_batch_size(batch_size)
+    scope = {"batch_size": bounded_batch_size}
+    job = await _create_job(db_session, requested_by=requested_by, scope=scope, dry_run=dry_run)
+    job_id = int(job.id)
+    try:
+        summary: dict[str, Any] = {
+            "dry_run": bool(dry_run),
+            "missing_before": await _count_missing_keys(db_session),
+            "updated_publications": 0,
+            "batches": 0,
+            "last_publication_id": 0,
+        }
+        while not dry_run:
+            count, last_id = await _backfill_batch(
+                db_session,
+                after_id=summary["last_publication_id"],
+                batch_size=bounded_batch_size,
+            )
+            if count == 0:
+                break
+            summary = {
+                **summary,
+                "updated_publications": summary["updated_publications"] + count,
+                "batches": summary["batches"] + 1,
+                "last_publication_id": last_id,
+            }
+            job.summary = summary
+            await db_session.commit()
+        return await _complete_job(db_session, job=job, scope=scope, summary=summary)
+    except Exception as exc:
+        await _fail_job(db_session, job_id=job_id, error=exc)
+        raise
@@ -3,9 +3,10 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import DataRepairJob
+from app.db.models import DataRepairJob, Publication
 from app.services.dbops.application import (
     REPAIR_STATUS_COMPLETED,
     REPAIR_STATUS_FAILED,
@@ -47,6 +48,7 @@ def _scope_payload(
     max_year_delta: int,
     max_clusters: int,
     selected_cluster_keys: list[str],
+    incremental: bool,
 ) -> dict[str, Any]:
     return {
         "similarity_threshold": float(similarity_threshold),
@@ -54,9 +56,56 @@ def _scope_payload(
         "max_year_delta": int(max_year_delta),
         "max_clusters": int(max_clusters),
         "selected_cluster_keys": selected_cluster_keys,
+        "incremental": bool(incremental),
     }
 
 
+async def _last_scanned_publication_id(db_session: AsyncSession) -> int | None:
+    """Publication id covered by the last applied scan; previews never move it."""
+    result = await db_session.execute(
+        select(DataRepairJob.summary)
+        .where(
+            DataRepairJob.job_name == NEAR_DUP_JOB_NAME,
+            DataRepairJob.status == REPAIR_STATUS_COMPLETED,
+            DataRepairJob.dry_run.is_(False),
+        )
+        .order_by(DataRepairJob.id.desc())
+        .limit(1)
+    )
+    summary = result.scalar_one_or_none() or {}
+    value = summary.get("scanned_through_publication_id")
+    return int(value) if value is not None else None
+
+
+async def _max_publication_id(db_session: AsyncSession) -> int:
+    result = await db_session.execute(select(func.max(Publication.id)))
+    return int(result.scalar_one() or 0)
+
+
+def _applied_watermark(
+    *,
+    clusters: list[dedup_service.NearDuplicateCluster],
+    selected_clusters: list[dedup_service.NearDuplicateCluster],
+    after_publication_id: int | None,
+    scanned_through: int,
+) -> int:
+    """Keep clusters that were found but not merged ahead of the watermark.
+
+    The next incremental scan starts just below the lowest member of any
+    unmerged cluster, so every one of them is offered again.
+    """
+    selected_keys = {cluster.cluster_key for cluster in selected_clusters}
+    unmerged_ids = [
+        int(member.publication_id)
+        for cluster in clusters
+        if cluster.cluster_key not in selected_keys
+        for member in cluster.members
+    ]
+    if not unmerged_ids:
+        return scanned_through
+    return max(min(unmerged_ids) - 1, after_publication_id or 0)
+
+
 async def _create_job(
     db_session: AsyncSession,
     *,
@@ -129,6 +178,8 @@ def _summary_payload(
     missing_count: int,
     merged_publications: int,
     max_clusters: int,
+    after_publication_id: int | None,
+    scanned_through_publication_id: int,
 ) -> dict[str, Any]:
     return {
         "dry_run": bool(dry_run),
@@ -137,6 +188,8 @@ def _summary_payload(
         "missing_selected_cluster_count": int(missing_count),
         "merged_publications": int(merged_publications),
         "preview_cluster_count": int(min(cluster_count, max_clusters)),
+        "after_publication_id": after_publication_id,
+        "scanned_through_publication_id": int(scanned_through_publication_id),
     }
 
 
@@ -183,7 +236,14 @@ async def run_publication_near_duplicate_repair(
     max_clusters: int = NEAR_DUP_DEFAULT_MAX_CLUSTERS,
     selected_cluster_keys: list[str] | None = None,
     requested_by: str | None = None,
+    incremental: bool = False,
 ) -> dict[str, Any]:
+    """Preview or merge near-duplicate clusters.
+
+    An ``incremental`` scan only checks publications created after the last
+    applied scan, so previews skip pairs that were already reviewed. Clusters
+    an applied scan found but did not merge stay ahead of its watermark.
+    """
     normalized_keys = _normalized_cluster_keys(selected_cluster_keys)
     bounded_clusters = _normalized_max_clusters(max_clusters)
     scope = _scope_payload(
@@ -192,14 +252,18 @@ async def run_publication_near_duplicate_repair(
         max_year_delta=max_year_delta,
         max_clusters=bounded_clusters,
         selected_cluster_keys=normalized_keys,
+        incremental=incremental,
     )
+    after_publication_id = await _last_scanned_publication_id(db_session) if incremental else None
     job = await _create_job(db_session, requested_by=requested_by, scope=scope, dry_run=dry_run)
     try:
+        scanned_through = await _max_publication_id(db_session)
         clusters = await dedup_service.find_near_duplicate_clusters(
             db_session,
             similarity_threshold=similarity_threshold,
             min_shared_tokens=min_shared_tokens,
             max_year_delta=max_year_delta,
+            after_publication_id=after_publication_id,
         )
         selected, missing = _selected_clusters(clusters=clusters, selected_cluster_keys=normalized_keys)
         merged_publications = 0
@@ -207,6 +271,12 @@ async def run_publication_near_duplicate_repair(
             if not selected:
                 raise ValueError("No selected near-duplicate clusters matched current data.")
             merged_publications = await _merge_selected_clusters(db_session, selected_clusters=selected)
+            scanned_through = _applied_watermark(
+                clusters=clusters,
+                selected_clusters=selected,
+                after_publication_id=after_publication_id,
+                scanned_through=scanned_through,
+            )
         preview = _clusters_payload(clusters=clusters, max_clusters=bounded_clusters)
         summary = _summary_payload(
             dry_run=dry_run,
@@ -215,6 +285,8 @@ async def run_publication_near_duplicate_repair(
             missing_count=len(missing),
             merged_publications=merged_publications,
             max_clusters=bounded_clusters,
+            after_publication_id=after_publication_id,
+            scanned_through_publication_id=scanned_through,
         )
         return await _complete_job(
             db_session,
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import DataRepairJob, ScholarPageArchiveEntry
+from app.services.dbops.application import (
+    REPAIR_STATUS_COMPLETED,
+    REPAIR_STATUS_FAILED,
+    REPAIR_STATUS_PLANNED,
+    REPAIR_STATUS_RUNNING,
+)
+from app.services.ingestion import page_archive
+from app.settings import settings
+
+PAGE_ARCHIVE_PRUNE_JOB_NAME = "prune_scholar_page_archive"
+PAGE_ARCHIVE_PRUNE_BATCH_SIZE = 5000
+# Ingestion writes a page file before its entry commits; younger files are never orphans.
+ORPHAN_BLOB_GRACE_SECONDS = 86_400
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+async def _create_job(
+    db_session: AsyncSession,
+    *,
+    requested_by: str | None,
+    scope: dict[str, Any],
+    dry_run: bool,
+) -> DataRepairJob:
+    job = DataRepairJob(
+        job_name=PAGE_ARCHIVE_PRUNE_JOB_NAME,
+        requested_by=(requested_by or "").strip() or None,
+        scope=scope,
+        dry_run=bool(dry_run),
+        status=REPAIR_STATUS_PLANNED,
+        summary={},
+    )
+    db_session.add(job)
+    await db_session.flush()
+    job.status = REPAIR_STATUS_RUNNING
+    job.started_at = _utcnow()
+    # Committed up front: entries are deleted in separately committed batches.
+    await db_session.commit()
+    return job
+
+
+def _expired_entry_ids(*, cutoff: datetime, keep_latest: int):
+    ranked = select(
+        ScholarPageArchiveEntry.id,
+        ScholarPageArchiveEntry.fetched_at,
+        func.row_number()
+        .over(
+            partition_by=(ScholarPageArchiveEntry.scholar_profile_id, ScholarPageArchiveEntry.cstart),
+            order_by=(ScholarPageArchiveEntry.fetched_at.desc(), ScholarPageArchiveEntry.id.desc()),
+        )
+        .label("capture_rank"),
+    ).subquery()
+    return select(ranked.c.id).where(ranked.c.fetched_at < cutoff, ranked.c.capture_rank > keep_latest)
+
+
+async def _count_expired(db_session: AsyncSession, *, cutoff: datetime, keep_latest: int) -> int:
+    stmt = _expired_entry_ids(cutoff=cutoff, keep_latest=keep_latest)
+    result = await db_session.execute(select(func.count()).select_from(stmt.subquery()))
+    return int(result.scalar_one() or 0)
+
+
+async def _delete_expired(db_session: AsyncSession, *, cutoff: datetime, keep_latest: int) -> int:
+    deleted = 0
+    while True:
+        ids = list(
+            (
+                await db_session.execute(
+                    _expired_entry_ids(cutoff=cutoff, keep_latest=keep_latest).limit(PAGE_ARCHIVE_PRUNE_BATCH_SIZE)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if not ids:
+            return deleted
+        await db_session.execute(delete(ScholarPageArchiveEntry).where(ScholarPageArchiveEntry.id.in_(ids)))
+        await db_session.commit()
+        deleted += len(ids)
+
+
+async def _referenced_digests(db_session: AsyncSession) -> set[str]:
+    result = await db_session.execute(select(ScholarPageArchiveEntry.body_sha256).distinct())
+    return {str(value) for value in result.scalars().all()}
+
+
+async def _fail_job(db_session: AsyncSession, *, job_id: int, error: Exception) -> None:
+    await db_session.rollback()
+    job = await db_session.get(DataRepairJob, job_id)
+    if job is None:
+        return
+    job.status = REPAIR_STATUS_FAILED
+    job.error_text = str(error)
+    job.finished_at = _utcnow()
+    await db_session.commit()
+
+
+async def run_page_archive_prune(
+    db_session: AsyncSession,
+    *,
+    retention_days: int | None = None,
+    keep_latest: int | None = None,
+    dry_run: bool = True,
+    requested_by: str | None = None,
+) -> dict[str, Any]:
+    """Apply archive retention, then delete page files no entry references.
+
+    Entries older than ``retention_days`` go, except the ``keep_latest`` newest
+    captures of each scholar page, so re-parsing always has a copy to work from.
+    """
+    bounded_days = max(
+        int(retention_days if retention_days is not None else settings.ingestion_page_archive_retention_days), 0
+    )
+    bounded_keep = max(int(keep_latest if keep_latest is not None else settings.ingestion_page_archive_keep_latest), 0)
+    scope = {"retention_days": bounded_days, "keep_latest": bounded_keep}
+    job = await _create_job(db_session, requested_by=requested_by, scope=scope, dry_run=dry_run)
+    job_id = int(job.id)
+    try:
+        cutoff = _utcnow() - timedelta(days=bounded_days)
+        root = page_archive.archive_root()
+        expired = await _count_expired(db_session, cutoff=cutoff, keep_latest=bounded_keep)
+        deleted_entries = orphan_blobs_deleted = bytes_reclaimed = 0
+        if not dry_run:
+            deleted_entries = await _delete_expired(db_session, cutoff=cutoff, keep_latest=bounded_keep)
+            orphan_blobs_deleted, bytes_reclaimed = await asyncio.to_thread(
+                page_archive.delete_unreferenced_blobs,
+                root,
+                referenced=await _referenced_digests(db_session),
+                grace_seconds=ORPHAN_BLOB_GRACE_SECONDS,
+            )
+        blobs = await asyncio.to_thread(page_archive.scan_blobs, root)
+        summary = {
+            "dry_run": bool(dry_run),
+            "expired_entries": expired,
+            "deleted_entries": deleted_entries,
+            "orphan_blobs_deleted": orphan_blobs_deleted,
+            "bytes_reclaimed": bytes_reclaimed,
+            "disk_blob_count": len(blobs),
+            "disk_bytes": sum(blob.size_bytes for blob in blobs),
+        }
+        job.status = REPAIR_STATUS_COMPLETED
+        job.finished_at = _utcnow()
+        job.summary = summary
+        await db_session.commit()
+        return {"job_id": job_id, "status": job.status, "scope": scope, "summary": summary}
+    except Exception as exc:
+        await _fail_job(db_session, job_id=job_id, error=exc)
+        raise
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import CrawlRun, DataRepairJob, ScholarPageArchiveEntry, ScholarProfile
+from app.services.dbops.application import (
+    REPAIR_STATUS_COMPLETED,
+    REPAIR_STATUS_FAILED,
+    REPAIR_STATUS_PLANNED,
+    REPAIR_STATUS_RUNNING,
+)
+from app.services.ingestion import page_archive
+from app.services.ingestion.fingerprints import dedupe_publication_candidates
+from app.services.ingestion.publication_upsert import upsert_profile_publications
+from app.services.scholar import parse_executor
+from app.services.scholar.parser import ParsedProfilePage, ParseState, ScholarParserError
+from app.services.scholar.source import FetchResult
+
+PAGE_ARCHIVE_REPARSE_JOB_NAME = "reparse_scholar_page_archive"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+async def _create_job(
+    db_session: AsyncSession,
+    *,
+    requested_by: str | None,
+    scope: dict[str, Any],
+    dry_run: bool,
+) -> DataRepairJob:
+    job = DataRepairJob(
+        job_name=PAGE_ARCHIVE_REPARSE_JOB_NAME,
+        requested_by=(requested_by or "").strip() or None,
+        scope=scope,
+        dry_run=bool(dry_run),
+        status=REPAIR_STATUS_PLANNED,
+        summary={},
+    )
+    db_session.add(job)
+    await db_session.flush()
+    job.status = REPAIR_STATUS_RUNNING
+    job.started_at = _utcnow()
+    # Committed up front: the publication upsert commits per page.
+    await db_session.commit()
+    return job
+
+
+async def _latest_entries(
+    db_session: AsyncSession,
+    *,
+    user_id: int | None,
+    scholar_profile_ids: list[int],
+    parse_states: list[str],
+) -> list[ScholarPageArchiveEntry]:
+    """Return the newest capture of every archived (scholar, cstart) page in scope."""
+    stmt = (
+        select(ScholarPageArchiveEntry)
+        .distinct(ScholarPageArchiveEntry.scholar_profile_id, ScholarPageArchiveEntry.cstart)
+        .order_by(
+            ScholarPageArchiveEntry.scholar_profile_id,
+            ScholarPageArchiveEntry.cstart,
+            ScholarPageArchiveEntry.fetched_at.desc(),
+            ScholarPageArchiveEntry.id.desc(),
+        )
+    )
+    if user_id is not None:
+        stmt = stmt.join(ScholarProfile, ScholarProfile.id == ScholarPageArchiveEntry.scholar_profile_id).where(
+            ScholarProfile.user_id == user_id
+        )
+    if scholar_profile_ids:
+        stmt = stmt.where(ScholarPageArchiveEntry.scholar_profile_id.in_(scholar_profile_ids))
+    entries = list((await db_session.execute(stmt)).scalars().all())
+    if parse_states:
+        entries = [entry for entry in entries if entry.parse_state in parse_states]
+    return entries
+
+
+async def _parse_entry(entry: ScholarPageArchiveEntry, body: str) -> tuple[ParsedProfilePage | None, str | None]:
+    fetch_result = FetchResult(
+        requested_url=entry.requested_url,
+        status_code=entry.status_code,
+        final_url=entry.final_url,
+        body=body,
+        error=None,
+    )
+    try:
+        return await parse_executor.parse_profile_page(fetch_result), None
+    except ScholarParserError as exc:
+        return None, exc.code
+
+
+class _ReparseState:
+    def __init__(self) -> None:
+        self.pages_parsed = 0
+        self.missing_blob_count = 0
+        self.skipped_without_run = 0
+        self.publication_count = 0
+        self.discovered_publications = 0
+        self.raw_bytes_read = 0
+        self.parse_seconds = 0.0
+        self.upsert_seconds = 0.0
+        self.state_counts: Counter[str] = Counter()
+        self.error_counts: Counter[str] = Counter()
+
+
+async def _reparse_scholar_pages(
+    db_session: AsyncSession,
+    *,
+    scholar: ScholarProfile,
+    entries: list[ScholarPageArchiveEntry],
+    runs: dict[int, CrawlRun | None],
+    dry_run: bool,
+    state: _ReparseState,
+) -> None:
+    root = page_archive.archive_root()
+    seen_canonical: set[str] = set()
+    for entry in entries:
+        try:
+            body = await asyncio.to_thread(page_archive.read_blob, root, entry.body_sha256)
+        except FileNotFoundError:
+            state.missing_blob_count += 1
+            continue
+        parse_started = time.perf_counter()
+        parsed_page, error_code = await _parse_entry(entry, body)
+        state.parse_seconds += time.perf_counter() - parse_started
+        state.pages_parsed += 1
+        state.raw_bytes_read += int(entry.raw_bytes)
+        if parsed_page is None:
+            state.state_counts[ParseState.LAYOUT_CHANGED.value] += 1
+            state.error_counts[str(error_code)] += 1
+            continue
+        state.state_counts[parsed_page.state.value] += 1
+        if parsed_page.state not in {ParseState.OK, ParseState.NO_RESULTS}:
+            state.error_counts[parsed_page.state_reason] += 1
+            continue
+        state.publication_count += len(parsed_page.publications)
+        if dry_run or not parsed_page.publications:
+            continue
+        run = await _entry_run(db_session, entry=entry, runs=runs)
+        if run is None:
+            state.skipped_without_run += 1
+            continue
+        deduped = dedupe_publication_candidates(list(parsed_page.publications), seen_canonical=seen_canonical)
+        if not deduped:
+            continue
+        upsert_started = time.perf_counter()
+        state.discovered_publications += await upsert_profile_publications(
+            db_session,
+            run=run,
+            scholar=scholar,
+            publications=deduped,
+        )
+        state.upsert_seconds += time.perf_counter() - upsert_started
+
+
+async def _entry_run(
+    db_session: AsyncSession,
+    *,
+    entry: ScholarPageArchiveEntry,
+    runs: dict[int, CrawlRun | None],
+) -> CrawlRun | None:
+    # New links are credited to the run that fetched the page.
+    if entry.crawl_run_id is None:
+        return None
+    run_id = int(entry.crawl_run_id)
+    if run_id not in runs:
+        runs[run_id] = await db_session.get(CrawlRun, run_id)
+    return runs[run_id]
+
+
+def _summary(
+    *,
+    dry_run: bool,
+    entry_count: int,
+    scholar_count: int,
+    state: _ReparseState,
+    elapsed_seconds: float,
+) -> dict[str, Any]:
+    return {
+        "dry_run": bool(dry_run),
+        "entry_count": entry_count,
+        "scholar_count": scholar_count,
+        "pages_parsed": state.pages_parsed,
+        "missing_blob_count": state.missing_blob_count,
+        "state_counts": dict(sorted(state.state_counts.items())),
+        "error_counts": dict(sorted(state.error_counts.items())),
+        "publication_count": state.publication_count,
+        "discovered_publications": state.discovered_publications,
+        "skipped_without_run": state.skipped_without_run,
+        "raw_bytes_read": state.raw_bytes_read,
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "parse_seconds": round(state.parse_seconds, 3),
+        "upsert_seconds": round(state.upsert_seconds, 3),
+        "pages_per_second": round(state.pages_parsed / elapsed_seconds, 2) if elapsed_seconds > 0 else 0.0,
+    }
+
+
+async def _fail_job(db_session: AsyncSession, *, job_id: int, error: Exception) -> None:
+    await db_session.rollback()
+    job = await db_session.get(DataRepairJob, job_id)
+    if job is None:
+        return
+    job.status = REPAIR_STATUS_FAILED
+    job.error_text = str(error)
+    job.finished_at = _utcnow()
+    await db_session.commit()
+
+
+async def run_page_archive_reparse(
+    db_session: AsyncSession,
+    *,
+    user_id: int | None = None,
+    scholar_profile_ids: list[int] | None = None,
+    parse_states: list[str] | None = None,
+    dry_run: bool = True,
+    requested_by: str | None = None,
+) -> dict[str, Any]:
+    """Re-parse the newest archived capture of each scholar page without network access.
+
+    A dry run only parses and reports state counts. Otherwise publications are
+    upserted as if freshly fetched, and new links are credited to the run that
+    archived the page; pages whose run no longer exists are skipped.
+    """
+    target_ids = sorted({int(value) for value in scholar_profile_ids or []})
+    target_states = sorted({str(value).strip().lower() for value in parse_states or [] if str(value).strip()})
+    scope: dict[str, Any] = {"scholar_profile_ids": target_ids, "parse_states": target_states}
+    if user_id is not None:
+        scope["user_id"] = int(user_id)
+    job = await _create_job(db_session, requested_by=requested_by, scope=scope, dry_run=dry_run)
+    job_id = int(job.id)
+    try:
+        started = time.perf_counter()
+        entries = await _latest_entries(
+            db_session,
+            user_id=user_id,
+            scholar_profile_ids=target_ids,
+            parse_states=target_states,
+        )
+        entries_by_scholar: dict[int, list[ScholarPageArchiveEntry]] = {}
+        for entry in entries:
+            entries_by_scholar.setdefault(int(entry.scholar_profile_id), []).append(entry)
+        state = _ReparseState()
+        runs: dict[int, CrawlRun | None] = {}
+        for scholar_profile_id, scholar_entries in entries_by_scholar.items():
+            scholar = await db_session.get(ScholarProfile, scholar_profile_id)
+            if scholar is None:
+                continue
+            await _reparse_scholar_pages(
+                db_session,
+                scholar=scholar,
+                entries=scholar_entries,
+                runs=runs,
+                dry_run=dry_run,
+                state=state,
+            )
+        summary = _summary(
+            dry_run=dry_run,
+            entry_count=len(entries),
+            scholar_count=len(entries_by_scholar),
+            state=state,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        job.status = REPAIR_STATUS_COMPLETED
+        job.finished_at = _utcnow()
+        job.summary = summary
+        await db_session.commit()
+        return {"job_id": job_id, "status": job.status, "scope": scope, "summary": summary}
+    except Exception as exc:
+        await _fail_job(db_session, job_id=job_id, error=exc)
+        raise
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import except_, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import DataRepairJob, ScholarProfile, ScholarPublication, User, UserPublicationFeed
+from app.services.dbops.application import (
+    REPAIR_STATUS_COMPLETED,
+    REPAIR_STATUS_FAILED,
+    REPAIR_STATUS_PLANNED,
+    REPAIR_STATUS_RUNNING,
+)
+
+PUBLICATION_FEED_REBUILD_JOB_NAME = "rebuild_user_publication_feed"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+async def _create_job(
+    db_session: AsyncSession,
+    *,
+    requested_by: str | None,
+    scope: dict[str, Any],
+    dry_run: bool,
+) -> DataRepairJob:
+    job = DataRepairJob(
+        job_name=PUBLICATION_FEED_REBUILD_JOB_NAME,
+        requested_by=(requested_by or "").strip() or None,
+        scope=scope,
+        dry_run=bool(dry_run),
+        status=REPAIR_STATUS_PLANNED,
+        summary={},
+    )
+    db_session.add(job)
+    await db_session.flush()
+    job.status = REPAIR_STATUS_RUNNING
+    job.started_at = _utcnow()
+    return job
+
+
+def _expected_feed_rows(*, user_id: int | None):
+    stmt = (
+        select(
+            ScholarProfile.user_id,
+            ScholarPublication.publication_id,
+            func.bool_or(ScholarPublication.is_read.is_(False)),
+            func.bool_or(ScholarPublication.is_favorite),
+            func.min(ScholarPublication.created_at),
+            func.max(ScholarPublication.first_seen_run_id),
+        )
+        .select_from(ScholarPublication)
+        .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .group_by(ScholarProfile.user_id, ScholarPublication.publication_id)
+    )
+    if user_id is not None:
+        stmt = stmt.where(ScholarProfile.user_id == user_id)
+    return stmt
+
+
+def _stored_feed_rows(*, user_id: int | None):
+    stmt = select(
+        UserPublicationFeed.user_id,
+        UserPublicationFeed.publication_id,
+        UserPublicationFeed.is_unread,
+        UserPublicationFeed.is_favorite,
+        UserPublicationFeed.first_seen_at,
+        UserPublicationFeed.newest_run_id,
+    )
+    if user_id is not None:
+        stmt = stmt.where(UserPublicationFeed.user_id == user_id)
+    return stmt
+
+
+async def _count_rows(db_session: AsyncSession, stmt) -> int:
+    result = await db_session.execute(select(func.count()).select_from(stmt.subquery()))
+    return int(result.scalar_one() or 0)
+
+
+async def count_publication_feed_drift(db_session: AsyncSession, *, user_id: int | None = None) -> dict[str, int]:
+    """Compare stored feed rows with rows recomputed from scholar links."""
+    expected = _expected_feed_rows(user_id=user_id)
+    stored = _stored_feed_rows(user_id=user_id)
+    return {
+        "feed_rows": await _count_rows(db_session, stored),
+        "missing_or_stale_rows": await _count_rows(db_session, except_(expected, stored)),
+        "extra_or_stale_rows": await _count_rows(db_session, except_(stored, expected)),
+    }
+
+
+async def _target_user_ids(db_session: AsyncSession, *, user_id: int | None) -> list[int]:
+    stmt = select(User.id).order_by(User.id.asc())
+    if user_id is not None:
+        stmt = stmt.where(User.id == user_id)
+    result = await db_session.execute(stmt)
+    return [int(value) for value in result.scalars().all()]
+
+
+async def _resync_users(db_session: AsyncSession, *, user_ids: list[int]) -> None:
+    await db_session.execute(
+        text("SELECT user_publication_feed_sync_users(CAST(:user_ids AS integer[]))"),
+        {"user_ids": user_ids},
+    )
+
+
+async def _complete_job(
+    db_session: AsyncSession,
+    *,
+    job: DataRepairJob,
+    scope: dict[str, Any],
+    summary: dict[str, Any],
+) -> dict[str, Any]:
+    job.status = REPAIR_STATUS_COMPLETED
+    job.finished_at = _utcnow()
+    job.summary = summary
+    await db_session.commit()
+    return {
+        "job_id": int(job.id),
+        "status": job.status,
+        "scope": scope,
+        "summary": summary,
+    }
+
+
+async def _fail_job(db_session: AsyncSession, *, job: DataRepairJob, error: Exception) -> None:
+    from sqlalchemy.orm import make_transient
+
+    await db_session.rollback()
+    make_transient(job)
+    job.status = REPAIR_STATUS_FAILED
+    job.error_text = str(error)
+    job.finished_at = _utcnow()
+    db_session.add(job)
+    await db_session.commit()
+
+
+async def run_publication_feed_rebuild(
+    db_session: AsyncSession,
+    *,
+    user_id: int | None = None,
+    dry_run: bool = True,
+    requested_by: str | None = None,
+) -> dict[str, Any]:
+    """Recompute ``user_publication_feed`` from scholar links for one user or all users.
+
+    The triggers keep the feed current; this repairs drift left by restored
+    dumps or edits made with the triggers disabled. A dry run only reports the
+    drift.
+    """
+    scope: dict[str, Any] = {"scope_mode": "single_user" if user_id is not None else "all_users"}
+    if user_id is not None:
+        scope["user_id"] = int(user_id)
+    job = await _create_job(db_session, requested_by=requested_by, scope=scope, dry_run=dry_run)
+    try:
+        before = await count_publication_feed_drift(db_session, user_id=user_id)
+        user_ids: list[int] = []
+        if not dry_run:
+            user_ids = await _target_user_ids(db_session, user_id=user_id)
+            await _resync_users(db_session, user_ids=user_ids)
+        after = await count_publication_feed_drift(db_session, user_id=user_id)
+        summary = {
+            "dry_run": bool(dry_run),
+            "users_rebuilt": len(user_ids),
+            "feed_rows_before": before["feed_rows"],
+            "missing_or_stale_rows_before": before["missing_or_stale_rows"],
+            "extra_or_stale_rows_before": before["extra_or_stale_rows"],
+            "feed_rows_after": after["feed_rows"],
+            "drift_rows_after": after["missing_or_stale_rows"] + after["extra_or_stale_rows"],
+        }
+        return await _complete_job(db_session, job=job, scope=scope, summary=summary)
+    except Exception as exc:
+        await _fail_job(db_session, job=job, error=exc)
+        raise
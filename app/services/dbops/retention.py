@@ -0,0 +1,486 @@
+"""Retention for run history, job logs and expired cache entries.
+
+Each table has a policy: rows older than ``max_age_days`` are deleted, failed
+rows survive until ``failed_max_age_days``, and the ``keep_latest`` newest rows
+of each owner (user, publication or job name) are kept regardless of age.
+Deletes walk the primary key in keyset batches, each committed on its own, so
+no lock is held longer than one batch. Crawl runs can be folded into
+``crawl_run_rollups`` before deletion so long-range run statistics survive.
+
+Columns that reference a deleted row with ``ON DELETE SET NULL`` are cleared
+first, in batches of their own, so one parent delete never rewrites an
+unbounded number of rows (or fires the feed triggers for them). Archived pages
+of a deleted run lose their run and are skipped by the page archive re-parse.
+
+``bytes_reclaimed`` is the on-disk size of the deleted rows. Postgres reuses
+that space for new rows after autovacuum; it returns to the operating system
+only after ``VACUUM FULL``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    CursorResult,
+    Date,
+    and_,
+    cast,
+    delete,
+    func,
+    literal,
+    literal_column,
+    not_,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.db.models import (
+    ArxivQueryCacheEntry,
+    AuthorSearchCacheEntry,
+    CrawlRun,
+    CrawlRunRollup,
+    CrawlRunScholarResult,
+    DataRepairJob,
+    IngestionQueueItem,
+    PublicationPdfJobEvent,
+    RunStatus,
+    ScholarPageArchiveEntry,
+    ScholarPublication,
+    UserPublicationFeed,
+)
+from app.services.dbops.application import (
+    REPAIR_STATUS_COMPLETED,
+    REPAIR_STATUS_FAILED,
+    REPAIR_STATUS_PLANNED,
+    REPAIR_STATUS_RUNNING,
+)
+from app.services.publications.pdf_queue_common import PDF_STATUS_FAILED
+from app.settings import settings
+
+DB_RETENTION_JOB_NAME = "apply_db_retention"
+# A crawl run cascades to one result row per scholar, so run batches are smaller.
+RUN_BATCH_DIVISOR = 10
+
+_ROLLUP_COUNT_COLUMNS = (
+    "run_count",
+    "success_run_count",
+    "partial_failure_run_count",
+    "failed_run_count",
+    "canceled_run_count",
+    "scholar_count",
+    "new_pub_count",
+    "succeeded_count",
+    "failed_count",
+    "partial_count",
+)
+
+
+@dataclass(frozen=True)
+class Cascade:
+    """Rows removed by ``ON DELETE CASCADE`` with the parent; counted in the report."""
+
+    model: type[Any]
+    foreign_key: str
+
+
+@dataclass(frozen=True)
+class NullifiedReference:
+    """Column set to NULL by ``ON DELETE SET NULL``; cleared in its own batches first."""
+
+    model: type[Any]
+    foreign_key: str
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    name: str
+    model: type[Any]
+    primary_key: str
+    timestamp: str
+    max_age_days: int
+    batch_size: int
+    failed_max_age_days: int | None = None
+    failed: Any = None
+    keep_latest: int = 0
+    owner: tuple[str, ...] = ()
+    protected: Any = None
+    cascades: tuple[Cascade, ...] = ()
+    nullified_references: tuple[NullifiedReference, ...] = ()
+    reference_batch_size: int = 0
+    before_delete: Callable[[AsyncSession, list[Any]], Awaitable[None]] | None = None
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "table": self.model.__tablename__,
+            "max_age_days": self.max_age_days,
+            "failed_max_age_days": self.failed_max_age_days,
+            "keep_latest": self.keep_latest,
+            "owner": list(self.owner),
+        }
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+async def _remove_deleted_job_files(db_session: AsyncSession, job_ids: list[Any]) -> None:
+    # Imported lazily: the portability package imports dbops for its job statuses.
+    from app.services.portability.jobs import PORTABILITY_JOB_NAMES, remove_portability_job_files
+
+    result = await db_session.execute(
+        select(DataRepairJob).where(DataRepairJob.id.in_(job_ids), DataRepairJob.job_name.in_(PORTABILITY_JOB_NAMES))
+    )
+    jobs = list(result.scalars().all())
+    for job in jobs:
+        await asyncio.to_thread(remove_portability_job_files, job)
+
+
+def build_retention_policies() -> list[RetentionPolicy]:
+    batch_size = max(int(settings.db_retention_batch_size), 1)
+    return [
+        RetentionPolicy(
+            name="crawl_runs",
+            model=CrawlRun,
+            primary_key="id",
+            timestamp="start_dt",
+            max_age_days=max(int(settings.db_retention_run_days), 0),
+            failed_max_age_days=max(int(settings.db_retention_run_failed_days), 0),
+            failed=CrawlRun.status.in_((RunStatus.FAILED, RunStatus.PARTIAL_FAILURE)),
+            # The scheduler dates a user's next run from their newest one.
+            keep_latest=max(int(settings.db_retention_run_keep_per_user), 1),
+            owner=("user_id",),
+            protected=CrawlRun.status.in_((RunStatus.RUNNING, RunStatus.RESOLVING)),
+            cascades=(Cascade(CrawlRunScholarResult, "crawl_run_id"),),
+            # Links first: their triggers recompute the feed's newest_run_id.
+            nullified_references=(
+                NullifiedReference(ScholarPublication, "first_seen_run_id"),
+                NullifiedReference(UserPublicationFeed, "newest_run_id"),
+                NullifiedReference(ScholarPageArchiveEntry, "crawl_run_id"),
+                NullifiedReference(IngestionQueueItem, "last_run_id"),
+            ),
+            reference_batch_size=batch_size,
+            batch_size=max(batch_size // RUN_BATCH_DIVISOR, 1),
+        ),
+        RetentionPolicy(
+            name="publication_pdf_job_events",
+            model=PublicationPdfJobEvent,
+            primary_key="id",
+            timestamp="created_at",
+            max_age_days=max(int(settings.db_retention_pdf_event_days), 0),
+            failed_max_age_days=max(int(settings.db_retention_pdf_event_failed_days), 0),
+            failed=PublicationPdfJobEvent.status.is_not_distinct_from(PDF_STATUS_FAILED),
+            keep_latest=max(int(settings.db_retention_pdf_event_keep_per_publication), 0),
+            owner=("publication_id",),
+            batch_size=batch_size,
+        ),
+        RetentionPolicy(
+            name="data_repair_jobs",
+            model=DataRepairJob,
+            primary_key="id",
+            timestamp="created_at",
+            max_age_days=max(int(settings.db_retention_repair_job_days), 0),
+            failed_max_age_days=max(int(settings.db_retention_repair_job_failed_days), 0),
+            failed=DataRepairJob.status == REPAIR_STATUS_FAILED,
+            keep_latest=max(int(settings.db_retention_repair_job_keep_per_name), 0),
+            owner=("job_name",),
+            protected=DataRepairJob.status.in_((REPAIR_STATUS_PLANNED, REPAIR_STATUS_RUNNING)),
+            before_delete=_remove_deleted_job_files,
+            batch_size=batch_size,
+        ),
+        RetentionPolicy(
+            name="arxiv_query_cache_entries",
+            model=ArxivQueryCacheEntry,
+            primary_key="query_fingerprint",
+            timestamp="expires_at",
+            max_age_days=0,
+            batch_size=batch_size,
+        ),
+        RetentionPolicy(
+            name="author_search_cache_entries",
+            model=AuthorSearchCacheEntry,
+            primary_key="query_key",
+            timestamp="expires_at",
+            max_age_days=0,
+            batch_size=batch_size,
+        ),
+    ]
+
+
+def _expired_condition(policy: RetentionPolicy, *, now: datetime):
+    model = policy.model
+    timestamp = getattr(model, policy.timestamp)
+    condition = timestamp < now - timedelta(days=policy.max_age_days)
+    if policy.failed is not None and policy.failed_max_age_days is not None:
+        failed_days = max(policy.failed_max_age_days, policy.max_age_days)
+        condition = and_(condition, or_(not_(policy.failed), timestamp < now - timedelta(days=failed_days)))
+    if policy.protected is not None:
+        condition = and_(condition, not_(policy.protected))
+    if policy.keep_latest > 0 and policy.owner:
+        newer = aliased(model)
+        kept_ids = (
+            select(getattr(newer, policy.primary_key))
+            .where(*(getattr(newer, column) == getattr(model, column) for column in policy.owner))
+            .order_by(getattr(newer, policy.timestamp).desc(), getattr(newer, policy.primary_key).desc())
+            .limit(policy.keep_latest)
+            .correlate(model)
+        )
+        condition = and_(condition, getattr(model, policy.primary_key).not_in(kept_ids.scalar_subquery()))
+    return condition
+
+
+def _row_bytes(model: type[Any]):
+    return func.pg_column_size(model.__table__.table_valued())
+
+
+async def _count_expired(db_session: AsyncSession, policy: RetentionPolicy, *, condition) -> tuple[int, int]:
+    result = await db_session.execute(
+        select(func.count(), func.coalesce(func.sum(_row_bytes(policy.model)), 0)).where(condition)
+    )
+    rows, row_bytes = result.one()
+    return int(rows), int(row_bytes)
+
+
+async def _cascaded_usage(db_session: AsyncSession, cascade: Cascade, parent_ids: list[Any]) -> tuple[int, int]:
+    result = await db_session.execute(
+        select(func.count(), func.coalesce(func.sum(_row_bytes(cascade.model)), 0)).where(
+            getattr(cascade.model, cascade.foreign_key).in_(parent_ids)
+        )
+    )
+    rows, row_bytes = result.one()
+    return int(rows), int(row_bytes)
+
+
+async def _clear_references(
+    db_session: AsyncSession,
+    reference: NullifiedReference,
+    parent_ids: list[Any],
+    *,
+    batch_size: int,
+) -> int:
+    model = reference.model
+    foreign_key = getattr(model, reference.foreign_key)
+    key_columns = tuple_(*model.__table__.primary_key.columns)
+    cleared = 0
+    while True:
+        batch = select(*model.__table__.primary_key.columns).where(foreign_key.in_(parent_ids)).limit(batch_size)
+        stmt = (
+            update(model)
+            .where(key_columns.in_(batch))
+            .values({reference.foreign_key: None})
+            .execution_options(synchronize_session=False)
+        )
+        result: CursorResult[Any] = await db_session.execute(stmt)  # type: ignore[assignment]
+        await db_session.commit()
+        updated = int(result.rowcount or 0)
+        cleared += updated
+        if updated < batch_size:
+            return cleared
+
+
+async def _roll_up_runs(db_session: AsyncSession, run_ids: list[int]) -> None:
+    # Inlined rather than bound so the SELECT and GROUP BY expressions match.
+    period_start = cast(func.timezone(literal_column("'UTC'"), CrawlRun.start_dt), Date)
+    totals = (
+        select(
+            CrawlRun.user_id,
+            period_start,
+            CrawlRun.trigger_type,
+            func.count(),
+            func.count().filter(CrawlRun.status == RunStatus.SUCCESS),
+            func.count().filter(CrawlRun.status == RunStatus.PARTIAL_FAILURE),
+            func.count().filter(CrawlRun.status == RunStatus.FAILED),
+            func.count().filter(CrawlRun.status == RunStatus.CANCELED),
+            func.sum(CrawlRun.scholar_count),
+            func.sum(CrawlRun.new_pub_count),
+            func.sum(CrawlRun.succeeded_count),
+            func.sum(CrawlRun.failed_count),
+            func.sum(CrawlRun.partial_count),
+            func.min(CrawlRun.start_dt),
+            func.max(CrawlRun.start_dt),
+        )
+        .where(CrawlRun.id.in_(run_ids))
+        .group_by(CrawlRun.user_id, period_start, CrawlRun.trigger_type)
+    )
+    stmt = pg_insert(CrawlRunRollup).from_select(
+        ["user_id", "period_start", "trigger_type", *_ROLLUP_COUNT_COLUMNS, "first_start_dt", "last_start_dt"],
+        totals,
+    )
+    set_: dict[str, Any] = {
+        column: getattr(CrawlRunRollup, column) + getattr(stmt.excluded, column) for column in _ROLLUP_COUNT_COLUMNS
+    }
+    set_["first_start_dt"] = func.least(CrawlRunRollup.first_start_dt, stmt.excluded.first_start_dt)
+    set_["last_start_dt"] = func.greatest(CrawlRunRollup.last_start_dt, stmt.excluded.last_start_dt)
+    set_["updated_at"] = func.now()
+    await db_session.execute(
+        stmt.on_conflict_do_update(constraint="uq_crawl_run_rollups_user_period_trigger", set_=set_)
+    )
+
+
+async def _delete_expired(
+    db_session: AsyncSession,
+    policy: RetentionPolicy,
+    *,
+    condition,
+    roll_up: bool,
+) -> dict[str, int]:
+    model = policy.model
+    primary_key = getattr(model, policy.primary_key)
+    counts = {"deleted_rows": 0, "cascaded_rows": 0, "nullified_rows": 0, "bytes_reclaimed": 0, "batches": 0}
+    last_key: Any = None
+    while True:
+        stmt = select(primary_key, _row_bytes(model)).where(condition).order_by(primary_key).limit(policy.batch_size)
+        if last_key is not None:
+            stmt = stmt.where(primary_key > last_key)
+        rows = (await db_session.execute(stmt)).all()
+        if not rows:
+            return counts
+        keys = [row[0] for row in rows]
+        for reference in policy.nullified_references:
+            counts["nullified_rows"] += await _clear_references(
+                db_session,
+                reference,
+                keys,
+                batch_size=policy.reference_batch_size or policy.batch_size,
+            )
+        for cascade in policy.cascades:
+            cascaded_rows, cascaded_bytes = await _cascaded_usage(db_session, cascade, keys)
+            counts["cascaded_rows"] += cascaded_rows
+            counts["bytes_reclaimed"] += cascaded_bytes
+        if roll_up:
+            await _roll_up_runs(db_session, keys)
+        if policy.before_delete is not None:
+            await policy.before_delete(db_session, keys)
+        await db_session.execute(delete(model).where(primary_key.in_(keys)))
+        await db_session.commit()
+        counts["deleted_rows"] += len(keys)
+        counts["bytes_reclaimed"] += sum(int(row[1] or 0) for row in rows)
+        counts["batches"] += 1
+        last_key = keys[-1]
+
+
+async def _relation_bytes(db_session: AsyncSession, model: type[Any]) -> int:
+    result = await db_session.execute(select(func.pg_total_relation_size(cast(literal(model.__tablename__), REGCLASS))))
+    return int(result.scalar_one() or 0)
+
+
+async def _create_job(
+    db_session: AsyncSession,
+    *,
+    requested_by: str | None,
+    scope: dict[str, Any],
+    dry_run: bool,
+) -> DataRepairJob:
+    job = DataRepairJob(
+        job_name=DB_RETENTION_JOB_NAME,
+        requested_by=(requested_by or "").strip() or None,
+        scope=scope,
+        dry_run=bool(dry_run),
+        status=REPAIR_STATUS_PLANNED,
+        summary={},
+    )
+    db_session.add(job)
+    await db_session.flush()
+    job.status = REPAIR_STATUS_RUNNING
+    job.started_at = _utcnow()
+    # Committed up front: rows are deleted in separately committed batches.
+    await db_session.commit()
+    return job
+
+
+async def _fail_job(db_session: AsyncSession, *, job_id: int, error: Exception) -> None:
+    await db_session.rollback()
+    job = await db_session.get(DataRepairJob, job_id)
+    if job is None:
+        return
+    job.status = REPAIR_STATUS_FAILED
+    job.error_text = str(error)
+    job.finished_at = _utcnow()
+    await db_session.commit()
+
+
+async def db_retention_due(db_session: AsyncSession, *, interval_hours: int) -> bool:
+    """True when no applied retention pass started within ``interval_hours``."""
+    result = await db_session.execute(
+        select(func.max(DataRepairJob.created_at)).where(
+            DataRepairJob.job_name == DB_RETENTION_JOB_NAME,
+            DataRepairJob.dry_run.is_(False),
+        )
+    )
+    last_started = result.scalar_one_or_none()
+    if last_started is None:
+        return True
+    return last_started <= _utcnow() - timedelta(hours=max(int(interval_hours), 1))
+
+
+async def run_db_retention(
+    db_session: AsyncSession,
+    *,
+    dry_run: bool = True,
+    requested_by: str | None = None,
+    roll_up_runs: bool | None = None,
+) -> dict[str, Any]:
+    """Apply every retention policy and report rows and bytes per table.
+
+    A dry run only counts expired rows and their size.
+    """
+    policies = build_retention_policies()
+    roll_up = bool(settings.db_retention_run_rollups_enabled if roll_up_runs is None else roll_up_runs)
+    scope = {
+        "roll_up_runs": roll_up,
+        "policies": {policy.name: policy.describe() for policy in policies},
+    }
+    job = await _create_job(db_session, requested_by=requested_by, scope=scope, dry_run=dry_run)
+    job_id = int(job.id)
+    try:
+        now = _utcnow()
+        tables: dict[str, dict[str, int]] = {}
+        for policy in policies:
+            condition = _expired_condition(policy, now=now)
+            expired_rows, expired_bytes = await _count_expired(db_session, policy, condition=condition)
+            report = {
+                "expired_rows": expired_rows,
+                "expired_bytes": expired_bytes,
+                "deleted_rows": 0,
+                "cascaded_rows": 0,
+                "nullified_rows": 0,
+                "bytes_reclaimed": 0,
+                "batches": 0,
+            }
+            if not dry_run and expired_rows > 0:
+                report.update(
+                    await _delete_expired(
+                        db_session,
+                        policy,
+                        condition=condition,
+                        roll_up=roll_up and policy.model is CrawlRun,
+                    )
+                )
+            report["relation_bytes"] = await _relation_bytes(db_session, policy.model)
+            tables[policy.name] = report
+        summary = {
+            "dry_run": bool(dry_run),
+            "tables": tables,
+            "expired_rows": sum(report["expired_rows"] for report in tables.values()),
+            "deleted_rows": sum(report["deleted_rows"] + report["cascaded_rows"] for report in tables.values()),
+            "nullified_rows": sum(report["nullified_rows"] for report in tables.values()),
+            "bytes_reclaimed": sum(report["bytes_reclaimed"] for report in tables.values()),
+        }
+        job.status = REPAIR_STATUS_COMPLETED
+        job.finished_at = _utcnow()
+        job.summary = summary
+        await db_session.commit()
+        return {"job_id": job_id, "status": job.status, "scope": scope, "summary": summary}
+    except Exception as exc:
+        await _fail_job(db_session, job_id=job_id, error=exc)
+        raise
@@ -15,6 +15,7 @@ from app.db.models import (
     ScholarProfile,
 )
 from app.logging_utils import structured_log
+from app.services.ingestion import crawl_schedule
 from app.services.ingestion import queue as queue_service
 from app.services.ingestion.constants import RUN_LOCK_NAMESPACE
 from app.services.ingestion.enrichment import EnrichmentRunner
@@ -41,6 +42,7 @@ from app.services.ingestion.types import (
     RunFailureSummary,
     RunProgress,
 )
+from app.services.publications.facet_cache import invalidate_publication_counts_for_user
 from app.services.scholar.source import ScholarSource
 from app.services.settings import application as user_settings_service
 from app.settings import settings
@@ -136,6 +138,29 @@ class ScholarIngestionService:
                 await queue_service.clear_job_for_scholar(db_session, user_id=user_id, scholar_profile_id=sid)
         return scholars
 
+    @staticmethod
+    def _due_scholars_for_scheduled_run(
+        scholars: list[ScholarProfile],
+        *,
+        user_settings: Any,
+        user_id: int,
+    ) -> list[ScholarProfile]:
+        due = crawl_schedule.due_scholars(
+            scholars,
+            base_interval_minutes=int(user_settings.run_interval_minutes),
+            now=datetime.now(UTC),
+        )
+        if len(due) < len(scholars):
+            structured_log(
+                logger,
+                "info",
+                "ingestion.scholars_not_due_skipped",
+                user_id=user_id,
+                due_count=len(due),
+                skipped_count=len(scholars) - len(due),
+            )
+        return due
+
     async def _initialize_run_for_user(
         self,
         db_session: AsyncSession,
@@ -162,6 +187,12 @@ class ScholarIngestionService:
             user_id=user_id,
             filtered_scholar_ids=filtered_scholar_ids,
         )
+        if (
+            trigger_type == RunTriggerType.SCHEDULED
+            and filtered_scholar_ids is None
+            and crawl_schedule.adaptive_schedule_enabled()
+        ):
+            scholars = self._due_scholars_for_scheduled_run(scholars, user_settings=user_settings, user_id=user_id)
         await run_preflight_guard(
             db_session,
             self._source,
@@ -303,7 +334,6 @@ class ScholarIngestionService:
         alert_blocked_failure_threshold: int = 1,
         alert_network_failure_threshold: int = 2,
         alert_retry_scheduled_threshold: int = 3,
-        idempotency_key: str | None = None,
     ) -> None:
         paging = _resolve_paging_kwargs(
             request_delay_seconds=request_delay_seconds,
@@ -336,18 +366,19 @@ class ScholarIngestionService:
                     **paging,
                 )
                 failure_summary, alert_summary = complete_run_for_user(
+                    db_session,
                     user_settings=user_settings,
                     run=run,
                     scholars=attached_scholars,
                     user_id=user_id,
                     progress=progress,
-                    idempotency_key=idempotency_key,
                     **thresholds,
                 )
                 intended_final_status = run.status
                 if intended_final_status not in (RunStatus.CANCELED,):
                     run.status = RunStatus.RESOLVING
                 await db_session.commit()
+                invalidate_publication_counts_for_user(user_id)
                 log_run_completed(
                     run=run,
                     user_id=user_id,
@@ -401,8 +432,7 @@ class ScholarIngestionService:
                 if run_to_fail:
                     run_to_fail.status = RunStatus.FAILED
                     run_to_fail.end_dt = datetime.now(UTC)
-                    run_to_fail.error_log = run_to_fail.error_log or {}
-                    run_to_fail.error_log["terminal_exception"] = str(exc)
+                    run_to_fail.error_log = {**(run_to_fail.error_log or {}), "terminal_exception": str(exc)}
                     await cleanup_session.commit()
         except Exception:
             structured_log(
@@ -476,7 +506,6 @@ class ScholarIngestionService:
             thresholds=thresholds,
             auto_queue_continuations=auto_queue_continuations,
             queue_delay_seconds=queue_delay_seconds,
-            idempotency_key=idempotency_key,
         )
         user_settings = await user_settings_service.get_or_create_settings(db_session, user_id=user_id)
         await inline_enrich_and_finalize(
@@ -508,7 +537,6 @@ class ScholarIngestionService:
         thresholds: dict[str, Any],
         auto_queue_continuations: bool,
         queue_delay_seconds: int,
-        idempotency_key: str | None,
     ) -> tuple[RunProgress, RunFailureSummary, RunAlertSummary, RunStatus]:
         progress = await run_scholar_iteration(
             db_session,
@@ -523,18 +551,19 @@ class ScholarIngestionService:
         )
         user_settings = await user_settings_service.get_or_create_settings(db_session, user_id=user_id)
         failure_summary, alert_summary = complete_run_for_user(
+            db_session,
             user_settings=user_settings,
             run=run,
             scholars=scholars,
             user_id=user_id,
             progress=progress,
-            idempotency_key=idempotency_key,
             **thresholds,
         )
         intended_final_status = run.status
         if intended_final_status not in (RunStatus.CANCELED,):
             run.status = RunStatus.RESOLVING
         await db_session.commit()
+        invalidate_publication_counts_for_user(user_id)
         return progress, failure_summary, alert_summary, intended_final_status
 
     async def _try_acquire_user_lock(
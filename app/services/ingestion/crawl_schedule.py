@@ -0,0 +1,191 @@
+"""Adaptive per-scholar check schedule driven by first-page change history.
+
+Every successful first-page check is recorded on the profile: a first page
+whose fingerprint matches the previous one extends the no-change streak,
+anything else resets it and stamps ``last_change_dt``. A scholar is due again
+``base * backoff_factor ** no_change_streak`` minutes (capped) after the start
+of the run that last checked it, where the base is the user's run interval.
+Anchoring on the run start keeps intervals on whole multiples of the user's
+schedule, so a profile that becomes due is picked up by the next scheduled run
+rather than the one after.
+
+Scheduled runs only fetch due scholars; manual runs fetch everyone and update
+the history the same way. Failed checks leave the history alone, so the
+scholar stays due.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import ScholarProfile, User, UserSetting
+from app.settings import settings
+
+MINUTES_PER_DAY = 1440
+# Bounds the exponent so long streaks cannot overflow the float.
+_MAX_STREAK_EXPONENT = 64
+
+
+def adaptive_schedule_enabled() -> bool:
+    return bool(settings.ingestion_adaptive_schedule_enabled)
+
+
+def adaptive_interval_minutes(*, base_interval_minutes: int, no_change_streak: int) -> int:
+    base = max(int(base_interval_minutes), 1)
+    if not adaptive_schedule_enabled():
+        return base
+    ceiling = max(int(settings.ingestion_adaptive_max_interval_minutes), base)
+    factor = max(float(settings.ingestion_adaptive_backoff_factor), 1.0)
+    streak = min(max(int(no_change_streak), 0), _MAX_STREAK_EXPONENT)
+    return int(min(base * factor**streak, ceiling))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+def next_check_due_dt(
+    *,
+    last_change_check_dt: datetime | None,
+    no_change_streak: int,
+    base_interval_minutes: int,
+) -> datetime | None:
+    """Return when the scholar is next due, or ``None`` if it has never been checked."""
+    if last_change_check_dt is None:
+        return None
+    interval = adaptive_interval_minutes(base_interval_minutes=base_interval_minutes, no_change_streak=no_change_streak)
+    return _as_utc(last_change_check_dt) + timedelta(minutes=interval)
+
+
+def is_scholar_due(scholar: ScholarProfile, *, base_interval_minutes: int, now: datetime) -> bool:
+    due_dt = next_check_due_dt(
+        last_change_check_dt=scholar.last_change_check_dt,
+        no_change_streak=scholar.no_change_streak,
+        base_interval_minutes=base_interval_minutes,
+    )
+    return due_dt is None or due_dt <= now
+
+
+def due_scholars(
+    scholars: Iterable[ScholarProfile],
+    *,
+    base_interval_minutes: int,
+    now: datetime,
+) -> list[ScholarProfile]:
+    return [
+        scholar for scholar in scholars if is_scholar_due(scholar, base_interval_minutes=base_interval_minutes, now=now)
+    ]
+
+
+def record_first_page_check(
+    scholar: ScholarProfile,
+    *,
+    result_entry: dict[str, Any],
+    checked_at: datetime,
+) -> None:
+    """Fold one scholar result into its change history.
+
+    Only checks that started at the first page and did not fail count;
+    ``checked_at`` is the start of the run, the anchor for the next due time.
+    """
+    if int(result_entry.get("start_cstart") or 0) != 0 or result_entry.get("outcome") == "failed":
+        return
+    scholar.change_check_count = int(scholar.change_check_count or 0) + 1
+    scholar.last_change_check_dt = checked_at
+    if result_entry.get("skipped_no_change"):
+        scholar.change_unchanged_count = int(scholar.change_unchanged_count or 0) + 1
+        scholar.no_change_streak = int(scholar.no_change_streak or 0) + 1
+        return
+    scholar.no_change_streak = 0
+    scholar.last_change_dt = checked_at
+
+
+async def users_with_due_scholars(
+    db_session: AsyncSession,
+    *,
+    base_interval_minutes_by_user: dict[int, int],
+    now: datetime,
+) -> set[int]:
+    if not base_interval_minutes_by_user:
+        return set()
+    result = await db_session.execute(
+        select(ScholarProfile.user_id, ScholarProfile.last_change_check_dt, ScholarProfile.no_change_streak).where(
+            ScholarProfile.user_id.in_(list(base_interval_minutes_by_user)),
+            ScholarProfile.is_enabled.is_(True),
+        )
+    )
+    due_users: set[int] = set()
+    for user_id, last_change_check_dt, no_change_streak in result.all():
+        if int(user_id) in due_users:
+            continue
+        due_dt = next_check_due_dt(
+            last_change_check_dt=last_change_check_dt,
+            no_change_streak=no_change_streak,
+            base_interval_minutes=base_interval_minutes_by_user[int(user_id)],
+        )
+        if due_dt is None or due_dt <= now:
+            due_users.add(int(user_id))
+    return due_users
+
+
+async def crawl_schedule_summary(db_session: AsyncSession, *, now: datetime) -> dict[str, Any]:
+    """Summarize the schedule of enabled scholars of users with automatic runs.
+
+    Request figures count first-page fetches per day at the user's fixed run
+    interval versus the adaptive interval; deeper pages are only fetched when
+    the first page changed, so they are the same under both schedules.
+    """
+    result = await db_session.execute(
+        select(
+            UserSetting.run_interval_minutes,
+            ScholarProfile.last_change_check_dt,
+            ScholarProfile.no_change_streak,
+            ScholarProfile.change_check_count,
+            ScholarProfile.change_unchanged_count,
+        )
+        .join(ScholarProfile, ScholarProfile.user_id == UserSetting.user_id)
+        .join(User, User.id == UserSetting.user_id)
+        .where(
+            User.is_active.is_(True),
+            UserSetting.auto_run_enabled.is_(True),
+            ScholarProfile.is_enabled.is_(True),
+        )
+    )
+    scholar_count = due_count = backed_off_count = check_count = unchanged_count = 0
+    fixed_per_day = adaptive_per_day = 0.0
+    for base_interval, last_change_check_dt, streak, checks, unchanged in result.all():
+        base = max(int(base_interval), 1)
+        interval = adaptive_interval_minutes(base_interval_minutes=base, no_change_streak=streak)
+        due_dt = next_check_due_dt(
+            last_change_check_dt=last_change_check_dt,
+            no_change_streak=streak,
+            base_interval_minutes=base,
+        )
+        scholar_count += 1
+        due_count += int(due_dt is None or due_dt <= now)
+        backed_off_count += int(interval > base)
+        check_count += int(checks)
+        unchanged_count += int(unchanged)
+        fixed_per_day += MINUTES_PER_DAY / base
+        adaptive_per_day += MINUTES_PER_DAY / interval
+    saved_per_day = fixed_per_day - adaptive_per_day
+    return {
+        "enabled": adaptive_schedule_enabled(),
+        "backoff_factor": float(settings.ingestion_adaptive_backoff_factor),
+        "max_interval_minutes": int(settings.ingestion_adaptive_max_interval_minutes),
+        "scholar_count": scholar_count,
+        "due_count": due_count,
+        "backed_off_count": backed_off_count,
+        "first_page_check_count": check_count,
+        "unchanged_check_count": unchanged_count,
+        "unchanged_ratio": round(unchanged_count / check_count, 4) if check_count else 0.0,
+        "requests_per_day_fixed": round(fixed_per_day, 2),
+        "requests_per_day_adaptive": round(adaptive_per_day, 2),
+        "requests_per_day_saved": round(saved_per_day, 2),
+        "saved_ratio": round(saved_per_day / fixed_per_day, 4) if fixed_per_day else 0.0,
+    }
@@ -3,6 +3,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import or_, select
@@ -11,13 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models import (
     CrawlRun,
     Publication,
-    RunStatus,
     ScholarProfile,
     ScholarPublication,
 )
 from app.logging_utils import structured_log
-from app.services.arxiv.errors import ArxivRateLimitError
 from app.services.publication_identifiers import application as identifier_service
+from app.services.runs.cancellation import run_cancellation
 from app.services.runs.events import run_events
 from app.services.scholar.parser import PublicationCandidate
 from app.settings import settings
@@ -25,13 +27,16 @@ from app.settings import settings
 logger = logging.getLogger(__name__)
 
 
+def _sanitized_title(raw: str | None) -> str:
+    if not raw or not raw.strip():
+        return ""
+    return " ".join(re.sub(r"[^\w\s]", " ", raw).split())
+
+
 def _sanitize_titles(publications: list) -> list[str]:
     titles = []
     for p in publications:
-        raw = getattr(p, "title_raw", None) or getattr(p, "title", None)
-        if not raw or not raw.strip():
-            continue
-        safe = " ".join(re.sub(r"[^\w\s]", " ", raw).split())
+        safe = _sanitized_title(getattr(p, "title_raw", None) or getattr(p, "title", None))
         if safe:
             titles.append(safe)
     return titles
@@ -71,24 +76,90 @@ def _chunk_titles_by_url_length(
     return chunks
 
 
+def _publication_batches(publications: list[Publication]) -> list[tuple[list[str], list[Publication]]]:
+    """Pair each OpenAlex title chunk with the distinct publications it covers."""
+    title_to_pubs: dict[str, list[Publication]] = {}
+    for p in publications:
+        safe = _sanitized_title(p.title_raw)
+        if safe:
+            title_to_pubs.setdefault(safe, []).append(p)
+    batches: list[tuple[list[str], list[Publication]]] = []
+    for title_chunk in _chunk_titles_by_url_length(list(title_to_pubs)):
+        batch = [p for title in title_chunk for p in title_to_pubs[title]]
+        if batch:
+            batches.append((title_chunk, batch))
+    return batches
+
+
+FETCH_OK = "ok"
+FETCH_FAILED = "failed"
+FETCH_RATE_LIMITED = "rate_limited"
+FETCH_BUDGET_EXHAUSTED = "budget_exhausted"
+OPENALEX_RATE_LIMIT_PAUSE_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class _ChunkFetch:
+    status: str
+    works: list
+
+
+class _OpenAlexChunkFetcher:
+    """Fetches title-filter chunks concurrently, sharing rate-limit pauses.
+
+    A rate-limited chunk pauses every later request for
+    ``OPENALEX_RATE_LIMIT_PAUSE_SECONDS``; an exhausted daily budget stops
+    all requests that have not been sent yet.
+    """
+
+    def __init__(self, client, *, max_concurrency: int, run_id: int) -> None:
+        self._client = client
+        self._run_id = run_id
+        self._semaphore = asyncio.Semaphore(max(int(max_concurrency), 1))
+        self._paused_until = 0.0
+        self._budget_exhausted = False
+
+    async def fetch(self, titles: list[str]) -> _ChunkFetch:
+        from app.services.openalex.client import (
+            OpenAlexBudgetExhaustedError,
+            OpenAlexRateLimitError,
+        )
+
+        async with self._semaphore:
+            if self._budget_exhausted:
+                return _ChunkFetch(status=FETCH_BUDGET_EXHAUSTED, works=[])
+            delay = self._paused_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                works = await self._client.get_works_by_filter(
+                    {"title.search": "|".join(titles)}, limit=len(titles) * 3
+                )
+            except OpenAlexBudgetExhaustedError:
+                self._budget_exhausted = True
+                return _ChunkFetch(status=FETCH_BUDGET_EXHAUSTED, works=[])
+            except OpenAlexRateLimitError:
+                self._paused_until = time.monotonic() + OPENALEX_RATE_LIMIT_PAUSE_SECONDS
+                return _ChunkFetch(status=FETCH_RATE_LIMITED, works=[])
+            except Exception as e:
+                structured_log(
+                    logger, "warning", "ingestion.openalex_enrichment_failed", error=str(e), run_id=self._run_id
+                )
+                return _ChunkFetch(status=FETCH_FAILED, works=[])
+        return _ChunkFetch(status=FETCH_OK, works=works)
+
+
 class EnrichmentRunner:
     """Post-run OpenAlex enrichment logic.
 
     Receives service dependencies at construction so it can be tested
     independently of ``ScholarIngestionService``.
-    """
 
-    async def run_is_canceled(
-        self,
-        db_session: AsyncSession,
-        *,
-        run_id: int,
-    ) -> bool:
-        check_result = await db_session.execute(select(CrawlRun.status).where(CrawlRun.id == run_id))
-        status = check_result.scalar_one_or_none()
-        if status is None:
-            raise RuntimeError(f"Missing crawl_run for run_id={run_id}.")
-        return status == RunStatus.CANCELED
+    Enrichment is a pipeline: OpenAlex title-filter chunks are fetched
+    concurrently ahead of the batch being applied, matching happens in memory,
+    and identifier discovery and writes are batched per chunk. Cancellation is
+    read from an in-process ``RunCancelToken`` once per chunk.
+    """
 
     async def _load_unenriched_publications(
         self,
@@ -125,20 +196,18 @@ class EnrichmentRunner:
         openalex_works: list,
         now: datetime,
         arxiv_lookup_allowed: bool,
-    ) -> tuple[bool, bool]:
+    ) -> bool:
         from app.services.openalex.matching import find_best_match
 
         for p in batch:
-            if await self.run_is_canceled(db_session, run_id=run_id):
-                structured_log(logger, "info", "ingestion.enrichment_aborted", run_id=run_id)
-                return False, arxiv_lookup_allowed
             p.openalex_last_attempt_at = now
-            arxiv_lookup_allowed = await self._discover_identifiers_for_enrichment(
-                db_session,
-                publication=p,
-                run_id=run_id,
-                allow_arxiv_lookup=arxiv_lookup_allowed,
-            )
+        arxiv_lookup_allowed = await self._discover_identifiers_for_batch(
+            db_session,
+            batch=batch,
+            run_id=run_id,
+            allow_arxiv_lookup=arxiv_lookup_allowed,
+        )
+        for p in batch:
             match = find_best_match(
                 target_title=p.title_raw,
                 target_year=p.year,
@@ -150,7 +219,7 @@ class EnrichmentRunner:
                 p.citation_count = match.cited_by_count if match.cited_by_count is not None else p.citation_count
                 p.pdf_url = match.oa_url if match.oa_url is not None else p.pdf_url
                 p.openalex_enriched = True
-        return True, arxiv_lookup_allowed
+        return arxiv_lookup_allowed
 
     async def _flush_and_sweep_duplicates(
         self,
@@ -178,11 +247,7 @@ class EnrichmentRunner:
         run_id: int,
         openalex_api_key: str | None = None,
     ) -> None:
-        from app.services.openalex.client import (
-            OpenAlexBudgetExhaustedError,
-            OpenAlexClient,
-            OpenAlexRateLimitError,
-        )
+        from app.services.openalex.client import OpenAlexClient
 
         _, publications = await self._load_unenriched_publications(db_session, run_id=run_id)
         if not publications:
@@ -192,136 +257,113 @@ class EnrichmentRunner:
         client = OpenAlexClient(api_key=resolved_key, mailto=settings.crossref_api_mailto)
         now = datetime.now(UTC)
         arxiv_lookup_allowed = True
-
-        all_titles = _sanitize_titles(publications)
-        title_chunks = _chunk_titles_by_url_length(all_titles)
-
-        # Build a mapping from sanitized title → publications for batch association
-        title_to_pubs: dict[str, list[Publication]] = {}
-        for p in publications:
-            raw = getattr(p, "title_raw", None) or getattr(p, "title", None)
-            if not raw or not raw.strip():
-                continue
-            safe = " ".join(re.sub(r"[^\w\s]", " ", raw).split())
-            if safe:
-                title_to_pubs.setdefault(safe, []).append(p)
-
-        for title_chunk in title_chunks:
-            if await self.run_is_canceled(db_session, run_id=run_id):
-                structured_log(logger, "info", "ingestion.enrichment_aborted", run_id=run_id)
-                return
-            batch = []
-            for t in title_chunk:
-                batch.extend(title_to_pubs.get(t, []))
-            if not batch:
-                continue
-            try:
-                openalex_works = await client.get_works_by_filter(
-                    {"title.search": "|".join(title_chunk)}, limit=len(title_chunk) * 3
+        batches = _publication_batches(publications)
+        max_concurrency = max(int(settings.openalex_enrichment_max_concurrency), 1)
+        fetcher = _OpenAlexChunkFetcher(client, max_concurrency=max_concurrency, run_id=run_id)
+        pending_batches = iter(batches)
+        window: deque[tuple[list[Publication], asyncio.Task[_ChunkFetch]]] = deque()
+
+        def _prefetch() -> None:
+            # Keep a bounded number of chunk requests in flight ahead of the batch being applied.
+            while len(window) < max_concurrency * 2:
+                next_batch = next(pending_batches, None)
+                if next_batch is None:
+                    return
+                titles, batch = next_batch
+                window.append((batch, asyncio.create_task(fetcher.fetch(titles))))
+
+        token = run_cancellation.acquire(run_id)
+        try:
+            _prefetch()
+            while window:
+                if await token.is_canceled(db_session):
+                    structured_log(logger, "info", "ingestion.enrichment_aborted", run_id=run_id)
+                    return
+                batch, task = window.popleft()
+                fetched = await task
+                _prefetch()
+                if fetched.status == FETCH_BUDGET_EXHAUSTED:
+                    structured_log(logger, "warning", "ingestion.openalex_budget_exhausted", run_id=run_id)
+                    break
+                if fetched.status == FETCH_RATE_LIMITED:
+                    structured_log(logger, "warning", "ingestion.openalex_rate_limited", run_id=run_id)
+                    continue
+                if fetched.status == FETCH_FAILED:
+                    for p in batch:
+                        p.openalex_last_attempt_at = now
+                    continue
+                arxiv_lookup_allowed = await self._enrich_batch(
+                    db_session,
+                    batch=batch,
+                    run_id=run_id,
+                    openalex_works=fetched.works,
+                    now=now,
+                    arxiv_lookup_allowed=arxiv_lookup_allowed,
                 )
-            except OpenAlexBudgetExhaustedError:
-                structured_log(logger, "warning", "ingestion.openalex_budget_exhausted", run_id=run_id)
-                break
-            except OpenAlexRateLimitError:
-                structured_log(logger, "warning", "ingestion.openalex_rate_limited", run_id=run_id)
-                await asyncio.sleep(60)
-                continue
-            except Exception as e:
-                structured_log(logger, "warning", "ingestion.openalex_enrichment_failed", error=str(e), run_id=run_id)
-                for p in batch:
-                    p.openalex_last_attempt_at = now
-                continue
-            should_continue, arxiv_lookup_allowed = await self._enrich_batch(
-                db_session,
-                batch=batch,
-                run_id=run_id,
-                openalex_works=openalex_works,
-                now=now,
-                arxiv_lookup_allowed=arxiv_lookup_allowed,
-            )
-            if not should_continue:
-                return
+        finally:
+            run_cancellation.release(token)
+            for _, task in window:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in window), return_exceptions=True)
 
         await self._flush_and_sweep_duplicates(db_session, run_id=run_id)
 
-    async def _discover_identifiers_for_enrichment(
+    async def _discover_identifiers_for_batch(
         self,
         db_session: AsyncSession,
         *,
-        publication: Publication,
+        batch: list[Publication],
         run_id: int,
         allow_arxiv_lookup: bool,
     ) -> bool:
-        if not allow_arxiv_lookup:
-            await identifier_service.sync_identifiers_for_publication_fields(
-                db_session,
-                publication=publication,
-            )
-            await self._publish_identifier_update_event(
-                db_session,
-                run_id=run_id,
-                publication_id=int(publication.id),
-            )
-            return False
-        try:
-            await identifier_service.discover_and_sync_identifiers_for_publication(
-                db_session,
-                publication=publication,
-                scholar_label=publication.author_text or "",
-            )
-            await self._publish_identifier_update_event(
-                db_session,
-                run_id=run_id,
-                publication_id=int(publication.id),
-            )
-            return True
-        except ArxivRateLimitError:
+        arxiv_lookup_allowed = await identifier_service.discover_and_sync_identifiers_for_publications(
+            db_session,
+            publications=batch,
+            allow_arxiv_lookup=allow_arxiv_lookup,
+            max_concurrency=settings.identifier_discovery_max_concurrency,
+        )
+        if allow_arxiv_lookup and not arxiv_lookup_allowed:
             structured_log(
                 logger,
                 "warning",
                 "ingestion.arxiv_rate_limited",
                 run_id=run_id,
-                publication_id=int(publication.id),
                 detail="arXiv temporarily disabled for remaining enrichment pass",
             )
-            await identifier_service.sync_identifiers_for_publication_fields(
-                db_session,
-                publication=publication,
-            )
-            await self._publish_identifier_update_event(
-                db_session,
-                run_id=run_id,
-                publication_id=int(publication.id),
-            )
-            return False
+        await self._publish_identifier_update_events(db_session, run_id=run_id, publications=batch)
+        return arxiv_lookup_allowed
 
-    async def _publish_identifier_update_event(
+    async def _publish_identifier_update_events(
         self,
         db_session: AsyncSession,
         *,
         run_id: int,
-        publication_id: int,
+        publications: list[Publication],
     ) -> None:
-        display = await identifier_service.display_identifier_for_publication_id(
+        if not run_events.has_subscribers(run_id):
+            return
+        displays = await identifier_service.display_identifiers_for_publications(
             db_session,
-            publication_id=publication_id,
+            publications=publications,
         )
-        if display is None:
-            return
-        await run_events.publish(
-            run_id=run_id,
-            event_type="identifier_updated",
-            data={
-                "publication_id": int(publication_id),
-                "display_identifier": {
-                    "kind": display.kind,
-                    "value": display.value,
-                    "label": display.label,
-                    "url": display.url,
-                    "confidence_score": float(display.confidence_score),
+        for publication in publications:
+            display = displays.get(int(publication.id))
+            if display is None:
+                continue
+            await run_events.publish(
+                run_id=run_id,
+                event_type="identifier_updated",
+                data={
+                    "publication_id": int(publication.id),
+                    "display_identifier": {
+                        "kind": display.kind,
+                        "value": display.value,
+                        "label": display.label,
+                        "url": display.url,
+                        "confidence_score": float(display.confidence_score),
+                    },
                 },
-            },
-        )
+            )
 
     async def enrich_publications_with_openalex(
         self,
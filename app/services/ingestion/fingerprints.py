@@ -67,6 +67,26 @@ _MIN_METADATA_CONTEXT_TOKENS = 4
 
 _CANONICAL_DEDUP_THRESHOLD = 0.82
 
+DEDUP_TOKEN_MIN_LENGTH = 3
+DEDUP_TOKEN_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "approach",
+        "for",
+        "in",
+        "method",
+        "of",
+        "on",
+        "the",
+        "to",
+        "using",
+        "via",
+        "with",
+    }
+)
+
 
 def normalize_title(value: str) -> str:
     lowered = _normalized_text(value).lower()
@@ -88,6 +108,21 @@ def canonical_title_tokens_for_dedup(title: str) -> set[str]:
     return _canonical_title_tokens(title)
 
 
+def near_duplicate_title_keys(title: str) -> tuple[str, list[str]]:
+    """Canonical text and sorted near-duplicate tokens stored on ``publications``.
+
+    Short tokens and stopwords are dropped. An empty token list means the title
+    never takes part in near-duplicate matching.
+    """
+    canonical = canonical_title_text_for_dedup(title)
+    tokens = {
+        token
+        for token in WORD_RE.findall(canonical)
+        if len(token) >= DEDUP_TOKEN_MIN_LENGTH and token not in DEDUP_TOKEN_STOPWORDS
+    }
+    return canonical, sorted(tokens)
+
+
 def _stripped_title_for_canonical(title: str) -> str:
     """Apply noise-stripping and lowercase but PRESERVE spaces (for later tokenization)."""
     t = _canonical_title_text(title)
@@ -309,7 +344,7 @@ def fuzzy_titles_match(
     return _jaccard(tokens_a, tokens_b) >= threshold
 
 
-def _dedupe_publication_candidates(
+def dedupe_publication_candidates(
     publications: list[PublicationCandidate],
     *,
     seen_canonical: set[str] | None = None,
@@ -0,0 +1,219 @@
+"""Content-addressed archive of fetched Scholar profile pages.
+
+With ``INGESTION_PAGE_ARCHIVE_ENABLED`` every fetched page that reached the
+parser (parsed, empty or layout-changed) is gzip-compressed to
+``<dir>/<sha[:2]>/<sha>.html.gz``, keyed by the same body SHA-256 as the run
+debug context, and indexed in ``scholar_page_archive_entries``. Identical
+bodies share one file. The dbops re-parse job replays archived pages through
+the parser and publication upsert without touching the network; the prune
+job applies retention and deletes files no entry references.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import CrawlRun, ScholarPageArchiveEntry, ScholarProfile
+from app.logging_utils import structured_log
+from app.services.scholar.parser import ParsedProfilePage, ParseState
+from app.services.scholar.source import FetchResult
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CODEC_GZIP = "gzip"
+BLOB_SUFFIX = ".html.gz"
+_GZIP_LEVEL = 6
+_ARCHIVED_STATES = {ParseState.OK, ParseState.NO_RESULTS, ParseState.LAYOUT_CHANGED}
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    body_sha256: str
+    raw_bytes: int
+    stored_bytes: int
+
+
+@dataclass(frozen=True)
+class BlobFile:
+    body_sha256: str
+    path: Path
+    size_bytes: int
+    modified_at: float
+
+
+def archive_enabled() -> bool:
+    return bool(settings.ingestion_page_archive_enabled)
+
+
+def archive_root() -> Path:
+    return Path(settings.ingestion_page_archive_dir)
+
+
+def blob_path(root: Path, sha256: str) -> Path:
+    return root / sha256[:2] / f"{sha256}{BLOB_SUFFIX}"
+
+
+def write_blob(root: Path, body: str) -> StoredBlob:
+    """Store ``body`` once; an existing file for the same digest is reused.
+
+    A reused file is touched, so the orphan sweep's age grace also covers the
+    window before the new entry that references it commits.
+    """
+    data = body.encode("utf-8")
+    sha256 = hashlib.sha256(data).hexdigest()
+    path = blob_path(root, sha256)
+    try:
+        os.utime(path)
+        return StoredBlob(body_sha256=sha256, raw_bytes=len(data), stored_bytes=path.stat().st_size)
+    except FileNotFoundError:
+        pass
+    compressed = gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so a concurrent reader never sees a partial file.
+    temp_path = path.parent / f".{sha256}.{uuid.uuid4().hex}.tmp"
+    temp_path.write_bytes(compressed)
+    os.replace(temp_path, path)
+    return StoredBlob(body_sha256=sha256, raw_bytes=len(data), stored_bytes=len(compressed))
+
+
+def read_blob(root: Path, sha256: str) -> str:
+    return gzip.decompress(blob_path(root, sha256).read_bytes()).decode("utf-8")
+
+
+def scan_blobs(root: Path) -> list[BlobFile]:
+    if not root.is_dir():
+        return []
+    blobs: list[BlobFile] = []
+    for path in root.glob(f"*/*{BLOB_SUFFIX}"):
+        stat = path.stat()
+        blobs.append(
+            BlobFile(
+                body_sha256=path.name.removesuffix(BLOB_SUFFIX),
+                path=path,
+                size_bytes=stat.st_size,
+                modified_at=stat.st_mtime,
+            )
+        )
+    return blobs
+
+
+def delete_unreferenced_blobs(root: Path, *, referenced: set[str], grace_seconds: float) -> tuple[int, int]:
+    """Delete blob files no entry references; return (files deleted, bytes freed).
+
+    Files younger than ``grace_seconds`` are kept: ingestion writes the file
+    before the transaction that inserts its entry commits.
+    """
+    cutoff = time.time() - grace_seconds
+    deleted = freed = 0
+    for blob in scan_blobs(root):
+        if blob.body_sha256 in referenced or blob.modified_at > cutoff:
+            continue
+        blob.path.unlink(missing_ok=True)
+        deleted += 1
+        freed += blob.size_bytes
+    return deleted, freed
+
+
+def should_archive(*, fetch_result: FetchResult, parsed_page: ParsedProfilePage) -> bool:
+    return bool(fetch_result.body) and parsed_page.state in _ARCHIVED_STATES
+
+
+async def archive_page(
+    db_session: AsyncSession,
+    *,
+    run: CrawlRun,
+    scholar: ScholarProfile,
+    cstart: int,
+    page_size: int,
+    fetch_result: FetchResult,
+    parsed_page: ParsedProfilePage,
+) -> None:
+    """Archive one fetched page; the entry commits with the caller's transaction."""
+    if not should_archive(fetch_result=fetch_result, parsed_page=parsed_page):
+        return
+    try:
+        stored = await asyncio.to_thread(write_blob, archive_root(), fetch_result.body)
+    except OSError as exc:
+        structured_log(
+            logger,
+            "warning",
+            "ingestion.page_archive_write_failed",
+            scholar_profile_id=scholar.id,
+            cstart=cstart,
+            error=str(exc),
+        )
+        return
+    db_session.add(
+        ScholarPageArchiveEntry(
+            scholar_profile_id=scholar.id,
+            crawl_run_id=run.id,
+            cstart=int(cstart),
+            page_size=int(page_size),
+            body_sha256=stored.body_sha256,
+            codec=CODEC_GZIP,
+            raw_bytes=stored.raw_bytes,
+            stored_bytes=stored.stored_bytes,
+            status_code=fetch_result.status_code,
+            requested_url=fetch_result.requested_url,
+            final_url=fetch_result.final_url,
+            parse_state=parsed_page.state.value,
+            parse_state_reason=(parsed_page.state_reason or None),
+        )
+    )
+
+
+async def archive_usage(db_session: AsyncSession) -> dict[str, Any]:
+    """Summarize the archive index; sizes count each distinct body once."""
+    entries = (
+        await db_session.execute(
+            select(
+                func.count(),
+                func.count().filter(ScholarPageArchiveEntry.parse_state == ParseState.LAYOUT_CHANGED.value),
+                func.min(ScholarPageArchiveEntry.fetched_at),
+                func.max(ScholarPageArchiveEntry.fetched_at),
+            )
+        )
+    ).one()
+    blobs = (
+        select(
+            func.max(ScholarPageArchiveEntry.raw_bytes).label("raw_bytes"),
+            func.max(ScholarPageArchiveEntry.stored_bytes).label("stored_bytes"),
+        )
+        .group_by(ScholarPageArchiveEntry.body_sha256)
+        .subquery()
+    )
+    blob_count, raw_bytes, stored_bytes = (
+        await db_session.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(blobs.c.raw_bytes), 0),
+                func.coalesce(func.sum(blobs.c.stored_bytes), 0),
+            )
+        )
+    ).one()
+    return {
+        "enabled": archive_enabled(),
+        "retention_days": int(settings.ingestion_page_archive_retention_days),
+        "keep_latest": int(settings.ingestion_page_archive_keep_latest),
+        "entry_count": int(entries[0]),
+        "layout_changed_entry_count": int(entries[1]),
+        "blob_count": int(blob_count),
+        "raw_bytes": int(raw_bytes),
+        "stored_bytes": int(stored_bytes),
+        "compression_ratio": round(int(stored_bytes) / int(raw_bytes), 4) if raw_bytes else 0.0,
+        "oldest_fetched_at": entries[2],
+        "newest_fetched_at": entries[3],
+    }
@@ -5,11 +5,11 @@ import logging
 from typing import Any
 
 from app.logging_utils import structured_log
+from app.services.scholar import parse_executor
 from app.services.scholar.parser import (
     ParsedProfilePage,
     ParseState,
     ScholarParserError,
-    parse_profile_page,
 )
 from app.services.scholar.source import FetchResult, ScholarSource
 
@@ -69,13 +69,13 @@ class PageFetcher:
 
     # ── Parse helpers ────────────────────────────────────────────────
 
-    def parse_page_or_layout_error(
+    async def parse_page_or_layout_error(
         self,
         *,
         fetch_result: FetchResult,
     ) -> ParsedProfilePage:
         try:
-            return parse_profile_page(fetch_result)
+            return await parse_executor.parse_profile_page(fetch_result)
         except ScholarParserError as exc:
             return self._parsed_page_from_parser_error(code=exc.code)
 
@@ -186,7 +186,7 @@ class PageFetcher:
                 cstart=cstart,
                 page_size=page_size,
             )
-            parsed_page = self.parse_page_or_layout_error(fetch_result=fetch_result)
+            parsed_page = await self.parse_page_or_layout_error(fetch_result=fetch_result)
             network_attempts, rate_limit_attempts, total_attempts = self._classify_attempt(
                 parsed_page, network_attempts=network_attempts, rate_limit_attempts=rate_limit_attempts
             )
@@ -4,12 +4,13 @@ import asyncio
 import logging
 from typing import Any
 
+from app import metrics
 from app.db.models import CrawlRun, RunStatus, ScholarProfile
 from app.logging_utils import structured_log
 from app.services.ingestion.fingerprints import (
-    _dedupe_publication_candidates,
     _next_cstart_value,
     build_initial_page_fingerprint,
+    dedupe_publication_candidates,
 )
 from app.services.ingestion.page_fetch import PageFetcher
 from app.services.ingestion.types import PagedLoopState, PagedParseResult
@@ -22,7 +23,8 @@ logger = logging.getLogger(__name__)
 class PaginationEngine:
     """Fetches and paginates Google Scholar profile pages.
 
-    Pure HTTP + parsing — no DB writes except via the provided upsert callback.
+    Pure HTTP + parsing — no DB writes except via the provided upsert and
+    archive callbacks.
     """
 
     def __init__(self, *, source: ScholarSource) -> None:
@@ -271,6 +273,30 @@ class PaginationEngine:
         ]
         return fetch_result, parsed_page, first_page_fingerprint_sha256, attempt_log, page_logs
 
+    @staticmethod
+    async def _archive_page(
+        db_session: Any,
+        *,
+        run: CrawlRun,
+        scholar: ScholarProfile,
+        cstart: int,
+        page_size: int,
+        fetch_result: FetchResult,
+        parsed_page: ParsedProfilePage,
+        archive_page_fn: Any,
+    ) -> None:
+        if archive_page_fn is None:
+            return
+        await archive_page_fn(
+            db_session,
+            run=run,
+            scholar=scholar,
+            cstart=cstart,
+            page_size=page_size,
+            fetch_result=fetch_result,
+            parsed_page=parsed_page,
+        )
+
     # ── Pagination loop ──────────────────────────────────────────────
 
     @staticmethod
@@ -284,9 +310,13 @@ class PaginationEngine:
         state: PagedLoopState,
         upsert_publications_fn: Any,
     ) -> None:
-        deduped = _dedupe_publication_candidates(list(publications), seen_canonical=seen_canonical)
+        with metrics.INGESTION_PAGE_DEDUPE_SECONDS.time():
+            deduped = dedupe_publication_candidates(list(publications), seen_canonical=seen_canonical)
         if deduped:
-            discovered_count = await upsert_publications_fn(db_session, run=run, scholar=scholar, publications=deduped)
+            with metrics.INGESTION_PAGE_UPSERT_SECONDS.time():
+                discovered_count = await upsert_publications_fn(
+                    db_session, run=run, scholar=scholar, publications=deduped
+                )
             state.discovered_publication_count += discovered_count
 
     async def _paginate_loop(
@@ -304,6 +334,7 @@ class PaginationEngine:
         rate_limit_retries: int,
         rate_limit_backoff_seconds: float,
         upsert_publications_fn: Any,
+        archive_page_fn: Any,
     ) -> None:
         seen_canonical: set[str] = set()
 
@@ -352,6 +383,16 @@ class PaginationEngine:
                 parsed_page=next_parsed_page,
                 page_attempt_log=next_attempt_log,
             )
+            await self._archive_page(
+                db_session,
+                run=run,
+                scholar=scholar,
+                cstart=state.current_cstart,
+                page_size=bounded_page_size,
+                fetch_result=next_fetch_result,
+                parsed_page=next_parsed_page,
+                archive_page_fn=archive_page_fn,
+            )
 
             if self._handle_page_state_transition(state=state):
                 return
@@ -381,7 +422,7 @@ class PaginationEngine:
             first_page_fetch_result=first_page_fetch_result,
             first_page_parsed_page=first_page_parsed_page,
             first_page_fingerprint_sha256=first_page_fingerprint_sha256,
-            publications=_dedupe_publication_candidates(state.publications),
+            publications=dedupe_publication_candidates(state.publications),
             attempt_log=state.attempt_log,
             page_logs=state.page_logs,
             pages_fetched=state.pages_fetched,
@@ -446,6 +487,7 @@ class PaginationEngine:
         page_size: int,
         previous_initial_page_fingerprint_sha256: str | None = None,
         upsert_publications_fn: Any = None,
+        archive_page_fn: Any = None,
     ) -> PagedParseResult:
         bounded_max_pages = max(1, int(max_pages))
         bounded_page_size = max(1, int(page_size))
@@ -464,6 +506,16 @@ class PaginationEngine:
             rate_limit_retries=rate_limit_retries,
             rate_limit_backoff_seconds=rate_limit_backoff_seconds,
         )
+        await self._archive_page(
+            db_session,
+            run=run,
+            scholar=scholar,
+            cstart=start_cstart,
+            page_size=bounded_page_size,
+            fetch_result=fetch_result,
+            parsed_page=parsed_page,
+            archive_page_fn=archive_page_fn,
+        )
         shortcut_result = self._short_circuit_initial_page(
             start_cstart=start_cstart,
             previous_initial_page_fingerprint_sha256=previous_initial_page_fingerprint_sha256,
@@ -495,6 +547,7 @@ class PaginationEngine:
             rate_limit_retries=rate_limit_retries,
             rate_limit_backoff_seconds=rate_limit_backoff_seconds,
             upsert_publications_fn=upsert_publications_fn,
+            archive_page_fn=archive_page_fn,
         )
         return self._result_from_pagination_state(
             state=state,
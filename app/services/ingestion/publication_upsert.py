@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import CrawlRun, Publication, ScholarProfile, ScholarPublication
@@ -12,6 +16,7 @@ from app.services.ingestion.fingerprints import (
     build_publication_fingerprint,
     build_publication_url,
     canonical_title_for_dedup,
+    near_duplicate_title_keys,
     normalize_title,
 )
 from app.services.publication_identifiers import application as identifier_service
@@ -28,64 +33,74 @@ def validate_publication_candidate(candidate: PublicationCandidate) -> None:
         raise RuntimeError("Publication candidate has negative citation_count.")
 
 
-async def find_publication_by_cluster(
-    db_session: AsyncSession,
-    *,
-    cluster_id: str | None,
-) -> Publication | None:
-    if not cluster_id:
-        return None
-    result = await db_session.execute(select(Publication).where(Publication.cluster_id == cluster_id))
-    return result.scalar_one_or_none()
-
-
-async def find_publication_by_fingerprint(
-    db_session: AsyncSession,
-    *,
-    fingerprint: str,
-) -> Publication | None:
-    result = await db_session.execute(select(Publication).where(Publication.fingerprint_sha256 == fingerprint))
-    return result.scalar_one_or_none()
-
-
-def select_existing_publication(
-    *,
-    cluster_publication: Publication | None,
-    fingerprint_publication: Publication | None,
-) -> Publication | None:
-    if cluster_publication is not None:
-        return cluster_publication
-    return fingerprint_publication
-
-
 def compute_canonical_title_hash(title: str) -> str:
     canonical = canonical_title_for_dedup(title)
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
-async def find_publication_by_canonical_title_hash(
-    db_session: AsyncSession,
-    *,
-    canonical_title_hash: str,
-) -> Publication | None:
-    result = await db_session.execute(
-        select(Publication).where(Publication.canonical_title_hash == canonical_title_hash)
+@dataclass(frozen=True)
+class CandidateKeys:
+    cluster_id: str | None
+    fingerprint: str
+    canonical_title_hash: str
+
+
+def candidate_keys(candidate: PublicationCandidate) -> CandidateKeys:
+    return CandidateKeys(
+        cluster_id=candidate.cluster_id or None,
+        fingerprint=build_publication_fingerprint(candidate),
+        canonical_title_hash=compute_canonical_title_hash(candidate.title),
     )
-    return result.scalar_one_or_none()
 
 
-async def create_publication(
-    db_session: AsyncSession,
+class PublicationIndex:
+    """In-memory view of the publications a page can match against.
+
+    Lookup precedence mirrors the per-row resolver: cluster_id, then
+    fingerprint, then canonical title hash. The first publication registered
+    for a key wins, so seeding in ascending id order keeps hash collisions
+    deterministic.
+    """
+
+    def __init__(self, publications: Iterable[Publication] = ()) -> None:
+        self._by_cluster: dict[str, Publication] = {}
+        self._by_fingerprint: dict[str, Publication] = {}
+        self._by_canonical_hash: dict[str, Publication] = {}
+        for publication in sorted(publications, key=lambda row: int(row.id)):
+            self.add(publication)
+
+    def add(self, publication: Publication) -> None:
+        if publication.cluster_id:
+            self._by_cluster.setdefault(publication.cluster_id, publication)
+        self._by_fingerprint.setdefault(publication.fingerprint_sha256, publication)
+        if publication.canonical_title_hash:
+            self._by_canonical_hash.setdefault(publication.canonical_title_hash, publication)
+
+    def match(self, keys: CandidateKeys) -> Publication | None:
+        if keys.cluster_id:
+            cluster_publication = self._by_cluster.get(keys.cluster_id)
+            if cluster_publication is not None:
+                return cluster_publication
+        fingerprint_publication = self._by_fingerprint.get(keys.fingerprint)
+        if fingerprint_publication is not None:
+            return fingerprint_publication
+        return self._by_canonical_hash.get(keys.canonical_title_hash)
+
+
+def build_new_publication(
     *,
     candidate: PublicationCandidate,
-    fingerprint: str,
+    keys: CandidateKeys,
 ) -> Publication:
-    publication = Publication(
+    dedup_title_text, dedup_title_tokens = near_duplicate_title_keys(candidate.title)
+    return Publication(
         cluster_id=candidate.cluster_id,
-        fingerprint_sha256=fingerprint,
+        fingerprint_sha256=keys.fingerprint,
         title_raw=candidate.title,
         title_normalized=normalize_title(candidate.title),
-        canonical_title_hash=compute_canonical_title_hash(candidate.title),
+        canonical_title_hash=keys.canonical_title_hash,
+        dedup_title_text=dedup_title_text,
+        dedup_title_tokens=dedup_title_tokens,
         year=candidate.year,
         citation_count=int(candidate.citation_count or 0),
         author_text=candidate.authors_text,
@@ -93,9 +108,6 @@ async def create_publication(
         pub_url=build_publication_url(candidate.title_url),
         pdf_url=None,
     )
-    db_session.add(publication)
-    await db_session.flush()
-    return publication
 
 
 def update_existing_publication(
@@ -108,6 +120,7 @@ def update_existing_publication(
     if not publication.title_raw:
         publication.title_raw = candidate.title
         publication.title_normalized = normalize_title(candidate.title)
+        publication.dedup_title_text, publication.dedup_title_tokens = near_duplicate_title_keys(candidate.title)
     if candidate.year is not None:
         publication.year = candidate.year
     if candidate.citation_count is not None:
@@ -120,50 +133,197 @@ def update_existing_publication(
         publication.pub_url = build_publication_url(candidate.title_url)
 
 
-async def resolve_publication(
+def plan_publication_resolution(
+    *,
+    index: PublicationIndex,
+    candidates: list[PublicationCandidate],
+    keys: list[CandidateKeys],
+) -> tuple[list[Publication], list[Publication]]:
+    """Resolve candidates in page order against the index.
+
+    Returns ``(resolved, pending)`` where ``resolved`` holds one publication per
+    candidate and ``pending`` lists the new, not yet persisted publications.
+    New rows are registered in the index immediately so later candidates on
+    the same page match them exactly as the sequential resolver did.
+    """
+    resolved: list[Publication] = []
+    pending: list[Publication] = []
+    for candidate, candidate_key in zip(candidates, keys, strict=True):
+        publication = index.match(candidate_key)
+        if publication is None:
+            publication = build_new_publication(candidate=candidate, keys=candidate_key)
+            pending.append(publication)
+        else:
+            update_existing_publication(publication=publication, candidate=candidate)
+        index.add(publication)
+        resolved.append(publication)
+    return resolved, pending
+
+
+async def load_matching_publications(
     db_session: AsyncSession,
-    candidate: PublicationCandidate,
-) -> Publication:
-    validate_publication_candidate(candidate)
-    fingerprint = build_publication_fingerprint(candidate)
-    cluster_publication = await find_publication_by_cluster(
-        db_session,
-        cluster_id=candidate.cluster_id,
+    *,
+    keys: list[CandidateKeys],
+) -> list[Publication]:
+    if not keys:
+        return []
+    cluster_ids = sorted({key.cluster_id for key in keys if key.cluster_id})
+    clauses = [
+        Publication.fingerprint_sha256.in_(sorted({key.fingerprint for key in keys})),
+        Publication.canonical_title_hash.in_(sorted({key.canonical_title_hash for key in keys})),
+    ]
+    if cluster_ids:
+        clauses.append(Publication.cluster_id.in_(cluster_ids))
+    result = await db_session.execute(select(Publication).where(or_(*clauses)))
+    return list(result.scalars().all())
+
+
+def _publication_insert_values(publication: Publication) -> dict[str, Any]:
+    return {
+        "cluster_id": publication.cluster_id,
+        "fingerprint_sha256": publication.fingerprint_sha256,
+        "title_raw": publication.title_raw,
+        "title_normalized": publication.title_normalized,
+        "canonical_title_hash": publication.canonical_title_hash,
+        "dedup_title_text": publication.dedup_title_text,
+        "dedup_title_tokens": publication.dedup_title_tokens,
+        "year": publication.year,
+        "citation_count": int(publication.citation_count or 0),
+        "author_text": publication.author_text,
+        "venue_text": publication.venue_text,
+        "pub_url": publication.pub_url,
+        "pdf_url": publication.pdf_url,
+    }
+
+
+async def _insert_pending_publications(
+    db_session: AsyncSession,
+    *,
+    pending: list[Publication],
+) -> dict[str, Publication]:
+    if not pending:
+        return {}
+    stmt = (
+        pg_insert(Publication)
+        .values([_publication_insert_values(row) for row in pending])
+        .on_conflict_do_nothing()
+        .returning(Publication)
     )
-    fingerprint_publication = await find_publication_by_fingerprint(
+    result = await db_session.scalars(select(Publication).from_statement(stmt))
+    return {row.fingerprint_sha256: row for row in result.all()}
+
+
+async def _resolve_insert_conflicts(
+    db_session: AsyncSession,
+    *,
+    candidates: list[PublicationCandidate],
+    keys: list[CandidateKeys],
+    resolved: list[Publication],
+    conflicted: list[Publication],
+) -> dict[int, Publication]:
+    # A concurrent run inserted the same publication between our lookup and insert.
+    # Re-read the winners and apply this page's fields to them instead.
+    conflicted_ids = {id(row) for row in conflicted}
+    conflicted_keys = [key for key, row in zip(keys, resolved, strict=True) if id(row) in conflicted_ids]
+    index = PublicationIndex(await load_matching_publications(db_session, keys=conflicted_keys))
+    replacements: dict[int, Publication] = {}
+    for candidate, key, row in zip(candidates, keys, resolved, strict=True):
+        if id(row) not in conflicted_ids:
+            continue
+        winner = index.match(key)
+        if winner is None:
+            raise RuntimeError("Publication insert conflicted but no matching row was found.")
+        update_existing_publication(publication=winner, candidate=candidate)
+        replacements[id(row)] = winner
+    return replacements
+
+
+def unique_publications(publications: Iterable[Publication]) -> list[Publication]:
+    seen_ids: set[int] = set()
+    unique: list[Publication] = []
+    for publication in publications:
+        if int(publication.id) in seen_ids:
+            continue
+        seen_ids.add(int(publication.id))
+        unique.append(publication)
+    return unique
+
+
+async def resolve_publications(
+    db_session: AsyncSession,
+    candidates: list[PublicationCandidate],
+) -> list[Publication]:
+    """Resolve a page of candidates to persisted publications, one per candidate.
+
+    Lookups run as a single ``IN (...)`` query and new rows are written with one
+    ``INSERT ... ON CONFLICT DO NOTHING`` instead of per-candidate round trips.
+    """
+    for candidate in candidates:
+        validate_publication_candidate(candidate)
+    keys = [candidate_keys(candidate) for candidate in candidates]
+    index = PublicationIndex(await load_matching_publications(db_session, keys=keys))
+    resolved, pending = plan_publication_resolution(index=index, candidates=candidates, keys=keys)
+
+    inserted = await _insert_pending_publications(db_session, pending=pending)
+    replacements = {id(row): inserted[row.fingerprint_sha256] for row in pending if row.fingerprint_sha256 in inserted}
+    conflicted = [row for row in pending if row.fingerprint_sha256 not in inserted]
+    if conflicted:
+        replacements.update(
+            await _resolve_insert_conflicts(
+                db_session,
+                candidates=candidates,
+                keys=keys,
+                resolved=resolved,
+                conflicted=conflicted,
+            )
+        )
+    resolved = [replacements.get(id(row), row) for row in resolved]
+
+    await identifier_service.sync_identifiers_for_publications_fields(
         db_session,
-        fingerprint=fingerprint,
-    )
-    publication = select_existing_publication(
-        cluster_publication=cluster_publication,
-        fingerprint_publication=fingerprint_publication,
+        publications=unique_publications(resolved),
     )
-    if publication is None:
-        canonical_hash = compute_canonical_title_hash(candidate.title)
-        publication = await find_publication_by_canonical_title_hash(
-            db_session,
-            canonical_title_hash=canonical_hash,
-        )
-    if publication is None:
-        created = await create_publication(
-            db_session,
-            candidate=candidate,
-            fingerprint=fingerprint,
+    return resolved
+
+
+async def resolve_publication(
+    db_session: AsyncSession,
+    candidate: PublicationCandidate,
+) -> Publication:
+    resolved = await resolve_publications(db_session, [candidate])
+    return resolved[0]
+
+
+async def insert_missing_scholar_links(
+    db_session: AsyncSession,
+    *,
+    run: CrawlRun,
+    scholar: ScholarProfile,
+    publications: list[Publication],
+) -> set[int]:
+    """Link publications to the scholar and return the ids that were newly linked."""
+    if not publications:
+        return set()
+    stmt = (
+        pg_insert(ScholarPublication)
+        .values(
+            [
+                {
+                    "scholar_profile_id": scholar.id,
+                    "publication_id": publication.id,
+                    "is_read": False,
+                    "first_seen_run_id": run.id,
+                }
+                for publication in publications
+            ]
         )
-        await identifier_service.sync_identifiers_for_publication_fields(
-            db_session,
-            publication=created,
+        .on_conflict_do_nothing(
+            index_elements=[ScholarPublication.scholar_profile_id, ScholarPublication.publication_id],
         )
-        return created
-    update_existing_publication(
-        publication=publication,
-        candidate=candidate,
+        .returning(ScholarPublication.publication_id)
     )
-    await identifier_service.sync_identifiers_for_publication_fields(
-        db_session,
-        publication=publication,
-    )
-    return publication
+    result = await db_session.execute(stmt)
+    return {int(publication_id) for publication_id in result.scalars().all()}
 
 
 async def upsert_profile_publications(
@@ -173,41 +333,21 @@ async def upsert_profile_publications(
     scholar: ScholarProfile,
     publications: list[PublicationCandidate],
 ) -> int:
-    seen_publication_ids: set[int] = set()
-    discovered_count = 0
-
     try:
-        for candidate in publications:
-            publication = await resolve_publication(db_session, candidate)
-            if publication.id in seen_publication_ids:
-                continue
-            seen_publication_ids.add(publication.id)
-
-            link_result = await db_session.execute(
-                select(ScholarPublication).where(
-                    ScholarPublication.scholar_profile_id == scholar.id,
-                    ScholarPublication.publication_id == publication.id,
-                )
-            )
-            link = link_result.scalar_one_or_none()
-            if link is not None:
-                continue
-
-            link = ScholarPublication(
-                scholar_profile_id=scholar.id,
-                publication_id=publication.id,
-                is_read=False,
-                first_seen_run_id=run.id,
-            )
-            db_session.add(link)
-            discovered_count += 1
-
-            await flush_discovered_publication(
-                db_session,
-                run=run,
-                scholar=scholar,
-                publication=publication,
-            )
+        resolved = unique_publications(await resolve_publications(db_session, publications))
+        linked_ids = await insert_missing_scholar_links(
+            db_session,
+            run=run,
+            scholar=scholar,
+            publications=resolved,
+        )
+        discovered = [publication for publication in resolved if int(publication.id) in linked_ids]
+        await flush_discovered_publications(
+            db_session,
+            run=run,
+            scholar=scholar,
+            publications=discovered,
+        )
 
         if not scholar.baseline_completed:
             scholar.baseline_completed = True
@@ -217,28 +357,32 @@ async def upsert_profile_publications(
         await db_session.rollback()
         raise
 
-    return discovered_count
+    return len(discovered)
 
 
-async def flush_discovered_publication(
+async def flush_discovered_publications(
     db_session: AsyncSession,
     *,
     run: CrawlRun,
     scholar: ScholarProfile,
-    publication: Publication,
+    publications: list[Publication],
 ) -> None:
-    run.new_pub_count = int(run.new_pub_count or 0) + 1
+    if not publications:
+        return
+    base_count = int(run.new_pub_count or 0)
+    run.new_pub_count = base_count + len(publications)
     await db_session.flush()
-    await run_events.publish(
-        run_id=run.id,
-        event_type="publication_discovered",
-        data={
-            "publication_id": publication.id,
-            "title": publication.title_raw,
-            "pub_url": publication.pub_url,
-            "scholar_profile_id": scholar.id,
-            "scholar_label": scholar.display_name or scholar.scholar_id,
-            "first_seen_at": datetime.now(UTC).isoformat(),
-            "new_publication_count": int(run.new_pub_count or 0),
-        },
-    )
+    for offset, publication in enumerate(publications, start=1):
+        await run_events.publish(
+            run_id=run.id,
+            event_type="publication_discovered",
+            data={
+                "publication_id": publication.id,
+                "title": publication.title_raw,
+                "pub_url": publication.pub_url,
+                "scholar_profile_id": scholar.id,
+                "scholar_label": scholar.display_name or scholar.scholar_id,
+                "first_seen_at": datetime.now(UTC).isoformat(),
+                "new_publication_count": base_count + offset,
+            },
+        )
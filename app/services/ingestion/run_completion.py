@@ -5,8 +5,11 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.db.models import (
     CrawlRun,
+    CrawlRunScholarResult,
     RunStatus,
     ScholarProfile,
 )
@@ -172,42 +175,84 @@ def apply_safety_outcome(
         )
 
 
+def _optional_text(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def build_scholar_result_row(*, run_id: int, position: int, entry: dict[str, Any]) -> CrawlRunScholarResult:
+    continuation_cstart = entry.get("continuation_cstart")
+    warnings = entry.get("warnings")
+    debug = entry.get("debug")
+    return CrawlRunScholarResult(
+        crawl_run_id=run_id,
+        position=position,
+        scholar_profile_id=int_or_default(entry.get("scholar_profile_id"), 0) or None,
+        scholar_id=_optional_text(entry.get("scholar_id")) or "unknown",
+        state=_optional_text(entry.get("state")) or "unknown",
+        state_reason=_optional_text(entry.get("state_reason")),
+        outcome=_optional_text(entry.get("outcome")) or "failed",
+        attempt_count=int_or_default(entry.get("attempt_count"), 0),
+        publication_count=int_or_default(entry.get("publication_count"), 0),
+        start_cstart=int_or_default(entry.get("start_cstart"), 0),
+        pages_fetched=int_or_default(entry.get("pages_fetched"), 0),
+        pages_attempted=int_or_default(entry.get("pages_attempted"), 0),
+        has_more_remaining=bool(entry.get("has_more_remaining")),
+        pagination_truncated_reason=_optional_text(entry.get("pagination_truncated_reason")),
+        articles_range=_optional_text(entry.get("articles_range")),
+        has_show_more_button=bool(entry.get("has_show_more_button")),
+        skipped_no_change=bool(entry.get("skipped_no_change")),
+        initial_page_fingerprint_sha256=_optional_text(entry.get("initial_page_fingerprint_sha256")),
+        continuation_cstart=int_or_default(continuation_cstart) if continuation_cstart is not None else None,
+        continuation_enqueued=bool(entry.get("continuation_enqueued")),
+        continuation_reason=_optional_text(entry.get("continuation_reason")),
+        continuation_cleared=bool(entry.get("continuation_cleared")),
+        warnings=[str(code) for code in warnings] if isinstance(warnings, list) else [],
+        error=_optional_text(entry.get("error")),
+        debug=debug if isinstance(debug, dict) else None,
+    )
+
+
 def finalize_run_record(
+    db_session: AsyncSession,
     *,
     run: CrawlRun,
-    scholars: list[ScholarProfile],
     progress: RunProgress,
     failure_summary: RunFailureSummary,
     alert_summary: RunAlertSummary,
-    idempotency_key: str | None,
     run_status: RunStatus,
 ) -> None:
     run.end_dt = datetime.now(UTC)
     if run.status != RunStatus.CANCELED:
         run.status = run_status
-    run.error_log = {
-        "scholar_results": progress.scholar_results,
-        "summary": {
-            "succeeded_count": progress.succeeded_count,
-            "failed_count": progress.failed_count,
-            "partial_count": progress.partial_count,
-            "failed_state_counts": failure_summary.failed_state_counts,
-            "failed_reason_counts": failure_summary.failed_reason_counts,
-            "scrape_failure_counts": failure_summary.scrape_failure_counts,
-            "retry_counts": {
-                "retries_scheduled_count": failure_summary.retries_scheduled_count,
-                "scholars_with_retries_count": failure_summary.scholars_with_retries_count,
-                "retry_exhausted_count": failure_summary.retry_exhausted_count,
-            },
-            "alert_thresholds": {
-                "blocked_failure_threshold": alert_summary.blocked_failure_threshold,
-                "network_failure_threshold": alert_summary.network_failure_threshold,
-                "retry_scheduled_threshold": alert_summary.retry_scheduled_threshold,
-            },
-            "alert_flags": alert_summary.alert_flags,
+    run.succeeded_count = progress.succeeded_count
+    run.failed_count = progress.failed_count
+    run.partial_count = progress.partial_count
+    run.summary = {
+        "succeeded_count": progress.succeeded_count,
+        "failed_count": progress.failed_count,
+        "partial_count": progress.partial_count,
+        "failed_state_counts": failure_summary.failed_state_counts,
+        "failed_reason_counts": failure_summary.failed_reason_counts,
+        "scrape_failure_counts": failure_summary.scrape_failure_counts,
+        "retry_counts": {
+            "retries_scheduled_count": failure_summary.retries_scheduled_count,
+            "scholars_with_retries_count": failure_summary.scholars_with_retries_count,
+            "retry_exhausted_count": failure_summary.retry_exhausted_count,
+        },
+        "alert_thresholds": {
+            "blocked_failure_threshold": alert_summary.blocked_failure_threshold,
+            "network_failure_threshold": alert_summary.network_failure_threshold,
+            "retry_scheduled_threshold": alert_summary.retry_scheduled_threshold,
         },
-        "meta": {"idempotency_key": idempotency_key} if idempotency_key else {},
+        "alert_flags": alert_summary.alert_flags,
     }
+    db_session.add_all(
+        build_scholar_result_row(run_id=int(run.id), position=position, entry=entry)
+        for position, entry in enumerate(progress.scholar_results)
+    )
 
 
 def resolve_run_status(
@@ -302,13 +347,13 @@ def _log_alert_threshold_warnings(
 
 
 def complete_run_for_user(
+    db_session: AsyncSession,
     *,
     user_settings: Any,
     run: CrawlRun,
     scholars: list[ScholarProfile],
     user_id: int,
     progress: RunProgress,
-    idempotency_key: str | None,
     alert_blocked_failure_threshold: int,
     alert_network_failure_threshold: int,
     alert_retry_scheduled_threshold: int,
@@ -331,12 +376,11 @@ def complete_run_for_user(
         partial_count=progress.partial_count,
     )
     finalize_run_record(
+        db_session,
         run=run,
-        scholars=scholars,
         progress=progress,
         failure_summary=failure_summary,
         alert_summary=alert_summary,
-        idempotency_key=idempotency_key,
         run_status=run_status,
     )
     return failure_summary, alert_summary
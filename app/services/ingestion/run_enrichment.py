@@ -6,9 +6,11 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import metrics
 from app.db.models import CrawlRun, RunStatus
 from app.logging_utils import structured_log
 from app.services.ingestion.enrichment import EnrichmentRunner
+from app.services.publications.facet_cache import invalidate_publication_counts_for_user
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +27,18 @@ async def background_enrich(
 ) -> None:
     try:
         async with session_factory() as session:
-            await enrichment_runner.enrich_pending_publications(
-                session,
-                run_id=run_id,
-                openalex_api_key=openalex_api_key,
-            )
+            with metrics.INGESTION_ENRICHMENT_SECONDS.time(mode="background"):
+                await enrichment_runner.enrich_pending_publications(
+                    session,
+                    run_id=run_id,
+                    openalex_api_key=openalex_api_key,
+                )
             run = await session.get(CrawlRun, run_id)
             if run is not None and run.status == RunStatus.RESOLVING:
                 run.status = intended_final_status
             await session.commit()
+            if run is not None:
+                invalidate_publication_counts_for_user(run.user_id)
             structured_log(
                 logger,
                 "info",
@@ -72,11 +77,12 @@ async def inline_enrich_and_finalize(
     intended_final_status: RunStatus,
 ) -> None:
     try:
-        await enrichment_runner.enrich_pending_publications(
-            db_session,
-            run_id=run.id,
-            openalex_api_key=getattr(user_settings, "openalex_api_key", None),
-        )
+        with metrics.INGESTION_ENRICHMENT_SECONDS.time(mode="inline"):
+            await enrichment_runner.enrich_pending_publications(
+                db_session,
+                run_id=run.id,
+                openalex_api_key=getattr(user_settings, "openalex_api_key", None),
+            )
     except Exception:
         structured_log(
             logger,
@@ -87,6 +93,7 @@ async def inline_enrich_and_finalize(
     if run.status == RunStatus.RESOLVING:
         run.status = intended_final_status
     await db_session.commit()
+    invalidate_publication_counts_for_user(run.user_id)
 
 
 def spawn_background_enrichment_task(
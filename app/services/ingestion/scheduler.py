@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 
-from app.db.background_session import background_session
+from app.db.background_session import background_session, background_session_limit
 from app.db.models import (
     CrawlRun,
     RunTriggerType,
@@ -16,6 +18,7 @@ from app.db.models import (
     UserSetting,
 )
 from app.logging_utils import structured_log
+from app.services.ingestion import crawl_schedule
 from app.services.ingestion.application import (
     RunAlreadyInProgressError,
     RunBlockedBySafetyPolicyError,
@@ -38,6 +41,15 @@ class _AutoRunCandidate:
     cooldown_reason: str | None
 
 
+@dataclass(frozen=True)
+class SchedulerTickMetrics:
+    due_count: int
+    started_count: int
+    deferred_count: int
+    in_flight_count: int
+    duration_ms: int
+
+
 class SchedulerService:
     def __init__(
         self,
@@ -53,6 +65,7 @@ class SchedulerService:
         continuation_max_delay_seconds: int,
         continuation_max_attempts: int,
         queue_batch_size: int,
+        max_concurrent_runs: int = 1,
     ) -> None:
         self._enabled = enabled
         self._tick_seconds = max(5, int(tick_seconds))
@@ -68,7 +81,14 @@ class SchedulerService:
         )
         self._continuation_max_attempts = max(1, int(continuation_max_attempts))
         self._queue_batch_size = max(1, int(queue_batch_size))
+        # Each in-flight run holds a background DB session for its whole
+        # duration; keep one permit free for the continuation and PDF drains.
+        self._session_budget = max(1, background_session_limit() - 1)
+        self._max_concurrent_runs = max(1, min(int(max_concurrent_runs), self._session_budget))
         self._task: asyncio.Task[None] | None = None
+        self._run_tasks: dict[int, asyncio.Task[bool]] = {}
+        self._retention_task: asyncio.Task[None] | None = None
+        self.last_tick_metrics: SchedulerTickMetrics | None = None
         self._source = LiveScholarSource()
         self._queue_runner = QueueJobRunner(
             tick_seconds=self._tick_seconds,
@@ -104,6 +124,7 @@ class SchedulerService:
             continuation_max_delay_seconds=self._continuation_max_delay_seconds,
             continuation_max_attempts=self._continuation_max_attempts,
             queue_batch_size=self._queue_batch_size,
+            max_concurrent_runs=self._max_concurrent_runs,
         )
 
     async def stop(self) -> None:
@@ -116,6 +137,14 @@ class SchedulerService:
             pass
         finally:
             self._task = None
+        run_tasks: list[asyncio.Task[Any]] = list(self._run_tasks.values())
+        if self._retention_task is not None:
+            run_tasks.append(self._retention_task)
+        for run_task in run_tasks:
+            run_task.cancel()
+        await asyncio.gather(*run_tasks, return_exceptions=True)
+        self._run_tasks.clear()
+        self._retention_task = None
         structured_log(logger, "info", "scheduler.stopped")
 
     async def _run_loop(self) -> None:
@@ -133,19 +162,70 @@ class SchedulerService:
             await asyncio.sleep(float(self._tick_seconds))
 
     async def _tick_once(self) -> None:
+        tick_started = time.perf_counter()
         if self._continuation_queue_enabled:
             await self._queue_runner.drain_continuation_queue()
 
         await self._drain_pdf_queue()
+        await self._resume_portability_jobs()
+        await self._start_db_retention()
 
         candidates = await self._load_candidates()
         if not candidates:
             return
-        now = datetime.now(UTC)
-        for candidate in candidates:
-            if not await self._is_due(candidate, now=now):
-                continue
-            await self._run_candidate(candidate)
+        due_candidates = await self._due_candidates(candidates, now=datetime.now(UTC))
+        if self._max_concurrent_runs <= 1:
+            started_count = 0
+            if self._run_capacity() > 0:
+                for candidate in due_candidates:
+                    started_count += await self._run_candidate(candidate)
+        else:
+            started_count = self._start_candidate_runs(due_candidates)
+        self._record_tick_metrics(
+            due_count=len(due_candidates),
+            started_count=started_count,
+            tick_started=tick_started,
+        )
+
+    def _record_tick_metrics(self, *, due_count: int, started_count: int, tick_started: float) -> None:
+        metrics = SchedulerTickMetrics(
+            due_count=due_count,
+            started_count=started_count,
+            deferred_count=due_count - started_count,
+            in_flight_count=len(self._run_tasks),
+            duration_ms=int((time.perf_counter() - tick_started) * 1000),
+        )
+        self.last_tick_metrics = metrics
+        if due_count <= 0:
+            return
+        structured_log(
+            logger,
+            "info",
+            "scheduler.tick_completed",
+            due_count=metrics.due_count,
+            started_count=metrics.started_count,
+            deferred_count=metrics.deferred_count,
+            in_flight_count=metrics.in_flight_count,
+            max_concurrent_runs=self._max_concurrent_runs,
+            duration_ms=metrics.duration_ms,
+        )
+
+    def _start_candidate_runs(self, due_candidates: list[_AutoRunCandidate]) -> int:
+        started_count = 0
+        for candidate in due_candidates:
+            if len(self._run_tasks) >= self._run_capacity():
+                break
+            task = asyncio.create_task(
+                self._run_candidate(candidate),
+                name=f"scholarr-scheduled-run-{candidate.user_id}",
+            )
+            self._run_tasks[candidate.user_id] = task
+            task.add_done_callback(functools.partial(self._drop_run_task, candidate.user_id))
+            started_count += 1
+        return started_count
+
+    def _drop_run_task(self, user_id: int, _task: asyncio.Task[bool]) -> None:
+        self._run_tasks.pop(user_id, None)
 
     async def _load_candidate_rows(self) -> list[Any]:
         async with background_session() as session:
@@ -202,23 +282,63 @@ class SchedulerService:
                 candidates.append(candidate)
         return candidates
 
-    async def _is_due(self, candidate: _AutoRunCandidate, *, now: datetime) -> bool:
+    async def _load_last_run_starts(self, user_ids: list[int]) -> dict[int, datetime]:
         async with background_session() as session:
             result = await session.execute(
-                select(CrawlRun.start_dt)
-                .where(
-                    CrawlRun.user_id == candidate.user_id,
-                )
-                .order_by(CrawlRun.start_dt.desc(), CrawlRun.id.desc())
-                .limit(1)
+                select(CrawlRun.user_id, func.max(CrawlRun.start_dt))
+                .where(CrawlRun.user_id.in_(user_ids))
+                .group_by(CrawlRun.user_id)
             )
-            last_run = result.scalar_one_or_none()
+            return {int(user_id): last_start for user_id, last_start in result.all()}
 
-        if last_run is None:
-            return True
+    async def _load_users_with_due_scholars(
+        self,
+        candidates: list[_AutoRunCandidate],
+        *,
+        now: datetime,
+    ) -> set[int]:
+        async with background_session() as session:
+            return await crawl_schedule.users_with_due_scholars(
+                session,
+                base_interval_minutes_by_user={
+                    candidate.user_id: candidate.run_interval_minutes for candidate in candidates
+                },
+                now=now,
+            )
 
-        next_due_dt = last_run + timedelta(minutes=candidate.run_interval_minutes)
-        return now >= next_due_dt
+    async def _due_candidates(
+        self,
+        candidates: list[_AutoRunCandidate],
+        *,
+        now: datetime,
+    ) -> list[_AutoRunCandidate]:
+        """Return due candidates in fair-share order: longest overdue first.
+
+        Users with a run still in flight are skipped, and so are users with no
+        scholar due under the adaptive schedule. Never-run users sort ahead of
+        everyone else, so when the concurrency cap defers part of the queue,
+        the users who have waited longest go next.
+        """
+        last_run_starts = await self._load_last_run_starts([candidate.user_id for candidate in candidates])
+        due: list[tuple[datetime | None, int, _AutoRunCandidate]] = []
+        for candidate in candidates:
+            if candidate.user_id in self._run_tasks:
+                continue
+            last_run = last_run_starts.get(candidate.user_id)
+            if last_run is None:
+                due.append((None, candidate.user_id, candidate))
+                continue
+            next_due_dt = last_run + timedelta(minutes=candidate.run_interval_minutes)
+            if now >= next_due_dt:
+                due.append((next_due_dt, candidate.user_id, candidate))
+        if due and crawl_schedule.adaptive_schedule_enabled():
+            with_due_scholars = await self._load_users_with_due_scholars(
+                [candidate for _next_due, _user_id, candidate in due],
+                now=now,
+            )
+            due = [item for item in due if item[1] in with_due_scholars]
+        due.sort(key=lambda item: (item[0] is not None, item[0] or now, item[1]))
+        return [candidate for _next_due, _user_id, candidate in due]
 
     async def _run_candidate_ingestion(
         self,
@@ -269,10 +389,11 @@ class SchedulerService:
                 )
                 return None
 
-    async def _run_candidate(self, candidate: _AutoRunCandidate) -> None:
+    async def _run_candidate(self, candidate: _AutoRunCandidate) -> bool:
+        """Run one due user; False when the run was skipped or did not complete."""
         run_summary = await self._run_candidate_ingestion(candidate=candidate)
         if run_summary is None:
-            return
+            return False
         structured_log(
             logger,
             "info",
@@ -283,6 +404,82 @@ class SchedulerService:
             scholar_count=run_summary.scholar_count,
             new_publication_count=run_summary.new_publication_count,
         )
+        return True
+
+    async def _resume_portability_jobs(self) -> None:
+        from app.services.portability.jobs import resume_stale_portability_jobs
+
+        async with background_session() as session:
+            try:
+                resumed = await resume_stale_portability_jobs(session)
+                if resumed > 0:
+                    structured_log(
+                        logger,
+                        "info",
+                        "scheduler.portability_jobs_resumed",
+                        resumed_count=resumed,
+                    )
+            except Exception:
+                structured_log(
+                    logger,
+                    "exception",
+                    "scheduler.portability_jobs_resume_failed",
+                )
+
+    def _run_capacity(self) -> int:
+        # A retention pass holds a background session for its whole duration,
+        # like a run, so it takes one run slot while it lasts.
+        held = 1 if self._retention_task is not None else 0
+        return max(0, min(self._max_concurrent_runs, self._session_budget - held))
+
+    async def _start_db_retention(self) -> None:
+        # A retention pass can outlast many ticks; it runs beside them, one at a time.
+        if self._retention_task is not None or not await self._db_retention_due():
+            return
+        task = asyncio.create_task(self._apply_db_retention(), name="scholarr-db-retention")
+        self._retention_task = task
+        task.add_done_callback(self._drop_retention_task)
+
+    def _drop_retention_task(self, task: asyncio.Task[None]) -> None:
+        if self._retention_task is task:
+            self._retention_task = None
+
+    async def _db_retention_due(self) -> bool:
+        if not settings.db_retention_enabled:
+            return False
+        from app.services.dbops import db_retention_due
+
+        async with background_session() as session:
+            try:
+                return await db_retention_due(session, interval_hours=settings.db_retention_interval_hours)
+            except Exception:
+                structured_log(
+                    logger,
+                    "exception",
+                    "scheduler.db_retention_failed",
+                )
+                return False
+
+    async def _apply_db_retention(self) -> None:
+        from app.services.dbops import run_db_retention
+
+        async with background_session() as session:
+            try:
+                result = await run_db_retention(session, dry_run=False, requested_by="scheduler")
+                structured_log(
+                    logger,
+                    "info",
+                    "scheduler.db_retention_completed",
+                    job_id=result["job_id"],
+                    deleted_rows=result["summary"]["deleted_rows"],
+                    bytes_reclaimed=result["summary"]["bytes_reclaimed"],
+                )
+            except Exception:
+                structured_log(
+                    logger,
+                    "exception",
+                    "scheduler.db_retention_failed",
+                )
 
     async def _drain_pdf_queue(self) -> None:
         from app.services.publications.pdf_queue import drain_ready_jobs
@@ -16,6 +16,7 @@ from app.db.models import (
     ScholarProfile,
 )
 from app.logging_utils import structured_log
+from app.services.ingestion import crawl_schedule, page_archive
 from app.services.ingestion import queue as queue_service
 from app.services.ingestion.constants import (
     RESUMABLE_PARTIAL_REASON_PREFIXES,
@@ -200,6 +201,7 @@ async def _fetch_and_prepare_scholar_result(
         page_size=page_size,
         previous_initial_page_fingerprint_sha256=scholar.last_initial_page_fingerprint_sha256,
         upsert_publications_fn=upsert_profile_publications,
+        archive_page_fn=page_archive.archive_page if page_archive.archive_enabled() else None,
     )
     assert_valid_paged_parse_result(scholar_id=scholar.scholar_id, paged_parse_result=paged_parse_result)
     apply_first_page_profile_metadata(scholar=scholar, paged_parse_result=paged_parse_result, run_dt=run_dt)
@@ -283,6 +285,7 @@ async def _run_first_pass(
         if run.status == RunStatus.CANCELED:
             structured_log(logger, "info", "ingestion.run_canceled", run_id=run.id, user_id=user_id)
             return first_pass_cstarts
+        run_started_at = run.start_dt
         if index > 0 and request_delay_seconds > 0:
             jitter = random.uniform(0.0, min(float(request_delay_seconds), 2.0))
             await asyncio.sleep(float(request_delay_seconds) + jitter)
@@ -299,6 +302,7 @@ async def _run_first_pass(
             queue_delay_seconds=queue_delay_seconds,
             **scholar_kwargs,
         )
+        crawl_schedule.record_first_page_check(scholar, result_entry=outcome.result_entry, checked_at=run_started_at)
         apply_outcome_to_progress(progress=progress, outcome=outcome)
         if _is_hard_challenge_outcome(outcome):
             structured_log(
@@ -8,6 +8,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from app.http.clients import UPSTREAM_OPENALEX, get_http_client
 from app.logging_utils import structured_log
 from app.services.openalex.types import OpenAlexWork
 
@@ -72,8 +73,8 @@ class OpenAlexClient:
         else:
             headers["User-Agent"] = "scholar-scraper/1.0"
 
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, headers=headers) as client:
-            response = await client.get(url, params=self._base_params)
+        client = get_http_client(UPSTREAM_OPENALEX)
+        response = await client.get(url, params=self._base_params, headers=headers, timeout=self.timeout)
 
         if response.status_code == 404:
             return None
@@ -128,8 +129,8 @@ class OpenAlexClient:
         else:
             headers["User-Agent"] = "scholar-scraper/1.0"
 
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, headers=headers) as client:
-            response = await client.get(url, params=params)
+        client = get_http_client(UPSTREAM_OPENALEX)
+        response = await client.get(url, params=params, headers=headers, timeout=self.timeout)
 
         if response.status_code == 429:
             remaining = response.headers.get("X-RateLimit-Remaining-USD", "")
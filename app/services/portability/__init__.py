@@ -7,15 +7,60 @@ from app.services.portability.application import (
 from app.services.portability.application import (
     MAX_IMPORT_SCHOLARS as MAX_IMPORT_SCHOLARS,
 )
+from app.services.portability.application import (
+    PORTABILITY_EXPORT_JOB_NAME as PORTABILITY_EXPORT_JOB_NAME,
+)
+from app.services.portability.application import (
+    PORTABILITY_IMPORT_JOB_NAME as PORTABILITY_IMPORT_JOB_NAME,
+)
 from app.services.portability.application import (
     ImportedPublicationInput as ImportedPublicationInput,
 )
 from app.services.portability.application import (
     ImportExportError as ImportExportError,
 )
+from app.services.portability.application import (
+    ImportUploadTooLargeError as ImportUploadTooLargeError,
+)
+from app.services.portability.application import (
+    PortabilityJobConflictError as PortabilityJobConflictError,
+)
+from app.services.portability.application import (
+    create_portability_job as create_portability_job,
+)
 from app.services.portability.application import (
     export_user_data as export_user_data,
 )
+from app.services.portability.application import (
+    fail_portability_job as fail_portability_job,
+)
+from app.services.portability.application import (
+    get_user_portability_job as get_user_portability_job,
+)
+from app.services.portability.application import (
+    gzip_chunks as gzip_chunks,
+)
+from app.services.portability.application import (
+    import_publications_in_chunks as import_publications_in_chunks,
+)
 from app.services.portability.application import (
     import_user_data as import_user_data,
 )
+from app.services.portability.application import (
+    iter_user_export_ndjson as iter_user_export_ndjson,
+)
+from app.services.portability.application import (
+    portability_job_path as portability_job_path,
+)
+from app.services.portability.application import (
+    read_ndjson_export as read_ndjson_export,
+)
+from app.services.portability.application import (
+    resume_stale_portability_jobs as resume_stale_portability_jobs,
+)
+from app.services.portability.application import (
+    spool_import_upload as spool_import_upload,
+)
+from app.services.portability.application import (
+    start_portability_job as start_portability_job,
+)
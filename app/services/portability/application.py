@@ -4,21 +4,38 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Publication
+from app.services.portability.bulk_import import import_publications_in_chunks
 from app.services.portability.constants import (
     EXPORT_SCHEMA_VERSION,
     MAX_IMPORT_PUBLICATIONS,
     MAX_IMPORT_SCHOLARS,
 )
-from app.services.portability.exporting import export_user_data
-from app.services.portability.normalize import _validate_import_sizes
-from app.services.portability.publication_import import (
-    _build_imported_publication_input,
-    _initialize_import_counters,
-    _upsert_imported_publication,
+from app.services.portability.exporting import (
+    export_user_data,
+    gzip_chunks,
+    iter_user_export_ndjson,
+    read_ndjson_export,
+)
+from app.services.portability.jobs import (
+    PORTABILITY_EXPORT_JOB_NAME,
+    PORTABILITY_IMPORT_JOB_NAME,
+    create_portability_job,
+    fail_portability_job,
+    get_user_portability_job,
+    portability_job_path,
+    resume_stale_portability_jobs,
+    spool_import_upload,
+    start_portability_job,
 )
+from app.services.portability.normalize import _validate_import_sizes
+from app.services.portability.publication_import import _initialize_import_counters
 from app.services.portability.scholar_import import _upsert_imported_scholars
-from app.services.portability.types import ImportedPublicationInput, ImportExportError
+from app.services.portability.types import (
+    ImportedPublicationInput,
+    ImportExportError,
+    ImportUploadTooLargeError,
+    PortabilityJobConflictError,
+)
 
 
 async def import_user_data(
@@ -34,24 +51,14 @@ async def import_user_data(
         user_id=user_id,
         scholars=scholars,
     )
-    cluster_cache: dict[str, Publication | None] = {}
-    fingerprint_cache: dict[str, Publication | None] = {}
     _initialize_import_counters(counters)
-    for item in publications:
-        parsed_item = _build_imported_publication_input(
-            item=item,
-            scholar_map=scholar_map,
-        )
-        if parsed_item is None:
-            counters["skipped_records"] += 1
-            continue
-        await _upsert_imported_publication(
-            db_session,
-            payload=parsed_item,
-            cluster_cache=cluster_cache,
-            fingerprint_cache=fingerprint_cache,
-            counters=counters,
-        )
+    await import_publications_in_chunks(
+        db_session,
+        scholar_map=scholar_map,
+        publications=publications,
+        counters=counters,
+    )
+    # Persists the scholar changes when there were no publication entries.
     await db_session.commit()
     return counters
 
@@ -60,8 +67,23 @@ __all__ = [
     "EXPORT_SCHEMA_VERSION",
     "MAX_IMPORT_PUBLICATIONS",
     "MAX_IMPORT_SCHOLARS",
+    "PORTABILITY_EXPORT_JOB_NAME",
+    "PORTABILITY_IMPORT_JOB_NAME",
     "ImportExportError",
+    "ImportUploadTooLargeError",
     "ImportedPublicationInput",
+    "PortabilityJobConflictError",
+    "create_portability_job",
     "export_user_data",
+    "fail_portability_job",
+    "get_user_portability_job",
+    "gzip_chunks",
+    "import_publications_in_chunks",
     "import_user_data",
+    "iter_user_export_ndjson",
+    "portability_job_path",
+    "read_ndjson_export",
+    "resume_stale_portability_jobs",
+    "spool_import_upload",
+    "start_portability_job",
 ]
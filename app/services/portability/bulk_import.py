@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+from itertools import batched, islice
+from typing import Any
+
+from sqlalchemy import Integer, Text, and_, bindparam, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Publication, ScholarProfile, ScholarPublication
+from app.services.ingestion.fingerprints import normalize_title
+from app.services.portability.constants import IMPORT_CHUNK_SIZE
+from app.services.portability.publication_import import (
+    _build_imported_publication_input,
+    _cache_resolved_publication,
+    _new_publication,
+    _update_import_publication,
+    _update_link_counters,
+)
+from app.services.portability.types import ImportedPublicationInput
+
+ChunkCheckpointCallback = Callable[[int, dict[str, int]], Awaitable[None]]
+
+_PUBLICATION_COLUMNS = (
+    Publication.id,
+    Publication.cluster_id,
+    Publication.fingerprint_sha256,
+    Publication.title_raw,
+    Publication.title_normalized,
+    Publication.year,
+    Publication.citation_count,
+    Publication.author_text,
+    Publication.venue_text,
+    Publication.pub_url,
+    Publication.pdf_url,
+)
+_PUBLICATION_VALUE_FIELDS = (
+    "cluster_id",
+    "title_raw",
+    "title_normalized",
+    "year",
+    "citation_count",
+    "author_text",
+    "venue_text",
+    "pub_url",
+    "pdf_url",
+)
+_PUBLICATION_TITLE_KEY_FIELDS = ("dedup_title_text", "dedup_title_tokens")
+
+
+class _ChunkPlan:
+    """Replays one chunk in payload order against publications loaded up front.
+
+    Publications are transient ``Publication`` objects keyed by ``id()`` so rows
+    created earlier in the chunk resolve exactly like stored ones. Lookups
+    follow the entry-by-entry rules: cluster, then fingerprint, then the
+    lowest-id publication already linked to the scholar with the same title.
+    """
+
+    def __init__(self, *, loaded: list[Publication], links: dict[tuple[int, int], bool]) -> None:
+        self.cluster_cache: dict[str, Publication | None] = {}
+        self.fingerprint_cache: dict[str, Publication | None] = {}
+        self.created: list[Publication] = []
+        self.changed: dict[int, Publication] = {}
+        self.original_titles: dict[int, str] = {}
+        # Maps (scholar_profile_id, id(publication)) to [stored is_read or None, planned is_read]
+        self.links: dict[tuple[int, int], list[Any]] = {}
+        self._title_index: dict[tuple[int, str], list[Publication]] = {}
+        self._linked_scholars: dict[int, set[int]] = {}
+        self._order: dict[int, tuple[int, int]] = {}
+        by_id: dict[int, Publication] = {}
+        for publication in loaded:
+            by_id[int(publication.id)] = publication
+            self._order[id(publication)] = (0, int(publication.id))
+            self.original_titles[id(publication)] = publication.title_raw
+            if publication.cluster_id:
+                self.cluster_cache[publication.cluster_id] = publication
+            self.fingerprint_cache[publication.fingerprint_sha256] = publication
+        for (scholar_profile_id, publication_id), is_read in links.items():
+            publication = by_id[publication_id]
+            self.links[(scholar_profile_id, id(publication))] = [is_read, is_read]
+            self._index_link(scholar_profile_id, publication)
+
+    def _index_link(self, scholar_profile_id: int, publication: Publication) -> None:
+        self._linked_scholars.setdefault(id(publication), set()).add(scholar_profile_id)
+        key = (scholar_profile_id, publication.title_normalized)
+        self._title_index.setdefault(key, []).append(publication)
+
+    def _reindex_title(self, publication: Publication) -> None:
+        # Stale entries under the old title are filtered out on lookup.
+        for scholar_profile_id in self._linked_scholars.get(id(publication), ()):
+            key = (scholar_profile_id, publication.title_normalized)
+            self._title_index.setdefault(key, []).append(publication)
+
+    def _find_linked_by_title(self, *, scholar_profile_id: int, title_normalized: str) -> Publication | None:
+        candidates = [
+            publication
+            for publication in self._title_index.get((scholar_profile_id, title_normalized), ())
+            if publication.title_normalized == title_normalized
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda publication: self._order[id(publication)])
+
+    def _resolve(self, payload: ImportedPublicationInput, *, scholar_profile_id: int) -> Publication | None:
+        if payload.cluster_id and self.cluster_cache.get(payload.cluster_id) is not None:
+            return self.cluster_cache[payload.cluster_id]
+        if self.fingerprint_cache.get(payload.fingerprint) is not None:
+            return self.fingerprint_cache[payload.fingerprint]
+        return self._find_linked_by_title(
+            scholar_profile_id=scholar_profile_id,
+            title_normalized=normalize_title(payload.title),
+        )
+
+    def apply(self, payload: ImportedPublicationInput, *, counters: dict[str, int]) -> None:
+        scholar_profile_id = int(payload.profile.id)
+        publication = self._resolve(payload, scholar_profile_id=scholar_profile_id)
+        if publication is None:
+            publication = _new_publication(
+                cluster_id=payload.cluster_id,
+                fingerprint_sha256=payload.fingerprint,
+                title=payload.title,
+                year=payload.year,
+                citation_count=payload.citation_count,
+                author_text=payload.author_text,
+                venue_text=payload.venue_text,
+                pub_url=payload.pub_url,
+                pdf_url=payload.pdf_url,
+            )
+            self._order[id(publication)] = (1, len(self.created))
+            self.created.append(publication)
+            counters["publications_created"] += 1
+        else:
+            previous_title = publication.title_normalized
+            if _update_import_publication(publication=publication, payload=payload):
+                counters["publications_updated"] += 1
+                if publication.id is not None:
+                    self.changed[id(publication)] = publication
+                if publication.title_normalized != previous_title:
+                    self._reindex_title(publication)
+        _cache_resolved_publication(
+            publication=publication,
+            cluster_id=payload.cluster_id,
+            fingerprint_sha256=payload.fingerprint,
+            cluster_cache=self.cluster_cache,
+            fingerprint_cache=self.fingerprint_cache,
+        )
+        self._apply_link(scholar_profile_id, publication, is_read=payload.is_read, counters=counters)
+
+    def _apply_link(
+        self,
+        scholar_profile_id: int,
+        publication: Publication,
+        *,
+        is_read: bool,
+        counters: dict[str, int],
+    ) -> None:
+        link = self.links.get((scholar_profile_id, id(publication)))
+        if link is None:
+            self.links[(scholar_profile_id, id(publication))] = [None, bool(is_read)]
+            self._index_link(scholar_profile_id, publication)
+            _update_link_counters(counters=counters, link_created=True, link_updated=False)
+            return
+        link_updated = link[1] != bool(is_read)
+        link[1] = bool(is_read)
+        _update_link_counters(counters=counters, link_created=False, link_updated=link_updated)
+
+
+def _transient_publication(row: Any) -> Publication:
+    return Publication(**{column.key: value for column, value in zip(_PUBLICATION_COLUMNS, row, strict=True)})
+
+
+async def _select_publications(db_session: AsyncSession, stmt) -> list[Publication]:
+    result = await db_session.execute(stmt)
+    return [_transient_publication(row) for row in result.all()]
+
+
+def _linked_title_matches_query(entries: list[ImportedPublicationInput]):
+    pairs = sorted({(int(entry.profile.id), normalize_title(entry.title)) for entry in entries})
+    title_keys = (
+        func.unnest(
+            bindparam("title_key_scholar_ids", [pair[0] for pair in pairs], type_=ARRAY(Integer)),
+            bindparam("title_key_titles", [pair[1] for pair in pairs], type_=ARRAY(Text)),
+        )
+        .table_valued("scholar_profile_id", "title_normalized")
+        .render_derived(name="title_keys")
+    )
+    return (
+        select(*_PUBLICATION_COLUMNS)
+        .select_from(title_keys)
+        .join(ScholarPublication, ScholarPublication.scholar_profile_id == title_keys.c.scholar_profile_id)
+        .join(
+            Publication,
+            and_(
+                Publication.id == ScholarPublication.publication_id,
+                Publication.title_normalized == title_keys.c.title_normalized,
+            ),
+        )
+        .distinct()
+    )
+
+
+async def _load_chunk_publications(
+    db_session: AsyncSession,
+    *,
+    entries: list[ImportedPublicationInput],
+) -> list[Publication]:
+    # Separate lookups so each one is an index scan on its unique index; an OR of
+    # the two lists is planned as a sequential scan of publications.
+    loaded = await _select_publications(
+        db_session,
+        select(*_PUBLICATION_COLUMNS).where(
+            Publication.fingerprint_sha256.in_(sorted({entry.fingerprint for entry in entries}))
+        ),
+    )
+    cluster_ids = sorted({entry.cluster_id for entry in entries if entry.cluster_id})
+    if cluster_ids:
+        loaded += await _select_publications(
+            db_session,
+            select(*_PUBLICATION_COLUMNS).where(Publication.cluster_id.in_(cluster_ids)),
+        )
+    found_clusters = {publication.cluster_id for publication in loaded}
+    found_fingerprints = {publication.fingerprint_sha256 for publication in loaded}
+    # Only entries without a cluster or fingerprint match fall through to the title lookup.
+    title_entries = [
+        entry
+        for entry in entries
+        if entry.fingerprint not in found_fingerprints and not (entry.cluster_id and entry.cluster_id in found_clusters)
+    ]
+    if title_entries:
+        # The cached generic plan for the key join ignores how many keys there
+        # are and falls back to scanning publications; plan each chunk afresh.
+        await db_session.execute(text("SET LOCAL plan_cache_mode = force_custom_plan"))
+        loaded += await _select_publications(db_session, _linked_title_matches_query(title_entries))
+    by_id: dict[int, Publication] = {}
+    for publication in loaded:
+        by_id.setdefault(int(publication.id), publication)
+    return list(by_id.values())
+
+
+async def _load_chunk_links(
+    db_session: AsyncSession,
+    *,
+    entries: list[ImportedPublicationInput],
+    publications: list[Publication],
+) -> dict[tuple[int, int], bool]:
+    if not publications:
+        return {}
+    result = await db_session.execute(
+        select(
+            ScholarPublication.scholar_profile_id,
+            ScholarPublication.publication_id,
+            ScholarPublication.is_read,
+        ).where(
+            ScholarPublication.publication_id.in_(sorted(int(publication.id) for publication in publications)),
+            ScholarPublication.scholar_profile_id.in_(sorted({int(entry.profile.id) for entry in entries})),
+        )
+    )
+    return {
+        (int(scholar_profile_id), int(publication_id)): bool(is_read)
+        for scholar_profile_id, publication_id, is_read in result.all()
+    }
+
+
+def _publication_row(publication: Publication, *, include_title_keys: bool) -> dict[str, Any]:
+    row = {field: getattr(publication, field) for field in _PUBLICATION_VALUE_FIELDS}
+    if include_title_keys:
+        row.update({field: getattr(publication, field) for field in _PUBLICATION_TITLE_KEY_FIELDS})
+    return row
+
+
+async def _insert_created_publications(db_session: AsyncSession, *, plan: _ChunkPlan) -> None:
+    if not plan.created:
+        return
+    rows = [
+        {"fingerprint_sha256": publication.fingerprint_sha256, **_publication_row(publication, include_title_keys=True)}
+        for publication in plan.created
+    ]
+    # render_nulls keeps every row on the same column list, so the ORM sends one
+    # multi-row statement instead of splitting the batch wherever a value is NULL.
+    stmt = (
+        pg_insert(Publication)
+        .on_conflict_do_nothing()
+        .returning(Publication.id, Publication.fingerprint_sha256)
+        .execution_options(render_nulls=True)
+    )
+    result = await db_session.execute(stmt, rows)
+    inserted = {fingerprint: int(publication_id) for publication_id, fingerprint in result.all()}
+    conflicted: list[Publication] = []
+    for publication in plan.created:
+        publication_id = inserted.get(publication.fingerprint_sha256)
+        if publication_id is None:
+            conflicted.append(publication)
+            continue
+        publication.id = publication_id
+    if conflicted:
+        await _claim_conflicting_publications(db_session, plan=plan, conflicted=conflicted)
+
+
+async def _claim_conflicting_publications(
+    db_session: AsyncSession,
+    *,
+    plan: _ChunkPlan,
+    conflicted: list[Publication],
+) -> None:
+    # Another writer (usually a crawl) inserted the same publication after the
+    # chunk was loaded. Import onto the stored row instead.
+    cluster_ids = [publication.cluster_id for publication in conflicted if publication.cluster_id]
+    clauses = [Publication.fingerprint_sha256.in_([publication.fingerprint_sha256 for publication in conflicted])]
+    if cluster_ids:
+        clauses.append(Publication.cluster_id.in_(cluster_ids))
+    result = await db_session.execute(
+        select(Publication.id, Publication.fingerprint_sha256, Publication.cluster_id).where(or_(*clauses))
+    )
+    rows = result.all()
+    by_fingerprint = {fingerprint: int(publication_id) for publication_id, fingerprint, _cluster in rows}
+    by_cluster = {cluster_id: int(publication_id) for publication_id, _fingerprint, cluster_id in rows if cluster_id}
+    for publication in conflicted:
+        publication_id = by_fingerprint.get(publication.fingerprint_sha256)
+        if publication_id is None and publication.cluster_id:
+            publication_id = by_cluster.get(publication.cluster_id)
+        if publication_id is None:
+            raise RuntimeError("Publication insert conflicted but no matching row was found.")
+        publication.id = publication_id
+        plan.original_titles[id(publication)] = ""
+        plan.changed[id(publication)] = publication
+
+
+async def _update_changed_publications(db_session: AsyncSession, *, plan: _ChunkPlan) -> None:
+    if not plan.changed:
+        return
+    rows = [
+        {
+            "id": int(publication.id),
+            **_publication_row(
+                publication,
+                include_title_keys=publication.title_raw != plan.original_titles.get(id(publication)),
+            ),
+        }
+        for publication in plan.changed.values()
+    ]
+    # Bulk updates batch consecutive rows with the same keys; keep the retitled ones together.
+    rows.sort(key=len)
+    await db_session.execute(update(Publication), rows)
+
+
+async def _upsert_chunk_links(
+    db_session: AsyncSession,
+    *,
+    plan: _ChunkPlan,
+    publications: dict[int, Publication],
+) -> None:
+    rows = [
+        {
+            "scholar_profile_id": scholar_profile_id,
+            "publication_id": int(publications[publication_key].id),
+            "is_read": is_read,
+        }
+        for (scholar_profile_id, publication_key), (stored_is_read, is_read) in plan.links.items()
+        if stored_is_read is None or stored_is_read != is_read
+    ]
+    if not rows:
+        return
+    insert_stmt = pg_insert(ScholarPublication)
+    # RETURNING makes the executemany a single multi-row statement per page, so
+    # the feed trigger runs once per page instead of once per link.
+    stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[ScholarPublication.scholar_profile_id, ScholarPublication.publication_id],
+        set_={"is_read": insert_stmt.excluded.is_read},
+        where=ScholarPublication.is_read.is_distinct_from(insert_stmt.excluded.is_read),
+    ).returning(ScholarPublication.publication_id)
+    await db_session.execute(stmt, rows)
+
+
+async def _import_chunk(
+    db_session: AsyncSession,
+    *,
+    entries: list[ImportedPublicationInput],
+    counters: dict[str, int],
+) -> None:
+    loaded = await _load_chunk_publications(db_session, entries=entries)
+    links = await _load_chunk_links(db_session, entries=entries, publications=loaded)
+    plan = _ChunkPlan(loaded=loaded, links=links)
+    for entry in entries:
+        plan.apply(entry, counters=counters)
+    await _insert_created_publications(db_session, plan=plan)
+    await _update_changed_publications(db_session, plan=plan)
+    publications = {id(publication): publication for publication in [*loaded, *plan.created]}
+    await _upsert_chunk_links(db_session, plan=plan, publications=publications)
+
+
+async def import_publications_in_chunks(
+    db_session: AsyncSession,
+    *,
+    scholar_map: dict[str, ScholarProfile],
+    publications: Iterable[dict[str, Any]],
+    counters: dict[str, int],
+    start_offset: int = 0,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    on_chunk_imported: ChunkCheckpointCallback | None = None,
+) -> dict[str, int]:
+    """Import publication entries ``chunk_size`` at a time, committing each chunk.
+
+    Each chunk costs a few set lookups and one write per table regardless of
+    its size, and produces the same rows and counters as importing the entries
+    one by one. Entries before ``start_offset`` are skipped so an interrupted
+    import can resume after its last committed chunk. ``on_chunk_imported``
+    receives the offset of the next entry and the running counters before the
+    chunk commits, so a checkpoint it writes commits or rolls back with it.
+    """
+    offset = max(int(start_offset), 0)
+    for items in batched(islice(publications, offset, None), max(int(chunk_size), 1)):
+        # Counted separately so a chunk that fails to write leaves the totals untouched.
+        chunk_counters = dict(counters)
+        entries: list[ImportedPublicationInput] = []
+        for item in items:
+            parsed_item = _build_imported_publication_input(item=item, scholar_map=scholar_map)
+            if parsed_item is None:
+                chunk_counters["skipped_records"] += 1
+                continue
+            entries.append(parsed_item)
+        if entries:
+            await _import_chunk(db_session, entries=entries, counters=chunk_counters)
+        if on_chunk_imported is not None:
+            await on_chunk_imported(offset + len(items), dict(chunk_counters))
+        await db_session.commit()
+        counters.update(chunk_counters)
+        offset += len(items)
+    return counters
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import json
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Publication, ScholarProfile, ScholarPublication
 from app.services.portability.constants import EXPORT_SCHEMA_VERSION
+from app.services.portability.types import ImportExportError
+
+NDJSON_RECORD_HEADER = "header"
+NDJSON_RECORD_SCHOLAR = "scholar"
+NDJSON_RECORD_PUBLICATION = "publication"
+# Rows fetched per server-side cursor round trip.
+_EXPORT_STREAM_BATCH_ROWS = 2000
+# Encoded lines are buffered up to this size before being handed to the response.
+_EXPORT_STREAM_CHUNK_BYTES = 64 * 1024
 
 
 def _exported_at_iso() -> str:
@@ -52,17 +64,14 @@ def _serialize_export_publication(row: Any) -> dict[str, Any]:
     }
 
 
-async def export_user_data(
-    db_session: AsyncSession,
-    *,
-    user_id: int,
-    scholar_profile_ids: list[int] | None = None,
-) -> dict[str, Any]:
+def _export_scholar_query(*, user_id: int, scholar_profile_ids: list[int] | None):
     scholar_query = select(ScholarProfile).where(ScholarProfile.user_id == user_id)
     if scholar_profile_ids:
         scholar_query = scholar_query.where(ScholarProfile.id.in_(scholar_profile_ids))
-    scholars_result = await db_session.execute(scholar_query.order_by(ScholarProfile.id.asc()))
+    return scholar_query.order_by(ScholarProfile.id.asc())
+
 
+def _export_publication_query(*, user_id: int, scholar_profile_ids: list[int] | None):
     pub_query = (
         select(
             ScholarProfile.scholar_id,
@@ -83,8 +92,20 @@ async def export_user_data(
     )
     if scholar_profile_ids:
         pub_query = pub_query.where(ScholarProfile.id.in_(scholar_profile_ids))
+    return pub_query.order_by(ScholarPublication.created_at.desc(), Publication.id.desc())
+
+
+async def export_user_data(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    scholar_profile_ids: list[int] | None = None,
+) -> dict[str, Any]:
+    scholars_result = await db_session.execute(
+        _export_scholar_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids)
+    )
     publication_result = await db_session.execute(
-        pub_query.order_by(ScholarPublication.created_at.desc(), Publication.id.desc())
+        _export_publication_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids)
     )
 
     scholars = [_serialize_export_scholar(profile) for profile in scholars_result.scalars().all()]
@@ -95,3 +116,108 @@ async def export_user_data(
         "scholars": scholars,
         "publications": publications,
     }
+
+
+async def count_user_export_records(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    scholar_profile_ids: list[int] | None = None,
+) -> int:
+    """Number of ``scholar`` and ``publication`` records an export will contain."""
+    total = 0
+    for query in (
+        _export_scholar_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids),
+        _export_publication_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids),
+    ):
+        result = await db_session.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+        total += int(result.scalar_one() or 0)
+    return total
+
+
+def _ndjson_line(record_type: str, record: dict[str, Any]) -> bytes:
+    return json.dumps({"type": record_type, **record}, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+
+
+async def iter_user_export_ndjson(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    scholar_profile_ids: list[int] | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield the export as NDJSON chunks in constant memory.
+
+    The first line is a ``header`` record carrying ``schema_version`` and
+    ``exported_at``, followed by one ``scholar`` line per profile and one
+    ``publication`` line per link, each with the same fields as the JSON
+    export. Rows come from server-side cursors, so nothing is materialized.
+    """
+    buffer = bytearray(
+        _ndjson_line(
+            NDJSON_RECORD_HEADER,
+            {"schema_version": EXPORT_SCHEMA_VERSION, "exported_at": _exported_at_iso()},
+        )
+    )
+    scholars = await db_session.stream_scalars(
+        _export_scholar_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids).execution_options(
+            yield_per=_EXPORT_STREAM_BATCH_ROWS
+        )
+    )
+    async for profiles in scholars.partitions():
+        for profile in profiles:
+            buffer += _ndjson_line(NDJSON_RECORD_SCHOLAR, _serialize_export_scholar(profile))
+        if len(buffer) >= _EXPORT_STREAM_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    publications = await db_session.stream(
+        _export_publication_query(user_id=user_id, scholar_profile_ids=scholar_profile_ids).execution_options(
+            yield_per=_EXPORT_STREAM_BATCH_ROWS
+        )
+    )
+    async for rows in publications.partitions():
+        for row in rows:
+            buffer += _ndjson_line(NDJSON_RECORD_PUBLICATION, _serialize_export_publication(row))
+        yield bytes(buffer)
+        buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def iter_ndjson_records(lines: Iterable[bytes | str]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ``(record_type, record)`` pairs from NDJSON export lines one at a time."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            raise ImportExportError(f"Line {line_number} is not valid JSON.") from exc
+        if not isinstance(record, dict):
+            raise ImportExportError(f"Line {line_number} is not a JSON object.")
+        record_type = record.pop("type", None)
+        if record_type not in {NDJSON_RECORD_HEADER, NDJSON_RECORD_SCHOLAR, NDJSON_RECORD_PUBLICATION}:
+            raise ImportExportError(f"Line {line_number} has unknown record type {record_type!r}.")
+        yield record_type, record
+
+
+def read_ndjson_export(lines: Iterable[bytes | str]) -> dict[str, Any]:
+    """Parse an NDJSON export back into the JSON export shape accepted by import."""
+    payload: dict[str, Any] = {"schema_version": None, "exported_at": None, "scholars": [], "publications": []}
+    for record_type, record in iter_ndjson_records(lines):
+        if record_type == NDJSON_RECORD_HEADER:
+            payload["schema_version"] = record.get("schema_version")
+            payload["exported_at"] = record.get("exported_at")
+        elif record_type == NDJSON_RECORD_SCHOLAR:
+            payload["scholars"].append(record)
+        else:
+            payload["publications"].append(record)
+    return payload
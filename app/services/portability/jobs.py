@@ -0,0 +1,546 @@
+"""Background import and export jobs for payloads too large for one request.
+
+Each job is a ``data_repair_jobs`` row (``portability_import`` or
+``portability_export``) whose ``scope`` names the owning user and the file it
+reads or writes under ``PORTABILITY_JOB_DIR``. Progress (rows done, rows per
+second, ETA and, for imports, the offset after the last committed chunk) is
+written to ``summary`` after every chunk, in the chunk's own transaction, and
+``updated_at`` doubles as the heartbeat. Uploads and the upload scan, which
+write no progress, refresh it on a timer. A running job whose heartbeat goes
+stale is claimed again by the scheduler: imports continue from
+``summary.next_offset``, exports start over.
+Every attempt carries its own ``worker_token``, so a worker that lost its
+claim stops at its next checkpoint instead of writing alongside the new one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import gzip
+import itertools
+import json
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from io import BufferedReader
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import CursorResult, Update, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.background_session import background_session
+from app.db.models import DataRepairJob
+from app.db.session import get_session_factory
+from app.logging_utils import structured_log
+from app.services.dbops.application import (
+    REPAIR_STATUS_COMPLETED,
+    REPAIR_STATUS_FAILED,
+    REPAIR_STATUS_PLANNED,
+    REPAIR_STATUS_RUNNING,
+)
+from app.services.portability.bulk_import import import_publications_in_chunks
+from app.services.portability.constants import EXPORT_SCHEMA_VERSION
+from app.services.portability.exporting import (
+    NDJSON_RECORD_HEADER,
+    NDJSON_RECORD_PUBLICATION,
+    NDJSON_RECORD_SCHOLAR,
+    count_user_export_records,
+    gzip_chunks,
+    iter_ndjson_records,
+    iter_user_export_ndjson,
+)
+from app.services.portability.normalize import _validate_import_counts
+from app.services.portability.publication_import import _initialize_import_counters
+from app.services.portability.scholar_import import _upsert_imported_scholars
+from app.services.portability.types import (
+    ImportExportError,
+    ImportUploadTooLargeError,
+    PortabilityJobConflictError,
+)
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+PORTABILITY_IMPORT_JOB_NAME = "portability_import"
+PORTABILITY_EXPORT_JOB_NAME = "portability_export"
+PORTABILITY_JOB_NAMES = (PORTABILITY_IMPORT_JOB_NAME, PORTABILITY_EXPORT_JOB_NAME)
+ACTIVE_JOB_STATUSES = (REPAIR_STATUS_PLANNED, REPAIR_STATUS_RUNNING)
+# A planned or running job whose heartbeat is older than this is considered abandoned.
+JOB_STALE_AFTER_SECONDS = 120
+# Export progress is persisted at most this often; imports checkpoint every chunk.
+_PROGRESS_SAVE_INTERVAL_SECONDS = 1.0
+# Uploads and upload scans write no progress, so they refresh the heartbeat on a timer.
+_HEARTBEAT_INTERVAL_SECONDS = JOB_STALE_AFTER_SECONDS / 4
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+class _JobTakenOver(Exception):
+    """The job was claimed by another worker since this attempt started."""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _job_file_name(job: DataRepairJob) -> str:
+    if job.job_name == PORTABILITY_IMPORT_JOB_NAME:
+        return f"import-{int(job.id)}.upload"
+    suffix = ".ndjson.gz" if (job.scope or {}).get("gzip") else ".ndjson"
+    return f"export-{int(job.id)}{suffix}"
+
+
+def portability_job_path(job: DataRepairJob) -> Path:
+    return Path(settings.portability_job_dir) / str((job.scope or {})["file"])
+
+
+def _remove_job_files(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    path.with_name(f"{path.name}.part").unlink(missing_ok=True)
+
+
+def remove_portability_job_files(job: DataRepairJob) -> None:
+    """Delete a job's spooled upload or export file, e.g. before its row is removed."""
+    if job.job_name in PORTABILITY_JOB_NAMES and (job.scope or {}).get("file"):
+        _remove_job_files(portability_job_path(job))
+
+
+async def create_portability_job(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    job_name: str,
+    requested_by: str | None,
+    scope: dict[str, Any] | None = None,
+) -> DataRepairJob:
+    """Record a ``planned`` job, refusing a second unfinished job of the same kind for the user."""
+    active = await db_session.execute(
+        select(DataRepairJob.id)
+        .where(
+            DataRepairJob.job_name == job_name,
+            DataRepairJob.status.in_(ACTIVE_JOB_STATUSES),
+            DataRepairJob.scope["user_id"].astext == str(int(user_id)),
+        )
+        .limit(1)
+    )
+    if active.scalar_one_or_none() is not None:
+        kind = "import" if job_name == PORTABILITY_IMPORT_JOB_NAME else "export"
+        raise PortabilityJobConflictError(f"An {kind} job is already in progress.")
+    job = DataRepairJob(
+        job_name=job_name,
+        requested_by=(requested_by or "").strip() or None,
+        scope={"user_id": int(user_id), **(scope or {})},
+        dry_run=False,
+        status=REPAIR_STATUS_PLANNED,
+        summary={"phase": "uploading" if job_name == PORTABILITY_IMPORT_JOB_NAME else "queued"},
+    )
+    db_session.add(job)
+    await db_session.flush()
+    job.scope = {**job.scope, "file": _job_file_name(job)}
+    job.updated_at = _utcnow()
+    await db_session.commit()
+    return job
+
+
+@contextlib.asynccontextmanager
+async def _heartbeat(beat: Callable[[], Awaitable[None]]) -> AsyncIterator[None]:
+    """Call ``beat`` every ``_HEARTBEAT_INTERVAL_SECONDS`` while the block runs.
+
+    A lost claim (``_JobTakenOver``) ends the beat and is raised when the block
+    exits; other failures are logged and the beat carries on.
+    """
+
+    async def _beat_forever() -> None:
+        while True:
+            await asyncio.sleep(_HEARTBEAT_INTERVAL_SECONDS)
+            try:
+                await beat()
+            except _JobTakenOver:
+                raise
+            except Exception as exc:
+                structured_log(logger, "warning", "portability.heartbeat_failed", error=str(exc))
+
+    task = asyncio.create_task(_beat_forever())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def _touch_planned_job(job_id: int) -> None:
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        await session.execute(
+            update(DataRepairJob)
+            .where(DataRepairJob.id == job_id, DataRepairJob.status == REPAIR_STATUS_PLANNED)
+            .values(updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+
+async def spool_import_upload(job: DataRepairJob, chunks: AsyncIterator[bytes], *, max_bytes: int) -> int:
+    """Write the request body to the job's upload file without holding it in memory."""
+    path = portability_job_path(job)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    size = 0
+    try:
+        async with _heartbeat(functools.partial(_touch_planned_job, int(job.id))):
+            with path.open("wb") as handle:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise ImportUploadTooLargeError(f"Upload exceeds max size ({max_bytes} bytes).")
+                    handle.write(chunk)
+        if size == 0:
+            raise ImportExportError("Upload is empty.")
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return size
+
+
+async def start_portability_job(
+    db_session: AsyncSession,
+    *,
+    job: DataRepairJob,
+    summary: dict[str, Any] | None = None,
+) -> DataRepairJob:
+    """Move a ``planned`` job to ``running`` and start its worker.
+
+    Raises ``PortabilityJobConflictError`` when the job is no longer planned,
+    e.g. because the stale-job sweep failed it while its upload was stalled.
+    """
+    await db_session.refresh(job, with_for_update=True)
+    if job.status != REPAIR_STATUS_PLANNED:
+        await db_session.rollback()
+        raise PortabilityJobConflictError("The job was interrupted before it started.")
+    token = uuid.uuid4().hex
+    job.status = REPAIR_STATUS_RUNNING
+    job.started_at = _utcnow()
+    job.updated_at = job.started_at
+    job.summary = {**(job.summary or {}), **(summary or {}), "phase": "queued", "worker_token": token, "attempt": 1}
+    await db_session.commit()
+    _spawn_job(int(job.id), token)
+    structured_log(logger, "info", "portability.job_started", job_id=int(job.id), job_name=job.job_name)
+    return job
+
+
+async def fail_portability_job(db_session: AsyncSession, *, job: DataRepairJob, error_text: str) -> None:
+    job.status = REPAIR_STATUS_FAILED
+    job.error_text = error_text
+    job.finished_at = _utcnow()
+    job.updated_at = job.finished_at
+    job.summary = {**(job.summary or {}), "phase": "failed"}
+    await db_session.commit()
+    _remove_job_files(portability_job_path(job))
+
+
+async def get_user_portability_job(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    job_id: int,
+    job_name: str,
+) -> DataRepairJob | None:
+    job = await db_session.get(DataRepairJob, job_id)
+    if job is None or job.job_name != job_name:
+        return None
+    if int((job.scope or {}).get("user_id", -1)) != int(user_id):
+        return None
+    return job
+
+
+async def resume_stale_portability_jobs(db_session: AsyncSession) -> int:
+    """Claim jobs whose worker stopped heartbeating and restart them in this process."""
+    cutoff = _utcnow() - timedelta(seconds=JOB_STALE_AFTER_SECONDS)
+    result = await db_session.execute(
+        select(DataRepairJob)
+        .where(
+            DataRepairJob.job_name.in_(PORTABILITY_JOB_NAMES),
+            DataRepairJob.status.in_(ACTIVE_JOB_STATUSES),
+            DataRepairJob.updated_at < cutoff,
+        )
+        .order_by(DataRepairJob.id.asc())
+        .with_for_update(skip_locked=True)
+    )
+    abandoned: list[Path] = []
+    claimed: list[tuple[int, str]] = []
+    for job in result.scalars().all():
+        if job.status == REPAIR_STATUS_PLANNED:
+            # The upload never completed, so there is nothing consistent to resume from.
+            job.status = REPAIR_STATUS_FAILED
+            job.error_text = "Interrupted before the job started."
+            job.finished_at = _utcnow()
+            job.updated_at = job.finished_at
+            job.summary = {**(job.summary or {}), "phase": "failed"}
+            abandoned.append(portability_job_path(job))
+            continue
+        # A fresh ``updated_at`` keeps other schedulers off the claimed job.
+        token = uuid.uuid4().hex
+        attempt = int((job.summary or {}).get("attempt") or 1) + 1
+        job.summary = {**(job.summary or {}), "worker_token": token, "attempt": attempt}
+        job.updated_at = _utcnow()
+        claimed.append((int(job.id), token))
+    await db_session.commit()
+    for path in abandoned:
+        _remove_job_files(path)
+    for job_id, token in claimed:
+        _spawn_job(job_id, token)
+        structured_log(logger, "info", "portability.job_resumed", job_id=job_id)
+    return len(claimed)
+
+
+class _JobProgress:
+    """Throughput and checkpoint of the current attempt, persisted into ``summary``."""
+
+    def __init__(self, job: DataRepairJob, *, token: str) -> None:
+        self.job_id = int(job.id)
+        self.token = token
+        self.summary = dict(job.summary or {})
+        self._started = time.monotonic()
+        self._start_rows = 0
+        self._saved_at = 0.0
+
+    def begin(self, *, phase: str, rows_total: int, rows_done: int) -> None:
+        self.summary.update(phase=phase, rows_total=rows_total)
+        self._started = time.monotonic()
+        self._start_rows = rows_done
+        self.advance(rows_done)
+
+    def advance(self, rows_done: int) -> None:
+        elapsed = time.monotonic() - self._started
+        rate = (rows_done - self._start_rows) / elapsed if elapsed > 0 else 0.0
+        remaining = max(int(self.summary.get("rows_total") or 0) - rows_done, 0)
+        self.summary.update(
+            rows_done=rows_done,
+            rows_per_second=round(rate, 1),
+            eta_seconds=round(remaining / rate, 1) if rate > 0 else None,
+        )
+
+    def _update(self, values: dict[str, Any]) -> Update:
+        return (
+            update(DataRepairJob)
+            .where(
+                DataRepairJob.id == self.job_id,
+                DataRepairJob.summary["worker_token"].astext == self.token,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def save(self, *, throttle: bool = False, status: str | None = None, error_text: str | None = None) -> None:
+        now = time.monotonic()
+        if throttle and now - self._saved_at < _PROGRESS_SAVE_INTERVAL_SECONDS:
+            return
+        self._saved_at = now
+        values: dict[str, Any] = {"summary": dict(self.summary), "updated_at": func.now()}
+        if status is not None:
+            values.update(status=status, error_text=error_text, finished_at=func.now())
+        # A short session of its own: the export still has a server-side cursor open on the worker's.
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            result: CursorResult[Any] = await session.execute(self._update(values))  # type: ignore[assignment]
+            await session.commit()
+        if result.rowcount == 0:
+            raise _JobTakenOver
+
+    async def stage(self, db_session: AsyncSession) -> None:
+        """Write the progress in ``db_session``'s open transaction, to commit with the work it describes."""
+        self._saved_at = time.monotonic()
+        result: CursorResult[Any] = await db_session.execute(  # type: ignore[assignment]
+            self._update({"summary": dict(self.summary), "updated_at": func.now()})
+        )
+        if result.rowcount == 0:
+            raise _JobTakenOver
+
+
+def _open_upload(path: Path) -> gzip.GzipFile | BufferedReader:
+    with path.open("rb") as probe:
+        compressed = probe.read(len(_GZIP_MAGIC)) == _GZIP_MAGIC
+    return gzip.open(path, "rb") if compressed else path.open("rb")
+
+
+def _iter_json_document_records(path: Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    with _open_upload(path) as handle:
+        try:
+            payload = json.load(handle)
+        except ValueError as exc:
+            raise ImportExportError("Upload is neither a JSON export nor NDJSON.") from exc
+    if isinstance(payload, dict) and isinstance(payload.get("data"), dict):
+        payload = payload["data"]
+    if not isinstance(payload, dict):
+        raise ImportExportError("Upload must be a JSON object.")
+    yield NDJSON_RECORD_HEADER, {"schema_version": payload.get("schema_version")}
+    for record_type, key in ((NDJSON_RECORD_SCHOLAR, "scholars"), (NDJSON_RECORD_PUBLICATION, "publications")):
+        for record in payload.get(key) or []:
+            if not isinstance(record, dict):
+                raise ImportExportError(f"Every entry in '{key}' must be a JSON object.")
+            yield record_type, record
+
+
+def _iter_upload_records(path: Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield upload records in file order, for NDJSON exports and JSON export envelopes alike."""
+    with _open_upload(path) as handle:
+        lines = (line for line in handle if line.strip())
+        first_line = next(lines, b"")
+        try:
+            first_record = json.loads(first_line)
+        except ValueError:
+            first_record = None
+        if isinstance(first_record, dict) and "type" in first_record:
+            yield from iter_ndjson_records(itertools.chain([first_line], lines))
+            return
+    yield from _iter_json_document_records(path)
+
+
+def _scan_upload(path: Path) -> tuple[Any, list[dict[str, Any]], int]:
+    schema_version: Any = None
+    scholars: list[dict[str, Any]] = []
+    publication_count = 0
+    for record_type, record in _iter_upload_records(path):
+        if record_type == NDJSON_RECORD_HEADER:
+            schema_version = record.get("schema_version")
+        elif record_type == NDJSON_RECORD_SCHOLAR:
+            scholars.append(record)
+        else:
+            publication_count += 1
+    return schema_version, scholars, publication_count
+
+
+def _iter_upload_publications(path: Path) -> Iterator[dict[str, Any]]:
+    for record_type, record in _iter_upload_records(path):
+        if record_type == NDJSON_RECORD_PUBLICATION:
+            yield record
+
+
+async def _run_import(db_session: AsyncSession, job: DataRepairJob, progress: _JobProgress) -> dict[str, int]:
+    path = portability_job_path(job)
+    async with _heartbeat(progress.save):
+        schema_version, scholars, publication_count = await asyncio.to_thread(_scan_upload, path)
+    if schema_version is not None and schema_version != EXPORT_SCHEMA_VERSION:
+        raise ImportExportError(f"Import schema version is not supported. Expected {EXPORT_SCHEMA_VERSION}.")
+    _validate_import_counts(scholar_count=len(scholars), publication_count=publication_count)
+
+    scholar_map, counters = await _upsert_imported_scholars(
+        db_session,
+        user_id=int(job.scope["user_id"]),
+        scholars=scholars,
+    )
+    if "counters" in progress.summary:
+        # Scholars were counted by the attempt that first committed them.
+        counters = dict(progress.summary["counters"])
+    else:
+        _initialize_import_counters(counters)
+    start_offset = int(progress.summary.get("next_offset") or 0)
+    progress.summary.update(counters=counters, next_offset=start_offset)
+    progress.begin(phase="importing", rows_total=publication_count, rows_done=start_offset)
+    await progress.stage(db_session)
+    await db_session.commit()
+
+    async def _checkpoint(next_offset: int, snapshot: dict[str, int]) -> None:
+        progress.summary.update(counters=snapshot, next_offset=next_offset)
+        progress.advance(next_offset)
+        await progress.stage(db_session)
+
+    return await import_publications_in_chunks(
+        db_session,
+        scholar_map=scholar_map,
+        publications=_iter_upload_publications(path),
+        counters=counters,
+        start_offset=start_offset,
+        on_chunk_imported=_checkpoint,
+    )
+
+
+async def _run_export(db_session: AsyncSession, job: DataRepairJob, progress: _JobProgress) -> None:
+    user_id = int(job.scope["user_id"])
+    scholar_profile_ids = job.scope.get("scholar_profile_ids")
+    rows_total = await count_user_export_records(db_session, user_id=user_id, scholar_profile_ids=scholar_profile_ids)
+    progress.begin(phase="exporting", rows_total=rows_total, rows_done=0)
+    await progress.save()
+
+    async def _counted(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        lines = 0
+        async for chunk in chunks:
+            lines += chunk.count(b"\n")
+            # The first line is the header, not a record.
+            progress.advance(max(lines - 1, 0))
+            yield chunk
+
+    chunks = _counted(iter_user_export_ndjson(db_session, user_id=user_id, scholar_profile_ids=scholar_profile_ids))
+    if job.scope.get("gzip"):
+        chunks = gzip_chunks(chunks)
+    path = portability_job_path(job)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.part")
+    # Exports restart from scratch; the partial file is only renamed once complete.
+    with partial.open("wb") as handle:
+        async for chunk in chunks:
+            handle.write(chunk)
+            await progress.save(throttle=True)
+    partial.replace(path)
+    progress.summary["bytes"] = path.stat().st_size
+
+
+async def _run_job(job_id: int, token: str) -> None:
+    async with background_session() as db_session:
+        job = await db_session.get(DataRepairJob, job_id)
+        if job is None or (job.summary or {}).get("worker_token") != token:
+            return
+        job_name = job.job_name
+        path = portability_job_path(job)
+        progress = _JobProgress(job, token=token)
+        try:
+            if job_name == PORTABILITY_IMPORT_JOB_NAME:
+                progress.summary["counters"] = await _run_import(db_session, job, progress)
+            else:
+                await _run_export(db_session, job, progress)
+            progress.summary.update(phase="completed", eta_seconds=0)
+            await progress.save(status=REPAIR_STATUS_COMPLETED)
+        except _JobTakenOver:
+            structured_log(logger, "warning", "portability.job_taken_over", job_id=job_id)
+            return
+        except Exception as exc:
+            await db_session.rollback()
+            progress.summary["phase"] = "failed"
+            structured_log(logger, "warning", "portability.job_failed", job_id=job_id, error=str(exc))
+            try:
+                await progress.save(status=REPAIR_STATUS_FAILED, error_text=str(exc))
+            except _JobTakenOver:
+                return
+            _remove_job_files(path)
+            return
+        if job_name == PORTABILITY_IMPORT_JOB_NAME:
+            _remove_job_files(path)
+        structured_log(
+            logger,
+            "info",
+            "portability.job_completed",
+            job_id=job_id,
+            job_name=job_name,
+            rows_done=progress.summary.get("rows_done"),
+            rows_per_second=progress.summary.get("rows_per_second"),
+        )
+
+
+def _drop_finished_task(task: asyncio.Task[None]) -> None:
+    _background_tasks.discard(task)
+    try:
+        task.result()
+    except Exception:
+        structured_log(logger, "exception", "portability.job_task_failed")
+
+
+def _spawn_job(job_id: int, token: str) -> None:
+    task = asyncio.create_task(_run_job(job_id, token))
+    _background_tasks.add(task)
+    task.add_done_callback(_drop_finished_task)
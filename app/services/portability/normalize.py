@@ -101,7 +101,11 @@ def _validate_import_sizes(
     scholars: list[dict[str, Any]],
     publications: list[dict[str, Any]],
 ) -> None:
-    if len(scholars) > MAX_IMPORT_SCHOLARS:
+    _validate_import_counts(scholar_count=len(scholars), publication_count=len(publications))
+
+
+def _validate_import_counts(*, scholar_count: int, publication_count: int) -> None:
+    if scholar_count > MAX_IMPORT_SCHOLARS:
         raise ImportExportError(f"Import exceeds max scholars ({MAX_IMPORT_SCHOLARS}).")
-    if len(publications) > MAX_IMPORT_PUBLICATIONS:
+    if publication_count > MAX_IMPORT_PUBLICATIONS:
         raise ImportExportError(f"Import exceeds max publications ({MAX_IMPORT_PUBLICATIONS}).")
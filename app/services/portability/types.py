@@ -9,6 +9,14 @@ class ImportExportError(ValueError):
     """Raised when import/export payload constraints are violated."""
 
 
+class PortabilityJobConflictError(ImportExportError):
+    """Raised when the user already has an unfinished job of the same kind."""
+
+
+class ImportUploadTooLargeError(ImportExportError):
+    """Raised when a spooled import upload exceeds the configured size limit."""
+
+
 @dataclass(frozen=True)
 class ImportedPublicationInput:
     profile: ScholarProfile
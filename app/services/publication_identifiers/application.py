@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import TYPE_CHECKING
+import asyncio
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Publication, PublicationIdentifier
+from app.services.arxiv.errors import ArxivRateLimitError
 from app.services.arxiv.guards import arxiv_skip_reason_for_item
 from app.services.doi.normalize import normalize_doi
 from app.services.publication_identifiers.normalize import (
@@ -120,6 +124,21 @@ async def sync_identifiers_for_publication_fields(
     await _upsert_publication_candidates(db_session, publication_id=int(publication.id), candidates=candidates)
 
 
+async def sync_identifiers_for_publications_fields(
+    db_session: AsyncSession,
+    *,
+    publications: list[Publication],
+) -> None:
+    rows = [
+        _identifier_row_values(publication_id=int(publication.id), candidate=candidate)
+        for publication in publications
+        for candidate in _dedup_candidates(_publication_field_candidates(publication))
+    ]
+    if not rows:
+        return
+    await db_session.execute(_identifier_upsert_statement(), rows)
+
+
 async def discover_and_sync_identifiers_for_publication(
     db_session: AsyncSession,
     *,
@@ -184,20 +203,9 @@ async def _discover_crossref_doi(
     publication_id: int,
     item: UnreadPublicationItem,
 ) -> bool:
-    from app.services.crossref import application as crossref_service
-
-    discovered_doi = await crossref_service.discover_doi_for_publication(item=item)
-    normalized_doi = normalize_doi(discovered_doi)
-    if discovered_doi is None or normalized_doi is None:
+    candidate = await _crossref_doi_candidate(item)
+    if candidate is None:
         return False
-    candidate = _candidate(
-        IdentifierKind.DOI,
-        discovered_doi,
-        normalized_doi,
-        "crossref_api",
-        CONFIDENCE_MEDIUM,
-        None,
-    )
     await _upsert_publication_candidate(
         db_session,
         publication_id=publication_id,
@@ -212,13 +220,41 @@ async def _discover_arxiv_identifier(
     publication_id: int,
     item: UnreadPublicationItem,
 ) -> None:
+    candidate = await _arxiv_identifier_candidate(item)
+    if candidate is None:
+        return
+    await _upsert_publication_candidate(
+        db_session,
+        publication_id=publication_id,
+        candidate=candidate,
+    )
+
+
+async def _crossref_doi_candidate(item: UnreadPublicationItem) -> IdentifierCandidate | None:
+    from app.services.crossref import application as crossref_service
+
+    discovered_doi = await crossref_service.discover_doi_for_publication(item=item)
+    normalized_doi = normalize_doi(discovered_doi)
+    if discovered_doi is None or normalized_doi is None:
+        return None
+    return _candidate(
+        IdentifierKind.DOI,
+        discovered_doi,
+        normalized_doi,
+        "crossref_api",
+        CONFIDENCE_MEDIUM,
+        None,
+    )
+
+
+async def _arxiv_identifier_candidate(item: UnreadPublicationItem) -> IdentifierCandidate | None:
     from app.services.arxiv import application as arxiv_service
 
     discovered_arxiv = await arxiv_service.discover_arxiv_id_for_publication(item=item)
     normalized_arxiv = normalize_arxiv_id(discovered_arxiv)
     if discovered_arxiv is None or normalized_arxiv is None:
-        return
-    candidate = _candidate(
+        return None
+    return _candidate(
         IdentifierKind.ARXIV,
         discovered_arxiv,
         normalized_arxiv,
@@ -226,11 +262,108 @@ async def _discover_arxiv_identifier(
         CONFIDENCE_MEDIUM,
         None,
     )
-    await _upsert_publication_candidate(
+
+
+@dataclass
+class _ArxivLookupState:
+    allowed: bool
+
+
+async def discover_and_sync_identifiers_for_publications(
+    db_session: AsyncSession,
+    *,
+    publications: list[Publication],
+    allow_arxiv_lookup: bool,
+    max_concurrency: int = 1,
+) -> bool:
+    """Batched ``discover_and_sync_identifiers_for_publication``.
+
+    Field identifiers are upserted in one statement and existing DOI/arXiv rows
+    are read in one query. Crossref and arXiv lookups for the remaining
+    publications run up to ``max_concurrency`` at a time (each upstream keeps
+    its own pacing) and their results are upserted together. Returns whether
+    arXiv lookups are still allowed. As with the per-publication pass, an
+    arXiv rate limit stops the Crossref and arXiv lookups that have not
+    started yet, leaving only the field identifiers for the rest of the batch.
+    """
+    arxiv_state = _ArxivLookupState(allowed=allow_arxiv_lookup)
+    if not publications:
+        return arxiv_state.allowed
+    await sync_identifiers_for_publications_fields(db_session, publications=publications)
+    existing_kinds = await _identifier_kinds_by_publication(
         db_session,
-        publication_id=publication_id,
-        candidate=candidate,
+        publication_ids=[int(publication.id) for publication in publications],
     )
+    pending = [
+        publication
+        for publication in publications
+        if IdentifierKind.DOI.value not in existing_kinds.get(int(publication.id), set())
+    ]
+    semaphore = asyncio.Semaphore(max(int(max_concurrency), 1))
+
+    async def _lookup(publication: Publication) -> list[IdentifierCandidate]:
+        async with semaphore:
+            return await _lookup_identifier_candidates(
+                publication,
+                has_existing_arxiv=IdentifierKind.ARXIV.value in existing_kinds.get(int(publication.id), set()),
+                arxiv_state=arxiv_state,
+            )
+
+    discovered = await asyncio.gather(*(_lookup(publication) for publication in pending))
+    rows = [
+        _identifier_row_values(publication_id=int(publication.id), candidate=candidate)
+        for publication, candidates in zip(pending, discovered, strict=True)
+        for candidate in candidates
+    ]
+    if rows:
+        await db_session.execute(_identifier_upsert_statement(), rows)
+    return arxiv_state.allowed
+
+
+async def _lookup_identifier_candidates(
+    publication: Publication,
+    *,
+    has_existing_arxiv: bool,
+    arxiv_state: _ArxivLookupState,
+) -> list[IdentifierCandidate]:
+    if not arxiv_state.allowed:
+        return []
+    item = _identifier_lookup_item(publication=publication, scholar_label=publication.author_text or "")
+    candidates: list[IdentifierCandidate] = []
+    doi_candidate = await _crossref_doi_candidate(item)
+    if doi_candidate is not None:
+        candidates.append(doi_candidate)
+    skip_reason = arxiv_skip_reason_for_item(
+        item=item,
+        has_strong_doi=doi_candidate is not None and doi_candidate.confidence_score >= CONFIDENCE_MEDIUM,
+        has_existing_arxiv=has_existing_arxiv,
+    )
+    if skip_reason is not None or not arxiv_state.allowed:
+        return candidates
+    try:
+        arxiv_candidate = await _arxiv_identifier_candidate(item)
+    except ArxivRateLimitError:
+        arxiv_state.allowed = False
+        return candidates
+    if arxiv_candidate is not None:
+        candidates.append(arxiv_candidate)
+    return candidates
+
+
+async def _identifier_kinds_by_publication(
+    db_session: AsyncSession,
+    *,
+    publication_ids: list[int],
+) -> dict[int, set[str]]:
+    result = await db_session.execute(
+        select(PublicationIdentifier.publication_id, PublicationIdentifier.kind)
+        .where(PublicationIdentifier.publication_id.in_(publication_ids))
+        .distinct()
+    )
+    kinds: dict[int, set[str]] = {}
+    for publication_id, kind in result.all():
+        kinds.setdefault(int(publication_id), set()).add(str(kind))
+    return kinds
 
 
 async def _has_confident_identifier(
@@ -361,6 +494,39 @@ def _new_identifier_row(
     )
 
 
+def _identifier_row_values(
+    *,
+    publication_id: int,
+    candidate: IdentifierCandidate,
+) -> dict[str, Any]:
+    return {
+        "publication_id": publication_id,
+        "kind": candidate.kind.value,
+        "value_raw": candidate.value_raw,
+        "value_normalized": candidate.value_normalized,
+        "source": candidate.source,
+        "confidence_score": candidate.confidence_score,
+        "evidence_url": candidate.evidence_url,
+    }
+
+
+def _identifier_upsert_statement() -> Insert:
+    # Set-based equivalent of _merge_identifier_row: only a candidate at least as
+    # confident as the stored row may overwrite it, and a missing evidence_url
+    # never clears an existing one.
+    stmt = pg_insert(PublicationIdentifier)
+    return stmt.on_conflict_do_update(
+        constraint="uq_publication_identifiers_publication_kind_value",
+        set_={
+            "value_raw": stmt.excluded.value_raw,
+            "source": stmt.excluded.source,
+            "confidence_score": stmt.excluded.confidence_score,
+            "evidence_url": func.coalesce(stmt.excluded.evidence_url, PublicationIdentifier.evidence_url),
+        },
+        where=stmt.excluded.confidence_score >= PublicationIdentifier.confidence_score,
+    )
+
+
 def _merge_identifier_row(existing: PublicationIdentifier, *, candidate: IdentifierCandidate) -> None:
     if candidate.confidence_score >= float(existing.confidence_score):
         existing.value_raw = candidate.value_raw
@@ -432,6 +598,28 @@ async def display_identifier_for_publication_id(
     )
 
 
+async def display_identifiers_for_publications(
+    db_session: AsyncSession,
+    *,
+    publications: list[Publication],
+) -> dict[int, DisplayIdentifier]:
+    """``display_identifier_for_publication_id`` for many loaded publications in one query."""
+    mapping = await _display_identifier_map(
+        db_session,
+        publication_ids=[int(publication.id) for publication in publications],
+    )
+    displays: dict[int, DisplayIdentifier] = {}
+    for publication in publications:
+        display = mapping.get(int(publication.id)) or derive_display_identifier_from_values(
+            doi=None,
+            pub_url=publication.pub_url,
+            pdf_url=publication.pdf_url,
+        )
+        if display is not None:
+            displays[int(publication.id)] = display
+    return displays
+
+
 async def _display_identifier_map(
     db_session: AsyncSession,
     *,
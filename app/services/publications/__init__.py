@@ -10,6 +10,9 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     MODE_UNREAD as MODE_UNREAD,
 )
+from app.services.publications.application import (
+    PublicationFacetCounts as PublicationFacetCounts,
+)
 from app.services.publications.application import (
     PublicationListItem as PublicationListItem,
 )
@@ -28,6 +31,9 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     count_pdf_queue_items as count_pdf_queue_items,
 )
+from app.services.publications.application import (
+    count_publication_facets_for_user as count_publication_facets_for_user,
+)
 from app.services.publications.application import (
     count_unread_for_user as count_unread_for_user,
 )
@@ -40,12 +46,18 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     get_latest_run_id_for_user as get_latest_run_id_for_user,
 )
+from app.services.publications.application import (
+    get_publication_facet_counts_for_user as get_publication_facet_counts_for_user,
+)
 from app.services.publications.application import (
     get_publication_item_for_user as get_publication_item_for_user,
 )
 from app.services.publications.application import (
     hydrate_pdf_enrichment_state as hydrate_pdf_enrichment_state,
 )
+from app.services.publications.application import (
+    invalidate_publication_counts_for_user as invalidate_publication_counts_for_user,
+)
 from app.services.publications.application import (
     list_for_user as list_for_user,
 )
@@ -73,9 +85,6 @@ from app.services.publications.application import (
 from app.services.publications.application import (
     retry_pdf_for_user as retry_pdf_for_user,
 )
-from app.services.publications.application import (
-    schedule_missing_pdf_enrichment_for_user as schedule_missing_pdf_enrichment_for_user,
-)
 from app.services.publications.application import (
     schedule_retry_pdf_enrichment_for_row as schedule_retry_pdf_enrichment_for_row,
 )
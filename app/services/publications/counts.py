@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import distinct, func, select
+from sqlalchemy import ColumnElement, and_, distinct, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Publication, ScholarProfile, ScholarPublication
+from app.db.models import Publication, ScholarProfile, ScholarPublication, UserPublicationFeed
 from app.services.publications.modes import (
     MODE_ALL,
     MODE_LATEST,
@@ -13,6 +13,8 @@ from app.services.publications.modes import (
     resolve_publication_view_mode,
 )
 from app.services.publications.queries import get_latest_run_id_for_user
+from app.services.publications.search import matching_scholar_profile_ids, publication_search_clause
+from app.services.publications.types import PublicationFacetCounts
 
 
 async def count_for_user(
@@ -27,6 +29,7 @@ async def count_for_user(
 ) -> int:
     resolved_mode = resolve_publication_view_mode(mode)
     latest_run_id = await get_latest_run_id_for_user(db_session, user_id=user_id)
+    search_scholar_ids = await matching_scholar_profile_ids(db_session, user_id=user_id, search=search)
     stmt = (
         select(func.count(distinct(ScholarPublication.publication_id)))
         .select_from(ScholarPublication)
@@ -34,7 +37,7 @@ async def count_for_user(
         .join(Publication, Publication.id == ScholarPublication.publication_id)
         .where(ScholarProfile.user_id == user_id)
     )
-    stmt = _apply_search_filter(stmt, search=search)
+    stmt = _apply_search_filter(stmt, search=search, scholar_profile_ids=search_scholar_ids)
     if scholar_profile_id is not None:
         stmt = stmt.where(ScholarProfile.id == scholar_profile_id)
     if favorite_only:
@@ -51,15 +54,172 @@ async def count_for_user(
     return int(result.scalar_one() or 0)
 
 
-def _apply_search_filter(stmt, *, search: str | None):
-    if not search:
+def _apply_search_filter(stmt, *, search: str | None, scholar_profile_ids: tuple[int, ...] = ()):
+    clause = publication_search_clause(search, scholar_profile_ids=scholar_profile_ids)
+    if clause is None:
         return stmt
-    safe_search = search.replace("%", r"\%").replace("_", r"\_")
-    pattern = f"%{safe_search}%"
-    return stmt.where(
-        Publication.title_raw.ilike(pattern)
-        | ScholarProfile.display_name.ilike(pattern)
-        | Publication.venue_text.ilike(pattern)
+    return stmt.where(clause)
+
+
+def _distinct_publication_count(*conditions: ColumnElement[bool]):
+    counted = func.count(distinct(ScholarPublication.publication_id))
+    if not conditions:
+        return counted
+    return counted.filter(and_(*conditions))
+
+
+def publication_facet_counts_query(
+    *,
+    user_id: int,
+    latest_run_id: int | None,
+    scholar_profile_id: int | None,
+    favorite_only: bool,
+    search: str | None,
+    snapshot_before: datetime | None,
+    search_scholar_ids: tuple[int, ...] = (),
+):
+    """One aggregate pass for the unread/favorites/latest/total list facets.
+
+    Each facet keeps the filters of its former standalone count: the favorites
+    facet ignores ``favorite_only`` and only the total honours ``search``.
+    """
+    is_favorite = ScholarPublication.is_favorite.is_(True)
+    scope = [is_favorite] if favorite_only else []
+    latest_count = (
+        _distinct_publication_count(*scope, ScholarPublication.first_seen_run_id == latest_run_id)
+        if latest_run_id is not None
+        else literal(0)
+    )
+    search_clause = publication_search_clause(search, scholar_profile_ids=search_scholar_ids)
+    total_conditions = [*scope, search_clause] if search_clause is not None else scope
+    stmt = (
+        select(
+            _distinct_publication_count(*scope, ScholarPublication.is_read.is_(False)),
+            _distinct_publication_count(is_favorite),
+            latest_count,
+            _distinct_publication_count(*total_conditions),
+        )
+        .select_from(ScholarPublication)
+        .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .join(Publication, Publication.id == ScholarPublication.publication_id)
+        .where(ScholarProfile.user_id == user_id)
+    )
+    if scholar_profile_id is not None:
+        stmt = stmt.where(ScholarProfile.id == scholar_profile_id)
+    if snapshot_before is not None:
+        stmt = stmt.where(ScholarPublication.created_at <= snapshot_before)
+    return stmt
+
+
+def feed_facet_counts_query(*, user_id: int, latest_run_id: int | None):
+    """Unscoped list facets from ``user_publication_feed`` (one row per publication).
+
+    Every referenced column is in ``ix_user_publication_feed_user_facets``, so
+    this is an index-only scan over the user's feed rows. The latest facet is
+    counted per link instead: ``newest_run_id`` also tracks failed and canceled
+    runs, which ``get_latest_run_id_for_user`` skips.
+    """
+    latest_count = (
+        select(func.count(distinct(ScholarPublication.publication_id)))
+        .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .where(ScholarProfile.user_id == user_id, ScholarPublication.first_seen_run_id == latest_run_id)
+        .scalar_subquery()
+        if latest_run_id is not None
+        else literal(0)
+    )
+    return select(
+        func.count().filter(UserPublicationFeed.is_unread.is_(True)),
+        func.count().filter(UserPublicationFeed.is_favorite.is_(True)),
+        latest_count,
+        func.count(),
+    ).where(UserPublicationFeed.user_id == user_id)
+
+
+def _search_total_query(
+    *,
+    user_id: int,
+    search_clause: ColumnElement[bool],
+    snapshot_before: datetime | None,
+):
+    stmt = (
+        select(func.count(distinct(ScholarPublication.publication_id)))
+        .select_from(ScholarPublication)
+        .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .join(Publication, Publication.id == ScholarPublication.publication_id)
+        .where(ScholarProfile.user_id == user_id, search_clause)
+    )
+    if snapshot_before is not None:
+        stmt = stmt.where(ScholarPublication.created_at <= snapshot_before)
+    return stmt
+
+
+async def _count_feed_facets_for_user(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    latest_run_id: int | None,
+    search: str | None,
+    snapshot_before: datetime | None,
+) -> PublicationFacetCounts:
+    result = await db_session.execute(feed_facet_counts_query(user_id=user_id, latest_run_id=latest_run_id))
+    unread_count, favorites_count, latest_count, total_count = result.one()
+    search_scholar_ids = await matching_scholar_profile_ids(db_session, user_id=user_id, search=search)
+    search_clause = publication_search_clause(search, scholar_profile_ids=search_scholar_ids)
+    if search_clause is not None:
+        total_result = await db_session.execute(
+            _search_total_query(user_id=user_id, search_clause=search_clause, snapshot_before=snapshot_before)
+        )
+        total_count = total_result.scalar_one()
+    return PublicationFacetCounts(
+        unread_count=int(unread_count or 0),
+        favorites_count=int(favorites_count or 0),
+        latest_count=int(latest_count or 0),
+        total_count=int(total_count or 0),
+    )
+
+
+async def count_publication_facets_for_user(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    latest_run_id: int | None,
+    scholar_profile_id: int | None = None,
+    favorite_only: bool = False,
+    search: str | None = None,
+    snapshot_before: datetime | None = None,
+    pinned_snapshot: bool = False,
+) -> PublicationFacetCounts:
+    """List facet counts.
+
+    Live (unpinned) counts without a scholar or favorites scope come from the
+    per-user feed; scoped or snapshot-pinned counts aggregate the link join.
+    """
+    if scholar_profile_id is None and not favorite_only and not pinned_snapshot:
+        return await _count_feed_facets_for_user(
+            db_session,
+            user_id=user_id,
+            latest_run_id=latest_run_id,
+            search=search,
+            snapshot_before=snapshot_before,
+        )
+    search_scholar_ids = await matching_scholar_profile_ids(db_session, user_id=user_id, search=search)
+    result = await db_session.execute(
+        publication_facet_counts_query(
+            user_id=user_id,
+            latest_run_id=latest_run_id,
+            scholar_profile_id=scholar_profile_id,
+            favorite_only=favorite_only,
+            search=search,
+            snapshot_before=snapshot_before,
+            search_scholar_ids=search_scholar_ids,
+        )
+    )
+    unread_count, favorites_count, latest_count, total_count = result.one()
+    return PublicationFacetCounts(
+        unread_count=int(unread_count or 0),
+        favorites_count=int(favorites_count or 0),
+        latest_count=int(latest_count or 0),
+        total_count=int(total_count or 0),
     )
 
 
@@ -0,0 +1,99 @@
+"""Opaque keyset cursors for publication listing.
+
+A cursor records the sort of the page it came from and the sort key of the
+last row: the sort value, ``Publication.id`` and the scholar profile id (a
+publication appears once per linked scholar). The next page resumes strictly
+after that tuple instead of skipping ``OFFSET`` rows.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+CURSOR_VERSION = 1
+
+_DATETIME_SORTS = frozenset({"first_seen"})
+_INT_SORTS = frozenset({"year", "citations", "pdf_status"})
+_TEXT_SORTS = frozenset({"title", "scholar"})
+_FLOAT_SORTS = frozenset({"relevance"})
+
+
+class InvalidPublicationCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class PublicationCursor:
+    sort_by: str
+    sort_dir: str
+    sort_value: datetime | float | int | str
+    publication_id: int
+    scholar_profile_id: int
+
+
+def _encoded_sort_value(value: datetime | float | int | str) -> float | int | str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _decoded_sort_value(sort_by: str, value: object) -> datetime | float | int | str:
+    if sort_by in _DATETIME_SORTS and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if sort_by in _INT_SORTS and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if sort_by in _TEXT_SORTS and isinstance(value, str):
+        return value
+    if sort_by in _FLOAT_SORTS and isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    raise InvalidPublicationCursorError("Cursor sort value does not match its sort field.")
+
+
+def encode_publication_cursor(cursor: PublicationCursor) -> str:
+    payload = {
+        "v": CURSOR_VERSION,
+        "s": cursor.sort_by,
+        "d": cursor.sort_dir,
+        "k": [
+            _encoded_sort_value(cursor.sort_value),
+            int(cursor.publication_id),
+            int(cursor.scholar_profile_id),
+        ],
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_publication_cursor(token: str) -> PublicationCursor:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (UnicodeError, binascii.Error, ValueError) as exc:
+        raise InvalidPublicationCursorError("Cursor is not valid base64 JSON.") from exc
+    if not isinstance(payload, dict) or payload.get("v") != CURSOR_VERSION:
+        raise InvalidPublicationCursorError("Unsupported cursor version.")
+    sort_by = payload.get("s")
+    sort_dir = payload.get("d")
+    key = payload.get("k")
+    if sort_by not in _DATETIME_SORTS | _INT_SORTS | _TEXT_SORTS | _FLOAT_SORTS or sort_dir not in {"asc", "desc"}:
+        raise InvalidPublicationCursorError("Cursor sort is not supported.")
+    if not isinstance(key, list) or len(key) != 3:
+        raise InvalidPublicationCursorError("Cursor key is malformed.")
+    sort_value, publication_id, scholar_profile_id = key
+    if not isinstance(publication_id, int) or not isinstance(scholar_profile_id, int):
+        raise InvalidPublicationCursorError("Cursor key is malformed.")
+    try:
+        decoded_value = _decoded_sort_value(str(sort_by), sort_value)
+    except ValueError as exc:
+        raise InvalidPublicationCursorError(str(exc)) from exc
+    return PublicationCursor(
+        sort_by=str(sort_by),
+        sort_dir=str(sort_dir),
+        sort_value=decoded_value,
+        publication_id=publication_id,
+        scholar_profile_id=scholar_profile_id,
+    )
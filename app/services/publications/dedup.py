@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from collections.abc import Iterable
+import math
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass
 
-from sqlalchemy import delete, select
+from sqlalchemy import ColumnElement, delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
@@ -13,7 +15,7 @@ from app.db.models import Publication, PublicationIdentifier, ScholarPublication
 from app.logging_utils import structured_log
 from app.services.ingestion.fingerprints import (
     canonical_title_text_for_dedup,
-    canonical_title_tokens_for_dedup,
+    near_duplicate_title_keys,
     normalize_title,
 )
 
@@ -23,24 +25,7 @@ NEAR_DUP_DEFAULT_SIMILARITY_THRESHOLD = 0.78
 NEAR_DUP_DEFAULT_CONTAINMENT_THRESHOLD = 0.92
 NEAR_DUP_DEFAULT_MIN_SHARED_TOKENS = 3
 NEAR_DUP_DEFAULT_MAX_YEAR_DELTA = 1
-NEAR_DUP_MIN_TOKEN_LENGTH = 3
 NEAR_DUP_CLUSTER_KEY_LENGTH = 16
-NEAR_DUP_STOPWORDS = {
-    "a",
-    "an",
-    "and",
-    "approach",
-    "for",
-    "in",
-    "method",
-    "of",
-    "on",
-    "the",
-    "to",
-    "using",
-    "via",
-    "with",
-}
 
 
 @dataclass(frozen=True)
@@ -133,8 +118,11 @@ def _merge_publication_metadata(*, winner: Publication, dup: Publication) -> Non
         winner.cluster_id = dup.cluster_id
     if not winner.canonical_title_hash and dup.canonical_title_hash:
         winner.canonical_title_hash = dup.canonical_title_hash
-    winner.title_raw = _preferred_title_text(winner=winner.title_raw, dup=dup.title_raw)
-    winner.title_normalized = normalize_title(winner.title_raw)
+    title = _preferred_title_text(winner=winner.title_raw, dup=dup.title_raw)
+    if title != winner.title_raw:
+        winner.dedup_title_text, winner.dedup_title_tokens = near_duplicate_title_keys(title)
+    winner.title_raw = title
+    winner.title_normalized = normalize_title(title)
 
 
 def _preferred_title_text(*, winner: str, dup: str) -> str:
@@ -244,8 +232,14 @@ async def find_near_duplicate_clusters(
     similarity_threshold: float = NEAR_DUP_DEFAULT_SIMILARITY_THRESHOLD,
     min_shared_tokens: int = NEAR_DUP_DEFAULT_MIN_SHARED_TOKENS,
     max_year_delta: int = NEAR_DUP_DEFAULT_MAX_YEAR_DELTA,
+    after_publication_id: int | None = None,
 ) -> list[NearDuplicateCluster]:
-    candidates = await _load_near_duplicate_candidates(db_session)
+    """Cluster near-duplicate publications.
+
+    With ``after_publication_id`` only pairs involving a publication created
+    after that id are checked; older publications still take part as partners.
+    """
+    candidates = await _load_near_duplicate_candidates(db_session, after_publication_id=after_publication_id)
     if len(candidates) < 2:
         return []
     groups = _cluster_candidate_groups(
@@ -253,6 +247,7 @@ async def find_near_duplicate_clusters(
         similarity_threshold=similarity_threshold,
         min_shared_tokens=min_shared_tokens,
         max_year_delta=max_year_delta,
+        after_publication_id=after_publication_id,
     )
     clusters = [_near_duplicate_cluster(group) for group in groups]
     return sorted(clusters, key=lambda item: (-len(item.members), item.winner_publication_id))
@@ -298,6 +293,40 @@ def near_duplicate_cluster_payload(cluster: NearDuplicateCluster) -> dict[str, o
 
 async def _load_near_duplicate_candidates(
     db_session: AsyncSession,
+    *,
+    after_publication_id: int | None = None,
+) -> list[_NearDuplicateCandidate]:
+    """Load clustering candidates.
+
+    With ``after_publication_id`` only the newer publications and the older
+    ones that share a title token with them are loaded; no other older title
+    can pair with a newer one. Older rows without backfilled keys are always
+    loaded, since their tokens are derived here.
+    """
+    if after_publication_id is None:
+        return await _select_near_duplicate_candidates(db_session)
+    new_candidates = await _select_near_duplicate_candidates(
+        db_session,
+        Publication.id > after_publication_id,
+    )
+    new_tokens = sorted({token for candidate in new_candidates for token in candidate.tokens})
+    if not new_tokens:
+        return []
+    old_candidates = await _select_near_duplicate_candidates(
+        db_session,
+        Publication.id <= after_publication_id,
+        or_(
+            Publication.dedup_title_tokens.overlap(new_tokens),
+            Publication.dedup_title_tokens.is_(None),
+            Publication.dedup_title_text.is_(None),
+        ),
+    )
+    return old_candidates + new_candidates
+
+
+async def _select_near_duplicate_candidates(
+    db_session: AsyncSession,
+    *criteria: ColumnElement[bool],
 ) -> list[_NearDuplicateCandidate]:
     result = await db_session.execute(
         select(
@@ -305,7 +334,11 @@ async def _load_near_duplicate_candidates(
             Publication.title_raw,
             Publication.year,
             Publication.citation_count,
+            Publication.dedup_title_text,
+            Publication.dedup_title_tokens,
         )
+        .where(*criteria)
+        .order_by(Publication.id)
     )
     records = [
         _candidate_from_row(
@@ -313,8 +346,10 @@ async def _load_near_duplicate_candidates(
             title=str(title_raw or ""),
             year=year,
             citation_count=int(citation_count or 0),
+            canonical_text=canonical_text,
+            tokens=tokens,
         )
-        for publication_id, title_raw, year, citation_count in result.all()
+        for publication_id, title_raw, year, citation_count, canonical_text, tokens in result.all()
     ]
     return [record for record in records if record is not None]
 
@@ -325,73 +360,142 @@ def _candidate_from_row(
     title: str,
     year: int | None,
     citation_count: int,
+    canonical_text: str | None = None,
+    tokens: list[str] | None = None,
 ) -> _NearDuplicateCandidate | None:
-    canonical = canonical_title_text_for_dedup(title)
-    raw_tokens = canonical_title_tokens_for_dedup(title)
-    tokens = _normalized_tokens(raw_tokens)
-    if not canonical or not tokens:
+    if canonical_text is None or tokens is None:
+        # Not backfilled yet: derive the keys from the title.
+        canonical_text, tokens = near_duplicate_title_keys(title)
+    if not canonical_text or not tokens:
         return None
     return _NearDuplicateCandidate(
         publication_id=publication_id,
         title=title,
         year=year,
         citation_count=citation_count,
-        canonical_text=canonical,
+        canonical_text=canonical_text,
         tokens=frozenset(tokens),
     )
 
 
-def _normalized_tokens(tokens: Iterable[str]) -> set[str]:
-    return {token for token in tokens if len(token) >= NEAR_DUP_MIN_TOKEN_LENGTH and token not in NEAR_DUP_STOPWORDS}
-
-
 def _cluster_candidate_groups(
     candidates: list[_NearDuplicateCandidate],
     *,
     similarity_threshold: float,
     min_shared_tokens: int,
     max_year_delta: int,
+    after_publication_id: int | None = None,
 ) -> list[list[_NearDuplicateCandidate]]:
     by_id = {candidate.publication_id: candidate for candidate in candidates}
-    token_index = _candidate_token_index(candidates)
     parent = {candidate.publication_id: candidate.publication_id for candidate in candidates}
-    for candidate in candidates:
-        peers = _candidate_peer_ids(candidate=candidate, token_index=token_index)
-        for peer_id in sorted(peers):
-            if peer_id <= candidate.publication_id:
-                continue
-            peer = by_id[peer_id]
-            if _is_near_duplicate_pair(
-                candidate,
-                peer,
-                similarity_threshold=similarity_threshold,
-                min_shared_tokens=min_shared_tokens,
-                max_year_delta=max_year_delta,
-            ):
-                _union(parent, candidate.publication_id, peer_id)
+    pairs = _near_duplicate_candidate_pairs(
+        candidates,
+        similarity_threshold=similarity_threshold,
+        min_shared_tokens=min_shared_tokens,
+        after_publication_id=after_publication_id,
+    )
+    for left_id, right_id in pairs:
+        if _find_root(parent, left_id) == _find_root(parent, right_id):
+            continue
+        if _is_near_duplicate_pair(
+            by_id[left_id],
+            by_id[right_id],
+            similarity_threshold=similarity_threshold,
+            min_shared_tokens=min_shared_tokens,
+            max_year_delta=max_year_delta,
+        ):
+            _union(parent, left_id, right_id)
     return _grouped_candidates(candidates, parent)
 
 
-def _candidate_token_index(
+def _near_duplicate_candidate_pairs(
     candidates: list[_NearDuplicateCandidate],
-) -> dict[str, set[int]]:
-    index: dict[str, set[int]] = {}
+    *,
+    similarity_threshold: float,
+    min_shared_tokens: int,
+    after_publication_id: int | None = None,
+) -> Iterator[tuple[int, int]]:
+    """Yield every pair ``_is_near_duplicate_pair`` could accept, and few others.
+
+    Identical canonical titles are paired through an exact-text bucket. Every
+    other accepted pair must share at least ``_required_overlap`` tokens. With
+    each title's tokens ordered rarest first, the first shared token then lies
+    within the first ``size - required + 1`` tokens of both titles (prefix
+    filtering), so only those prefixes are indexed. Common words ("learning",
+    "network") never produce candidate pairs on their own, and no pair the
+    verifier would accept is skipped.
+
+    With ``after_publication_id`` only pairs with at least one member above
+    that id are yielded; older titles probe a separate index of the newer ones.
+    """
+
+    def is_new(publication_id: int) -> bool:
+        return after_publication_id is None or publication_id > after_publication_id
+
+    by_canonical_text: dict[str, list[int]] = {}
     for candidate in candidates:
-        for token in candidate.tokens:
-            index.setdefault(token, set()).add(candidate.publication_id)
-    return index
-
+        by_canonical_text.setdefault(candidate.canonical_text, []).append(candidate.publication_id)
+    for bucket in by_canonical_text.values():
+        # Old members are not paired with each other in incremental mode, so
+        # link every member to the first one once the bucket holds a new title.
+        if len(bucket) > 1 and any(is_new(publication_id) for publication_id in bucket):
+            for publication_id in bucket[1:]:
+                yield bucket[0], publication_id
+
+    def required(smaller: int, larger: int) -> int:
+        return _required_overlap(
+            smaller,
+            larger,
+            similarity_threshold=similarity_threshold,
+            min_shared_tokens=min_shared_tokens,
+        )
 
-def _candidate_peer_ids(
-    *,
-    candidate: _NearDuplicateCandidate,
-    token_index: dict[str, set[int]],
-) -> set[int]:
-    peers: set[int] = set()
-    for token in candidate.tokens:
-        peers.update(token_index.get(token, set()))
-    peers.discard(candidate.publication_id)
-    return peers
+    frequency: Counter[str] = Counter(token for candidate in candidates for token in candidate.tokens)
+    prefix_index: dict[str, list[tuple[int, int, int]]] = {}
+    new_prefix_index: dict[str, list[tuple[int, int, int]]] = {}
+    # Titles are indexed smallest first, so each pair is found when its larger
+    # (or equal-sized, later) member probes the prefixes indexed before it.
+    for candidate in sorted(candidates, key=lambda item: (len(item.tokens), item.publication_id)):
+        size = len(candidate.tokens)
+        ordered = sorted(candidate.tokens, key=lambda token: (frequency[token], token))
+        candidate_is_new = is_new(candidate.publication_id)
+        probe_index = prefix_index if candidate_is_new else new_prefix_index
+        peers: dict[int, bool] = {}
+        for position, token in enumerate(ordered[: max(size - required(1, size) + 1, 0)]):
+            for peer_id, peer_size, peer_position in probe_index.get(token, ()):
+                if peer_id in peers:
+                    continue
+                # The first shared prefix token is the first shared token of
+                # the pair, so the tokens after it bound the total overlap.
+                pair_required = required(peer_size, size)
+                peers[peer_id] = (
+                    position < size - pair_required + 1
+                    and peer_position < peer_size - pair_required + 1
+                    and 1 + min(size - position - 1, peer_size - peer_position - 1) >= pair_required
+                )
+        for peer_id in sorted(peer_id for peer_id, viable in peers.items() if viable):
+            yield peer_id, candidate.publication_id
+        for position, token in enumerate(ordered[: max(size - required(size, size) + 1, 0)]):
+            entry = (candidate.publication_id, size, position)
+            prefix_index.setdefault(token, []).append(entry)
+            if candidate_is_new and after_publication_id is not None:
+                new_prefix_index.setdefault(token, []).append(entry)
+
+
+def _required_overlap(smaller: int, larger: int, *, similarity_threshold: float, min_shared_tokens: int) -> int:
+    """Lower bound on shared tokens for any pair ``_is_near_duplicate_pair`` accepts.
+
+    Jaccard >= t means shared >= t * (smaller + larger) / (1 + t); containment
+    means shared >= c * smaller. The bound never decreases as ``larger``
+    grows, so ``(size, size)`` is safe for indexing a title against every
+    partner at least as large. The epsilon keeps float rounding from pushing a
+    bound above its exact value.
+    """
+    threshold = max(float(similarity_threshold), 0.0)
+    jaccard_overlap = threshold * (smaller + larger) / (1.0 + threshold)
+    containment_overlap = NEAR_DUP_DEFAULT_CONTAINMENT_THRESHOLD * smaller
+    overlap = math.ceil(min(jaccard_overlap, containment_overlap) - 1e-9)
+    return max(int(min_shared_tokens), overlap, 1)
 
 
 def _is_near_duplicate_pair(
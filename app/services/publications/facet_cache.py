@@ -0,0 +1,106 @@
+"""Short-lived per-user cache for publication list facet counts.
+
+Entries are keyed by the list filters plus the user's latest run id, so a new
+run never serves counts from the previous one. Read/favorite changes and run
+completion drop every entry of the affected user. The cache is per process and
+disabled when ``PUBLICATION_COUNTS_CACHE_TTL_SECONDS`` is 0.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.publications.counts import count_publication_facets_for_user
+from app.services.publications.types import PublicationFacetCounts
+from app.settings import settings
+
+PUBLICATION_COUNTS_CACHE_MAX_ENTRIES = 2048
+
+FacetCountsKey = tuple[int, int | None, int | None, bool, str | None, str | None]
+
+
+class PublicationFacetCountsCache:
+    def __init__(self, *, max_entries: int = PUBLICATION_COUNTS_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max(int(max_entries), 1)
+        self._entries: OrderedDict[FacetCountsKey, tuple[float, PublicationFacetCounts]] = OrderedDict()
+
+    def get(self, key: FacetCountsKey, *, ttl_seconds: float) -> PublicationFacetCounts | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, counts = entry
+        if time.monotonic() - stored_at >= ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return counts
+
+    def put(self, key: FacetCountsKey, counts: PublicationFacetCounts) -> None:
+        self._entries[key] = (time.monotonic(), counts)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        normalized_user_id = int(user_id)
+        for key in [key for key in self._entries if key[0] == normalized_user_id]:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+publication_facet_counts_cache = PublicationFacetCountsCache()
+
+
+def invalidate_publication_counts_for_user(user_id: int) -> None:
+    publication_facet_counts_cache.invalidate_user(user_id)
+
+
+async def get_publication_facet_counts_for_user(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    latest_run_id: int | None,
+    scholar_profile_id: int | None = None,
+    favorite_only: bool = False,
+    search: str | None = None,
+    snapshot_before: datetime | None = None,
+    pinned_snapshot: bool = False,
+) -> PublicationFacetCounts:
+    """Facet counts, served from the per-user cache when it is enabled.
+
+    Unpinned requests (no client snapshot cursor) share one live entry per
+    filter set; pinned requests are keyed by their snapshot timestamp.
+    """
+    ttl_seconds = float(settings.publication_counts_cache_ttl_seconds)
+    snapshot_key = snapshot_before.isoformat() if pinned_snapshot and snapshot_before is not None else None
+    key: FacetCountsKey = (
+        int(user_id),
+        latest_run_id,
+        scholar_profile_id,
+        bool(favorite_only),
+        search,
+        snapshot_key,
+    )
+    if ttl_seconds > 0:
+        cached = publication_facet_counts_cache.get(key, ttl_seconds=ttl_seconds)
+        if cached is not None:
+            return cached
+    counts = await count_publication_facets_for_user(
+        db_session,
+        user_id=user_id,
+        latest_run_id=latest_run_id,
+        scholar_profile_id=scholar_profile_id,
+        favorite_only=favorite_only,
+        search=search,
+        snapshot_before=snapshot_before,
+        pinned_snapshot=pinned_snapshot,
+    )
+    if ttl_seconds > 0:
+        publication_facet_counts_cache.put(key, counts)
+    return counts
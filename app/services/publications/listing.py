@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.publication_identifiers import application as identifier_service
+from app.services.publications.cursors import PublicationCursor, encode_publication_cursor
 from app.services.publications.modes import (
     MODE_ALL,
     MODE_UNREAD,
@@ -15,9 +17,11 @@ from app.services.publications.queries import (
     get_publication_item_for_user,
     publication_list_item_from_row,
     publications_query,
+    resolve_publication_sort,
     unread_item_from_row,
 )
-from app.services.publications.types import PublicationListItem, UnreadPublicationItem
+from app.services.publications.search import matching_scholar_profile_ids, search_snippets_for_publications
+from app.services.publications.types import PublicationListItem, PublicationListPage, UnreadPublicationItem
 
 
 async def list_for_user(
@@ -33,9 +37,17 @@ async def list_for_user(
     limit: int = 100,
     offset: int = 0,
     snapshot_before: datetime | None = None,
+    latest_run_id: int | None = None,
+    resolve_latest_run: bool = True,
 ) -> list[PublicationListItem]:
+    """List a page of the user's publications.
+
+    Callers that already hold the latest run id (to share it with the facet
+    counts) pass it with ``resolve_latest_run=False``.
+    """
     resolved_mode = resolve_publication_view_mode(mode)
-    latest_run_id = await get_latest_run_id_for_user(db_session, user_id=user_id)
+    if resolve_latest_run:
+        latest_run_id = await get_latest_run_id_for_user(db_session, user_id=user_id)
     result = await db_session.execute(
         publications_query(
             user_id=user_id,
@@ -49,15 +61,100 @@ async def list_for_user(
             limit=limit,
             offset=offset,
             snapshot_before=snapshot_before,
+            search_scholar_ids=await matching_scholar_profile_ids(db_session, user_id=user_id, search=search),
         )
     )
     rows = [publication_list_item_from_row(row, latest_run_id=latest_run_id) for row in result.all()]
+    rows = await _with_search_snippets(db_session, items=rows, search=search)
     return await identifier_service.overlay_publication_items_with_display_identifiers(
         db_session,
         items=rows,
     )
 
 
+async def _with_search_snippets(
+    db_session: AsyncSession,
+    *,
+    items: list[PublicationListItem],
+    search: str | None,
+) -> list[PublicationListItem]:
+    snippets = await search_snippets_for_publications(
+        db_session,
+        publication_ids=[item.publication_id for item in items],
+        search=search,
+    )
+    if not snippets:
+        return items
+    return [replace(item, search_snippet=snippets.get(item.publication_id)) for item in items]
+
+
+async def list_page_for_user(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    latest_run_id: int | None,
+    mode: str = MODE_ALL,
+    scholar_profile_id: int | None = None,
+    favorite_only: bool = False,
+    search: str | None = None,
+    sort_by: str = "first_seen",
+    sort_dir: str = "desc",
+    limit: int = 100,
+    offset: int = 0,
+    snapshot_before: datetime | None = None,
+    after: PublicationCursor | None = None,
+) -> PublicationListPage:
+    """List one page and mint the keyset cursor for the page after it.
+
+    Pages after ``after`` when it is given, otherwise falls back to ``offset``.
+    One extra row is fetched to tell whether a next page exists.
+    """
+    resolved_mode = resolve_publication_view_mode(mode)
+    resolved_sort_by = resolve_publication_sort(sort_by, search=search)
+    resolved_sort_dir = "desc" if sort_dir == "desc" else "asc"
+    bounded_limit = max(int(limit), 1)
+    result = await db_session.execute(
+        publications_query(
+            user_id=user_id,
+            mode=resolved_mode,
+            latest_run_id=latest_run_id,
+            scholar_profile_id=scholar_profile_id,
+            favorite_only=favorite_only,
+            search=search,
+            sort_by=resolved_sort_by,
+            sort_dir=resolved_sort_dir,
+            limit=bounded_limit + 1,
+            offset=offset,
+            snapshot_before=snapshot_before,
+            after=after,
+            include_sort_key=True,
+            search_scholar_ids=await matching_scholar_profile_ids(db_session, user_id=user_id, search=search),
+        )
+    )
+    rows = result.all()
+    has_next = len(rows) > bounded_limit
+    page_rows = rows[:bounded_limit]
+    next_cursor = None
+    if has_next:
+        last_row = page_rows[-1]
+        next_cursor = encode_publication_cursor(
+            PublicationCursor(
+                sort_by=resolved_sort_by,
+                sort_dir=resolved_sort_dir,
+                sort_value=last_row[-1],
+                publication_id=int(last_row[0]),
+                scholar_profile_id=int(last_row[1]),
+            )
+        )
+    items = [publication_list_item_from_row(row[:-1], latest_run_id=latest_run_id) for row in page_rows]
+    items = await _with_search_snippets(db_session, items=items, search=search)
+    hydrated = await identifier_service.overlay_publication_items_with_display_identifiers(
+        db_session,
+        items=items,
+    )
+    return PublicationListPage(items=hydrated, has_next=has_next, next_cursor=next_cursor)
+
+
 async def retry_pdf_for_user(
     db_session: AsyncSession,
     *,
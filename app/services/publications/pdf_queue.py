@@ -82,21 +82,10 @@ def _item_from_row_and_job(
         pdf_failure_reason=job.last_failure_reason if job is not None else None,
         pdf_failure_detail=job.last_failure_detail if job is not None else None,
         display_identifier=row.display_identifier,
+        search_snippet=row.search_snippet,
     )
 
 
-def _queueable_rows(
-    rows: list[PublicationListItem],
-    *,
-    max_items: int,
-) -> list[PublicationListItem]:
-    bounded = max(0, int(max_items))
-    if bounded == 0:
-        return []
-    candidates = [row for row in rows if not row.pdf_url]
-    return candidates[:bounded]
-
-
 def _auto_retry_interval_seconds() -> int:
     return max(int(settings.pdf_auto_retry_interval_seconds), 1)
 
@@ -231,25 +220,6 @@ async def _enqueue_rows(
 # ---------------------------------------------------------------------------
 
 
-async def enqueue_missing_pdf_jobs(
-    db_session: AsyncSession,
-    *,
-    user_id: int,
-    request_email: str | None,
-    rows: list[PublicationListItem],
-    max_items: int,
-) -> list[int]:
-    queueable = _queueable_rows(rows, max_items=max_items)
-    queued_rows = await _enqueue_rows(
-        db_session,
-        user_id=user_id,
-        rows=queueable,
-        force_retry=False,
-    )
-    schedule_rows(user_id=user_id, request_email=request_email, rows=queued_rows)
-    return [row.publication_id for row in queued_rows]
-
-
 async def enqueue_retry_pdf_job(
     db_session: AsyncSession,
     *,
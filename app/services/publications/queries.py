@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Select, case, func, select
+from sqlalchemy import Select, case, func, literal, select, tuple_
 from sqlalchemy import false as sa_false
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,15 +15,21 @@ from app.db.models import (
     ScholarProfile,
     ScholarPublication,
 )
+from app.services.publications.cursors import PublicationCursor
 from app.services.publications.modes import MODE_LATEST, MODE_UNREAD
 from app.services.publications.pdf_queue_common import (
     PDF_STATUS_FAILED,
     PDF_STATUS_QUEUED,
     PDF_STATUS_RESOLVED,
     PDF_STATUS_RUNNING,
+    PDF_STATUS_UNTRACKED,
 )
+from app.services.publications.search import publication_search_clause, publication_search_rank, search_terms
 from app.services.publications.types import PublicationListItem, UnreadPublicationItem
 
+PUBLICATION_SORT_FIELDS = ("first_seen", "title", "year", "citations", "scholar", "pdf_status", "relevance")
+YEAR_NULL_SORT_VALUE = 2_147_483_647
+
 
 def _normalized_citation_count(value: object) -> int:
     try:
@@ -43,18 +49,46 @@ def _pdf_status_sort_rank():
     )
 
 
-def _sort_column(sort_by: str):
+def _sort_column(sort_by: str, *, search: str | None = None):
+    # Sort keys are never NULL so keyset cursors can compare them as row
+    # values. A missing year sorts after every real year, matching the
+    # Postgres default NULL placement; scholars sort by their shown label.
     sort_columns = {
         "first_seen": ScholarPublication.created_at,
         "title": Publication.title_raw,
-        "year": Publication.year,
+        "year": func.coalesce(Publication.year, YEAR_NULL_SORT_VALUE),
         "citations": Publication.citation_count,
-        "scholar": ScholarProfile.display_name,
+        "scholar": func.coalesce(ScholarProfile.display_name, ScholarProfile.scholar_id),
         "pdf_status": _pdf_status_sort_rank(),
     }
+    if sort_by == "relevance":
+        rank = publication_search_rank(search)
+        if rank is not None:
+            return rank
     return sort_columns.get(sort_by, ScholarPublication.created_at)
 
 
+def resolve_publication_sort(sort_by: str, *, search: str | None) -> str:
+    """Supported sort field; relevance needs search terms and otherwise means first_seen."""
+    if sort_by not in PUBLICATION_SORT_FIELDS:
+        return "first_seen"
+    if sort_by == "relevance" and not search_terms(search):
+        return "first_seen"
+    return sort_by
+
+
+def _keyset_after(sort_col, *, sort_dir: str, after: PublicationCursor):
+    row_key = tuple_(sort_col, Publication.id, ScholarProfile.id)
+    cursor_key = tuple_(
+        literal(after.sort_value, type_=sort_col.type),
+        literal(int(after.publication_id)),
+        literal(int(after.scholar_profile_id)),
+    )
+    if sort_dir == "desc":
+        return row_key < cursor_key
+    return row_key > cursor_key
+
+
 async def get_latest_run_id_for_user(
     db_session: AsyncSession,
     *,
@@ -92,7 +126,16 @@ def publications_query(
     sort_by: str = "first_seen",
     sort_dir: str = "desc",
     snapshot_before: datetime | None = None,
+    after: PublicationCursor | None = None,
+    include_sort_key: bool = False,
+    search_scholar_ids: tuple[int, ...] = (),
 ) -> Select[tuple]:
+    """Build the publication list query.
+
+    With ``after`` the page starts strictly after the cursor's sort key and
+    ``offset`` is ignored. ``include_sort_key`` appends the sort value as a
+    trailing column so callers can mint the next cursor.
+    """
     scholar_label = ScholarProfile.display_name
     stmt = (
         select(
@@ -110,20 +153,19 @@ def publications_query(
             ScholarPublication.is_favorite,
             ScholarPublication.first_seen_run_id,
             ScholarPublication.created_at,
+            PublicationPdfJob.status,
+            PublicationPdfJob.attempt_count,
+            PublicationPdfJob.last_failure_reason,
+            PublicationPdfJob.last_failure_detail,
         )
         .join(ScholarPublication, ScholarPublication.publication_id == Publication.id)
         .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
         .outerjoin(PublicationPdfJob, PublicationPdfJob.publication_id == Publication.id)
         .where(ScholarProfile.user_id == user_id)
     )
-    if search:
-        safe_search = search.replace("%", r"\%").replace("_", r"\_")
-        pat = f"%{safe_search}%"
-        stmt = stmt.where(
-            Publication.title_raw.ilike(pat)
-            | ScholarProfile.display_name.ilike(pat)
-            | Publication.venue_text.ilike(pat)
-        )
+    search_clause = publication_search_clause(search, scholar_profile_ids=search_scholar_ids)
+    if search_clause is not None:
+        stmt = stmt.where(search_clause)
     if scholar_profile_id is not None:
         stmt = stmt.where(ScholarProfile.id == scholar_profile_id)
     if favorite_only:
@@ -137,12 +179,20 @@ def publications_query(
     if snapshot_before is not None:
         stmt = stmt.where(ScholarPublication.created_at <= snapshot_before)
 
-    sort_col = _sort_column(sort_by)
-    order = sort_col.desc() if sort_dir == "desc" else sort_col.asc()
-    stmt = stmt.order_by(order, Publication.id.desc())
+    sort_col = _sort_column(sort_by, search=search)
+    if include_sort_key:
+        stmt = stmt.add_columns(sort_col.label("sort_key"))
+    if after is not None:
+        stmt = stmt.where(_keyset_after(sort_col, sort_dir=sort_dir, after=after))
+    if sort_dir == "desc":
+        stmt = stmt.order_by(sort_col.desc(), Publication.id.desc(), ScholarProfile.id.desc())
+    else:
+        stmt = stmt.order_by(sort_col.asc(), Publication.id.asc(), ScholarProfile.id.asc())
 
     if limit is not None:
-        stmt = stmt.offset(max(int(offset), 0)).limit(limit)
+        if after is None:
+            stmt = stmt.offset(max(int(offset), 0))
+        stmt = stmt.limit(limit)
 
     return stmt
 
@@ -169,9 +219,14 @@ def publication_query_for_user(
             ScholarPublication.is_favorite,
             ScholarPublication.first_seen_run_id,
             ScholarPublication.created_at,
+            PublicationPdfJob.status,
+            PublicationPdfJob.attempt_count,
+            PublicationPdfJob.last_failure_reason,
+            PublicationPdfJob.last_failure_detail,
         )
         .join(ScholarPublication, ScholarPublication.publication_id == Publication.id)
         .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .outerjoin(PublicationPdfJob, PublicationPdfJob.publication_id == Publication.id)
         .where(
             ScholarProfile.user_id == user_id,
             ScholarProfile.id == scholar_profile_id,
@@ -202,11 +257,22 @@ async def get_publication_item_for_user(
     return publication_list_item_from_row(row, latest_run_id=latest_run_id)
 
 
+def _pdf_status(pdf_url: str | None, job_status: str | None) -> str:
+    if pdf_url:
+        return PDF_STATUS_RESOLVED
+    return job_status or PDF_STATUS_UNTRACKED
+
+
 def publication_list_item_from_row(
     row: Any,
     *,
     latest_run_id: int | None,
 ) -> PublicationListItem:
+    """Map a list row, PDF job columns included, to a list item.
+
+    The job state comes from the list query's outer join, so reads never
+    touch the PDF queue separately.
+    """
     (
         publication_id,
         scholar_profile_id,
@@ -222,6 +288,10 @@ def publication_list_item_from_row(
         is_favorite,
         first_seen_run_id,
         created_at,
+        pdf_job_status,
+        pdf_attempt_count,
+        pdf_failure_reason,
+        pdf_failure_detail,
     ) = row
     return PublicationListItem(
         publication_id=int(publication_id),
@@ -237,6 +307,10 @@ def publication_list_item_from_row(
         is_favorite=bool(is_favorite),
         first_seen_at=created_at,
         is_new_in_latest_run=(latest_run_id is not None and int(first_seen_run_id or 0) == latest_run_id),
+        pdf_status=_pdf_status(pdf_url, pdf_job_status),
+        pdf_attempt_count=int(pdf_attempt_count or 0),
+        pdf_failure_reason=pdf_failure_reason,
+        pdf_failure_detail=pdf_failure_detail,
     )
 
 
@@ -256,6 +330,7 @@ def unread_item_from_row(row: Any) -> UnreadPublicationItem:
         _is_favorite,
         _first_seen_run_id,
         _created_at,
+        *_pdf_job_state,
     ) = row
     return UnreadPublicationItem(
         publication_id=int(publication_id),
@@ -6,6 +6,7 @@ from sqlalchemy import CursorResult, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import ScholarProfile, ScholarPublication
+from app.services.publications.facet_cache import invalidate_publication_counts_for_user
 
 
 def _normalized_selection_pairs(selections: list[tuple[int, int]]) -> set[tuple[int, int]]:
@@ -38,6 +39,7 @@ async def mark_all_unread_as_read_for_user(
     )
     result: CursorResult[Any] = await db_session.execute(stmt)  # type: ignore[assignment]
     await db_session.commit()
+    invalidate_publication_counts_for_user(user_id)
     return int(result.rowcount or 0)
 
 
@@ -66,6 +68,7 @@ async def mark_selected_as_read_for_user(
     )
     result: CursorResult[Any] = await db_session.execute(stmt)  # type: ignore[assignment]
     await db_session.commit()
+    invalidate_publication_counts_for_user(user_id)
     return int(result.rowcount or 0)
 
 
@@ -89,4 +92,5 @@ async def set_publication_favorite_for_user(
     )
     result: CursorResult[Any] = await db_session.execute(stmt)  # type: ignore[assignment]
     await db_session.commit()
+    invalidate_publication_counts_for_user(user_id)
     return int(result.rowcount or 0)
@@ -0,0 +1,136 @@
+"""Full-text search over the user's publication library.
+
+``publications.search_vector`` is a stored generated ``tsvector`` over the
+title (weight A), venue (B) and author text (C) with the language-agnostic
+``simple`` configuration, backed by a GIN index. Postgres recomputes it on
+every insert/update, so the ingestion upsert paths need no extra writes.
+
+Each word of the search box becomes a prefix term (``graph:* & neur:*``).
+Scholar names are not part of the publication vector; they are matched
+against the user's few profiles first and OR-ed in by id, which keeps the
+plain text match index-friendly when no scholar name matches.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+
+from sqlalchemy import ColumnElement, Float, cast, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Publication, ScholarProfile
+
+SEARCH_TEXT_CONFIG = "simple"
+SEARCH_MAX_TERMS = 8
+SNIPPET_START = "\x02"
+SNIPPET_STOP = "\x03"
+
+_TERM_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def search_terms(search: str | None) -> list[str]:
+    if not search:
+        return []
+    terms: list[str] = []
+    for match in _TERM_RE.finditer(search.lower()):
+        term = match.group(0)
+        if term not in terms:
+            terms.append(term)
+        if len(terms) >= SEARCH_MAX_TERMS:
+            break
+    return terms
+
+
+def _escaped_like_pattern(search: str) -> str:
+    safe_search = search.replace("%", r"\%").replace("_", r"\_")
+    return f"%{safe_search}%"
+
+
+def _search_config():
+    return cast(literal(SEARCH_TEXT_CONFIG), REGCONFIG)
+
+
+def search_tsquery(terms: list[str]):
+    query_text = " & ".join(f"{term}:*" for term in terms)
+    return func.to_tsquery(_search_config(), query_text)
+
+
+def publication_search_clause(
+    search: str | None,
+    *,
+    scholar_profile_ids: tuple[int, ...] = (),
+) -> ColumnElement[bool] | None:
+    """Predicate for the ``search`` list/count filter, or None without a search.
+
+    Input without any word characters falls back to the substring match the
+    list used before full-text search existed.
+    """
+    if not search:
+        return None
+    terms = search_terms(search)
+    if not terms:
+        pattern = _escaped_like_pattern(search)
+        return (
+            Publication.title_raw.ilike(pattern)
+            | ScholarProfile.display_name.ilike(pattern)
+            | Publication.venue_text.ilike(pattern)
+        )
+    clause = Publication.search_vector.bool_op("@@")(search_tsquery(terms))
+    if scholar_profile_ids:
+        return or_(clause, ScholarProfile.id.in_(scholar_profile_ids))
+    return clause
+
+
+def publication_search_rank(search: str | None):
+    terms = search_terms(search)
+    if not terms:
+        return None
+    return func.ts_rank_cd(Publication.search_vector, search_tsquery(terms), type_=Float)
+
+
+async def matching_scholar_profile_ids(
+    db_session: AsyncSession,
+    *,
+    user_id: int,
+    search: str | None,
+) -> tuple[int, ...]:
+    if not search or not search_terms(search):
+        return ()
+    result = await db_session.execute(
+        select(ScholarProfile.id)
+        .where(
+            ScholarProfile.user_id == user_id,
+            ScholarProfile.display_name.ilike(_escaped_like_pattern(search)),
+        )
+        .order_by(ScholarProfile.id.asc())
+    )
+    return tuple(int(value) for value in result.scalars().all())
+
+
+def _snippet_html(headline: str) -> str:
+    escaped = html.escape(headline, quote=False)
+    return escaped.replace(SNIPPET_START, "<mark>").replace(SNIPPET_STOP, "</mark>")
+
+
+async def search_snippets_for_publications(
+    db_session: AsyncSession,
+    *,
+    publication_ids: list[int],
+    search: str | None,
+) -> dict[int, str]:
+    """HTML-escaped title snippets with matched words wrapped in ``<mark>``."""
+    terms = search_terms(search)
+    if not terms or not publication_ids:
+        return {}
+    headline = func.ts_headline(
+        _search_config(),
+        Publication.title_raw,
+        search_tsquery(terms),
+        literal(f"StartSel={SNIPPET_START}, StopSel={SNIPPET_STOP}, HighlightAll=true"),
+    )
+    result = await db_session.execute(
+        select(Publication.id, headline).where(Publication.id.in_(sorted(set(publication_ids))))
+    )
+    return {int(publication_id): _snippet_html(str(value or "")) for publication_id, value in result.all()}
@@ -6,6 +6,14 @@ from datetime import datetime
 from app.services.publication_identifiers.types import DisplayIdentifier
 
 
+@dataclass(frozen=True)
+class PublicationFacetCounts:
+    unread_count: int
+    favorites_count: int
+    latest_count: int
+    total_count: int
+
+
 @dataclass(frozen=True)
 class PublicationListItem:
     publication_id: int
@@ -26,6 +34,7 @@ class PublicationListItem:
     pdf_failure_reason: str | None = None
     pdf_failure_detail: str | None = None
     display_identifier: DisplayIdentifier | None = None
+    search_snippet: str | None = None
 
 
 @dataclass(frozen=True)
@@ -39,3 +48,10 @@ class UnreadPublicationItem:
     venue_text: str | None
     pub_url: str | None
     pdf_url: str | None
+
+
+@dataclass(frozen=True)
+class PublicationListPage:
+    items: list[PublicationListItem]
+    has_next: bool
+    next_cursor: str | None = None
@@ -43,6 +43,9 @@ from app.services.runs.application import (
 from app.services.runs.application import (
     list_runs_for_user as list_runs_for_user,
 )
+from app.services.runs.application import (
+    list_scholar_results_for_run as list_scholar_results_for_run,
+)
 from app.services.runs.application import (
     queue_status_counts_for_user as queue_status_counts_for_user,
 )
@@ -13,6 +13,7 @@ from app.services.runs.runs_service import (
     get_run_for_user,
     list_recent_runs_for_user,
     list_runs_for_user,
+    list_scholar_results_for_run,
 )
 from app.services.runs.summary import extract_run_summary
 from app.services.runs.types import (
@@ -40,6 +41,7 @@ __all__ = [
     "list_queue_items_for_user",
     "list_recent_runs_for_user",
     "list_runs_for_user",
+    "list_scholar_results_for_run",
     "queue_status_counts_for_user",
     "retry_queue_item_for_user",
 ]
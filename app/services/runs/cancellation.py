@@ -0,0 +1,77 @@
+"""In-process run cancellation tokens.
+
+Long loops over a run (post-run enrichment) check a token instead of reading
+``crawl_runs.status`` on every item. ``cancel_run`` in the API sets the token
+directly; cancellations made elsewhere (another worker process, a script) are
+still noticed through a status read at most every ``status_recheck_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import CrawlRun, RunStatus
+
+STATUS_RECHECK_SECONDS = 5.0
+
+
+class RunCancelToken:
+    def __init__(self, run_id: int, *, status_recheck_seconds: float = STATUS_RECHECK_SECONDS) -> None:
+        self.run_id = int(run_id)
+        self._event = asyncio.Event()
+        self._status_recheck_seconds = max(float(status_recheck_seconds), 0.0)
+        self._status_checked_at: float | None = None
+
+    @property
+    def canceled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    async def is_canceled(self, db_session: AsyncSession) -> bool:
+        if self._event.is_set():
+            return True
+        now = time.monotonic()
+        if self._status_checked_at is not None and now - self._status_checked_at < self._status_recheck_seconds:
+            return False
+        self._status_checked_at = now
+        result = await db_session.execute(select(CrawlRun.status).where(CrawlRun.id == self.run_id))
+        status = result.scalar_one_or_none()
+        if status is None:
+            raise RuntimeError(f"Missing crawl_run for run_id={self.run_id}.")
+        if status == RunStatus.CANCELED:
+            self._event.set()
+        return self._event.is_set()
+
+
+class RunCancellationRegistry:
+    def __init__(self) -> None:
+        self._tokens: dict[int, set[RunCancelToken]] = {}
+
+    def acquire(self, run_id: int) -> RunCancelToken:
+        token = RunCancelToken(run_id)
+        self._tokens.setdefault(token.run_id, set()).add(token)
+        return token
+
+    def release(self, token: RunCancelToken) -> None:
+        tokens = self._tokens.get(token.run_id)
+        if tokens is None:
+            return
+        tokens.discard(token)
+        if not tokens:
+            self._tokens.pop(token.run_id, None)
+
+    def cancel(self, run_id: int) -> int:
+        """Signal every live token of ``run_id``; returns how many were signalled."""
+        tokens = self._tokens.get(int(run_id), set())
+        for token in tokens:
+            token.cancel()
+        return len(tokens)
+
+
+run_cancellation = RunCancellationRegistry()
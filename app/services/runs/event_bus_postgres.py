@@ -0,0 +1,248 @@
+"""``LISTEN/NOTIFY`` transport for run events across API workers and replicas.
+
+Every process started with ``RUN_EVENTS_BACKEND=postgres`` holds one
+listening connection and feeds each notification into its local
+``RunEventPublisher`` fan-out and replay history, including its own
+notifications. Publishing only queues the event: one task per process drains
+the queue over its own long-lived connection, so publishers never check a
+connection out of the pool or wait on the caller's ingestion transaction. A
+queued ``scholar_progress`` is replaced by a newer one of the same run, so
+progress ticks that arrive faster than they can be sent cost one NOTIFY.
+Both connections are reserved in ``background_session_limit()``.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import deque
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import get_engine
+from app.logging_utils import structured_log
+from app.services.runs.events import (
+    EVENT_SCHOLAR_PROGRESS,
+    RUN_EVENTS_BACKEND_POSTGRES,
+    RunEvent,
+    RunEventPublisher,
+)
+
+logger = logging.getLogger(__name__)
+
+RUN_EVENTS_CHANNEL = "scholarr_run_events"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+_MAX_NOTIFY_PAYLOAD_BYTES = 7900
+_RECONNECT_DELAY_SECONDS = 2.0
+
+
+def encode_run_event(event: RunEvent) -> str:
+    return json.dumps(
+        {"run_id": event.run_id, "id": event.event_id, "type": event.type, "data": event.data},
+        separators=(",", ":"),
+    )
+
+
+def decode_run_event(payload: str) -> RunEvent | None:
+    try:
+        raw = json.loads(payload)
+        return RunEvent(
+            run_id=int(raw["run_id"]),
+            event_id=int(raw["id"]),
+            type=str(raw["type"]),
+            data=dict(raw.get("data") or {}),
+        )
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+class PostgresRunEventPublisher(RunEventPublisher):
+    backend = RUN_EVENTS_BACKEND_POSTGRES
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._connection: AsyncConnection | None = None
+        self._supervisor: asyncio.Task[None] | None = None
+        self._listening = asyncio.Event()
+        self._outbox: deque[RunEvent] = deque()
+        self._outbox_limit = max(self._subscriber_queue_size, 2)
+        self._outbox_ready = asyncio.Event()
+        self._notify_connection: AsyncConnection | None = None
+        self._notifier: asyncio.Task[None] | None = None
+
+    def has_subscribers(self, run_id: int) -> bool:
+        # Streams may be open on other processes, which this one cannot see.
+        return True
+
+    def is_listening(self) -> bool:
+        return self._listening.is_set()
+
+    async def wait_listening(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._listening.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def start(self) -> None:
+        if self._supervisor is not None:
+            return
+        self._supervisor = asyncio.create_task(self._supervise(), name="run-events-listener")
+
+    async def stop(self) -> None:
+        supervisor = self._supervisor
+        self._supervisor = None
+        if supervisor is not None:
+            supervisor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await supervisor
+        await self._close_connection()
+        notifier = self._notifier
+        self._notifier = None
+        if notifier is not None:
+            notifier.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await notifier
+        await self._close_notify_connection()
+        # Whatever was still queued reaches this process's subscribers at least.
+        while self._outbox:
+            self._deliver(self._outbox.popleft())
+
+    async def _supervise(self) -> None:
+        while True:
+            try:
+                terminated = await self._listen()
+                await terminated.wait()
+                structured_log(logger, "warning", "runs.event_listener_disconnected")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                structured_log(logger, "error", "runs.event_listener_failed", error=str(exc))
+            await self._close_connection()
+            await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    async def _listen(self) -> asyncio.Event:
+        connection = await get_engine().connect()
+        self._connection = connection
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if driver_connection is None:
+            raise RuntimeError("Run event listener connection has no asyncpg driver connection.")
+        terminated = asyncio.Event()
+        driver_connection.add_termination_listener(lambda _connection: terminated.set())
+        await driver_connection.add_listener(RUN_EVENTS_CHANNEL, self._on_notification)
+        self._listening.set()
+        structured_log(logger, "info", "runs.event_listener_started", channel=RUN_EVENTS_CHANNEL)
+        return terminated
+
+    async def _close_connection(self) -> None:
+        self._listening.clear()
+        connection = self._connection
+        self._connection = None
+        if connection is None:
+            return
+        try:
+            await connection.close()
+        except Exception as exc:
+            structured_log(logger, "debug", "runs.event_listener_close_failed", error=str(exc))
+
+    def _on_notification(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:
+        event = decode_run_event(payload)
+        if event is None:
+            structured_log(logger, "warning", "runs.event_notification_invalid", payload_bytes=len(payload))
+            return
+        self._deliver(event)
+
+    async def publish(self, run_id: int, event_type: str, data: dict[str, Any]) -> None:
+        event = RunEvent(run_id=run_id, event_id=self._next_event_id(run_id), type=event_type, data=data)
+        # Keep the id sequence moving even before our own notification loops back.
+        history = self._history(run_id)
+        history.last_event_id = max(history.last_event_id, event.event_id)
+        payload_bytes = len(encode_run_event(event).encode("utf-8"))
+        if payload_bytes > _MAX_NOTIFY_PAYLOAD_BYTES:
+            structured_log(
+                logger,
+                "warning",
+                "runs.event_payload_too_large",
+                run_id=run_id,
+                event_type=event_type,
+                payload_bytes=payload_bytes,
+            )
+            self._deliver(event)
+            return
+        self._enqueue(event)
+        self._ensure_notifier()
+
+    def _enqueue(self, event: RunEvent) -> None:
+        if event.type == EVENT_SCHOLAR_PROGRESS:
+            stale = [
+                queued
+                for queued in self._outbox
+                if queued.run_id == event.run_id and queued.type == EVENT_SCHOLAR_PROGRESS
+            ]
+            for queued in stale:
+                self._outbox.remove(queued)
+        if len(self._outbox) >= self._outbox_limit:
+            # The notifier is stuck (database down or slow); serve this process locally.
+            structured_log(
+                logger,
+                "warning",
+                "runs.event_outbox_full",
+                run_id=event.run_id,
+                outbox_size=len(self._outbox),
+            )
+            self._deliver(self._outbox.popleft())
+        self._outbox.append(event)
+        self._outbox_ready.set()
+
+    def _ensure_notifier(self) -> None:
+        if self._notifier is not None and not self._notifier.done():
+            return
+        self._notifier = asyncio.create_task(self._drain_outbox(), name="run-events-notifier")
+
+    async def _drain_outbox(self) -> None:
+        while True:
+            while not self._outbox:
+                self._outbox_ready.clear()
+                await self._outbox_ready.wait()
+            event = self._outbox.popleft()
+            try:
+                await self._notify(event)
+            except asyncio.CancelledError:
+                self._outbox.appendleft(event)
+                raise
+            except Exception as exc:
+                # Progress events are best-effort; never fail the ingestion over them.
+                structured_log(
+                    logger,
+                    "warning",
+                    "runs.event_notify_failed",
+                    run_id=event.run_id,
+                    event_type=event.type,
+                    error=str(exc),
+                )
+                await self._close_notify_connection()
+                self._deliver(event)
+
+    async def _notify(self, event: RunEvent) -> None:
+        connection = self._notify_connection
+        if connection is None:
+            connection = await get_engine().connect()
+            self._notify_connection = connection
+        await connection.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": RUN_EVENTS_CHANNEL, "payload": encode_run_event(event)},
+        )
+        await connection.commit()
+
+    async def _close_notify_connection(self) -> None:
+        connection = self._notify_connection
+        self._notify_connection = None
+        if connection is None:
+            return
+        try:
+            await connection.close()
+        except Exception as exc:
+            structured_log(logger, "debug", "runs.event_notifier_close_failed", error=str(exc))
@@ -1,80 +1,269 @@
+"""Run progress events for the ``/runs/{run_id}/stream`` SSE endpoint.
+
+``RunEventPublisher`` keeps everything in this process: per-run subscribers
+and a bounded replay history. ``PostgresRunEventPublisher`` (see
+``event_bus_postgres``) reuses that local fan-out but carries events between
+processes over ``LISTEN/NOTIFY``, so a stream opened on any API worker sees
+events from the worker running the ingestion.
+
+Event ids are microsecond timestamps made strictly increasing per run, so they
+stay ordered across publisher restarts and can be echoed back by the browser
+as ``Last-Event-ID``.
+"""
+
 import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict, deque
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 from typing import Any
 
 from app.logging_utils import structured_log
+from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
-_SUBSCRIBER_QUEUE_MAXSIZE = 256
+RUN_EVENTS_BACKEND_MEMORY = "memory"
+RUN_EVENTS_BACKEND_POSTGRES = "postgres"
+
+EVENT_RUN_COMPLETE = "run_complete"
+EVENT_SCHOLAR_PROGRESS = "scholar_progress"
+EVENT_EVENTS_DROPPED = "events_dropped"
+
+# Runs whose replay history is kept; the oldest is forgotten first.
+_MAX_TRACKED_RUNS = 64
+
+
+@dataclass(frozen=True)
+class RunEvent:
+    run_id: int
+    event_id: int
+    type: str
+    data: dict[str, Any]
+
+
+class _RunHistory:
+    """Recent events of one run for ``Last-Event-ID`` replay.
+
+    ``scholar_progress`` is a snapshot, so only the newest one is kept rather
+    than letting progress ticks push real events out of the ring.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._events: deque[RunEvent] = deque(maxlen=max(size, 1))
+        self.latest_progress: RunEvent | None = None
+        self.last_event_id = 0
+        self._evicted_through = 0
+
+    def append(self, event: RunEvent) -> None:
+        self.last_event_id = max(self.last_event_id, event.event_id)
+        if event.type == EVENT_SCHOLAR_PROGRESS:
+            self.latest_progress = event
+            return
+        if len(self._events) == self._events.maxlen:
+            self._evicted_through = self._events[0].event_id
+        self._events.append(event)
+
+    def since(self, last_event_id: int) -> tuple[list[RunEvent], bool]:
+        """Events newer than ``last_event_id`` and whether some of them were already evicted."""
+        events = [event for event in self._events if event.event_id > last_event_id]
+        if self.latest_progress is not None and self.latest_progress.event_id > last_event_id:
+            events.append(self.latest_progress)
+        return events, last_event_id < self._evicted_through
+
+
+class RunEventSubscription:
+    """Bounded buffer between the bus and one SSE connection.
+
+    A pending ``scholar_progress`` is replaced by the newer one. When the
+    buffer overflows the backlog is discarded and the subscriber is sent the
+    latest progress snapshot plus an ``events_dropped`` marker instead of being
+    disconnected.
+    """
+
+    def __init__(self, run_id: int, *, maxsize: int) -> None:
+        self.run_id = run_id
+        self.dropped_events = 0
+        self._maxsize = max(maxsize, 2)
+        self._pending: deque[RunEvent] = deque()
+        self._progress: RunEvent | None = None
+        self._wakeup = asyncio.Event()
+
+    def offer(self, event: RunEvent) -> None:
+        if event.type == EVENT_SCHOLAR_PROGRESS:
+            if self._progress is not None and self._progress in self._pending:
+                self._pending.remove(self._progress)
+            self._progress = event
+        if len(self._pending) >= self._maxsize:
+            self._drop_to_snapshot(event)
+        self._pending.append(event)
+        self._wakeup.set()
+
+    def _drop_to_snapshot(self, incoming: RunEvent) -> None:
+        dropped = len(self._pending)
+        self.dropped_events += dropped
+        self._pending.clear()
+        structured_log(
+            logger,
+            "warning",
+            "runs.event_subscriber_lagged",
+            run_id=self.run_id,
+            dropped_events=dropped,
+        )
+        self._pending.append(
+            RunEvent(
+                run_id=self.run_id,
+                event_id=incoming.event_id,
+                type=EVENT_EVENTS_DROPPED,
+                data={"dropped": dropped},
+            )
+        )
+        if self._progress is not None and self._progress is not incoming:
+            self._pending.append(self._progress)
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def get(self) -> RunEvent:
+        while not self._pending:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        return self._pending.popleft()
 
 
 class RunEventPublisher:
-    def __init__(self) -> None:
-        # Maps run_id to a set of subscriber queues
-        self._subscribers: dict[int, set[asyncio.Queue]] = {}
-
-    def subscribe(self, run_id: int) -> asyncio.Queue:
-        if run_id not in self._subscribers:
-            self._subscribers[run_id] = set()
-        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_MAXSIZE)
-        self._subscribers[run_id].add(queue)
+    """In-process run event bus (the default backend)."""
+
+    backend = RUN_EVENTS_BACKEND_MEMORY
+
+    def __init__(self, *, replay_size: int = 256, subscriber_queue_size: int = 256) -> None:
+        self._replay_size = replay_size
+        self._subscriber_queue_size = subscriber_queue_size
+        # Maps run_id to its live subscriptions
+        self._subscribers: dict[int, set[RunEventSubscription]] = {}
+        self._histories: OrderedDict[int, _RunHistory] = OrderedDict()
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    def _history(self, run_id: int) -> _RunHistory:
+        history = self._histories.get(run_id)
+        if history is None:
+            history = _RunHistory(self._replay_size)
+            self._histories[run_id] = history
+            while len(self._histories) > _MAX_TRACKED_RUNS:
+                self._histories.popitem(last=False)
+        else:
+            self._histories.move_to_end(run_id)
+        return history
+
+    def _next_event_id(self, run_id: int) -> int:
+        history = self._history(run_id)
+        return max(time.time_ns() // 1000, history.last_event_id + 1)
+
+    def subscribe(self, run_id: int, *, last_event_id: int | None = None) -> RunEventSubscription:
+        subscription = RunEventSubscription(run_id, maxsize=self._subscriber_queue_size)
+        if last_event_id is not None:
+            events, truncated = self._history(run_id).since(last_event_id)
+            if truncated:
+                subscription.offer(
+                    RunEvent(run_id=run_id, event_id=last_event_id, type=EVENT_EVENTS_DROPPED, data={"dropped": None})
+                )
+            for event in events:
+                subscription.offer(event)
+        self._subscribers.setdefault(run_id, set()).add(subscription)
         structured_log(
             logger,
             "debug",
             "runs.event_subscriber_added",
             run_id=run_id,
             subscriber_count=len(self._subscribers[run_id]),
+            replay_from=last_event_id,
         )
-        return queue
+        return subscription
 
-    def unsubscribe(self, run_id: int, queue: asyncio.Queue) -> None:
+    def unsubscribe(self, run_id: int, subscription: RunEventSubscription) -> None:
         if run_id in self._subscribers:
-            self._subscribers[run_id].discard(queue)
+            self._subscribers[run_id].discard(subscription)
             if not self._subscribers[run_id]:
                 self._subscribers.pop(run_id, None)
 
-    async def publish(self, run_id: int, event_type: str, data: dict[str, Any]) -> None:
-        if run_id not in self._subscribers:
-            return
-
-        message = {"type": event_type, "data": data}
+    def has_subscribers(self, run_id: int) -> bool:
+        return bool(self._subscribers.get(run_id))
 
+    def _deliver(self, event: RunEvent) -> None:
+        self._history(event.run_id).append(event)
         # Fan-out to all active subscribers for this run
-        for queue in list(self._subscribers[run_id]):
-            try:
-                queue.put_nowait(message)
-            except asyncio.QueueFull:
-                structured_log(
-                    logger,
-                    "warning",
-                    "runs.event_subscriber_queue_full",
-                    run_id=run_id,
-                )
-                self._subscribers[run_id].discard(queue)
+        for subscription in list(self._subscribers.get(event.run_id, ())):
+            subscription.offer(event)
+
+    async def publish(self, run_id: int, event_type: str, data: dict[str, Any]) -> None:
+        event = RunEvent(run_id=run_id, event_id=self._next_event_id(run_id), type=event_type, data=data)
+        self._deliver(event)
 
     async def publish_run_complete(self, run_id: int) -> None:
-        await self.publish(run_id, "run_complete", {})
+        await self.publish(run_id, EVENT_RUN_COMPLETE, {})
+
+
+def build_run_event_publisher(backend: str) -> RunEventPublisher:
+    options = {
+        "replay_size": max(int(settings.run_events_replay_buffer_size), 1),
+        "subscriber_queue_size": max(int(settings.run_events_subscriber_queue_size), 2),
+    }
+    normalized = (backend or "").strip().lower()
+    if normalized == RUN_EVENTS_BACKEND_POSTGRES:
+        from app.services.runs.event_bus_postgres import PostgresRunEventPublisher
+
+        return PostgresRunEventPublisher(**options)
+    if normalized != RUN_EVENTS_BACKEND_MEMORY:
+        structured_log(
+            logger,
+            "warning",
+            "runs.invalid_event_backend_fallback",
+            run_events_backend=backend,
+            fallback_backend=RUN_EVENTS_BACKEND_MEMORY,
+        )
+    return RunEventPublisher(**options)
+
+
+run_events = build_run_event_publisher(settings.run_events_backend)
+
+
+async def start_run_events() -> None:
+    await run_events.start()
+
+
+async def stop_run_events() -> None:
+    await run_events.stop()
+
+
+def parse_last_event_id(raw_value: str | None) -> int | None:
+    try:
+        value = int((raw_value or "").strip())
+    except ValueError:
+        return None
+    return value if value >= 0 else None
 
 
-run_events = RunEventPublisher()
+def format_sse_event(event: RunEvent) -> str:
+    # Server-Sent Events format: "id: <id>\nevent: <type>\ndata: <json>\n\n"
+    return f"id: {event.event_id}\nevent: {event.type}\ndata: {json.dumps(event.data)}\n\n"
 
 
-async def event_generator(run_id: int) -> AsyncGenerator[str, None]:
-    queue = run_events.subscribe(run_id)
+async def event_generator(run_id: int, *, last_event_id: int | None = None) -> AsyncGenerator[str, None]:
+    subscription = run_events.subscribe(run_id, last_event_id=last_event_id)
     try:
         while True:
             # Wait for a new event
-            message = await queue.get()
-            event_type = message["type"]
-            if event_type == "run_complete":
-                yield f"event: {event_type}\ndata: {{}}\n\n"
+            event = await subscription.get()
+            yield format_sse_event(event)
+            if event.type == EVENT_RUN_COMPLETE:
                 break
-            # Server-Sent Events format: "event: <type>\ndata: <json>\n\n"
-            data_str = json.dumps(message["data"])
-            yield f"event: {event_type}\ndata: {data_str}\n\n"
     except asyncio.CancelledError:
         structured_log(
             logger,
@@ -84,4 +273,4 @@ async def event_generator(run_id: int) -> AsyncGenerator[str, None]:
         )
         raise
     finally:
-        run_events.unsubscribe(run_id, queue)
+        run_events.unsubscribe(run_id, subscription)
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from sqlalchemy import or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, undefer
 
-from app.db.models import CrawlRun, RunStatus, RunTriggerType
+from app.db.models import CrawlRun, CrawlRunScholarResult, RunStatus, RunTriggerType
+
+# Run lists and idempotency lookups only need the typed summary columns.
+_RUN_LIST_OPTIONS = (
+    defer(CrawlRun.summary, raiseload=True),
+    defer(CrawlRun.error_log, raiseload=True),
+)
 
 
 async def list_recent_runs_for_user(
@@ -14,6 +21,7 @@ async def list_recent_runs_for_user(
 ) -> list[CrawlRun]:
     result = await db_session.execute(
         select(CrawlRun)
+        .options(*_RUN_LIST_OPTIONS)
         .where(CrawlRun.user_id == user_id)
         .order_by(CrawlRun.start_dt.desc(), CrawlRun.id.desc())
         .limit(limit)
@@ -30,6 +38,7 @@ async def list_runs_for_user(
 ) -> list[CrawlRun]:
     stmt = (
         select(CrawlRun)
+        .options(*_RUN_LIST_OPTIONS)
         .where(CrawlRun.user_id == user_id)
         .order_by(CrawlRun.start_dt.desc(), CrawlRun.id.desc())
         .limit(limit)
@@ -63,15 +72,30 @@ async def get_manual_run_by_idempotency_key(
 ) -> CrawlRun | None:
     result = await db_session.execute(
         select(CrawlRun)
+        .options(*_RUN_LIST_OPTIONS)
         .where(
             CrawlRun.user_id == user_id,
             CrawlRun.trigger_type == RunTriggerType.MANUAL,
-            or_(
-                CrawlRun.idempotency_key == idempotency_key,
-                CrawlRun.error_log["meta"]["idempotency_key"].astext == idempotency_key,
-            ),
+            CrawlRun.idempotency_key == idempotency_key,
         )
         .order_by(CrawlRun.start_dt.desc(), CrawlRun.id.desc())
         .limit(1)
     )
     return result.scalar_one_or_none()
+
+
+async def list_scholar_results_for_run(
+    db_session: AsyncSession,
+    *,
+    run_id: int,
+    include_debug: bool = True,
+) -> list[CrawlRunScholarResult]:
+    stmt = (
+        select(CrawlRunScholarResult)
+        .where(CrawlRunScholarResult.crawl_run_id == run_id)
+        .order_by(CrawlRunScholarResult.position.asc())
+    )
+    if include_debug:
+        stmt = stmt.options(undefer(CrawlRunScholarResult.debug))
+    result = await db_session.execute(stmt)
+    return list(result.scalars().all())
@@ -10,15 +10,6 @@ def _safe_int(value: object, default: int = 0) -> int:
         return default
 
 
-def _summary_dict(error_log: object) -> dict[str, Any]:
-    if not isinstance(error_log, dict):
-        return {}
-    summary = error_log.get("summary")
-    if not isinstance(summary, dict):
-        return {}
-    return summary
-
-
 def _summary_int_dict(summary: dict[str, Any], key: str) -> dict[str, int]:
     value = summary.get(key)
     if not isinstance(value, dict):
@@ -55,8 +46,8 @@ def _retry_counts(summary: dict[str, Any]) -> dict[str, int]:
     }
 
 
-def extract_run_summary(error_log: object) -> dict[str, Any]:
-    summary = _summary_dict(error_log)
+def extract_run_summary(run_summary: object) -> dict[str, Any]:
+    summary = run_summary if isinstance(run_summary, dict) else {}
     return {
         "succeeded_count": _safe_int(summary.get("succeeded_count", 0)),
         "failed_count": _safe_int(summary.get("failed_count", 0)),
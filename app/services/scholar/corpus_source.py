@@ -0,0 +1,169 @@
+"""Record Scholar responses to an on-disk corpus and replay them offline.
+
+A corpus is a flat directory in the layout of
+``tests/fixtures/scholar/regression``:
+
+- ``profile_<scholar_id>.html`` is the first profile page (``cstart=0``);
+- ``profile_<scholar_id>.cstart<N>.html`` is the page starting at row ``N``;
+- ``search_<digest>.start<N>.html`` is an author search result page, keyed by
+  a digest of the query so arbitrary queries make safe file names.
+
+Each page may have a ``.json`` sidecar next to it holding ``status_code``,
+``final_url`` and ``error``. Pages without one replay as plain 200 responses,
+so hand-written fixtures work unchanged. Replay ignores ``pagesize``: a corpus
+holds whatever page size it was recorded or generated with.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+from app.services.scholar.source import (
+    DEFAULT_PAGE_SIZE,
+    FetchResult,
+    ScholarSource,
+    _build_author_search_url,
+    _build_profile_url,
+)
+
+REPLAY_MISS_ERROR = "replay_miss"
+_SAFE_SCHOLAR_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def profile_page_name(scholar_id: str, *, cstart: int) -> str:
+    if not _SAFE_SCHOLAR_ID.fullmatch(scholar_id):
+        raise ValueError(f"Scholar id {scholar_id!r} cannot be used as a corpus file name.")
+    if cstart > 0:
+        return f"profile_{scholar_id}.cstart{int(cstart)}.html"
+    return f"profile_{scholar_id}.html"
+
+
+def author_search_page_name(query: str, *, start: int) -> str:
+    digest = hashlib.sha256(query.strip().lower().encode("utf-8")).hexdigest()[:16]
+    return f"search_{digest}.start{max(int(start), 0)}.html"
+
+
+def _sidecar_path(page_path: Path) -> Path:
+    return page_path.with_suffix(".json")
+
+
+def write_corpus_page(corpus_dir: Path, name: str, result: FetchResult) -> Path:
+    """Store ``result`` under ``name``; a sidecar is written only when it adds information."""
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    page_path = corpus_dir / name
+    page_path.write_text(result.body, encoding="utf-8")
+    sidecar: dict[str, Any] = {
+        "requested_url": result.requested_url,
+        "status_code": result.status_code,
+        "final_url": result.final_url,
+        "error": result.error,
+    }
+    if result.status_code != 200 or result.error is not None or result.final_url not in (None, result.requested_url):
+        _sidecar_path(page_path).write_text(json.dumps(sidecar, indent=2, sort_keys=True), encoding="utf-8")
+    else:
+        _sidecar_path(page_path).unlink(missing_ok=True)
+    return page_path
+
+
+class ReplayScholarSource:
+    """Serve profile and search pages from a corpus without touching the network.
+
+    Pages are read once and kept in memory, so repeated runs over the same
+    corpus measure ingestion rather than disk reads. A page missing from the
+    corpus comes back as a network-style error result, which ingestion treats
+    like any other failed fetch.
+    """
+
+    def __init__(self, corpus_dir: Path | str) -> None:
+        self._corpus_dir = Path(corpus_dir)
+        self._pages: dict[str, FetchResult | None] = {}
+        self.requests: list[str] = []
+
+    async def fetch_profile_html(self, scholar_id: str) -> FetchResult:
+        return await self.fetch_profile_page_html(scholar_id, cstart=0, pagesize=DEFAULT_PAGE_SIZE)
+
+    async def fetch_profile_page_html(
+        self,
+        scholar_id: str,
+        *,
+        cstart: int,
+        pagesize: int = DEFAULT_PAGE_SIZE,
+    ) -> FetchResult:
+        requested_url = _build_profile_url(scholar_id=scholar_id, cstart=cstart, pagesize=pagesize)
+        return self._replay(profile_page_name(scholar_id, cstart=cstart), requested_url=requested_url)
+
+    async def fetch_author_search_html(self, query: str, *, start: int = 0) -> FetchResult:
+        requested_url = _build_author_search_url(query=query, start=start)
+        return self._replay(author_search_page_name(query, start=start), requested_url=requested_url)
+
+    def _replay(self, name: str, *, requested_url: str) -> FetchResult:
+        self.requests.append(name)
+        if name not in self._pages:
+            self._pages[name] = self._load(name, requested_url=requested_url)
+        stored = self._pages[name]
+        if stored is None:
+            return FetchResult(
+                requested_url=requested_url,
+                status_code=None,
+                final_url=None,
+                body="",
+                error=f"{REPLAY_MISS_ERROR}: {name} is not in {self._corpus_dir}",
+            )
+        return FetchResult(
+            requested_url=requested_url,
+            status_code=stored.status_code,
+            final_url=stored.final_url or requested_url,
+            body=stored.body,
+            error=stored.error,
+        )
+
+    def _load(self, name: str, *, requested_url: str) -> FetchResult | None:
+        page_path = self._corpus_dir / name
+        if not page_path.is_file():
+            return None
+        sidecar_path = _sidecar_path(page_path)
+        sidecar = json.loads(sidecar_path.read_text(encoding="utf-8")) if sidecar_path.is_file() else {}
+        return FetchResult(
+            requested_url=requested_url,
+            status_code=sidecar.get("status_code", 200),
+            final_url=sidecar.get("final_url"),
+            body=page_path.read_text(encoding="utf-8"),
+            error=sidecar.get("error"),
+        )
+
+
+class RecordingScholarSource:
+    """Pass requests through to ``inner`` and save every response to a corpus.
+
+    Error responses are recorded too, with their status in the sidecar, so a
+    replay reproduces blocked pages and layout changes as well as good ones.
+    """
+
+    def __init__(self, inner: ScholarSource, corpus_dir: Path | str) -> None:
+        self._inner = inner
+        self._corpus_dir = Path(corpus_dir)
+
+    async def fetch_profile_html(self, scholar_id: str) -> FetchResult:
+        result = await self._inner.fetch_profile_html(scholar_id)
+        write_corpus_page(self._corpus_dir, profile_page_name(scholar_id, cstart=0), result)
+        return result
+
+    async def fetch_profile_page_html(
+        self,
+        scholar_id: str,
+        *,
+        cstart: int,
+        pagesize: int = DEFAULT_PAGE_SIZE,
+    ) -> FetchResult:
+        result = await self._inner.fetch_profile_page_html(scholar_id, cstart=cstart, pagesize=pagesize)
+        write_corpus_page(self._corpus_dir, profile_page_name(scholar_id, cstart=cstart), result)
+        return result
+
+    async def fetch_author_search_html(self, query: str, *, start: int = 0) -> FetchResult:
+        result = await self._inner.fetch_author_search_html(query, start=start)
+        write_corpus_page(self._corpus_dir, author_search_page_name(query, start=start), result)
+        return result
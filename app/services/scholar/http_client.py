@@ -0,0 +1,88 @@
+"""Shared, pooled async HTTP client for Google Scholar requests.
+
+Every ``LiveScholarSource`` instance routes through one ``httpx.AsyncClient``
+so consecutive page fetches reuse keep-alive connections (and HTTP/2 when the
+optional ``h2`` package is installed) instead of paying a TCP+TLS handshake
+per page.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+
+import httpx
+
+from app.logging_utils import structured_log
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def http2_available() -> bool:
+    return bool(settings.scholar_http_http2_enabled) and importlib.util.find_spec("h2") is not None
+
+
+def scholar_http_timeout() -> httpx.Timeout:
+    connect_seconds = max(float(settings.scholar_http_connect_timeout_seconds), 0.1)
+    read_seconds = max(float(settings.scholar_http_read_timeout_seconds), 0.1)
+    return httpx.Timeout(
+        connect=connect_seconds,
+        read=read_seconds,
+        write=read_seconds,
+        pool=connect_seconds,
+    )
+
+
+def scholar_http_total_timeout_seconds() -> float:
+    return max(float(settings.scholar_http_total_timeout_seconds), 0.1)
+
+
+def scholar_http_limits() -> httpx.Limits:
+    max_connections = max(int(settings.scholar_http_max_connections), 1)
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=max(float(settings.scholar_http_keepalive_expiry_seconds), 0.0),
+    )
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = http2_available()
+    structured_log(
+        logger,
+        "info",
+        "scholar_source.http_client_initialized",
+        http2=http2,
+        max_connections=int(settings.scholar_http_max_connections),
+    )
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=scholar_http_timeout(),
+        limits=scholar_http_limits(),
+        follow_redirects=True,
+    )
+
+
+def get_scholar_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client, rebuilding it if the event loop changed."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _build_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_scholar_http_client() -> None:
+    global _client, _client_loop
+    client = _client
+    _client = None
+    _client_loop = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        structured_log(logger, "info", "scholar_source.http_client_closed")
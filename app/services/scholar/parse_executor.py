@@ -0,0 +1,248 @@
+"""Optional process pool for Scholar HTML parsing.
+
+Parsing a 100-row profile page is pure CPU work. Run inline it stalls the
+event loop that also serves the API and SSE streams. When enabled, pages are
+parsed in a small, warmed ``ProcessPoolExecutor`` with a bounded number of
+in-flight submissions. Small bodies, a disabled or unstarted pool, and a
+broken pool all fall back to inline parsing, so callers never need to care
+which path ran.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from app import metrics
+from app.logging_utils import structured_log
+from app.services.scholar import parser as scholar_parser
+from app.services.scholar.parser_types import (
+    ParsedAuthorSearchPage,
+    ParsedProfilePage,
+    ScholarDomInvariantError,
+    ScholarMalformedDataError,
+    ScholarParserError,
+)
+from app.services.scholar.source import FetchResult
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_PARSER_ERROR_TYPES: dict[str, type[ScholarParserError]] = {
+    error_type.__name__: error_type
+    for error_type in (ScholarParserError, ScholarDomInvariantError, ScholarMalformedDataError)
+}
+_WARM_UP_BODY = '<html><div id="gsc_prf_in">warm</div><tr class="gsc_a_tr"><a class="gsc_a_at">x</a></tr></html>'
+
+
+@dataclass
+class ParseExecutorStats:
+    pool_parses: int = 0
+    inline_parses: int = 0
+    fallbacks: int = 0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+    parse_seconds_total: float = 0.0
+    parse_seconds_max: float = 0.0
+
+    def record(self, *, pooled: bool, queue_wait_seconds: float, parse_seconds: float) -> None:
+        if pooled:
+            self.pool_parses += 1
+        else:
+            self.inline_parses += 1
+        self.queue_wait_seconds_total += queue_wait_seconds
+        self.queue_wait_seconds_max = max(self.queue_wait_seconds_max, queue_wait_seconds)
+        self.parse_seconds_total += parse_seconds
+        self.parse_seconds_max = max(self.parse_seconds_max, parse_seconds)
+        metrics.SCHOLAR_PARSE_SECONDS.observe(parse_seconds, mode="pool" if pooled else "inline")
+        if pooled:
+            metrics.SCHOLAR_PARSE_QUEUE_SECONDS.observe(queue_wait_seconds)
+
+
+@dataclass(frozen=True)
+class _WorkerOutcome:
+    page: Any
+    error_type: str | None
+    error_code: str | None
+    error_message: str | None
+    started_monotonic: float
+    parse_seconds: float
+
+
+_executor: ProcessPoolExecutor | None = None
+_pending: asyncio.Semaphore | None = None
+_stats = ParseExecutorStats()
+
+
+def _run_in_worker(parse_fn: Callable[[FetchResult], Any], fetch_result: FetchResult) -> _WorkerOutcome:
+    # time.monotonic() is system-wide on the supported platforms, so the parent
+    # can subtract its submit timestamp to get the time spent queued.
+    started = time.monotonic()
+    try:
+        page = parse_fn(fetch_result)
+    except ScholarParserError as exc:
+        # Parser errors take keyword-only constructor arguments and do not
+        # survive pickling, so they cross the process boundary as fields.
+        return _WorkerOutcome(
+            page=None,
+            error_type=type(exc).__name__,
+            error_code=exc.code,
+            error_message=str(exc),
+            started_monotonic=started,
+            parse_seconds=time.monotonic() - started,
+        )
+    return _WorkerOutcome(
+        page=page,
+        error_type=None,
+        error_code=None,
+        error_message=None,
+        started_monotonic=started,
+        parse_seconds=time.monotonic() - started,
+    )
+
+
+def _warm_up_worker() -> int:
+    fetch_result = FetchResult(
+        requested_url="https://scholar.google.com/citations",
+        status_code=200,
+        final_url="https://scholar.google.com/citations",
+        body=_WARM_UP_BODY,
+        error=None,
+    )
+    scholar_parser.parse_profile_page(fetch_result)
+    return os.getpid()
+
+
+def parse_executor_stats() -> dict[str, float | int]:
+    return asdict(_stats)
+
+
+def parse_executor_running() -> bool:
+    return _executor is not None
+
+
+async def start_parse_executor() -> None:
+    global _executor, _pending
+    if not settings.scholar_parse_executor_enabled or _executor is not None:
+        return
+    workers = max(int(settings.scholar_parse_executor_workers), 1)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    loop = asyncio.get_running_loop()
+    started = time.monotonic()
+    try:
+        # One warm-up task per worker forces every process to spawn and import
+        # the parser now rather than on the first real page.
+        pids = await asyncio.gather(*(loop.run_in_executor(executor, _warm_up_worker) for _ in range(workers)))
+    except Exception as exc:
+        executor.shutdown(wait=False, cancel_futures=True)
+        structured_log(logger, "error", "scholar_parse_executor.start_failed", error=str(exc))
+        return
+    _executor = executor
+    _pending = asyncio.Semaphore(max(int(settings.scholar_parse_executor_max_pending), 1))
+    structured_log(
+        logger,
+        "info",
+        "scholar_parse_executor.started",
+        workers=workers,
+        warm_workers=len(set(pids)),
+        warm_up_ms=int((time.monotonic() - started) * 1000),
+    )
+
+
+async def stop_parse_executor() -> None:
+    global _executor, _pending
+    executor = _executor
+    _executor = None
+    _pending = None
+    if executor is None:
+        return
+    await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+    structured_log(logger, "info", "scholar_parse_executor.stopped", **parse_executor_stats())
+
+
+def _discard_broken_executor(executor: ProcessPoolExecutor) -> None:
+    global _executor, _pending
+    if _executor is executor:
+        _executor = None
+        _pending = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_inline[ParsedPage](parse_fn: Callable[[FetchResult], ParsedPage], fetch_result: FetchResult) -> ParsedPage:
+    started = time.monotonic()
+    try:
+        return parse_fn(fetch_result)
+    finally:
+        _stats.record(pooled=False, queue_wait_seconds=0.0, parse_seconds=time.monotonic() - started)
+
+
+def _unwrap(outcome: _WorkerOutcome) -> Any:
+    if outcome.error_type is None:
+        return outcome.page
+    error_type = _PARSER_ERROR_TYPES.get(outcome.error_type, ScholarParserError)
+    raise error_type(code=outcome.error_code or "parser_error", message=outcome.error_message or "")
+
+
+async def _parse[ParsedPage](
+    parse_fn: Callable[[FetchResult], ParsedPage],
+    fetch_result: FetchResult,
+    *,
+    kind: str,
+) -> ParsedPage:
+    executor = _executor
+    pending = _pending
+    if executor is None or pending is None or len(fetch_result.body) < settings.scholar_parse_executor_min_body_chars:
+        return _parse_inline(parse_fn, fetch_result)
+
+    submitted = time.monotonic()
+    try:
+        async with pending:
+            outcome = await asyncio.get_running_loop().run_in_executor(
+                executor,
+                _run_in_worker,
+                parse_fn,
+                fetch_result,
+            )
+    except BrokenProcessPool as exc:
+        _stats.fallbacks += 1
+        _discard_broken_executor(executor)
+        structured_log(
+            logger,
+            "error",
+            "scholar_parse_executor.pool_unavailable",
+            kind=kind,
+            error=str(exc),
+        )
+        return _parse_inline(parse_fn, fetch_result)
+
+    queue_wait_seconds = max(outcome.started_monotonic - submitted, 0.0)
+    _stats.record(pooled=True, queue_wait_seconds=queue_wait_seconds, parse_seconds=outcome.parse_seconds)
+    structured_log(
+        logger,
+        "debug",
+        "scholar_parse_executor.parsed",
+        kind=kind,
+        body_chars=len(fetch_result.body),
+        queue_wait_ms=int(queue_wait_seconds * 1000),
+        parse_ms=int(outcome.parse_seconds * 1000),
+    )
+    return _unwrap(outcome)
+
+
+async def parse_profile_page(fetch_result: FetchResult) -> ParsedProfilePage:
+    return await _parse(scholar_parser.parse_profile_page, fetch_result, kind="profile")
+
+
+async def parse_author_search_page(fetch_result: FetchResult) -> ParsedAuthorSearchPage:
+    return await _parse(scholar_parser.parse_author_search_page, fetch_result, kind="author_search")
@@ -24,15 +24,7 @@ from app.services.scholar.parser_types import (
 from app.services.scholar.parser_utils import (
     strip_tags,
 )
-from app.services.scholar.profile_rows import (
-    count_markers,
-    extract_articles_range,
-    extract_profile_image_url,
-    extract_profile_name,
-    has_operation_error_banner,
-    has_show_more_button,
-    parse_publications,
-)
+from app.services.scholar.profile_rows import scan_profile_page
 from app.services.scholar.source import FetchResult
 from app.services.scholar.state_detection import (
     detect_author_search_state,
@@ -90,50 +82,47 @@ def _assert_profile_dom_invariants(
 
 
 def parse_profile_page(fetch_result: FetchResult) -> ParsedProfilePage:
-    publications, warnings = parse_publications(fetch_result.body)
-    marker_counts = count_markers(fetch_result.body)
-    visible_text = strip_tags(SCRIPT_STYLE_RE.sub(" ", fetch_result.body)).lower()
-
-    show_more = has_show_more_button(fetch_result.body)
-    operation_error_banner = has_operation_error_banner(fetch_result.body)
-    articles_range = extract_articles_range(fetch_result.body)
+    scan = scan_profile_page(fetch_result.body)
+    warnings = list(scan.warnings)
+    show_more = scan.has_show_more_button
 
     if show_more:
         warnings.append("possible_partial_page_show_more_present")
-    if operation_error_banner:
+    if scan.has_operation_error_banner:
         warnings.append("operation_error_banner_present")
 
     warnings = sorted(set(warnings))
     _assert_profile_dom_invariants(
         fetch_result=fetch_result,
-        marker_counts=marker_counts,
-        publications=publications,
+        marker_counts=scan.marker_counts,
+        publications=scan.publications,
         warnings=warnings,
         has_show_more_button_flag=show_more,
-        articles_range=articles_range,
+        articles_range=scan.articles_range,
     )
 
     state, state_reason = detect_state(
         fetch_result,
-        publications,
-        marker_counts,
+        scan.publications,
+        scan.marker_counts,
         warnings=warnings,
         has_show_more_button_flag=show_more,
-        articles_range=articles_range,
-        visible_text=visible_text,
+        articles_range=scan.articles_range,
+        visible_text=scan.visible_text,
+        body_lowered=scan.body_lowered,
     )
 
     return ParsedProfilePage(
         state=state,
         state_reason=state_reason,
-        profile_name=extract_profile_name(fetch_result.body),
-        profile_image_url=extract_profile_image_url(fetch_result.body),
-        publications=publications,
-        marker_counts=marker_counts,
+        profile_name=scan.profile_name,
+        profile_image_url=scan.profile_image_url,
+        publications=scan.publications,
+        marker_counts=scan.marker_counts,
         warnings=warnings,
         has_show_more_button=show_more,
-        has_operation_error_banner=operation_error_banner,
-        articles_range=articles_range,
+        has_operation_error_banner=scan.has_operation_error_banner,
+        articles_range=scan.articles_range,
     )
 
 
@@ -67,10 +67,6 @@ NETWORK_TLS_ERROR_KEYWORDS = [
 
 TAG_RE = re.compile(r"<[^>]+>", re.S)
 SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.I | re.S)
-SHOW_MORE_BUTTON_RE = re.compile(
-    r"<button\b[^>]*\bid\s*=\s*['\"]gsc_bpf_more['\"][^>]*>",
-    re.I | re.S,
-)
 
 PROFILE_ROW_PARSER_DIRECT_MARKERS = (
     "gs_ggs",
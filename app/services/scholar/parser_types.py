@@ -52,6 +52,20 @@ class ScholarSearchCandidate:
     profile_image_url: str | None
 
 
+@dataclass(frozen=True)
+class ProfilePageScan:
+    publications: list[PublicationCandidate]
+    warnings: list[str]
+    marker_counts: dict[str, int]
+    body_lowered: str
+    visible_text: str
+    profile_name: str | None
+    profile_image_url: str | None
+    articles_range: str | None
+    has_show_more_button: bool
+    has_operation_error_banner: bool
+
+
 @dataclass(frozen=True)
 class ParsedProfilePage:
     state: ParseState
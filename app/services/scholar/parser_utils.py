@@ -9,6 +9,19 @@ def normalize_space(value: str) -> str:
     return " ".join(unescape(value).split())
 
 
+def lower_chunked(value: str, *, chunk_size: int = 65536) -> str:
+    """``str.lower`` in bounded slices.
+
+    CPython lowers through a UCS-4 scratch buffer three times the input length,
+    so lowering a large non-ASCII page in one call costs roughly twelve bytes
+    per character at peak. Slicing only affects context-sensitive final-sigma
+    casing, which no ASCII marker or keyword check can observe.
+    """
+    if len(value) <= chunk_size:
+        return value.lower()
+    return "".join(value[start : start + chunk_size].lower() for start in range(0, len(value), chunk_size))
+
+
 def strip_tags(value: str) -> str:
     return normalize_space(TAG_RE.sub(" ", value))
 
@@ -5,23 +5,27 @@ from html.parser import HTMLParser
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
-from app.services.scholar.parser_constants import (
-    MARKER_KEYS,
-    SHOW_MORE_BUTTON_RE,
-)
-from app.services.scholar.parser_types import PublicationCandidate
+from app.services.scholar.parser_constants import MARKER_KEYS
+from app.services.scholar.parser_types import ProfilePageScan, PublicationCandidate
 from app.services.scholar.parser_utils import (
     attr_class,
     attr_href,
     build_absolute_scholar_url,
+    lower_chunked,
     normalize_space,
-    strip_tags,
 )
 
+PROFILE_NAME_ELEMENT_ID = "gsc_prf_in"
+ARTICLES_RANGE_ELEMENT_ID = "gsc_a_nn"
+SHOW_MORE_BUTTON_ID = "gsc_bpf_more"
+PROFILE_IMAGE_ELEMENT_ID = "gsc_prf_pup-img"
+RAW_TEXT_TAGS = frozenset({"script", "style"})
+
+
+class ScholarRowState:
+    """Per-row accumulator for one ``gsc_a_tr`` publication row."""
 
-class ScholarRowParser(HTMLParser):
     def __init__(self) -> None:
-        super().__init__(convert_charrefs=True)
         self.title_href: str | None = None
         self.title_parts: list[str] = []
         self.citation_parts: list[str] = []
@@ -33,7 +37,7 @@ class ScholarRowParser(HTMLParser):
         self._year_depth = 0
         self._gray_stack: list[dict[str, Any]] = []
 
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+    def start(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
         if self._title_depth > 0:
             self._title_depth += 1
         if self._citation_depth > 0:
@@ -62,7 +66,7 @@ class ScholarRowParser(HTMLParser):
             self._gray_stack.append({"depth": 1, "parts": []})
             return
 
-    def handle_data(self, data: str) -> None:
+    def data(self, data: str) -> None:
         if self._title_depth > 0:
             self.title_parts.append(data)
         if self._citation_depth > 0:
@@ -72,7 +76,7 @@ class ScholarRowParser(HTMLParser):
         if self._gray_stack:
             self._gray_stack[-1]["parts"].append(data)
 
-    def handle_endtag(self, tag: str) -> None:
+    def end(self) -> None:
         if self._title_depth > 0:
             self._title_depth -= 1
         if self._citation_depth > 0:
@@ -88,12 +92,131 @@ class ScholarRowParser(HTMLParser):
                 self._gray_stack.pop()
 
 
-def extract_rows(html: str) -> list[str]:
-    pattern = re.compile(
-        r"<tr\b(?=[^>]*\bclass\s*=\s*['\"][^'\"]*\bgsc_a_tr\b[^'\"]*['\"])[^>]*>(.*?)</tr>",
-        re.I | re.S,
-    )
-    return [match.group(1) for match in pattern.finditer(html)]
+def _attr_value(attrs: list[tuple[str, str | None]], name: str) -> str | None:
+    for attr_name, raw_value in attrs:
+        if attr_name == name:
+            return raw_value
+    return None
+
+
+def _attr_index(attrs: list[tuple[str, str | None]], name: str) -> int:
+    for index, (attr_name, _raw_value) in enumerate(attrs):
+        if attr_name == name:
+            return index
+    return -1
+
+
+def _attr_value_after(
+    attrs: list[tuple[str, str | None]],
+    *,
+    anchor: str,
+    anchor_value: str,
+    name: str,
+) -> str | None:
+    """Return ``name``'s value when ``anchor=anchor_value`` precedes it in the tag."""
+    anchor_index = _attr_index(attrs, anchor)
+    if anchor_index < 0 or (attrs[anchor_index][1] or "").lower() != anchor_value:
+        return None
+    value_index = _attr_index(attrs, name)
+    if value_index <= anchor_index:
+        return None
+    return attrs[value_index][1] or None
+
+
+class ScholarProfilePageParser(HTMLParser):
+    """Single streaming tokenizer pass over a Scholar profile page.
+
+    Publication rows, the profile header, the articles range, the show-more
+    control and the visible text used for no-results detection are all
+    collected from one ``feed`` instead of separate regex scans per field.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.publications: list[PublicationCandidate] = []
+        self.warnings: list[str] = []
+        self.row_count = 0
+        self.profile_name: str | None = None
+        self.articles_range: str | None = None
+        self.show_more_tag: str | None = None
+        self.og_image_url: str | None = None
+        self.profile_image_src: str | None = None
+        self.visible_parts: list[str] = []
+
+        self._row: ScholarRowState | None = None
+        self._raw_text_tag: str | None = None
+        self._captures: dict[str, list[str]] = {}
+        self._captured_ids: set[str] = set()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._on_start(tag, attrs)
+        if tag in RAW_TEXT_TAGS:
+            self._raw_text_tag = tag
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._on_start(tag, attrs)
+        if self._row is not None:
+            self._row.end()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == self._raw_text_tag:
+            self._raw_text_tag = None
+        if self._captures:
+            self._finish_captures()
+        if self._row is None:
+            return
+        if tag == "tr":
+            self._finish_row(self._row)
+            self._row = None
+            return
+        self._row.end()
+
+    def handle_data(self, data: str) -> None:
+        if self._raw_text_tag is None:
+            self.visible_parts.append(data)
+        for parts in self._captures.values():
+            parts.append(data)
+        if self._row is not None:
+            self._row.data(data)
+
+    def _on_start(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._row is not None:
+            self._row.start(tag, attrs)
+        elif tag == "tr" and "gsc_a_tr" in attr_class(attrs).split():
+            self._row = ScholarRowState()
+            return
+
+        element_id = (_attr_value(attrs, "id") or "").lower()
+        if element_id in (PROFILE_NAME_ELEMENT_ID, ARTICLES_RANGE_ELEMENT_ID) and element_id not in self._captured_ids:
+            self._captured_ids.add(element_id)
+            self._captures[element_id] = []
+        elif tag == "button" and element_id == SHOW_MORE_BUTTON_ID and self.show_more_tag is None:
+            self.show_more_tag = (self.get_starttag_text() or "").lower()
+        elif tag == "meta" and self.og_image_url is None:
+            self.og_image_url = _attr_value_after(attrs, anchor="property", anchor_value="og:image", name="content")
+        elif tag == "img" and self.profile_image_src is None:
+            self.profile_image_src = _attr_value_after(
+                attrs,
+                anchor="id",
+                anchor_value=PROFILE_IMAGE_ELEMENT_ID,
+                name="src",
+            )
+
+    def _finish_captures(self) -> None:
+        for element_id, parts in self._captures.items():
+            value = normalize_space(" ".join(parts)) or None
+            if element_id == PROFILE_NAME_ELEMENT_ID:
+                self.profile_name = value
+            else:
+                self.articles_range = value
+        self._captures = {}
+
+    def _finish_row(self, row: ScholarRowState) -> None:
+        self.row_count += 1
+        publication, row_warnings = _publication_from_row(row)
+        self.warnings.extend(row_warnings)
+        if publication is not None:
+            self.publications.append(publication)
 
 
 def parse_cluster_id_from_href(href: str | None) -> str | None:
@@ -140,34 +263,32 @@ def parse_citation_count(parts: list[str]) -> int | None:
     return int(digits)
 
 
-def _parse_publication_row(row_html: str) -> tuple[PublicationCandidate | None, list[str]]:
-    parser = ScholarRowParser()
-    parser.feed(row_html)
+def _publication_from_row(row: ScholarRowState) -> tuple[PublicationCandidate | None, list[str]]:
     warnings: list[str] = []
-    title = normalize_space("".join(parser.title_parts))
+    title = normalize_space("".join(row.title_parts))
     if not title:
         warnings.append("row_missing_title")
         return None, warnings
-    if not parser.title_href:
+    if not row.title_href:
         warnings.append("row_missing_title_href")
 
-    citation_text = normalize_space(" ".join(parser.citation_parts))
-    citation_count = parse_citation_count(parser.citation_parts)
+    citation_text = normalize_space(" ".join(row.citation_parts))
+    citation_count = parse_citation_count(row.citation_parts)
     if citation_text and citation_count is None:
         warnings.append("layout_row_citation_unparseable")
 
-    year_text = normalize_space(" ".join(parser.year_parts))
-    year = parse_year(parser.year_parts)
+    year_text = normalize_space(" ".join(row.year_parts))
+    year = parse_year(row.year_parts)
     if year_text and year is None:
         warnings.append("layout_row_year_unparseable")
 
-    authors_text = parser.gray_texts[0] if len(parser.gray_texts) > 0 else None
-    venue_text = parser.gray_texts[1] if len(parser.gray_texts) > 1 else None
+    authors_text = row.gray_texts[0] if len(row.gray_texts) > 0 else None
+    venue_text = row.gray_texts[1] if len(row.gray_texts) > 1 else None
     return (
         PublicationCandidate(
             title=title,
-            title_url=parser.title_href,
-            cluster_id=parse_cluster_id_from_href(parser.title_href),
+            title_url=row.title_href,
+            cluster_id=parse_cluster_id_from_href(row.title_href),
             year=year,
             citation_count=citation_count,
             authors_text=authors_text,
@@ -178,80 +299,19 @@ def _parse_publication_row(row_html: str) -> tuple[PublicationCandidate | None,
     )
 
 
-def parse_publications(html: str) -> tuple[list[PublicationCandidate], list[str]]:
-    rows = extract_rows(html)
-    warnings: list[str] = []
-    publications: list[PublicationCandidate] = []
-
-    for row_html in rows:
-        publication, row_warnings = _parse_publication_row(row_html)
-        warnings.extend(row_warnings)
-        if publication is None:
-            continue
-        publications.append(publication)
-
-    if not rows:
-        warnings.append("no_rows_detected")
-    if rows and not publications:
-        warnings.append("layout_all_rows_unparseable")
-
-    return publications, sorted(set(warnings))
-
-
-def extract_profile_name(html: str) -> str | None:
-    pattern = re.compile(
-        r"<[^>]*\bid\s*=\s*['\"]gsc_prf_in['\"][^>]*>(.*?)</[^>]+>",
-        re.I | re.S,
-    )
-    match = pattern.search(html)
-    if not match:
-        return None
-    value = strip_tags(match.group(1))
-    return value or None
-
-
-def extract_profile_image_url(html: str) -> str | None:
-    og_image_pattern = re.compile(
-        r"<meta[^>]+property=['\"]og:image['\"][^>]+content=['\"]([^'\"]+)['\"][^>]*>",
-        re.I | re.S,
-    )
-    og_match = og_image_pattern.search(html)
-    if og_match:
-        value = normalize_space(og_match.group(1))
-        absolute = build_absolute_scholar_url(value)
+def _profile_image_url(parser: ScholarProfilePageParser) -> str | None:
+    if parser.og_image_url:
+        absolute = build_absolute_scholar_url(normalize_space(parser.og_image_url))
         if absolute:
             return absolute
-
-    image_pattern = re.compile(
-        r"<img[^>]*\bid=['\"]gsc_prf_pup-img['\"][^>]*\bsrc=['\"]([^'\"]+)['\"][^>]*>",
-        re.I | re.S,
-    )
-    image_match = image_pattern.search(html)
-    if not image_match:
-        return None
-
-    value = normalize_space(image_match.group(1))
-    return build_absolute_scholar_url(value)
-
-
-def extract_articles_range(html: str) -> str | None:
-    pattern = re.compile(
-        r"<[^>]*\bid\s*=\s*['\"]gsc_a_nn['\"][^>]*>(.*?)</[^>]+>",
-        re.I | re.S,
-    )
-    match = pattern.search(html)
-    if not match:
+    if not parser.profile_image_src:
         return None
-    value = strip_tags(match.group(1))
-    return value or None
+    return build_absolute_scholar_url(normalize_space(parser.profile_image_src))
 
 
-def has_show_more_button(html: str) -> bool:
-    match = SHOW_MORE_BUTTON_RE.search(html)
-    if match is None:
+def is_enabled_show_more_tag(button_tag: str | None) -> bool:
+    if button_tag is None:
         return False
-
-    button_tag = match.group(0).lower()
     if "disabled" in button_tag:
         return False
     if 'aria-disabled="true"' in button_tag or "aria-disabled='true'" in button_tag:
@@ -259,13 +319,39 @@ def has_show_more_button(html: str) -> bool:
     return "gs_dis" not in button_tag
 
 
-def has_operation_error_banner(html: str) -> bool:
-    lowered = html.lower()
-    if 'id="gsc_a_err"' not in lowered and "id='gsc_a_err'" not in lowered:
+def has_operation_error_banner(lowered_html: str) -> bool:
+    if 'id="gsc_a_err"' not in lowered_html and "id='gsc_a_err'" not in lowered_html:
         return False
-    return "can't perform the operation now" in lowered or "cannot perform the operation now" in lowered
+    return "can't perform the operation now" in lowered_html or "cannot perform the operation now" in lowered_html
 
 
-def count_markers(html: str) -> dict[str, int]:
-    lowered = html.lower()
-    return {key: lowered.count(key.lower()) for key in MARKER_KEYS}
+def count_markers(lowered_html: str) -> dict[str, int]:
+    return {key: lowered_html.count(key) for key in MARKER_KEYS}
+
+
+def scan_profile_page(html: str) -> ProfilePageScan:
+    parser = ScholarProfilePageParser()
+    parser.feed(html)
+    parser.close()
+
+    warnings = parser.warnings
+    if parser.row_count == 0:
+        warnings.append("no_rows_detected")
+    elif not parser.publications:
+        warnings.append("layout_all_rows_unparseable")
+
+    # Marker counts and the error banner are raw substring checks (they also
+    # match inside scripts and attributes), so they share one lowered copy.
+    lowered = lower_chunked(html)
+    return ProfilePageScan(
+        publications=parser.publications,
+        warnings=sorted(set(warnings)),
+        marker_counts=count_markers(lowered),
+        body_lowered=lowered,
+        visible_text=normalize_space(" ".join(parser.visible_parts)).lower(),
+        profile_name=parser.profile_name,
+        profile_image_url=_profile_image_url(parser),
+        articles_range=parser.articles_range,
+        has_show_more_button=is_enabled_show_more_tag(parser.show_more_tag),
+        has_operation_error_banner=has_operation_error_banner(lowered),
+    )
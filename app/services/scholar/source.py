@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import logging
 import random
+import time
 from dataclasses import dataclass
 from typing import Protocol
-from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
+import httpx
+
+from app import metrics
 from app.logging_utils import structured_log
+from app.services.scholar import http_client as scholar_http_client
 from app.services.scholar import rate_limit as scholar_rate_limit
 from app.settings import settings
 
@@ -60,12 +64,18 @@ class LiveScholarSource:
     def __init__(
         self,
         *,
-        timeout_seconds: float = 25.0,
+        timeout_seconds: float | None = None,
         min_interval_seconds: float | None = None,
         rotate_user_agents: bool | None = None,
         user_agents: list[str] | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
-        self._timeout_seconds = timeout_seconds
+        self._timeout_seconds = (
+            scholar_http_client.scholar_http_total_timeout_seconds()
+            if timeout_seconds is None
+            else max(float(timeout_seconds), 0.1)
+        )
+        self._client = client
         configured_interval = (
             float(settings.ingestion_min_request_delay_seconds)
             if min_interval_seconds is None
@@ -98,6 +108,7 @@ class LiveScholarSource:
         headers = {
             "User-Agent": self._resolve_user_agent_for_request(),
             "Accept": "text/html,application/xhtml+xml",
+            "Accept-Encoding": "gzip, deflate",
             "Accept-Language": self._accept_language,
         }
         if self._cookie_header is not None:
@@ -141,13 +152,19 @@ class LiveScholarSource:
         return await self._fetch_with_global_throttle(publication_url)
 
     async def _fetch_with_global_throttle(self, requested_url: str) -> FetchResult:
-        await scholar_rate_limit.wait_for_scholar_slot(
-            min_interval_seconds=self._min_interval_seconds,
-        )
-        return await asyncio.to_thread(self._fetch_sync, requested_url)
+        with metrics.UPSTREAM_SLOT_WAIT_SECONDS.time(upstream="scholar"):
+            await scholar_rate_limit.wait_for_scholar_slot(
+                min_interval_seconds=self._min_interval_seconds,
+            )
+        return await self._fetch(requested_url)
+
+    def _build_request(self, requested_url: str) -> httpx.Request:
+        return httpx.Request("GET", requested_url, headers=self._request_headers())
 
-    def _build_request(self, requested_url: str) -> Request:
-        return Request(requested_url, headers=self._request_headers())
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        return scholar_http_client.get_scholar_http_client()
 
     @staticmethod
     def _http_error_reason(*, status_code: int, final_url: str, body: str) -> str:
@@ -164,83 +181,115 @@ class LiveScholarSource:
         return f"http_error_status_{status_code}"
 
     @staticmethod
-    def _http_error_body(exc: HTTPError) -> str:
-        try:
-            return exc.read().decode("utf-8", errors="replace")
-        except Exception:
-            return ""
+    async def _read_body(response: httpx.Response) -> str:
+        # Decode incrementally while streaming so multi-byte characters split
+        # across chunk boundaries are reassembled without buffering raw bytes.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        parts = [decoder.decode(chunk) async for chunk in response.aiter_bytes()]
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
+
+    @staticmethod
+    def _network_error_message(exc: Exception) -> str:
+        if isinstance(exc, httpx.TimeoutException | TimeoutError):
+            return f"{type(exc).__name__}: request timed out"
+        detail = str(exc).strip()
+        return f"{type(exc).__name__}: {detail}" if detail else type(exc).__name__
 
     @staticmethod
-    def _network_error_result(requested_url: str, exc: URLError) -> FetchResult:
+    def _network_error_result(requested_url: str, exc: Exception) -> FetchResult:
+        error = LiveScholarSource._network_error_message(exc)
         structured_log(
             logger,
             "warning",
             "scholar_source.fetch_network_error",
             requested_url=requested_url,
+            error=error,
         )
         return FetchResult(
             requested_url=requested_url,
             status_code=None,
             final_url=None,
             body="",
-            error=str(exc),
+            error=error,
         )
 
     @staticmethod
-    def _http_error_result(requested_url: str, exc: HTTPError) -> FetchResult:
-        final_url = exc.geturl()
-        body = LiveScholarSource._http_error_body(exc)
-        block_reason = LiveScholarSource._http_error_reason(
-            status_code=exc.code,
-            final_url=final_url,
-            body=body,
-        )
+    def _http_error_result(
+        requested_url: str,
+        response: httpx.Response,
+        body: str,
+        *,
+        block_reason: str,
+    ) -> FetchResult:
+        final_url = str(response.url)
         structured_log(
             logger,
             "warning",
             "scholar_source.fetch_http_error",
             requested_url=requested_url,
-            status_code=exc.code,
+            status_code=response.status_code,
             final_url=final_url,
             block_reason=block_reason,
         )
         return FetchResult(
             requested_url=requested_url,
-            status_code=exc.code,
+            status_code=response.status_code,
             final_url=final_url,
             body=body,
-            error=str(exc),
+            error=f"HTTP Error {response.status_code}: {response.reason_phrase}",
         )
 
     @staticmethod
-    def _success_result(requested_url: str, response) -> FetchResult:
-        body = response.read().decode("utf-8", errors="replace")
-        status_code = getattr(response, "status", 200)
+    def _success_result(
+        requested_url: str,
+        response: httpx.Response,
+        body: str,
+        *,
+        elapsed_ms: int,
+    ) -> FetchResult:
         structured_log(
             logger,
             "debug",
             "scholar_source.fetch_succeeded",
             requested_url=requested_url,
-            status_code=status_code,
+            status_code=response.status_code,
+            http_version=response.http_version,
+            elapsed_ms=elapsed_ms,
         )
         return FetchResult(
             requested_url=requested_url,
-            status_code=status_code,
-            final_url=response.geturl(),
+            status_code=response.status_code,
+            final_url=str(response.url),
             body=body,
             error=None,
         )
 
-    def _fetch_sync(self, requested_url: str) -> FetchResult:
+    async def _fetch(self, requested_url: str) -> FetchResult:
         request = self._build_request(requested_url)
-
+        started = time.perf_counter()
         try:
-            with urlopen(request, timeout=self._timeout_seconds) as response:
-                return self._success_result(requested_url, response)
-        except HTTPError as exc:
-            return self._http_error_result(requested_url, exc)
-        except URLError as exc:
+            async with asyncio.timeout(self._timeout_seconds):
+                response = await self._http_client().send(request, stream=True, follow_redirects=True)
+                try:
+                    body = await self._read_body(response)
+                finally:
+                    await response.aclose()
+        except (httpx.HTTPError, TimeoutError) as exc:
+            metrics.SCHOLAR_FETCH_SECONDS.observe(time.perf_counter() - started, outcome="network_error")
             return self._network_error_result(requested_url, exc)
+        elapsed = time.perf_counter() - started
+        if response.is_error:
+            block_reason = self._http_error_reason(
+                status_code=response.status_code,
+                final_url=str(response.url),
+                body=body,
+            )
+            outcome = "blocked" if block_reason.startswith("blocked_") else "http_error"
+            metrics.SCHOLAR_FETCH_SECONDS.observe(elapsed, outcome=outcome)
+            return self._http_error_result(requested_url, response, body, block_reason=block_reason)
+        metrics.SCHOLAR_FETCH_SECONDS.observe(elapsed, outcome="success")
+        return self._success_result(requested_url, response, body, elapsed_ms=int(elapsed * 1000))
 
 
 def _build_profile_url(*, scholar_id: str, cstart: int, pagesize: int) -> str:
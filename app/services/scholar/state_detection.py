@@ -96,11 +96,12 @@ def detect_state(
     has_show_more_button_flag: bool,
     articles_range: str | None,
     visible_text: str,
+    body_lowered: str | None = None,
 ) -> tuple[ParseState, str]:
     if fetch_result.status_code is None:
         return ParseState.NETWORK_ERROR, classify_network_error_reason(fetch_result.error)
 
-    lowered = fetch_result.body.lower()
+    lowered = fetch_result.body.lower() if body_lowered is None else body_lowered
     final = (fetch_result.final_url or "").lower()
     status_code = int(fetch_result.status_code)
 
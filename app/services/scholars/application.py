@@ -8,7 +8,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import ScholarProfile
-from app.services.scholar.parser import ScholarParserError, parse_profile_page
+from app.services.scholar import parse_executor
+from app.services.scholar.parser import ScholarParserError
 from app.services.scholar.source import ScholarSource
 from app.services.scholars.author_search import search_author_candidates
 from app.services.scholars.constants import (
@@ -197,7 +198,7 @@ async def hydrate_profile_metadata(
 ) -> ScholarProfile:
     fetch_result = await source.fetch_profile_html(profile.scholar_id)
     try:
-        parsed_page = parse_profile_page(fetch_result)
+        parsed_page = await parse_executor.parse_profile_page(fetch_result)
     except ScholarParserError:
         return profile
 
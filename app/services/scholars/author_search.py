@@ -11,11 +11,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import AuthorSearchRuntimeState
 from app.logging_utils import structured_log
+from app.services.scholar import parse_executor
 from app.services.scholar.parser import (
     ParsedAuthorSearchPage,
     ParseState,
     ScholarParserError,
-    parse_author_search_page,
 )
 from app.services.scholar.source import ScholarSource
 from app.services.scholars.author_search_cache import (
@@ -309,7 +309,7 @@ async def _fetch_author_search_with_retries(
     for attempt_index in range(max_attempts):
         fetch_result = await source.fetch_author_search_html(normalized_query, start=0)
         try:
-            parsed = parse_author_search_page(fetch_result)
+            parsed = await parse_executor.parse_author_search_page(fetch_result)
         except ScholarParserError as exc:
             parsed = ParsedAuthorSearchPage(
                 state=ParseState.LAYOUT_CHANGED,
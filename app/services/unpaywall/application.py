@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
+from app.http.clients import UPSTREAM_UNPAYWALL, get_http_client
 from app.logging_utils import structured_log
 from app.services.crossref.application import discover_doi_for_publication
 from app.services.doi.normalize import normalize_doi
@@ -13,7 +15,7 @@ from app.services.unpaywall.pdf_discovery import (
     looks_like_pdf_url,
     resolve_pdf_from_landing_page,
 )
-from app.services.unpaywall.rate_limit import wait_for_unpaywall_slot
+from app.services.unpaywall.rate_limit import unpaywall_host_slot, wait_for_unpaywall_slot
 from app.settings import settings
 
 if TYPE_CHECKING:
@@ -40,6 +42,44 @@ class OaResolutionOutcome:
     used_crossref: bool
 
 
+class _CrossrefBudget:
+    """Crossref lookup budget shared by every concurrent item of one request.
+
+    ``try_acquire`` has no await point, so the check and the increment are
+    atomic with respect to the other resolution tasks on the event loop.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(int(limit), 0)
+        self.used = 0
+
+    def try_acquire(self) -> bool:
+        if self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+    def release(self) -> None:
+        self.used = max(self.used - 1, 0)
+
+
+class _CrossrefLease:
+    """One item's claim on the shared budget, remembered for failure reporting."""
+
+    def __init__(self, budget: _CrossrefBudget) -> None:
+        self._budget = budget
+        self.held = False
+
+    def try_acquire(self) -> bool:
+        self.held = self._budget.try_acquire()
+        return self.held
+
+    def release(self) -> None:
+        if self.held:
+            self._budget.release()
+            self.held = False
+
+
 def _extract_doi_candidate(text: str | None) -> str | None:
     if not text:
         return None
@@ -167,13 +207,11 @@ async def _fetch_unpaywall_payload_by_doi(
     doi: str,
     email: str,
 ) -> dict | None:
-    await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds)
+    url = UNPAYWALL_URL_TEMPLATE.format(doi=doi)
     headers = {"User-Agent": f"scholar-scraper/1.0 (mailto:{email})"}
-    response = await client.get(
-        UNPAYWALL_URL_TEMPLATE.format(doi=doi),
-        params={"email": email},
-        headers=headers,
-    )
+    async with unpaywall_host_slot(url):
+        await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds, url=url)
+        response = await client.get(url, params={"email": email}, headers=headers)
     if response.status_code != 200:
         return None
     payload = response.json()
@@ -192,7 +230,7 @@ async def _resolve_item_payload(
     client,
     item: PublicationListItem,
     email: str,
-    allow_crossref: bool,
+    crossref: _CrossrefLease,
 ) -> tuple[dict | None, bool, str | None]:
     doi = _publication_doi(item)
     payload: dict | None = None
@@ -200,13 +238,16 @@ async def _resolve_item_payload(
         payload = await _fetch_unpaywall_payload_by_doi(client=client, doi=doi, email=email)
         if payload is not None and _has_direct_payload_pdf(payload):
             return payload, False, doi
-    if not allow_crossref or not settings.crossref_enabled:
+    if not settings.crossref_enabled or not crossref.try_acquire():
         return payload, False, doi
     crossref_doi = await discover_doi_for_publication(
         item=item,
         max_rows=settings.crossref_max_rows,
         email=email,
     )
+    if crossref_doi is None:
+        # Only lookups that found a DOI count against the request budget.
+        crossref.release()
     if crossref_doi is None or crossref_doi == doi:
         return payload, crossref_doi is not None, doi or crossref_doi
     crossref_payload = await _fetch_unpaywall_payload_by_doi(
@@ -295,13 +336,13 @@ async def _resolve_outcome_for_item(
     client,
     item: PublicationListItem,
     email: str,
-    allow_crossref: bool,
+    crossref: _CrossrefLease,
 ) -> OaResolutionOutcome:
     payload, used_crossref, resolved_doi = await _resolve_item_payload(
         client=client,
         item=item,
         email=email,
-        allow_crossref=allow_crossref,
+        crossref=crossref,
     )
     if not isinstance(payload, dict):
         return _outcome_with_failure(
@@ -332,14 +373,15 @@ async def _safe_outcome_for_item(
     client,
     item: PublicationListItem,
     email: str,
-    allow_crossref: bool,
+    crossref_budget: _CrossrefBudget,
 ) -> OaResolutionOutcome:
+    crossref = _CrossrefLease(crossref_budget)
     try:
         return await _resolve_outcome_for_item(
             client=client,
             item=item,
             email=email,
-            allow_crossref=allow_crossref,
+            crossref=crossref,
         )
     except Exception as exc:  # pragma: no cover - defensive network boundary
         structured_log(
@@ -348,31 +390,34 @@ async def _safe_outcome_for_item(
         return _outcome_with_failure(
             item=item,
             failure_reason=FAILURE_RESOLUTION_EXCEPTION,
-            used_crossref=allow_crossref and settings.crossref_enabled,
+            used_crossref=crossref.held,
         )
 
 
+def _max_concurrency() -> int:
+    return max(int(settings.unpaywall_max_concurrency), 1)
+
+
 async def _resolve_outcomes_with_client(
     *,
     client,
     targets: list[PublicationListItem],
     email: str,
 ) -> dict[int, OaResolutionOutcome]:
-    outcomes: dict[int, OaResolutionOutcome] = {}
-    crossref_budget = _crossref_budget_value()
-    crossref_lookups = 0
-    for item in targets:
-        allow_crossref = crossref_budget > 0 and crossref_lookups < crossref_budget
-        outcome = await _safe_outcome_for_item(
-            client=client,
-            item=item,
-            email=email,
-            allow_crossref=allow_crossref,
-        )
-        if outcome.used_crossref:
-            crossref_lookups += 1
-        outcomes[item.publication_id] = outcome
-    return outcomes
+    crossref_budget = _CrossrefBudget(_crossref_budget_value())
+    semaphore = asyncio.Semaphore(_max_concurrency())
+
+    async def _resolve(item: PublicationListItem) -> OaResolutionOutcome:
+        async with semaphore:
+            return await _safe_outcome_for_item(
+                client=client,
+                item=item,
+                email=email,
+                crossref_budget=crossref_budget,
+            )
+
+    resolved = await asyncio.gather(*(_resolve(item) for item in targets))
+    return {item.publication_id: outcome for item, outcome in zip(targets, resolved, strict=True)}
 
 
 async def resolve_publication_oa_metadata(
@@ -395,17 +440,12 @@ async def resolve_publication_oa_outcomes(
     if email is None:
         structured_log(logger, "debug", "unpaywall.resolve_skipped_missing_email")
         return {}
-    import httpx
-
-    timeout_seconds = max(float(settings.unpaywall_timeout_seconds), 0.5)
     targets = _resolution_targets(items)[: max(int(settings.unpaywall_max_items_per_request), 0)]
-    headers = {"User-Agent": f"scholar-scraper/1.0 (mailto:{email})"}
-    async with httpx.AsyncClient(timeout=timeout_seconds, follow_redirects=True, headers=headers) as client:
-        outcomes = await _resolve_outcomes_with_client(
-            client=client,
-            targets=targets,
-            email=email,
-        )
+    outcomes = await _resolve_outcomes_with_client(
+        client=get_http_client(UPSTREAM_UNPAYWALL),
+        targets=targets,
+        email=email,
+    )
     structured_log(
         logger,
         "info",
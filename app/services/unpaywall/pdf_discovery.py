@@ -4,7 +4,11 @@ import re
 from html.parser import HTMLParser
 from urllib.parse import urljoin, urlparse
 
-from app.services.unpaywall.rate_limit import wait_for_unpaywall_slot
+from app.services.unpaywall.rate_limit import (
+    landing_page_crawl_slot,
+    unpaywall_host_slot,
+    wait_for_unpaywall_slot,
+)
 from app.settings import settings
 
 PDF_MIME = "application/pdf"
@@ -108,8 +112,9 @@ def _is_html_response(response) -> bool:
 
 
 async def _fetch_page_html(client, *, page_url: str) -> str | None:
-    await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds)
-    response = await client.get(page_url, follow_redirects=True)
+    async with unpaywall_host_slot(page_url):
+        await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds, url=page_url)
+        response = await client.get(page_url, follow_redirects=True)
     if response.status_code != 200 or not _is_html_response(response):
         return None
     text = response.text or ""
@@ -119,8 +124,9 @@ async def _fetch_page_html(client, *, page_url: str) -> str | None:
 async def _candidate_is_pdf(client, *, candidate_url: str) -> bool:
     if looks_like_pdf_url(candidate_url):
         return True
-    await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds)
-    response = await client.get(candidate_url, follow_redirects=True)
+    async with unpaywall_host_slot(candidate_url):
+        await wait_for_unpaywall_slot(min_interval_seconds=settings.unpaywall_min_interval_seconds, url=candidate_url)
+        response = await client.get(candidate_url, follow_redirects=True)
     content_type = str(response.headers.get("content-type") or "").lower()
     return response.status_code == 200 and PDF_MIME in content_type
 
@@ -143,6 +149,11 @@ async def _resolve_pdf_from_candidate_page(client, *, candidate_url: str) -> str
 async def resolve_pdf_from_landing_page(client, *, page_url: str) -> str | None:
     if not settings.unpaywall_pdf_discovery_enabled:
         return None
+    async with landing_page_crawl_slot():
+        return await _crawl_landing_page(client, page_url=page_url)
+
+
+async def _crawl_landing_page(client, *, page_url: str) -> str | None:
     html = await _fetch_page_html(client, page_url=page_url)
     if not html:
         return None
@@ -1,18 +1,124 @@
+"""Per-host request pacing for Unpaywall API calls and landing-page crawls.
+
+Each host gets its own token bucket (refilled at ``1 / min_interval`` tokens
+per second, holding at most ``UNPAYWALL_RATE_LIMIT_BURST`` tokens) and its own
+concurrency semaphore, so a slow publisher site no longer holds up requests to
+``api.unpaywall.org`` or to other publishers. A process-wide semaphore caps how
+many landing pages are crawled at once.
+"""
+
 from __future__ import annotations
 
 import asyncio
 import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from app import metrics
+from app.settings import settings
+
+UNPAYWALL_API_HOST = "api.unpaywall.org"
+MAX_TRACKED_HOSTS = 512
+
+
+@dataclass
+class _HostLimiter:
+    tokens: float
+    updated_at: float
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    active: int = 0
+
+    def is_idle(self) -> bool:
+        return self.active == 0 and not self.lock.locked()
+
+
+_HOSTS: OrderedDict[str, _HostLimiter] = OrderedDict()
+_landing_crawls: asyncio.Semaphore | None = None
+
+
+def _host_key(url: str | None) -> str:
+    if not url:
+        return UNPAYWALL_API_HOST
+    return (urlparse(url).hostname or "").lower() or UNPAYWALL_API_HOST
 
-_REQUEST_LOCK = asyncio.Lock()
-_LAST_REQUEST_AT = 0.0
 
+def _burst_capacity() -> float:
+    return float(max(int(settings.unpaywall_rate_limit_burst), 1))
 
-async def wait_for_unpaywall_slot(*, min_interval_seconds: float) -> None:
-    global _LAST_REQUEST_AT
+
+def _evict_idle_hosts() -> None:
+    for host in list(_HOSTS):
+        if len(_HOSTS) <= MAX_TRACKED_HOSTS:
+            return
+        if _HOSTS[host].is_idle():
+            del _HOSTS[host]
+
+
+def _limiter_for(url: str | None) -> _HostLimiter:
+    host = _host_key(url)
+    limiter = _HOSTS.get(host)
+    if limiter is None:
+        limiter = _HostLimiter(
+            tokens=_burst_capacity(),
+            updated_at=time.monotonic(),
+            semaphore=asyncio.Semaphore(max(int(settings.unpaywall_per_host_concurrency), 1)),
+        )
+        _HOSTS[host] = limiter
+        _evict_idle_hosts()
+    else:
+        _HOSTS.move_to_end(host)
+    return limiter
+
+
+async def wait_for_unpaywall_slot(*, min_interval_seconds: float, url: str | None = None) -> None:
+    """Take one token from the bucket of ``url``'s host (the API host by default)."""
     interval = max(float(min_interval_seconds), 0.0)
-    async with _REQUEST_LOCK:
-        elapsed = time.monotonic() - _LAST_REQUEST_AT
-        remaining = interval - elapsed
-        if remaining > 0:
-            await asyncio.sleep(remaining)
-        _LAST_REQUEST_AT = time.monotonic()
+    if interval <= 0:
+        return
+    rate = 1.0 / interval
+    limiter = _limiter_for(url)
+    limiter.active += 1
+    try:
+        with metrics.UPSTREAM_SLOT_WAIT_SECONDS.time(upstream="unpaywall"):
+            async with limiter.lock:
+                now = time.monotonic()
+                limiter.tokens = min(_burst_capacity(), limiter.tokens + (now - limiter.updated_at) * rate)
+                limiter.updated_at = now
+                if limiter.tokens < 1.0:
+                    await asyncio.sleep((1.0 - limiter.tokens) / rate)
+                    limiter.tokens = 1.0
+                    limiter.updated_at = time.monotonic()
+                limiter.tokens -= 1.0
+    finally:
+        limiter.active -= 1
+
+
+@asynccontextmanager
+async def unpaywall_host_slot(url: str | None) -> AsyncIterator[None]:
+    """Hold one of the per-host concurrent request slots for ``url``'s host."""
+    limiter = _limiter_for(url)
+    limiter.active += 1
+    try:
+        async with limiter.semaphore:
+            yield
+    finally:
+        limiter.active -= 1
+
+
+@asynccontextmanager
+async def landing_page_crawl_slot() -> AsyncIterator[None]:
+    global _landing_crawls
+    if _landing_crawls is None:
+        _landing_crawls = asyncio.Semaphore(max(int(settings.unpaywall_landing_page_max_concurrency), 1))
+    async with _landing_crawls:
+        yield
+
+
+def reset_unpaywall_rate_limits() -> None:
+    global _landing_crawls
+    _HOSTS.clear()
+    _landing_crawls = None
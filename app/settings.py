@@ -68,6 +68,19 @@ class Settings:
     database_pool_size: int = _env_int("DATABASE_POOL_SIZE", 5)
     database_pool_max_overflow: int = _env_int("DATABASE_POOL_MAX_OVERFLOW", 10)
     database_pool_timeout_seconds: int = _env_int("DATABASE_POOL_TIMEOUT_SECONDS", 30)
+    db_retention_enabled: bool = _env_bool("DB_RETENTION_ENABLED", False)
+    db_retention_interval_hours: int = _env_int("DB_RETENTION_INTERVAL_HOURS", 24)
+    db_retention_batch_size: int = _env_int("DB_RETENTION_BATCH_SIZE", 2000)
+    db_retention_run_days: int = _env_int("DB_RETENTION_RUN_DAYS", 180)
+    db_retention_run_failed_days: int = _env_int("DB_RETENTION_RUN_FAILED_DAYS", 365)
+    db_retention_run_keep_per_user: int = _env_int("DB_RETENTION_RUN_KEEP_PER_USER", 50)
+    db_retention_run_rollups_enabled: bool = _env_bool("DB_RETENTION_RUN_ROLLUPS_ENABLED", True)
+    db_retention_pdf_event_days: int = _env_int("DB_RETENTION_PDF_EVENT_DAYS", 90)
+    db_retention_pdf_event_failed_days: int = _env_int("DB_RETENTION_PDF_EVENT_FAILED_DAYS", 365)
+    db_retention_pdf_event_keep_per_publication: int = _env_int("DB_RETENTION_PDF_EVENT_KEEP_PER_PUBLICATION", 5)
+    db_retention_repair_job_days: int = _env_int("DB_RETENTION_REPAIR_JOB_DAYS", 180)
+    db_retention_repair_job_failed_days: int = _env_int("DB_RETENTION_REPAIR_JOB_FAILED_DAYS", 365)
+    db_retention_repair_job_keep_per_name: int = _env_int("DB_RETENTION_REPAIR_JOB_KEEP_PER_NAME", 20)
     session_secret_key: str = os.getenv("SESSION_SECRET_KEY", "dev-insecure-session-key")
     session_cookie_secure: bool = _env_bool("SESSION_COOKIE_SECURE", False)
     security_headers_enabled: bool = _env_bool("SECURITY_HEADERS_ENABLED", True)
@@ -186,8 +199,25 @@ class Settings:
         "INGESTION_CONTINUATION_MAX_ATTEMPTS",
         6,
     )
+    ingestion_adaptive_schedule_enabled: bool = _env_bool("INGESTION_ADAPTIVE_SCHEDULE_ENABLED", False)
+    ingestion_adaptive_backoff_factor: float = _env_float("INGESTION_ADAPTIVE_BACKOFF_FACTOR", 2.0)
+    ingestion_adaptive_max_interval_minutes: int = _env_int(
+        "INGESTION_ADAPTIVE_MAX_INTERVAL_MINUTES",
+        10_080,
+    )
+    ingestion_page_archive_enabled: bool = _env_bool("INGESTION_PAGE_ARCHIVE_ENABLED", False)
+    ingestion_page_archive_dir: str = _env_str(
+        "INGESTION_PAGE_ARCHIVE_DIR",
+        "/tmp/scholarr_uploads/page_archive",
+    )
+    ingestion_page_archive_retention_days: int = _env_int("INGESTION_PAGE_ARCHIVE_RETENTION_DAYS", 30)
+    ingestion_page_archive_keep_latest: int = _env_int("INGESTION_PAGE_ARCHIVE_KEEP_LATEST", 1)
     scheduler_queue_batch_size: int = _env_int("SCHEDULER_QUEUE_BATCH_SIZE", 10)
     scheduler_pdf_queue_batch_size: int = _env_int("SCHEDULER_PDF_QUEUE_BATCH_SIZE", 15)
+    scheduler_max_concurrent_runs: int = _env_int("SCHEDULER_MAX_CONCURRENT_RUNS", 1)
+    run_events_backend: str = _env_str("RUN_EVENTS_BACKEND", "memory")
+    run_events_replay_buffer_size: int = _env_int("RUN_EVENTS_REPLAY_BUFFER_SIZE", 256)
+    run_events_subscriber_queue_size: int = _env_int("RUN_EVENTS_SUBSCRIBER_QUEUE_SIZE", 256)
     frontend_enabled: bool = _env_bool("FRONTEND_ENABLED", True)
     frontend_dist_dir: str = _env_str("FRONTEND_DIST_DIR", "/app/frontend/dist")
     scholar_image_upload_dir: str = _env_str(
@@ -198,6 +228,8 @@ class Settings:
         "SCHOLAR_IMAGE_UPLOAD_MAX_BYTES",
         2_000_000,
     )
+    portability_job_dir: str = _env_str("PORTABILITY_JOB_DIR", "/tmp/scholarr_uploads/portability")
+    portability_upload_max_bytes: int = _env_int("PORTABILITY_UPLOAD_MAX_BYTES", 512_000_000)
     scholar_name_search_enabled: bool = _env_bool("SCHOLAR_NAME_SEARCH_ENABLED", True)
     scholar_name_search_cache_ttl_seconds: int = _env_int(
         "SCHOLAR_NAME_SEARCH_CACHE_TTL_SECONDS",
@@ -242,12 +274,28 @@ class Settings:
         "en-US,en;q=0.9",
     )
     scholar_http_cookie: str = _env_str("SCHOLAR_HTTP_COOKIE", "")
+    scholar_http_connect_timeout_seconds: float = _env_float("SCHOLAR_HTTP_CONNECT_TIMEOUT_SECONDS", 5.0)
+    scholar_http_read_timeout_seconds: float = _env_float("SCHOLAR_HTTP_READ_TIMEOUT_SECONDS", 20.0)
+    scholar_http_total_timeout_seconds: float = _env_float("SCHOLAR_HTTP_TOTAL_TIMEOUT_SECONDS", 25.0)
+    scholar_http_max_connections: int = _env_int("SCHOLAR_HTTP_MAX_CONNECTIONS", 4)
+    scholar_http_keepalive_expiry_seconds: float = _env_float("SCHOLAR_HTTP_KEEPALIVE_EXPIRY_SECONDS", 60.0)
+    scholar_http_http2_enabled: bool = _env_bool("SCHOLAR_HTTP_HTTP2_ENABLED", True)
+    scholar_parse_executor_enabled: bool = _env_bool("SCHOLAR_PARSE_EXECUTOR_ENABLED", False)
+    scholar_parse_executor_workers: int = _env_int("SCHOLAR_PARSE_EXECUTOR_WORKERS", 2)
+    scholar_parse_executor_max_pending: int = _env_int("SCHOLAR_PARSE_EXECUTOR_MAX_PENDING", 4)
+    scholar_parse_executor_min_body_chars: int = _env_int("SCHOLAR_PARSE_EXECUTOR_MIN_BODY_CHARS", 20_000)
+    publication_counts_cache_ttl_seconds: float = _env_float("PUBLICATION_COUNTS_CACHE_TTL_SECONDS", 0.0)
     unpaywall_enabled: bool = _env_bool("UNPAYWALL_ENABLED", True)
     unpaywall_email: str = _env_str("UNPAYWALL_EMAIL", "")
     unpaywall_timeout_seconds: float = _env_float("UNPAYWALL_TIMEOUT_SECONDS", 4.0)
     unpaywall_min_interval_seconds: float = _env_float("UNPAYWALL_MIN_INTERVAL_SECONDS", 0.6)
     unpaywall_max_items_per_request: int = _env_int("UNPAYWALL_MAX_ITEMS_PER_REQUEST", 20)
     unpaywall_retry_cooldown_seconds: int = _env_int("UNPAYWALL_RETRY_COOLDOWN_SECONDS", 1800)
+    unpaywall_max_concurrency: int = _env_int("UNPAYWALL_MAX_CONCURRENCY", 4)
+    unpaywall_per_host_concurrency: int = _env_int("UNPAYWALL_PER_HOST_CONCURRENCY", 2)
+    unpaywall_rate_limit_burst: int = _env_int("UNPAYWALL_RATE_LIMIT_BURST", 2)
+    unpaywall_landing_page_max_concurrency: int = _env_int("UNPAYWALL_LANDING_PAGE_MAX_CONCURRENCY", 2)
+    unpaywall_http_max_connections: int = _env_int("UNPAYWALL_HTTP_MAX_CONNECTIONS", 16)
     pdf_auto_retry_interval_seconds: int = _env_int(
         "PDF_AUTO_RETRY_INTERVAL_SECONDS",
         86_400,
@@ -262,6 +310,7 @@ class Settings:
     unpaywall_pdf_discovery_max_html_bytes: int = _env_int("UNPAYWALL_PDF_DISCOVERY_MAX_HTML_BYTES", 500_000)
     arxiv_enabled: bool = _env_bool("ARXIV_ENABLED", True)
     arxiv_timeout_seconds: float = _env_float("ARXIV_TIMEOUT_SECONDS", 3.0)
+    arxiv_http_max_connections: int = _env_int("ARXIV_HTTP_MAX_CONNECTIONS", 2)
     arxiv_min_interval_seconds: float = _env_float("ARXIV_MIN_INTERVAL_SECONDS", 4.0)
     arxiv_rate_limit_cooldown_seconds: float = _env_float("ARXIV_RATE_LIMIT_COOLDOWN_SECONDS", 60.0)
     arxiv_default_max_results: int = _env_int("ARXIV_DEFAULT_MAX_RESULTS", 3)
@@ -273,8 +322,12 @@ class Settings:
     crossref_timeout_seconds: float = _env_float("CROSSREF_TIMEOUT_SECONDS", 8.0)
     crossref_min_interval_seconds: float = _env_float("CROSSREF_MIN_INTERVAL_SECONDS", 0.6)
     crossref_max_lookups_per_request: int = _env_int("CROSSREF_MAX_LOOKUPS_PER_REQUEST", 8)
+    identifier_discovery_max_concurrency: int = _env_int("IDENTIFIER_DISCOVERY_MAX_CONCURRENCY", 4)
 
     openalex_api_key: str | None = os.getenv("OPENALEX_API_KEY")
+    openalex_http_max_connections: int = _env_int("OPENALEX_HTTP_MAX_CONNECTIONS", 4)
+    openalex_enrichment_max_concurrency: int = _env_int("OPENALEX_ENRICHMENT_MAX_CONCURRENCY", 4)
+    upstream_http_keepalive_expiry_seconds: float = _env_float("UPSTREAM_HTTP_KEEPALIVE_EXPIRY_SECONDS", 30.0)
     database_reserved_api_connections: int = _env_int("DATABASE_RESERVED_API_CONNECTIONS", 3)
 
     crossref_api_token: str | None = os.getenv("CROSSREF_API_TOKEN")
@@ -117,6 +117,7 @@ export interface TriggerPublicationNearDuplicateRepairPayload {
   max_year_delta?: number;
   max_clusters?: number;
   selected_cluster_keys?: string[];
+  incremental?: boolean;
   requested_by?: string;
   confirmation_text?: string;
 }
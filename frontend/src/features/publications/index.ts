@@ -7,7 +7,8 @@ export type PublicationSortBy =
   | "year"
   | "citations"
   | "scholar"
-  | "pdf_status";
+  | "pdf_status"
+  | "relevance";
 
 export interface DisplayIdentifier {
   kind: string;
@@ -36,6 +37,8 @@ export interface PublicationItem {
   is_favorite: boolean;
   first_seen_at: string;
   is_new_in_latest_run: boolean;
+  // HTML-escaped title with matched search terms wrapped in <mark>; only set when searching.
+  search_snippet?: string | null;
 }
 
 export interface PublicationsResult {
@@ -53,6 +56,8 @@ export interface PublicationsResult {
   snapshot: string;
   has_next: boolean;
   has_prev: boolean;
+  // Opaque keyset cursor for the following page; null on the last page.
+  next_cursor?: string | null;
   publications: PublicationItem[];
 }
 
@@ -66,6 +71,7 @@ export interface PublicationsQuery {
   page?: number;
   pageSize?: number;
   snapshot?: string;
+  cursor?: string;
 }
 
 export interface PublicationSelection {
@@ -103,6 +109,9 @@ export async function listPublications(query: PublicationsQuery = {}): Promise<P
   if (query.snapshot && query.snapshot.trim().length > 0) {
     params.set("snapshot", query.snapshot.trim());
   }
+  if (query.cursor) {
+    params.set("cursor", query.cursor);
+  }
 
   const suffix = params.toString();
   const response = await apiRequest<PublicationsResult>(
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""Measure end-to-end ingestion throughput from a replayed Scholar corpus.
+
+Creates ``--users`` synthetic users who each track the same ``--scholars``
+profiles, then runs ``ScholarIngestionService.run_for_user`` for every user
+against DATABASE_URL with pages served by ``ReplayScholarSource`` and no
+request delay. Without ``--corpus`` a synthetic corpus of scholars x
+``--pages`` pages is generated in a temporary directory. The first user's run
+creates the publications; later runs only link them, as on a shared instance.
+
+Enrichment runs against an in-process OpenAlex stub that echoes every queried
+title back as a work, with arXiv, Crossref and Unpaywall lookups switched off,
+so it times local matching and writes rather than upstream latency.
+Everything runs inside an outer transaction that is rolled back.
+
+Reports scholars/min, SQL statements per fetched page, p50/p95 per phase
+(fetch, parse, dedupe, upsert, enrichment) and the peak RSS of the process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app import metrics
+from app.db.models import RunTriggerType, ScholarProfile, User
+from app.services.ingestion.application import ScholarIngestionService
+from app.services.openalex import client as openalex_client
+from app.services.openalex.types import OpenAlexWork
+from app.services.scholar import parse_executor
+from app.services.scholar.corpus_source import ReplayScholarSource, profile_page_name
+from app.services.scholar.source import DEFAULT_PAGE_SIZE, FetchResult
+from app.settings import settings
+
+# Percentiles are taken over these histograms, keyed by report phase name.
+PHASE_METRICS = {
+    "parse": metrics.SCHOLAR_PARSE_SECONDS.name,
+    "dedupe": metrics.INGESTION_PAGE_DEDUPE_SECONDS.name,
+    "upsert": metrics.INGESTION_PAGE_UPSERT_SECONDS.name,
+    "enrichment": metrics.INGESTION_ENRICHMENT_SECONDS.name,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end ingestion from a replayed corpus.")
+    parser.add_argument("--users", type=int, default=3, help="Synthetic users, each tracking every scholar.")
+    parser.add_argument("--scholars", type=int, default=10, help="Scholars per user.")
+    parser.add_argument("--pages", type=int, default=3, help="Profile pages per synthetic scholar.")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="Rows per synthetic page.")
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        default=None,
+        help="Replay this corpus directory instead of generating one; its first --scholars profiles are used.",
+    )
+    parser.add_argument("--database-url", default=settings.database_url, help="Target database URL.")
+    return parser
+
+
+class _BenchIngestionService(ScholarIngestionService):
+    @staticmethod
+    def _effective_request_delay_seconds(value: int) -> int:
+        # The production floor exists to be polite to Scholar; a replay has no one to be polite to.
+        return 0
+
+
+class _TimedSource:
+    def __init__(self, inner: ReplayScholarSource) -> None:
+        self._inner = inner
+        self.fetch_seconds: list[float] = []
+
+    async def fetch_profile_html(self, scholar_id: str) -> FetchResult:
+        return await self.fetch_profile_page_html(scholar_id, cstart=0, pagesize=DEFAULT_PAGE_SIZE)
+
+    async def fetch_profile_page_html(self, scholar_id: str, *, cstart: int, pagesize: int) -> FetchResult:
+        started = time.perf_counter()
+        result = await self._inner.fetch_profile_page_html(scholar_id, cstart=cstart, pagesize=pagesize)
+        self.fetch_seconds.append(time.perf_counter() - started)
+        return result
+
+    async def fetch_author_search_html(self, query: str, *, start: int) -> FetchResult:
+        return await self._inner.fetch_author_search_html(query, start=start)
+
+
+class _EchoOpenAlexClient:
+    """Answers every title search with one matching work, without network calls."""
+
+    def __init__(self, **_kwargs: Any) -> None:
+        self._next_id = 0
+
+    async def get_works_by_filter(self, filters: dict[str, str], limit: int = 50) -> list[OpenAlexWork]:
+        works: list[OpenAlexWork] = []
+        for title in filters.get("title.search", "").split("|")[:limit]:
+            self._next_id += 1
+            works.append(
+                OpenAlexWork(
+                    openalex_id=f"https://openalex.org/W{self._next_id}",
+                    doi=None,
+                    pmid=None,
+                    pmcid=None,
+                    title=title,
+                    publication_year=None,
+                    cited_by_count=0,
+                    is_oa=False,
+                    oa_url=None,
+                )
+            )
+        return works
+
+
+def _synthetic_page(*, scholar_id: str, page_index: int, pages: int, page_size: int) -> str:
+    first = page_index * page_size
+    rows = []
+    for row in range(first, first + page_size):
+        rows.append(
+            f"""<tr class="gsc_a_tr">
+  <td class="gsc_a_t">
+    <a class="gsc_a_at" href="/citations?view_op=view_citation&amp;citation_for_view={scholar_id}:b{row:05d}"
+    >Synthetic ingestion benchmark paper {scholar_id} number {row}</a>
+    <div class="gs_gray">A Bench, B Bench</div>
+    <div class="gs_gray">Journal of Benchmarks {row % 17}</div>
+  </td>
+  <td class="gsc_a_c"><a class="gsc_a_ac">{row % 50}</a></td>
+  <td class="gsc_a_y"><span class="gsc_a_h">{2000 + row % 25}</span></td>
+</tr>"""
+        )
+    more = "" if page_index + 1 < pages else " disabled"
+    return f"""<html><body>
+<div id="gsc_prf_in">Bench Scholar {scholar_id}</div>
+<table><tbody id="gsc_a_b">
+{"".join(rows)}
+</tbody></table>
+<span id="gsc_a_nn">Articles {first + 1}&ndash;{first + page_size}</span>
+<button id="gsc_bpf_more" class="gs_btn"{more}>Show more</button>
+</body></html>
+"""
+
+
+def _write_synthetic_corpus(corpus_dir: Path, *, scholars: int, pages: int, page_size: int) -> list[str]:
+    scholar_ids = [f"bench{index:07d}" for index in range(scholars)]
+    for scholar_id in scholar_ids:
+        for page_index in range(pages):
+            name = profile_page_name(scholar_id, cstart=page_index * page_size)
+            body = _synthetic_page(scholar_id=scholar_id, page_index=page_index, pages=pages, page_size=page_size)
+            (corpus_dir / name).write_text(body, encoding="utf-8")
+    return scholar_ids
+
+
+def _corpus_scholar_ids(corpus_dir: Path, *, limit: int) -> list[str]:
+    ids = sorted(
+        path.name.removeprefix("profile_").removesuffix(".html")
+        for path in corpus_dir.glob("profile_*.html")
+        if "." not in path.name.removesuffix(".html")
+    )
+    return ids[:limit]
+
+
+def _percentiles(values: list[float]) -> dict[str, Any]:
+    if not values:
+        return {"count": 0, "p50_ms": None, "p95_ms": None}
+    ordered = sorted(values)
+
+    def _rank(fraction: float) -> float:
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    return {
+        "count": len(ordered),
+        "p50_ms": round(_rank(0.50) * 1000, 3),
+        "p95_ms": round(_rank(0.95) * 1000, 3),
+    }
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+async def _seed_users(db_session: AsyncSession, *, users: int, scholar_ids: list[str]) -> list[int]:
+    tag = uuid.uuid4().hex[:10]
+    user_ids: list[int] = []
+    for index in range(users):
+        user = User(email=f"bench-ingest-{tag}-{index}@example.invalid", password_hash="bench")
+        db_session.add(user)
+        await db_session.flush()
+        db_session.add_all([ScholarProfile(user_id=user.id, scholar_id=scholar_id) for scholar_id in scholar_ids])
+        user_ids.append(int(user.id))
+    await db_session.commit()
+    return user_ids
+
+
+async def _ingest(
+    db_session: AsyncSession,
+    *,
+    source: _TimedSource,
+    user_ids: list[int],
+    pages: int,
+    page_size: int,
+) -> dict[str, Any]:
+    service = _BenchIngestionService(source=source)
+    scholars_processed = 0
+    started = time.perf_counter()
+    with metrics.track_db_time() as db_time, metrics.collect_observations() as observed:
+        for user_id in user_ids:
+            summary = await service.run_for_user(
+                db_session,
+                user_id=user_id,
+                trigger_type=RunTriggerType.MANUAL,
+                request_delay_seconds=0,
+                network_error_retries=0,
+                retry_backoff_seconds=0,
+                rate_limit_retries=0,
+                rate_limit_backoff_seconds=0,
+                max_pages_per_scholar=pages,
+                page_size=page_size,
+                auto_queue_continuations=False,
+            )
+            scholars_processed += int(summary.scholar_count)
+    elapsed = time.perf_counter() - started
+    page_count = len(source.fetch_seconds)
+    phases = {"fetch": _percentiles(source.fetch_seconds)}
+    phases.update({phase: _percentiles(observed.get(name, [])) for phase, name in PHASE_METRICS.items()})
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "scholars_processed": scholars_processed,
+        "pages_fetched": page_count,
+        "scholars_per_minute": round(scholars_processed / elapsed * 60, 1) if elapsed else None,
+        "db_statements": db_time.statements,
+        "db_seconds": round(db_time.seconds, 3),
+        "db_statements_per_page": round(db_time.statements / page_count, 1) if page_count else None,
+        "phases": phases,
+    }
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    users = max(int(args.users), 1)
+    pages = max(int(args.pages), 1)
+    page_size = max(int(args.page_size), 1)
+    with tempfile.TemporaryDirectory(prefix="scholarr-bench-corpus-") as temp_dir:
+        if args.corpus is not None:
+            corpus_dir = args.corpus
+            scholar_ids = _corpus_scholar_ids(corpus_dir, limit=max(int(args.scholars), 1))
+        else:
+            corpus_dir = Path(temp_dir)
+            scholar_ids = _write_synthetic_corpus(
+                corpus_dir, scholars=max(int(args.scholars), 1), pages=pages, page_size=page_size
+            )
+        if not scholar_ids:
+            raise RuntimeError(f"No profile_<scholar_id>.html pages found in {corpus_dir}.")
+        source = _TimedSource(ReplayScholarSource(corpus_dir))
+
+        for flag in ("arxiv_enabled", "crossref_enabled", "unpaywall_enabled"):
+            object.__setattr__(settings, flag, False)
+        openalex_client.OpenAlexClient = _EchoOpenAlexClient  # type: ignore[misc,assignment]
+
+        engine = create_async_engine(args.database_url)
+        metrics.instrument_engine(engine.sync_engine)
+        await parse_executor.start_parse_executor()
+        try:
+            async with engine.connect() as connection:
+                outer = await connection.begin()
+                db_session = AsyncSession(
+                    bind=connection,
+                    expire_on_commit=False,
+                    join_transaction_mode="create_savepoint",
+                )
+                try:
+                    user_ids = await _seed_users(db_session, users=users, scholar_ids=scholar_ids)
+                    result = await _ingest(
+                        db_session,
+                        source=source,
+                        user_ids=user_ids,
+                        pages=pages,
+                        page_size=page_size,
+                    )
+                finally:
+                    await db_session.close()
+                    await outer.rollback()
+        finally:
+            await parse_executor.stop_parse_executor()
+            await engine.dispose()
+    return {
+        "users": users,
+        "scholars_per_user": len(scholar_ids),
+        "pages_per_scholar": pages,
+        "page_size": page_size,
+        "corpus": str(args.corpus) if args.corpus is not None else "synthetic",
+        "parse_executor_enabled": bool(settings.scholar_parse_executor_enabled),
+        **result,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    try:
+        report = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Compare near-duplicate candidate generation strategies on synthetic titles.
+
+``baseline`` is the previous whole-token inverted index: every title is
+verified against every peer that shares any token. ``prefix`` is the current
+``_cluster_candidate_groups``, which probes only each title's rarest prefix
+tokens. Both feed the same ``_is_near_duplicate_pair`` verifier, and the
+report says whether their groupings match.
+
+The baseline grows roughly quadratically with common tokens (about half an
+hour at 100k titles), so it only runs up to ``--baseline-max-titles``; raise
+the limit to time it at 100k/500k as well.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from app.services.publications import dedup
+from app.services.publications.dedup import _NearDuplicateCandidate
+
+DEFAULT_SIZES = "10000,100000,500000"
+COMMON_WORDS = ("learning", "network", "neural", "deep", "analysis", "model", "data", "system")
+GroupFn = Callable[..., list[list[_NearDuplicateCandidate]]]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate candidate generation.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated title counts.")
+    parser.add_argument("--baseline-max-titles", type=int, default=10_000, help="Skip the baseline above this.")
+    parser.add_argument("--vocabulary", type=int, default=50_000, help="Distinct rare words in the corpus.")
+    parser.add_argument("--duplicate-rate", type=float, default=0.05, help="Share of titles that are near-dups.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser
+
+
+def _synthetic_candidates(count: int, *, vocabulary: int, duplicate_rate: float, seed: int) -> list[Any]:
+    rng = random.Random(seed)
+    words = [f"w{index}" for index in range(max(vocabulary, 1))]
+    cum_weights = list(itertools.accumulate(1.0 / rank for rank in range(1, len(words) + 1)))
+    candidates: list[_NearDuplicateCandidate] = []
+    titles: list[str] = []
+    for publication_id in range(1, count + 1):
+        if titles and rng.random() < duplicate_rate:
+            tokens = rng.choice(titles).split()
+            tokens[rng.randrange(len(tokens))] = rng.choice(words)
+            title = " ".join(tokens)
+        else:
+            size = rng.randint(4, 14)
+            # A few very common words plus a Zipf-distributed vocabulary tail.
+            chosen = rng.sample(COMMON_WORDS, k=rng.randint(1, 3))
+            chosen += rng.choices(words, cum_weights=cum_weights, k=size)
+            title = " ".join(chosen)
+        titles.append(title)
+        candidate = dedup._candidate_from_row(
+            publication_id=publication_id,
+            title=title,
+            year=rng.randint(2000, 2025),
+            citation_count=rng.randint(0, 500),
+        )
+        if candidate is not None:
+            candidates.append(candidate)
+    return candidates
+
+
+def _baseline_groups(
+    candidates: list[_NearDuplicateCandidate],
+    *,
+    similarity_threshold: float,
+    min_shared_tokens: int,
+    max_year_delta: int,
+) -> list[list[_NearDuplicateCandidate]]:
+    by_id = {candidate.publication_id: candidate for candidate in candidates}
+    token_index: dict[str, set[int]] = {}
+    for candidate in candidates:
+        for token in candidate.tokens:
+            token_index.setdefault(token, set()).add(candidate.publication_id)
+    parent = {candidate.publication_id: candidate.publication_id for candidate in candidates}
+    for candidate in candidates:
+        peers: set[int] = set()
+        for token in candidate.tokens:
+            peers.update(token_index.get(token, set()))
+        for peer_id in sorted(peers):
+            if peer_id <= candidate.publication_id:
+                continue
+            if dedup._is_near_duplicate_pair(
+                candidate,
+                by_id[peer_id],
+                similarity_threshold=similarity_threshold,
+                min_shared_tokens=min_shared_tokens,
+                max_year_delta=max_year_delta,
+            ):
+                dedup._union(parent, candidate.publication_id, peer_id)
+    return dedup._grouped_candidates(candidates, parent)
+
+
+def _measure(group_fn: GroupFn, candidates: list[_NearDuplicateCandidate]) -> tuple[dict[str, Any], list[list[int]]]:
+    thresholds = {
+        "similarity_threshold": dedup.NEAR_DUP_DEFAULT_SIMILARITY_THRESHOLD,
+        "min_shared_tokens": dedup.NEAR_DUP_DEFAULT_MIN_SHARED_TOKENS,
+        "max_year_delta": dedup.NEAR_DUP_DEFAULT_MAX_YEAR_DELTA,
+    }
+    started = time.perf_counter()
+    groups = group_fn(candidates, **thresholds)
+    seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        group_fn(candidates, **thresholds)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    grouping = sorted([member.publication_id for member in group] for group in groups)
+    return {"seconds": round(seconds, 3), "peak_memory_bytes": peak, "clusters": len(groups)}, grouping
+
+
+def _bench_size(count: int, args: argparse.Namespace) -> dict[str, Any]:
+    candidates = _synthetic_candidates(
+        count,
+        vocabulary=args.vocabulary,
+        duplicate_rate=args.duplicate_rate,
+        seed=args.seed,
+    )
+    prefix, prefix_grouping = _measure(dedup._cluster_candidate_groups, candidates)
+    report: dict[str, Any] = {"titles": count, "candidates": len(candidates), "prefix": prefix}
+    if count > args.baseline_max_titles:
+        report["baseline"] = "skipped"
+        return report
+    baseline, baseline_grouping = _measure(_baseline_groups, candidates)
+    report["baseline"] = baseline
+    report["groupings_match"] = baseline_grouping == prefix_grouping
+    if prefix["seconds"] > 0:
+        report["speedup"] = round(baseline["seconds"] / prefix["seconds"], 2)
+    return report
+
+
+def _run(args: argparse.Namespace) -> dict[str, Any]:
+    sizes = [int(value) for value in str(args.sizes).split(",") if value.strip()]
+    if not sizes:
+        raise ValueError("--sizes must list at least one title count.")
+    results = [_bench_size(count, args) for count in sizes]
+    mismatched = [item["titles"] for item in results if item.get("groupings_match") is False]
+    return {"status": "failed" if mismatched else "ok", "mismatched_sizes": mismatched, "results": results}
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    try:
+        report = _run(args)
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0 if report["status"] == "ok" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Compare the buffered JSON export with the streamed NDJSON export.
+
+Seeds one user with ``--publications`` linked rows inside an outer transaction
+that is rolled back, then measures wall time and time to first byte for
+``export_user_data`` + ``json.dumps`` versus draining ``iter_user_export_ndjson``
+(optionally through gzip). Peak Python heap comes from a second, ``tracemalloc``
+traced pass so tracing overhead does not skew the timings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+import uuid
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.models import ScholarProfile, User
+from app.services.portability import export_user_data, gzip_chunks, iter_user_export_ndjson
+from app.settings import settings
+
+_SEED_SQL = """
+WITH inserted AS (
+    INSERT INTO publications (
+        fingerprint_sha256, title_raw, title_normalized, venue_text, author_text, year, citation_count, pub_url
+    )
+    SELECT
+        md5(:tag || 'a' || i) || md5(:tag || 'b' || i),
+        'Synthetic export publication number ' || i || ' about sparse spectral methods',
+        'syntheticexportpublicationnumber' || i,
+        'Journal of Benchmarks ' || (i % 211),
+        'Author ' || (i % 997) || ', Coauthor ' || (i % 89) || ', Third Author ' || (i % 13),
+        1990 + i % 35,
+        i % 500,
+        'https://scholar.google.com/citations?view_op=view_citation&citation_for_view=' || md5(:tag || i)
+    FROM generate_series(1, :count) AS i
+    RETURNING id
+)
+INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
+SELECT (CAST(:scholar_ids AS integer[]))[1 + inserted.id % :scholar_count], inserted.id, inserted.id % 3 = 0
+FROM inserted
+"""
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark buffered vs. streamed portability export.")
+    parser.add_argument("--publications", type=int, default=100_000, help="Synthetic library size.")
+    parser.add_argument("--scholars", type=int, default=20, help="Scholars the library is spread across.")
+    parser.add_argument("--database-url", default=settings.database_url, help="Target database URL.")
+    return parser
+
+
+async def _seed(db_session: AsyncSession, *, publications: int, scholars: int) -> int:
+    tag = uuid.uuid4().hex[:10]
+    user = User(email=f"bench-export-{tag}@example.invalid", password_hash="bench")
+    db_session.add(user)
+    await db_session.flush()
+    profiles = [
+        ScholarProfile(user_id=user.id, scholar_id=f"bench{tag}{index}", display_name=f"Bench Scholar {index}")
+        for index in range(max(scholars, 1))
+    ]
+    db_session.add_all(profiles)
+    await db_session.flush()
+    await db_session.execute(
+        text(_SEED_SQL),
+        {
+            "tag": tag,
+            "count": publications,
+            "scholar_ids": [profile.id for profile in profiles],
+            "scholar_count": len(profiles),
+        },
+    )
+    await db_session.execute(text("ANALYZE scholar_publications"))
+    user_id = int(user.id)
+    db_session.expunge_all()
+    return user_id
+
+
+def _report(*, started: float, first_byte: float, output_bytes: int) -> dict[str, Any]:
+    return {
+        "seconds": round(time.perf_counter() - started, 3),
+        "first_byte_ms": round((first_byte - started) * 1000.0, 1),
+        "output_bytes": output_bytes,
+    }
+
+
+async def _buffered_json(db_session: AsyncSession, *, user_id: int) -> dict[str, Any]:
+    started = time.perf_counter()
+    data = await export_user_data(db_session, user_id=user_id)
+    body = json.dumps({"data": data}).encode()
+    first_byte = time.perf_counter()
+    return _report(started=started, first_byte=first_byte, output_bytes=len(body))
+
+
+async def _streamed_ndjson(db_session: AsyncSession, *, user_id: int, compress: bool = False) -> dict[str, Any]:
+    started = time.perf_counter()
+    first_byte: float | None = None
+    output_bytes = 0
+    chunks = iter_user_export_ndjson(db_session, user_id=user_id)
+    if compress:
+        chunks = gzip_chunks(chunks)
+    async for chunk in chunks:
+        if first_byte is None:
+            first_byte = time.perf_counter()
+        output_bytes += len(chunk)
+    return _report(started=started, first_byte=first_byte or time.perf_counter(), output_bytes=output_bytes)
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    engine = create_async_engine(args.database_url)
+    report: dict[str, Any] = {"publications": args.publications}
+    try:
+        async with engine.connect() as connection:
+            outer = await connection.begin()
+            db_session = AsyncSession(
+                bind=connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            try:
+                user_id = await _seed(db_session, publications=args.publications, scholars=args.scholars)
+                for name, measure, options in (
+                    ("buffered_json", _buffered_json, {}),
+                    ("ndjson", _streamed_ndjson, {}),
+                    ("ndjson_gzip", _streamed_ndjson, {"compress": True}),
+                ):
+                    report[name] = await measure(db_session, user_id=user_id, **options)
+                    db_session.expunge_all()
+                    tracemalloc.start()
+                    await measure(db_session, user_id=user_id, **options)
+                    report[name]["peak_heap_mb"] = round(tracemalloc.get_traced_memory()[1] / 1_000_000, 1)
+                    tracemalloc.stop()
+                    db_session.expunge_all()
+            finally:
+                await db_session.close()
+                await outer.rollback()
+    finally:
+        await engine.dispose()
+    return report
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    try:
+        report = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
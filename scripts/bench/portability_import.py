@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Time portability import of a synthetic export payload.
+
+Builds ``--publications`` entries spread over ``--scholars`` scholars, then
+inside an outer transaction that is rolled back imports them into an empty
+account (every publication and link created) and imports the same payload
+again (every entry resolved to an existing publication, nothing changed).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.models import User
+from app.services.portability import import_user_data
+from app.settings import settings
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark portability import.")
+    parser.add_argument("--publications", type=int, default=20_000, help="Publication entries in the payload.")
+    parser.add_argument("--scholars", type=int, default=20, help="Scholars the entries are spread across.")
+    parser.add_argument("--database-url", default=settings.database_url, help="Target database URL.")
+    return parser
+
+
+def _payload(*, tag: str, publications: int, scholars: int) -> dict[str, list[dict[str, Any]]]:
+    scholar_ids = [f"bench{tag[:5]}{index:02d}" for index in range(max(scholars, 1))]
+    return {
+        "scholars": [
+            {"scholar_id": scholar_id, "display_name": f"Bench Scholar {index}", "is_enabled": True}
+            for index, scholar_id in enumerate(scholar_ids)
+        ],
+        "publications": [
+            {
+                "scholar_id": scholar_ids[index % len(scholar_ids)],
+                "cluster_id": f"{tag}{index}" if index % 2 == 0 else None,
+                "title": f"Synthetic import publication {tag} number {index}",
+                "year": 1990 + index % 35,
+                "citation_count": index % 500,
+                "author_text": f"Author {index % 997}, Coauthor {index % 89}",
+                "venue_text": f"Journal of Benchmarks {index % 211}",
+                "pub_url": None,
+                "pdf_url": None,
+                "is_read": index % 3 == 0,
+            }
+            for index in range(publications)
+        ],
+    }
+
+
+async def _timed_import(db_session: AsyncSession, *, user_id: int, payload: dict[str, Any]) -> dict[str, Any]:
+    started = time.perf_counter()
+    counters = await import_user_data(db_session, user_id=user_id, **payload)
+    seconds = time.perf_counter() - started
+    return {
+        "seconds": round(seconds, 2),
+        "entries_per_second": round(len(payload["publications"]) / max(seconds, 1e-9), 1),
+        "counters": counters,
+    }
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    engine = create_async_engine(args.database_url)
+    tag = uuid.uuid4().hex[:10]
+    payload = _payload(tag=tag, publications=args.publications, scholars=args.scholars)
+    report: dict[str, Any] = {"publications": args.publications, "scholars": args.scholars}
+    try:
+        async with engine.connect() as connection:
+            outer = await connection.begin()
+            db_session = AsyncSession(
+                bind=connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            try:
+                user = User(email=f"bench-import-{tag}@example.invalid", password_hash="bench")
+                db_session.add(user)
+                await db_session.flush()
+                report["fresh_import"] = await _timed_import(db_session, user_id=int(user.id), payload=payload)
+                db_session.expunge_all()
+                report["repeat_import"] = await _timed_import(db_session, user_id=int(user.id), payload=payload)
+            finally:
+                await db_session.close()
+                await outer.rollback()
+    finally:
+        await engine.dispose()
+    return report
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    try:
+        report = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Time publication search: leading-wildcard ILIKE vs. the full-text index.
+
+Seeds a synthetic library (one user, a few scholars, ``--publications`` rows)
+inside an outer transaction that is rolled back, then times the search list
+page plus its count for each term with the legacy ``%term%`` predicate and
+with the ``search_vector`` tsquery predicate. The report also records whether
+the full-text plan touches ``ix_publications_search_vector``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import distinct, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.models import Publication, ScholarProfile, ScholarPublication, User
+from app.services.publications.queries import publications_query
+from app.services.publications.search import publication_search_clause
+from app.settings import settings
+
+_WORDS = [
+    "graph",
+    "neural",
+    "protein",
+    "quantum",
+    "learning",
+    "bayesian",
+    "sparse",
+    "kernel",
+    "climate",
+    "genome",
+    "robust",
+    "causal",
+    "spectral",
+    "transformer",
+    "lattice",
+    "stochastic",
+]
+
+_SEED_SQL = """
+WITH inserted AS (
+    INSERT INTO publications (
+        fingerprint_sha256, title_raw, title_normalized, venue_text, author_text, year, citation_count
+    )
+    SELECT
+        md5(:tag || 'a' || i) || md5(:tag || 'b' || i),
+        t.title,
+        lower(t.title),
+        'Journal of ' || initcap(w.words[1 + (i * 5) % cardinality(w.words)]),
+        'Author ' || (i % 997) || ', Coauthor ' || (i % 89),
+        1990 + i % 35,
+        i % 500
+    FROM generate_series(1, :count) AS i
+    CROSS JOIN (SELECT CAST(:words AS text[]) AS words) AS w
+    CROSS JOIN LATERAL (
+        SELECT initcap(w.words[1 + i % cardinality(w.words)]) || ' '
+            || w.words[1 + (i / 7) % cardinality(w.words)] || ' methods for '
+            || w.words[1 + (i / 53) % cardinality(w.words)] || ' study ' || i AS title
+    ) AS t
+    RETURNING id
+)
+INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
+SELECT (CAST(:scholar_ids AS integer[]))[1 + inserted.id % :scholar_count], inserted.id, false
+FROM inserted
+"""
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark publication search predicates.")
+    parser.add_argument("--publications", type=int, default=100_000, help="Synthetic library size.")
+    parser.add_argument("--scholars", type=int, default=20, help="Scholars the library is spread across.")
+    parser.add_argument(
+        "--terms",
+        default="quantum,graph neural,genom,study 4242,nonexistentterm",
+        help="Comma-separated search strings.",
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per term and predicate.")
+    parser.add_argument("--page-size", type=int, default=50, help="List page size.")
+    parser.add_argument("--database-url", default=settings.database_url, help="Target database URL.")
+    return parser
+
+
+def _legacy_search_clause(search: str):
+    safe_search = search.replace("%", r"\%").replace("_", r"\_")
+    pattern = f"%{safe_search}%"
+    return (
+        Publication.title_raw.ilike(pattern)
+        | ScholarProfile.display_name.ilike(pattern)
+        | Publication.venue_text.ilike(pattern)
+    )
+
+
+def _search_count(*, user_id: int, clause: Any) -> Any:
+    return (
+        select(func.count(distinct(ScholarPublication.publication_id)))
+        .select_from(ScholarPublication)
+        .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .join(Publication, Publication.id == ScholarPublication.publication_id)
+        .where(ScholarProfile.user_id == user_id, clause)
+    )
+
+
+def _legacy_statements(*, user_id: int, search: str, page_size: int) -> list[Any]:
+    page = publications_query(
+        user_id=user_id,
+        mode="all",
+        latest_run_id=None,
+        scholar_profile_id=None,
+        favorite_only=False,
+        limit=page_size,
+    ).where(_legacy_search_clause(search))
+    return [page, _search_count(user_id=user_id, clause=_legacy_search_clause(search))]
+
+
+def _full_text_statements(*, user_id: int, search: str, page_size: int) -> list[Any]:
+    page = publications_query(
+        user_id=user_id,
+        mode="all",
+        latest_run_id=None,
+        scholar_profile_id=None,
+        favorite_only=False,
+        search=search,
+        limit=page_size,
+    )
+    return [page, _search_count(user_id=user_id, clause=publication_search_clause(search))]
+
+
+async def _seed(db_session: AsyncSession, *, publications: int, scholars: int) -> int:
+    tag = uuid.uuid4().hex[:10]
+    user = User(email=f"bench-search-{tag}@example.invalid", password_hash="bench")
+    db_session.add(user)
+    await db_session.flush()
+    profiles = [
+        ScholarProfile(user_id=user.id, scholar_id=f"bench{tag}{index}", display_name=f"Bench Scholar {index}")
+        for index in range(max(scholars, 1))
+    ]
+    db_session.add_all(profiles)
+    await db_session.flush()
+    await db_session.execute(
+        text(_SEED_SQL),
+        {
+            "tag": tag,
+            "count": publications,
+            "words": _WORDS,
+            "scholar_ids": [profile.id for profile in profiles],
+            "scholar_count": len(profiles),
+        },
+    )
+    for table in ("scholar_profiles", "publications", "scholar_publications"):
+        await db_session.execute(text(f"ANALYZE {table}"))
+    return int(user.id)
+
+
+async def _time_statements(db_session: AsyncSession, statements: list[Any], *, repeats: int) -> dict[str, Any]:
+    samples: list[float] = []
+    for _ in range(max(repeats, 1)):
+        started = time.perf_counter()
+        for statement in statements:
+            (await db_session.execute(statement)).all()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+    }
+
+
+async def _uses_search_index(db_session: AsyncSession, statement: Any) -> bool:
+    compiled = statement.compile(
+        dialect=db_session.bind.dialect,  # type: ignore[union-attr]
+        compile_kwargs={"literal_binds": True},
+    )
+    plan = (await db_session.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+    return any("ix_publications_search_vector" in line for line in plan)
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    engine = create_async_engine(args.database_url)
+    terms = [term.strip() for term in str(args.terms).split(",") if term.strip()]
+    report: dict[str, Any] = {"publications": args.publications, "page_size": args.page_size, "terms": {}}
+    try:
+        async with engine.connect() as connection:
+            outer = await connection.begin()
+            db_session = AsyncSession(
+                bind=connection,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            try:
+                started = time.perf_counter()
+                user_id = await _seed(db_session, publications=args.publications, scholars=args.scholars)
+                report["seed_seconds"] = round(time.perf_counter() - started, 2)
+                for term in terms:
+                    legacy = _legacy_statements(user_id=user_id, search=term, page_size=args.page_size)
+                    full_text = _full_text_statements(user_id=user_id, search=term, page_size=args.page_size)
+                    legacy_result = await _time_statements(db_session, legacy, repeats=args.repeats)
+                    full_text_result = await _time_statements(db_session, full_text, repeats=args.repeats)
+                    full_text_result["uses_search_index"] = await _uses_search_index(db_session, full_text[0])
+                    total = (await db_session.execute(full_text[1])).scalar_one()
+                    report["terms"][term] = {
+                        "full_text_matches": int(total),
+                        "legacy_ilike": legacy_result,
+                        "full_text": full_text_result,
+                        "speedup": round(legacy_result["median_ms"] / max(full_text_result["median_ms"], 0.01), 2),
+                    }
+            finally:
+                await db_session.close()
+                await outer.rollback()
+    finally:
+        await engine.dispose()
+    return report
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    try:
+        report = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
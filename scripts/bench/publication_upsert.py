@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Count database round trips per scraped profile page.
+
+Compares the legacy per-candidate resolution loop with the batched
+``upsert_profile_publications`` path against the configured DATABASE_URL.
+Everything runs inside an outer transaction that is rolled back, so the
+target database is left untouched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.models import (
+    CrawlRun,
+    Publication,
+    RunStatus,
+    RunTriggerType,
+    ScholarProfile,
+    ScholarPublication,
+    User,
+)
+from app.services.ingestion.fingerprints import build_publication_fingerprint
+from app.services.ingestion.publication_upsert import (
+    build_new_publication,
+    candidate_keys,
+    update_existing_publication,
+    upsert_profile_publications,
+)
+from app.services.publication_identifiers import application as identifier_service
+from app.services.scholar.parser_types import PublicationCandidate
+from app.settings import settings
+
+UpsertFn = Callable[..., Awaitable[int]]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark publication upsert round trips per page.")
+    parser.add_argument("--page-size", type=int, default=100, help="Candidates per synthetic page.")
+    parser.add_argument("--database-url", default=settings.database_url, help="Target database URL.")
+    return parser
+
+
+def _synthetic_page(*, tag: str, page_size: int) -> list[PublicationCandidate]:
+    return [
+        PublicationCandidate(
+            title=f"Synthetic benchmark publication {tag} number {index}",
+            title_url=f"/citations?view_op=view_citation&citation_for_view=bench:{tag}{index}",
+            cluster_id=f"bench-{tag}-{index}" if index % 4 else None,
+            year=2000 + index % 25,
+            citation_count=index,
+            authors_text="A Bench, B Bench",
+            venue_text="Journal of Benchmarks",
+            pdf_url=None,
+        )
+        for index in range(page_size)
+    ]
+
+
+async def _legacy_upsert(
+    db_session: AsyncSession,
+    *,
+    run: CrawlRun,
+    scholar: ScholarProfile,
+    publications: list[PublicationCandidate],
+) -> int:
+    """Per-candidate resolution as implemented before batching, kept for comparison."""
+    discovered = 0
+    seen_ids: set[int] = set()
+    for candidate in publications:
+        keys = candidate_keys(candidate)
+        publication = None
+        if candidate.cluster_id:
+            result = await db_session.execute(select(Publication).where(Publication.cluster_id == keys.cluster_id))
+            publication = result.scalar_one_or_none()
+        result = await db_session.execute(
+            select(Publication).where(Publication.fingerprint_sha256 == build_publication_fingerprint(candidate))
+        )
+        publication = publication or result.scalar_one_or_none()
+        if publication is None:
+            result = await db_session.execute(
+                select(Publication).where(Publication.canonical_title_hash == keys.canonical_title_hash).limit(1)
+            )
+            publication = result.scalar_one_or_none()
+        if publication is None:
+            publication = build_new_publication(candidate=candidate, keys=keys)
+            db_session.add(publication)
+            await db_session.flush()
+        else:
+            update_existing_publication(publication=publication, candidate=candidate)
+        await identifier_service.sync_identifiers_for_publication_fields(db_session, publication=publication)
+        if publication.id in seen_ids:
+            continue
+        seen_ids.add(publication.id)
+        link = await db_session.execute(
+            select(ScholarPublication).where(
+                ScholarPublication.scholar_profile_id == scholar.id,
+                ScholarPublication.publication_id == publication.id,
+            )
+        )
+        if link.scalar_one_or_none() is not None:
+            continue
+        db_session.add(
+            ScholarPublication(
+                scholar_profile_id=scholar.id,
+                publication_id=publication.id,
+                is_read=False,
+                first_seen_run_id=run.id,
+            )
+        )
+        discovered += 1
+        run.new_pub_count = int(run.new_pub_count or 0) + 1
+        await db_session.flush()
+    await db_session.commit()
+    return discovered
+
+
+async def _measure(
+    db_session: AsyncSession,
+    *,
+    counter: dict[str, int],
+    upsert_fn: UpsertFn,
+    run: CrawlRun,
+    scholar: ScholarProfile,
+    page: list[PublicationCandidate],
+) -> dict[str, Any]:
+    counter["statements"] = 0
+    started = time.perf_counter()
+    discovered = await upsert_fn(db_session, run=run, scholar=scholar, publications=page)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    return {
+        "round_trips": counter["statements"],
+        "elapsed_ms": round(elapsed_ms, 2),
+        "discovered": discovered,
+    }
+
+
+async def _bench_mode(
+    db_session: AsyncSession,
+    *,
+    counter: dict[str, int],
+    upsert_fn: UpsertFn,
+    page_size: int,
+) -> dict[str, Any]:
+    tag = uuid.uuid4().hex[:10]
+    user = User(email=f"bench-{tag}@example.invalid", password_hash="bench")
+    db_session.add(user)
+    await db_session.flush()
+    scholar = ScholarProfile(user_id=user.id, scholar_id=f"bench{tag}")
+    run = CrawlRun(user_id=user.id, trigger_type=RunTriggerType.MANUAL, status=RunStatus.RUNNING)
+    db_session.add_all([scholar, run])
+    await db_session.commit()
+
+    page = _synthetic_page(tag=tag, page_size=page_size)
+    first_crawl = await _measure(db_session, counter=counter, upsert_fn=upsert_fn, run=run, scholar=scholar, page=page)
+    recrawl = await _measure(db_session, counter=counter, upsert_fn=upsert_fn, run=run, scholar=scholar, page=page)
+    return {"first_crawl_page": first_crawl, "recrawl_page": recrawl}
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    engine = create_async_engine(args.database_url)
+    counter = {"statements": 0}
+
+    def _count(*_args: Any, **_kwargs: Any) -> None:
+        counter["statements"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    report: dict[str, Any] = {"page_size": args.page_size}
+    try:
+        for label, upsert_fn in (("legacy_per_row", _legacy_upsert), ("batched", upsert_profile_publications)):
+            async with engine.connect() as connection:
+                outer = await connection.begin()
+                db_session = AsyncSession(
+                    bind=connection,
+                    expire_on_commit=False,
+                    join_transaction_mode="create_savepoint",
+                )
+                try:
+                    report[label] = await _bench_mode(
+                        db_session,
+                        counter=counter,
+                        upsert_fn=upsert_fn,
+                        page_size=args.page_size,
+                    )
+                finally:
+                    await db_session.close()
+                    await outer.rollback()
+    finally:
+        await engine.dispose()
+    return report
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    try:
+        report = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Measure Scholar profile page parse throughput and peak memory.
+
+Parses every HTML fixture under ``tests/fixtures/scholar`` (or ``--fixtures``)
+with ``parse_profile_page`` and reports pages/sec, per-page latency and the
+peak traced allocation of a single parse. Parsing runs on the ingestion event
+loop, so this is the CPU budget each fetched page costs the loop.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from app.services.scholar.parser import ScholarParserError, parse_profile_page
+from app.services.scholar.source import FetchResult
+
+DEFAULT_FIXTURES_DIR = Path("tests/fixtures/scholar")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark Scholar profile page parsing.")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES_DIR, help="Directory of profile HTML.")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed parses per fixture.")
+    return parser
+
+
+def _fetch_result(path: Path) -> FetchResult:
+    url = f"https://scholar.google.com/citations?hl=en&user={path.stem.rsplit('_', 1)[-1]}"
+    return FetchResult(
+        requested_url=url,
+        status_code=200,
+        final_url=url,
+        body=path.read_text(encoding="utf-8"),
+        error=None,
+    )
+
+
+def _parse(fetch_result: FetchResult) -> str:
+    try:
+        return parse_profile_page(fetch_result).state.value
+    except ScholarParserError as exc:
+        return exc.code
+
+
+def _peak_bytes(fetch_result: FetchResult) -> int:
+    tracemalloc.start()
+    try:
+        _parse(fetch_result)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _bench_fixture(path: Path, *, iterations: int) -> dict[str, Any]:
+    fetch_result = _fetch_result(path)
+    state = _parse(fetch_result)
+    timings: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        _parse(fetch_result)
+        timings.append(time.perf_counter() - started)
+    return {
+        "fixture": str(path),
+        "bytes": len(fetch_result.body.encode("utf-8")),
+        "state": state,
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3),
+        "peak_memory_bytes": _peak_bytes(fetch_result),
+        "total_seconds": sum(timings),
+    }
+
+
+def _run(args: argparse.Namespace) -> dict[str, Any]:
+    paths = sorted(args.fixtures.rglob("*.html"))
+    if not paths:
+        raise ValueError(f"No HTML fixtures found under {args.fixtures}.")
+    iterations = max(int(args.iterations), 1)
+    fixtures = [_bench_fixture(path, iterations=iterations) for path in paths]
+    total_seconds = sum(item.pop("total_seconds") for item in fixtures)
+    pages = len(fixtures) * iterations
+    return {
+        "status": "ok",
+        "pages": pages,
+        "pages_per_second": round(pages / total_seconds, 2) if total_seconds > 0 else None,
+        "peak_memory_bytes": max(item["peak_memory_bytes"] for item in fixtures),
+        "fixtures": fixtures,
+    }
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    try:
+        report = _run(args)
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
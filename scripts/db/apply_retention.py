@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+from app.db.session import get_session_factory
+from app.services.dbops import run_db_retention
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Delete run history, PDF job events, finished jobs and expired cache entries past retention.",
+    )
+    parser.add_argument("--apply", action="store_true", help="Delete expired rows. Default is dry-run (count only).")
+    parser.add_argument(
+        "--no-rollups",
+        action="store_true",
+        help="Do not add deleted crawl runs to crawl_run_rollups (overrides DB_RETENTION_RUN_ROLLUPS_ENABLED).",
+    )
+    parser.add_argument(
+        "--requested-by",
+        default="",
+        help="Operator identifier for audit logs (email/name/ticket).",
+    )
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    session_factory = get_session_factory()
+    async with session_factory() as db_session:
+        return await run_db_retention(
+            db_session,
+            dry_run=not args.apply,
+            requested_by=args.requested_by,
+            roll_up_runs=False if args.no_rollups else None,
+        )
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    try:
+        result = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
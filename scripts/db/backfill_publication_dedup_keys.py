@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+from app.db.session import get_session_factory
+from app.services.dbops import run_publication_dedup_key_backfill
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Store precomputed near-duplicate title keys on publications missing them.",
+    )
+    parser.add_argument("--apply", action="store_true", help="Write keys. Default is dry-run (count only).")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Publications updated per batch.")
+    parser.add_argument(
+        "--requested-by",
+        default="",
+        help="Operator identifier for audit logs (email/name/ticket).",
+    )
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    session_factory = get_session_factory()
+    async with session_factory() as db_session:
+        return await run_publication_dedup_key_backfill(
+            db_session,
+            dry_run=not args.apply,
+            batch_size=args.batch_size,
+            requested_by=args.requested_by,
+        )
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    try:
+        result = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+from app.db.session import get_session_factory
+from app.services.dbops import run_page_archive_prune
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Apply page archive retention and delete archived page files no entry references.",
+    )
+    parser.add_argument(
+        "--apply", action="store_true", help="Delete entries and files. Default is dry-run (count only)."
+    )
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=None,
+        help="Override INGESTION_PAGE_ARCHIVE_RETENTION_DAYS.",
+    )
+    parser.add_argument(
+        "--keep-latest",
+        type=int,
+        default=None,
+        help="Override INGESTION_PAGE_ARCHIVE_KEEP_LATEST.",
+    )
+    parser.add_argument(
+        "--requested-by",
+        default="",
+        help="Operator identifier for audit logs (email/name/ticket).",
+    )
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    session_factory = get_session_factory()
+    async with session_factory() as db_session:
+        return await run_page_archive_prune(
+            db_session,
+            retention_days=args.retention_days,
+            keep_latest=args.keep_latest,
+            dry_run=not args.apply,
+            requested_by=args.requested_by,
+        )
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    try:
+        result = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
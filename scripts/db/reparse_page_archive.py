@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+from app.db.session import get_session_factory
+from app.services.dbops import run_page_archive_reparse
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Re-parse archived Scholar profile pages and re-ingest their publications without network access.",
+    )
+    parser.add_argument("--apply", action="store_true", help="Upsert publications. Default is dry-run (parse only).")
+    parser.add_argument("--user-id", type=int, default=None, help="Limit to one user's scholars.")
+    parser.add_argument(
+        "--scholar-profile-id",
+        type=int,
+        action="append",
+        default=[],
+        help="Limit to a scholar profile id. Repeatable.",
+    )
+    parser.add_argument(
+        "--parse-state",
+        action="append",
+        default=[],
+        help="Only pages whose capture ended in this parse state (e.g. layout_changed). Repeatable.",
+    )
+    parser.add_argument(
+        "--requested-by",
+        default="",
+        help="Operator identifier for audit logs (email/name/ticket).",
+    )
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    session_factory = get_session_factory()
+    async with session_factory() as db_session:
+        return await run_page_archive_reparse(
+            db_session,
+            user_id=args.user_id,
+            scholar_profile_ids=args.scholar_profile_id,
+            parse_states=args.parse_state,
+            dry_run=not args.apply,
+            requested_by=args.requested_by,
+        )
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    try:
+        result = asyncio.run(_run(args))
+    except Exception as exc:
+        print(json.dumps({"status": "failed", "error": str(exc)}, indent=2))
+        return 1
+
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -24,6 +24,7 @@ RESET_SQL = text(
       author_search_cache_entries,
       author_search_runtime_state,
       data_repair_jobs,
+      user_publication_feed,
       publication_pdf_job_events,
       publication_pdf_jobs,
       ingestion_queue_items,
@@ -575,3 +575,89 @@ async def test_api_admin_dbops_near_duplicate_repair_scan_and_apply(
         },
     )
     assert int(remaining.scalar_one()) == 1
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_metrics_endpoint_is_admin_only_and_reports_route_latency(db_session: AsyncSession) -> None:
+    await insert_user(db_session, email="api-metrics-admin@example.com", password="admin-password", is_admin=True)
+    await insert_user(db_session, email="api-metrics-member@example.com", password="member-password")
+
+    anonymous = TestClient(app)
+    assert anonymous.get("/metrics").status_code == 401
+
+    member = TestClient(app)
+    login_user(member, email="api-metrics-member@example.com", password="member-password")
+    assert member.get("/metrics").status_code == 403
+
+    admin = TestClient(app)
+    login_user(admin, email="api-metrics-admin@example.com", password="admin-password")
+    assert admin.get("/api/v1/scholars").status_code == 200
+    response = admin.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'scholarr_http_request_duration_seconds_count{method="GET",route="/api/v1/scholars",status="200"}' in body
+    assert 'scholarr_http_request_db_statements_count{method="GET",route="/api/v1/scholars"}' in body
+    assert 'scholarr_queue_items{queue="ingestion",status="queued"} 0.0' in body
+    assert 'scholarr_queue_items{queue="pdf",status="failed"} 0.0' in body
+    assert "# TYPE scholarr_scholar_fetch_duration_seconds histogram" in body
+    assert "# TYPE scholarr_upstream_http_connection_reuse_ratio gauge" in body
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_admin_crawl_schedule_reports_backed_off_scholars_and_savings(db_session: AsyncSession) -> None:
+    await insert_user(db_session, email="api-crawl-admin@example.com", password="admin-password", is_admin=True)
+    user_id = await insert_user(db_session, email="api-crawl-member@example.com", password="member-password")
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO user_settings (user_id, auto_run_enabled, run_interval_minutes)
+            VALUES (:user_id, true, 360)
+            """
+        ),
+        {"user_id": user_id},
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_profiles (
+                user_id, scholar_id, display_name, is_enabled,
+                no_change_streak, change_check_count, change_unchanged_count, last_change_check_dt
+            )
+            VALUES
+                (:user_id, 'crawlSched01', 'Quiet', true, 2, 4, 3, now()),
+                (:user_id, 'crawlSched02', 'Never checked', true, 0, 0, 0, NULL)
+            """
+        ),
+        {"user_id": user_id},
+    )
+    await db_session.commit()
+    previous = (settings.ingestion_adaptive_schedule_enabled, settings.ingestion_adaptive_backoff_factor)
+    object.__setattr__(settings, "ingestion_adaptive_schedule_enabled", True)
+    object.__setattr__(settings, "ingestion_adaptive_backoff_factor", 2.0)
+
+    member = TestClient(app)
+    login_user(member, email="api-crawl-member@example.com", password="member-password")
+    admin = TestClient(app)
+    login_user(admin, email="api-crawl-admin@example.com", password="admin-password")
+    try:
+        assert member.get("/api/v1/admin/db/crawl-schedule").status_code == 403
+        response = admin.get("/api/v1/admin/db/crawl-schedule")
+    finally:
+        object.__setattr__(settings, "ingestion_adaptive_schedule_enabled", previous[0])
+        object.__setattr__(settings, "ingestion_adaptive_backoff_factor", previous[1])
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["scholar_count"] == 2
+    assert data["due_count"] == 1
+    assert data["backed_off_count"] == 1
+    assert data["unchanged_ratio"] == 0.75
+    assert data["requests_per_day_fixed"] == 8.0
+    assert data["requests_per_day_adaptive"] == 5.0
+    assert data["saved_ratio"] == 0.375
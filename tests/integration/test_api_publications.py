@@ -261,6 +261,242 @@ async def test_api_publications_list_supports_pagination(db_session: AsyncSessio
     assert len(second_data["publications"]) == 1
 
 
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_api_publications_keyset_cursor_pages_match_offset_order(db_session: AsyncSession) -> None:
+    user_id = await insert_user(
+        db_session,
+        email="api-pubs-cursor@example.com",
+        password="api-password",
+    )
+    scholar_profile_ids: list[int] = []
+    for scholar_id, display_name in (("cursorScholarA", "Cursor Scholar"), ("cursorScholarB", None)):
+        scholar_result = await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+                VALUES (:user_id, :scholar_id, :display_name, true)
+                RETURNING id
+                """
+            ),
+            {"user_id": user_id, "scholar_id": scholar_id, "display_name": display_name},
+        )
+        scholar_profile_ids.append(int(scholar_result.scalar_one()))
+
+    # Ties on year/citations/title and NULL years exercise the id tie-breakers.
+    rows = [
+        ("Cursor Alpha", 2020, 5),
+        ("Cursor Beta", None, 5),
+        ("Cursor Alpha", 2020, 1),
+        ("Cursor Gamma", 2018, 9),
+        ("Cursor Delta", None, 0),
+    ]
+    for index, (title, year, citations) in enumerate(rows):
+        created = await db_session.execute(
+            text(
+                """
+                INSERT INTO publications (
+                    fingerprint_sha256, title_raw, title_normalized, year, citation_count, pdf_url
+                )
+                VALUES (:fingerprint, :title_raw, :title_normalized, :year, :citation_count, :pdf_url)
+                RETURNING id
+                """
+            ),
+            {
+                "fingerprint": f"{(user_id + 900 + index):064x}",
+                "title_raw": title,
+                "title_normalized": title.lower(),
+                "year": year,
+                "citation_count": citations,
+                "pdf_url": "https://example.org/paper.pdf" if index % 2 else None,
+            },
+        )
+        publication_id = int(created.scalar_one())
+        linked_scholars = scholar_profile_ids if index == 0 else [scholar_profile_ids[index % 2]]
+        for scholar_profile_id in linked_scholars:
+            await db_session.execute(
+                text(
+                    """
+                    INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read, created_at)
+                    VALUES (:scholar_profile_id, :publication_id, false, now() - make_interval(mins => :age))
+                    """
+                ),
+                {
+                    "scholar_profile_id": scholar_profile_id,
+                    "publication_id": publication_id,
+                    "age": index % 3,
+                },
+            )
+    await db_session.commit()
+
+    client = TestClient(app)
+    login_user(client, email="api-pubs-cursor@example.com", password="api-password")
+
+    def _keys(items: list[dict]) -> list[tuple[int, int]]:
+        return [(int(item["publication_id"]), int(item["scholar_profile_id"])) for item in items]
+
+    for sort_by in ("first_seen", "title", "year", "citations", "scholar", "pdf_status"):
+        for sort_dir in ("asc", "desc"):
+            base_params = {"mode": "all", "sort_by": sort_by, "sort_dir": sort_dir}
+            full = client.get("/api/v1/publications", params={**base_params, "page_size": "50"})
+            assert full.status_code == 200
+            full_data = full.json()["data"]
+            assert full_data["next_cursor"] is None
+            expected = _keys(full_data["publications"])
+            assert len(expected) == 6
+
+            snapshot = full_data["snapshot"]
+            first = client.get("/api/v1/publications", params={**base_params, "page_size": "4", "snapshot": snapshot})
+            assert first.status_code == 200
+            first_data = first.json()["data"]
+            assert first_data["has_next"] is True
+            assert _keys(first_data["publications"]) == expected[:4]
+
+            paged: list[tuple[int, int]] = []
+            cursor = None
+            pages = 0
+            while True:
+                params = {**base_params, "page_size": "2", "snapshot": snapshot}
+                if cursor is not None:
+                    params["cursor"] = cursor
+                response = client.get("/api/v1/publications", params=params)
+                assert response.status_code == 200
+                data = response.json()["data"]
+                assert data["has_prev"] is (cursor is not None)
+                paged.extend(_keys(data["publications"]))
+                pages += 1
+                cursor = data["next_cursor"]
+                assert data["has_next"] is (cursor is not None)
+                if cursor is None:
+                    break
+            assert pages == 3
+            assert paged == expected, (sort_by, sort_dir)
+
+    first_page = client.get("/api/v1/publications?sort_by=title&sort_dir=asc&page_size=2").json()["data"]
+    mismatched = client.get(
+        "/api/v1/publications",
+        params={"sort_by": "year", "sort_dir": "asc", "cursor": first_page["next_cursor"]},
+    )
+    assert mismatched.status_code == 400
+    assert mismatched.json()["error"]["code"] == "invalid_cursor"
+    garbage = client.get("/api/v1/publications", params={"cursor": "not-a-cursor"})
+    assert garbage.status_code == 400
+    assert garbage.json()["error"]["code"] == "invalid_cursor"
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_api_publications_full_text_search_ranks_and_highlights(db_session: AsyncSession) -> None:
+    user_id = await insert_user(
+        db_session,
+        email="api-pubs-fts@example.com",
+        password="api-password",
+    )
+    scholar_profile_ids: list[int] = []
+    for scholar_id, display_name in (("ftsScholarA", "Grace Hopper"), ("ftsScholarB", "Alan Turing")):
+        scholar_result = await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+                VALUES (:user_id, :scholar_id, :display_name, true)
+                RETURNING id
+                """
+            ),
+            {"user_id": user_id, "scholar_id": scholar_id, "display_name": display_name},
+        )
+        scholar_profile_ids.append(int(scholar_result.scalar_one()))
+
+    rows = [
+        ("Graph <neural> networks for graph matching", "Journal of Graphs", "A Author", 0),
+        ("Protein folding at scale", "Graphical Models", "B Author", 0),
+        ("Compilers and languages", "Computing Surveys", "C Graphson", 0),
+        ("Computable numbers", "Proceedings", "D Author", 1),
+    ]
+    publication_ids: list[int] = []
+    for index, (title, venue, authors, scholar_index) in enumerate(rows):
+        created = await db_session.execute(
+            text(
+                """
+                INSERT INTO publications (
+                    fingerprint_sha256, title_raw, title_normalized, venue_text, author_text, citation_count
+                )
+                VALUES (:fingerprint, :title_raw, :title_normalized, :venue_text, :author_text, 0)
+                RETURNING id
+                """
+            ),
+            {
+                "fingerprint": f"{(user_id + 1200 + index):064x}",
+                "title_raw": title,
+                "title_normalized": title.lower(),
+                "venue_text": venue,
+                "author_text": authors,
+            },
+        )
+        publication_ids.append(int(created.scalar_one()))
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
+                VALUES (:scholar_profile_id, :publication_id, false)
+                """
+            ),
+            {"scholar_profile_id": scholar_profile_ids[scholar_index], "publication_id": publication_ids[-1]},
+        )
+    await db_session.commit()
+
+    client = TestClient(app)
+    login_user(client, email="api-pubs-fts@example.com", password="api-password")
+
+    ranked = client.get(
+        "/api/v1/publications",
+        params={"search": "grap", "sort_by": "relevance", "sort_dir": "desc", "page_size": "2"},
+    )
+    assert ranked.status_code == 200
+    ranked_data = ranked.json()["data"]
+    # Prefix terms match title, venue and author text; title hits (weight A) rank first.
+    assert ranked_data["total_count"] == 3
+    assert int(ranked_data["publications"][0]["publication_id"]) == publication_ids[0]
+    assert ranked_data["publications"][0]["search_snippet"] == (
+        "<mark>Graph</mark> &lt;neural&gt; networks for <mark>graph</mark> matching"
+    )
+    next_page = client.get(
+        "/api/v1/publications",
+        params={
+            "search": "grap",
+            "sort_by": "relevance",
+            "sort_dir": "desc",
+            "page_size": "2",
+            "snapshot": ranked_data["snapshot"],
+            "cursor": ranked_data["next_cursor"],
+        },
+    )
+    assert next_page.status_code == 200
+    seen = [int(item["publication_id"]) for item in ranked_data["publications"]]
+    seen += [int(item["publication_id"]) for item in next_page.json()["data"]["publications"]]
+    assert sorted(seen) == sorted(publication_ids[:3])
+
+    multi_term = client.get("/api/v1/publications", params={"search": "graph match"}).json()["data"]
+    assert [int(item["publication_id"]) for item in multi_term["publications"]] == [publication_ids[0]]
+
+    by_scholar = client.get("/api/v1/publications", params={"search": "turing"}).json()["data"]
+    assert by_scholar["total_count"] == 1
+    assert [int(item["publication_id"]) for item in by_scholar["publications"]] == [publication_ids[3]]
+
+    unsearched = client.get("/api/v1/publications", params={"sort_by": "relevance"}).json()["data"]
+    assert unsearched["total_count"] == 4
+    assert all(item["search_snippet"] is None for item in unsearched["publications"])
+
+    await db_session.execute(
+        text("UPDATE publications SET title_raw = 'Quantum annealing' WHERE id = :id"),
+        {"id": publication_ids[1]},
+    )
+    await db_session.commit()
+    renamed = client.get("/api/v1/publications", params={"search": "quantum"}).json()["data"]
+    assert [int(item["publication_id"]) for item in renamed["publications"]] == [publication_ids[1]]
+
+
 @pytest.mark.integration
 @pytest.mark.db
 @pytest.mark.asyncio
@@ -6,6 +6,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
+from app.services.publications import application as publication_service
 from app.services.publications.types import PublicationListItem
 from tests.integration.helpers import (
     api_csrf_headers,
@@ -17,7 +18,7 @@ from tests.integration.helpers import (
 @pytest.mark.integration
 @pytest.mark.db
 @pytest.mark.asyncio
-async def test_api_publications_list_schedules_background_enrichment(
+async def test_api_publications_list_reads_pdf_state_without_queueing(
     db_session: AsyncSession,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -41,46 +42,54 @@ async def test_api_publications_list_schedules_background_enrichment(
         },
     )
     scholar_profile_id = int(scholar_result.scalar_one())
-    publication_result = await db_session.execute(
-        text(
-            """
-            INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count)
-            VALUES (:fingerprint, :title_raw, :title_normalized, 3)
-            RETURNING id
-            """
-        ),
-        {
-            "fingerprint": f"{(user_id + 17):064x}",
-            "title_raw": "Background Target",
-            "title_normalized": "background target",
-        },
-    )
-    publication_id = int(publication_result.scalar_one())
+    publication_ids: list[int] = []
+    for index, title in enumerate(("Background Failed", "Background Untracked")):
+        publication_result = await db_session.execute(
+            text(
+                """
+                INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count)
+                VALUES (:fingerprint, :title_raw, :title_normalized, 3)
+                RETURNING id
+                """
+            ),
+            {
+                "fingerprint": f"{(user_id * 10 + index + 17):064x}",
+                "title_raw": title,
+                "title_normalized": title.lower(),
+            },
+        )
+        publication_id = int(publication_result.scalar_one())
+        publication_ids.append(publication_id)
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
+                VALUES (:scholar_profile_id, :publication_id, false)
+                """
+            ),
+            {
+                "scholar_profile_id": scholar_profile_id,
+                "publication_id": publication_id,
+            },
+        )
+    failed_id, untracked_id = publication_ids
     await db_session.execute(
         text(
             """
-            INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
-            VALUES (:scholar_profile_id, :publication_id, false)
+            INSERT INTO publication_pdf_jobs (publication_id, status, attempt_count, last_failure_reason)
+            VALUES (:publication_id, 'failed', 2, 'no_pdf_found')
             """
         ),
-        {
-            "scholar_profile_id": scholar_profile_id,
-            "publication_id": publication_id,
-        },
+        {"publication_id": failed_id},
     )
     await db_session.commit()
 
-    async def _fake_schedule(db_session, *, user_id: int, request_email: str | None, items, max_items: int):
-        assert db_session is not None
-        assert user_id > 0
-        assert request_email == "api-pubs-bg@example.com"
-        assert int(max_items) > 0
-        assert any(int(item.publication_id) == publication_id for item in items)
-        return 1
+    def _unexpected_overlay(*_args, **_kwargs):
+        raise AssertionError("list reads must not overlay PDF job state separately")
 
     monkeypatch.setattr(
-        "app.services.publications.application.schedule_missing_pdf_enrichment_for_user",
-        _fake_schedule,
+        "app.services.publications.application.hydrate_pdf_enrichment_state",
+        _unexpected_overlay,
     )
 
     client = TestClient(app)
@@ -88,11 +97,18 @@ async def test_api_publications_list_schedules_background_enrichment(
 
     response = client.get("/api/v1/publications?mode=all")
     assert response.status_code == 200
-    data = response.json()["data"]
-    assert len(data["publications"]) == 1
-    assert int(data["publications"][0]["publication_id"]) == publication_id
-    assert data["publications"][0]["pdf_url"] is None
-    assert data["publications"][0]["pdf_status"] in {"untracked", "queued", "running", "failed"}
+    by_id = {int(item["publication_id"]): item for item in response.json()["data"]["publications"]}
+    assert by_id[failed_id]["pdf_status"] == "failed"
+    assert by_id[failed_id]["pdf_attempt_count"] == 2
+    assert by_id[failed_id]["pdf_failure_reason"] == "no_pdf_found"
+    assert by_id[untracked_id]["pdf_status"] == "untracked"
+    assert by_id[untracked_id]["pdf_attempt_count"] == 0
+
+    jobs = await db_session.execute(
+        text("SELECT count(*) FROM publication_pdf_jobs WHERE publication_id = :publication_id"),
+        {"publication_id": untracked_id},
+    )
+    assert int(jobs.scalar_one()) == 0
 
 
 @pytest.mark.integration
@@ -335,3 +351,144 @@ async def test_api_publications_unread_and_latest_modes_can_diverge(
     assert alias_data["mode"] == "latest"
     assert alias_data["latest_count"] == latest_data["latest_count"]
     assert alias_data["publications"] == latest_data["publications"]
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_publication_facet_counts_match_per_facet_counts(db_session: AsyncSession) -> None:
+    user_id = await insert_user(
+        db_session,
+        email="api-pubs-facets@example.com",
+        password="api-password",
+    )
+    run_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO crawl_runs (user_id, trigger_type, status, scholar_count, new_pub_count)
+            VALUES (:user_id, 'manual', 'success', 2, 2)
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id},
+    )
+    latest_run_id = int(run_result.scalar_one())
+    scholar_ids = []
+    for scholar_id in ("facetScholarA", "facetScholarB"):
+        scholar_result = await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+                VALUES (:user_id, :scholar_id, :scholar_id, true)
+                RETURNING id
+                """
+            ),
+            {"user_id": user_id, "scholar_id": scholar_id},
+        )
+        scholar_ids.append(int(scholar_result.scalar_one()))
+    links = [
+        # (title, scholar indexes, is_read, is_favorite, first seen in latest run)
+        ("Facet graph learning", (0, 1), False, True, True),
+        ("Facet protein folding", (0,), True, True, False),
+        ("Facet graph databases", (1,), False, False, True),
+        ("Facet sparse kernels", (1,), True, False, False),
+    ]
+    for index, (title, scholar_indexes, is_read, is_favorite, in_latest) in enumerate(links):
+        publication_result = await db_session.execute(
+            text(
+                """
+                INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count)
+                VALUES (:fingerprint, :title_raw, :title_normalized, 1)
+                RETURNING id
+                """
+            ),
+            {
+                "fingerprint": f"{(user_id * 100 + index):064x}",
+                "title_raw": title,
+                "title_normalized": title.lower(),
+            },
+        )
+        publication_id = int(publication_result.scalar_one())
+        for scholar_index in scholar_indexes:
+            await db_session.execute(
+                text(
+                    """
+                    INSERT INTO scholar_publications (
+                        scholar_profile_id, publication_id, is_read, is_favorite, first_seen_run_id
+                    )
+                    VALUES (:scholar_profile_id, :publication_id, :is_read, :is_favorite, :first_seen_run_id)
+                    """
+                ),
+                {
+                    "scholar_profile_id": scholar_ids[scholar_index],
+                    "publication_id": publication_id,
+                    "is_read": is_read,
+                    "is_favorite": is_favorite,
+                    "first_seen_run_id": latest_run_id if in_latest else None,
+                },
+            )
+    # A later failed run re-links the first publication. The latest run still
+    # skips it, so the publication stays in the latest facet through scholar A.
+    failed_run_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO crawl_runs (user_id, trigger_type, status, scholar_count, new_pub_count)
+            VALUES (:user_id, 'manual', 'failed', 2, 0)
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id},
+    )
+    await db_session.execute(
+        text(
+            """
+            UPDATE scholar_publications
+            SET first_seen_run_id = :failed_run_id
+            WHERE scholar_profile_id = :scholar_profile_id
+              AND publication_id = (SELECT id FROM publications WHERE title_raw = 'Facet graph learning')
+            """
+        ),
+        {"failed_run_id": int(failed_run_result.scalar_one()), "scholar_profile_id": scholar_ids[1]},
+    )
+    await db_session.commit()
+
+    for scholar_profile_id in (None, scholar_ids[0], scholar_ids[1]):
+        for favorite_only in (False, True):
+            for search in (None, "graph"):
+                filters = {
+                    "user_id": user_id,
+                    "scholar_profile_id": scholar_profile_id,
+                    "snapshot_before": None,
+                }
+                facets = await publication_service.count_publication_facets_for_user(
+                    db_session,
+                    latest_run_id=latest_run_id,
+                    favorite_only=favorite_only,
+                    search=search,
+                    **filters,
+                )
+                assert facets.unread_count == await publication_service.count_unread_for_user(
+                    db_session, favorite_only=favorite_only, **filters
+                )
+                assert facets.favorites_count == await publication_service.count_favorite_for_user(
+                    db_session, **filters
+                )
+                assert facets.latest_count == await publication_service.count_latest_for_user(
+                    db_session, favorite_only=favorite_only, **filters
+                )
+                assert facets.total_count == await publication_service.count_for_user(
+                    db_session, favorite_only=favorite_only, search=search, **filters
+                )
+
+    totals = await publication_service.count_publication_facets_for_user(
+        db_session,
+        user_id=user_id,
+        latest_run_id=latest_run_id,
+    )
+    assert (totals.unread_count, totals.favorites_count, totals.latest_count, totals.total_count) == (2, 2, 2, 4)
+    no_run = await publication_service.count_publication_facets_for_user(
+        db_session,
+        user_id=user_id,
+        latest_run_id=None,
+    )
+    assert no_run.latest_count == 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.runtime_deps import get_scholar_source
 from app.main import app
+from app.services.portability import read_ndjson_export
 from app.services.scholar.rate_limit import reset_scholar_rate_limit_state_for_tests
 from app.services.scholar.source import FetchResult
 from app.settings import settings
@@ -474,3 +476,82 @@ async def test_api_scholar_import_export_round_trip(
         },
     )
     assert bool(updated_link_result.scalar_one()) is True
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_api_scholar_ndjson_export_streams_the_json_export(
+    db_session: AsyncSession,
+) -> None:
+    user_id = await insert_user(
+        db_session,
+        email="api-ndjson-export@example.com",
+        password="api-password",
+    )
+    scholar_result = await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_profiles (user_id, scholar_id, display_name, is_enabled)
+            VALUES (:user_id, 'ndjsonAAA111', 'Streamed Scholar', true)
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id},
+    )
+    scholar_profile_id = int(scholar_result.scalar_one())
+    for index in range(3):
+        publication_result = await db_session.execute(
+            text(
+                """
+                INSERT INTO publications (fingerprint_sha256, title_raw, title_normalized, citation_count)
+                VALUES (:fingerprint, :title_raw, :title_normalized, :index)
+                RETURNING id
+                """
+            ),
+            {
+                "fingerprint": f"{(user_id * 10 + index + 900):064x}",
+                "title_raw": f"Streamed Publication {index} – ünïcode",
+                "title_normalized": f"streamedpublication{index}",
+                "index": index,
+            },
+        )
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
+                VALUES (:scholar_profile_id, :publication_id, :is_read)
+                """
+            ),
+            {
+                "scholar_profile_id": scholar_profile_id,
+                "publication_id": int(publication_result.scalar_one()),
+                "is_read": index == 0,
+            },
+        )
+    await db_session.commit()
+
+    client = TestClient(app)
+    login_user(client, email="api-ndjson-export@example.com", password="api-password")
+
+    json_export = client.get("/api/v1/scholars/export").json()["data"]
+    ndjson_response = client.get("/api/v1/scholars/export", params={"format": "ndjson"})
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers["content-type"].startswith("application/x-ndjson")
+    lines = ndjson_response.content.splitlines()
+    assert len(lines) == 5
+    streamed = read_ndjson_export(lines)
+    assert streamed["schema_version"] == json_export["schema_version"]
+    assert streamed["scholars"] == json_export["scholars"]
+    assert streamed["publications"] == json_export["publications"]
+
+    gzip_response = client.get("/api/v1/scholars/export", params={"format": "ndjson", "gzip": "true"})
+    assert gzip_response.status_code == 200
+    assert gzip_response.headers["content-type"] == "application/gzip"
+    assert ".ndjson.gz" in gzip_response.headers["content-disposition"]
+    assert read_ndjson_export(gzip.decompress(gzip_response.content).splitlines()) == streamed
+
+    import_response = client.post("/api/v1/scholars/import", json=streamed, headers=api_csrf_headers(client))
+    assert import_response.status_code == 200
+    imported = import_response.json()["data"]
+    assert (imported["publications_created"], imported["links_created"], imported["skipped_records"]) == (0, 0, 0)
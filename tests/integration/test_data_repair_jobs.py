@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.services.dbops import run_publication_link_repair
+from app.services.dbops import (
+    run_publication_dedup_key_backfill,
+    run_publication_feed_rebuild,
+    run_publication_link_repair,
+    run_publication_near_duplicate_repair,
+)
 from tests.integration.helpers import insert_user
 
 
@@ -247,3 +254,314 @@ async def test_publication_link_repair_apply_clears_links_and_can_gc_orphans(
         scholar_profile_id=scholar_profile_id,
         publication_id=publication_id,
     )
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_dedup_key_backfill_and_incremental_near_duplicate_scan(
+    db_session: AsyncSession,
+) -> None:
+    title = "Adam: A method for stochastic optimization"
+    first_id = await _insert_publication(
+        db_session,
+        fingerprint=f"{9101:064x}",
+        title_raw=title,
+        title_normalized="adamamethodforstochasticoptimization",
+        citation_count=100,
+    )
+    second_id = await _insert_publication(
+        db_session,
+        fingerprint=f"{9102:064x}",
+        title_raw=title,
+        title_normalized="adamamethodforstochasticoptimization",
+        citation_count=3,
+    )
+    await _insert_publication(
+        db_session,
+        fingerprint=f"{9103:064x}",
+        title_raw="Deep residual learning for image recognition",
+        title_normalized="deepresiduallearningforimagerecognition",
+        citation_count=50,
+    )
+    await db_session.commit()
+
+    preview = await run_publication_dedup_key_backfill(db_session, dry_run=True)
+    assert preview["summary"]["missing_before"] == 3
+    assert preview["summary"]["updated_publications"] == 0
+    backfill = await run_publication_dedup_key_backfill(db_session, dry_run=False, batch_size=2)
+    assert backfill["summary"]["updated_publications"] == 3
+    assert backfill["summary"]["batches"] == 2
+    keys = await db_session.execute(
+        text("SELECT dedup_title_text, dedup_title_tokens FROM publications WHERE id = :id"),
+        {"id": first_id},
+    )
+    assert tuple(keys.one()) == ("adam: a method for stochastic optimization", ["adam", "optimization", "stochastic"])
+
+    scan = await run_publication_near_duplicate_repair(db_session, dry_run=True, incremental=True)
+    assert scan["summary"]["after_publication_id"] is None
+    assert [member["publication_id"] for member in scan["clusters"][0]["members"]] == [first_id, second_id]
+    applied = await run_publication_near_duplicate_repair(
+        db_session,
+        dry_run=False,
+        incremental=True,
+        selected_cluster_keys=[scan["clusters"][0]["cluster_key"]],
+    )
+    assert applied["summary"]["merged_publications"] == 1
+
+    rescan = await run_publication_near_duplicate_repair(db_session, dry_run=True, incremental=True)
+    assert rescan["summary"]["after_publication_id"] == applied["summary"]["scanned_through_publication_id"]
+    assert rescan["summary"]["candidate_cluster_count"] == 0
+
+    newcomer_id = await _insert_publication(
+        db_session,
+        fingerprint=f"{9104:064x}",
+        title_raw=title,
+        title_normalized="adamamethodforstochasticoptimization",
+        citation_count=1,
+    )
+    await db_session.commit()
+    newcomer_scan = await run_publication_near_duplicate_repair(db_session, dry_run=True, incremental=True)
+    assert [member["publication_id"] for member in newcomer_scan["clusters"][0]["members"]] == [first_id, newcomer_id]
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_dedup_key_backfill_keeps_committed_batches_when_it_fails(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.services.dbops import dedup_key_backfill
+
+    publication_ids = [
+        await _insert_publication(
+            db_session,
+            fingerprint=f"{9401 + index:064x}",
+            title_raw=title,
+            title_normalized=title.replace(" ", ""),
+            citation_count=1,
+        )
+        for index, title in enumerate(("first paper", "second paper", "broken paper"))
+    ]
+    await db_session.commit()
+    real_keys = dedup_key_backfill.near_duplicate_title_keys
+
+    def _keys(title: str):
+        if title == "broken paper":
+            raise ValueError("cannot tokenize")
+        return real_keys(title)
+
+    monkeypatch.setattr(dedup_key_backfill, "near_duplicate_title_keys", _keys)
+
+    with pytest.raises(ValueError, match="cannot tokenize"):
+        await run_publication_dedup_key_backfill(db_session, dry_run=False, batch_size=2)
+
+    filled = await db_session.execute(
+        text("SELECT id FROM publications WHERE dedup_title_text IS NOT NULL ORDER BY id"),
+    )
+    assert filled.scalars().all() == publication_ids[:2]
+    job = await db_session.execute(
+        text(
+            """
+            SELECT status, summary
+            FROM data_repair_jobs
+            WHERE job_name = 'backfill_publication_dedup_keys'
+            ORDER BY id DESC
+            LIMIT 1
+            """
+        )
+    )
+    status, summary = job.one()
+    assert status == "failed"
+    assert (summary["updated_publications"], summary["batches"]) == (2, 1)
+    assert summary["last_publication_id"] == publication_ids[1]
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_incremental_near_duplicate_scan_keeps_unselected_clusters(
+    db_session: AsyncSession,
+) -> None:
+    ids: dict[str, list[int]] = {}
+    for offset, (title, citation_count) in enumerate(
+        (
+            ("Adam: A method for stochastic optimization", 100),
+            ("Deep residual learning for image recognition", 50),
+            ("Adam: A method for stochastic optimization", 3),
+            ("Deep residual learning for image recognition", 2),
+        )
+    ):
+        publication_id = await _insert_publication(
+            db_session,
+            fingerprint=f"{9201 + offset:064x}",
+            title_raw=title,
+            title_normalized=title.lower().replace(" ", ""),
+            citation_count=citation_count,
+        )
+        ids.setdefault(title, []).append(publication_id)
+    await db_session.commit()
+    adam_ids, resnet_ids = ids.values()
+
+    scan = await run_publication_near_duplicate_repair(db_session, dry_run=True, incremental=True)
+    by_winner = {cluster["winner_publication_id"]: cluster for cluster in scan["clusters"]}
+    applied = await run_publication_near_duplicate_repair(
+        db_session,
+        dry_run=False,
+        incremental=True,
+        selected_cluster_keys=[by_winner[adam_ids[0]]["cluster_key"]],
+    )
+    assert applied["summary"]["merged_publications"] == 1
+    assert applied["summary"]["scanned_through_publication_id"] == resnet_ids[0] - 1
+
+    rescan = await run_publication_near_duplicate_repair(db_session, dry_run=True, incremental=True)
+    assert rescan["summary"]["after_publication_id"] == resnet_ids[0] - 1
+    assert [[member["publication_id"] for member in cluster["members"]] for cluster in rescan["clusters"]] == [
+        resnet_ids
+    ]
+
+
+async def _feed_rows(db_session: AsyncSession, *, user_id: int) -> list[tuple[int, bool, bool]]:
+    result = await db_session.execute(
+        text(
+            """
+            SELECT publication_id, is_unread, is_favorite
+            FROM user_publication_feed
+            WHERE user_id = :user_id
+            ORDER BY publication_id
+            """
+        ),
+        {"user_id": user_id},
+    )
+    return [tuple(row) for row in result.all()]
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_publication_feed_tracks_link_writes_and_rebuild_repairs_drift(
+    db_session: AsyncSession,
+) -> None:
+    user_id = await insert_user(db_session, email="feed-owner@example.com", password="StrongPassword123!")
+    first_scholar = await _insert_scholar_profile(
+        db_session, user_id=user_id, scholar_id="feedScholarA1", display_name="Feed A"
+    )
+    second_scholar = await _insert_scholar_profile(
+        db_session, user_id=user_id, scholar_id="feedScholarB1", display_name="Feed B"
+    )
+    shared_id = await _insert_publication(
+        db_session,
+        fingerprint=f"{9201:064x}",
+        title_raw="Shared paper",
+        title_normalized="sharedpaper",
+        citation_count=1,
+    )
+    duplicate_id = await _insert_publication(
+        db_session,
+        fingerprint=f"{9202:064x}",
+        title_raw="Duplicate paper",
+        title_normalized="duplicatepaper",
+        citation_count=1,
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
+            VALUES (:first, :shared, true), (:second, :duplicate, false)
+            """
+        ),
+        {"first": first_scholar, "second": second_scholar, "shared": shared_id, "duplicate": duplicate_id},
+    )
+    await db_session.commit()
+    assert await _feed_rows(db_session, user_id=user_id) == [(shared_id, False, False), (duplicate_id, True, False)]
+
+    await db_session.execute(
+        text("UPDATE scholar_publications SET publication_id = :shared WHERE publication_id = :duplicate"),
+        {"shared": shared_id, "duplicate": duplicate_id},
+    )
+    await db_session.commit()
+    assert await _feed_rows(db_session, user_id=user_id) == [(shared_id, True, False)]
+
+    await db_session.execute(
+        text("UPDATE scholar_publications SET is_favorite = true WHERE scholar_profile_id = :id"),
+        {"id": second_scholar},
+    )
+    await db_session.commit()
+    assert await _feed_rows(db_session, user_id=user_id) == [(shared_id, True, True)]
+
+    await db_session.execute(text("DELETE FROM scholar_profiles WHERE id = :id"), {"id": second_scholar})
+    await db_session.commit()
+    assert await _feed_rows(db_session, user_id=user_id) == [(shared_id, False, False)]
+
+    await db_session.execute(text("UPDATE user_publication_feed SET is_unread = true"))
+    await db_session.commit()
+
+    preview = await run_publication_feed_rebuild(db_session, dry_run=True)
+    assert preview["summary"]["missing_or_stale_rows_before"] == 1
+    assert preview["summary"]["extra_or_stale_rows_before"] == 1
+    assert preview["summary"]["drift_rows_after"] == 2
+    rebuilt = await run_publication_feed_rebuild(db_session, user_id=user_id, dry_run=False, requested_by="ops")
+    assert rebuilt["summary"]["users_rebuilt"] == 1
+    assert rebuilt["summary"]["drift_rows_after"] == 0
+    assert await _feed_rows(db_session, user_id=user_id) == [(shared_id, False, False)]
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_publication_feed_serializes_concurrent_link_writers(
+    db_session: AsyncSession,
+    database_url: str,
+) -> None:
+    user_id = await insert_user(db_session, email="feed-race@example.com", password="StrongPassword123!")
+    first_scholar = await _insert_scholar_profile(
+        db_session, user_id=user_id, scholar_id="feedRaceA001", display_name="Race A"
+    )
+    second_scholar = await _insert_scholar_profile(
+        db_session, user_id=user_id, scholar_id="feedRaceB001", display_name="Race B"
+    )
+    publication_id = await _insert_publication(
+        db_session,
+        fingerprint=f"{9301:064x}",
+        title_raw="Raced paper",
+        title_normalized="racedpaper",
+        citation_count=1,
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO scholar_publications (scholar_profile_id, publication_id, is_read)
+            VALUES (:first, :publication_id, false), (:second, :publication_id, false)
+            """
+        ),
+        {"first": first_scholar, "second": second_scholar, "publication_id": publication_id},
+    )
+    await db_session.commit()
+
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as reader, session_factory() as remover:
+            # The user marks the first scholar's link read and has not committed yet.
+            await reader.execute(
+                text("UPDATE scholar_publications SET is_read = true WHERE scholar_profile_id = :id"),
+                {"id": first_scholar},
+            )
+            # Meanwhile the second scholar's (unread) link is removed. Its recompute
+            # must wait for the read, or it keeps the feed row unread.
+            removal = asyncio.create_task(
+                remover.execute(
+                    text("DELETE FROM scholar_publications WHERE scholar_profile_id = :id"),
+                    {"id": second_scholar},
+                )
+            )
+            await asyncio.sleep(0.2)
+            assert not removal.done()
+            await reader.commit()
+            await removal
+            await remover.commit()
+    finally:
+        await engine.dispose()
+
+    assert await _feed_rows(db_session, user_id=user_id) == [(publication_id, False, False)]
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.dbops import db_retention_due, run_db_retention
+from app.settings import settings
+from tests.integration.helpers import insert_user, seed_publication_link_for_user
+
+RETENTION_SETTINGS = {
+    "db_retention_batch_size": 10,
+    "db_retention_run_days": 30,
+    "db_retention_run_failed_days": 90,
+    "db_retention_run_keep_per_user": 1,
+    "db_retention_run_rollups_enabled": True,
+    "db_retention_pdf_event_days": 30,
+    "db_retention_pdf_event_failed_days": 90,
+    "db_retention_pdf_event_keep_per_publication": 1,
+    "db_retention_repair_job_days": 30,
+    "db_retention_repair_job_failed_days": 90,
+    "db_retention_repair_job_keep_per_name": 1,
+}
+
+
+@pytest.fixture
+def retention_settings():
+    previous = {name: getattr(settings, name) for name in RETENTION_SETTINGS}
+    for name, value in RETENTION_SETTINGS.items():
+        object.__setattr__(settings, name, value)
+    yield
+    for name, value in previous.items():
+        object.__setattr__(settings, name, value)
+
+
+def _days_ago(days: int) -> datetime:
+    return datetime.now(UTC) - timedelta(days=days)
+
+
+async def _insert_run(db_session: AsyncSession, *, user_id: int, status: str, age_days: int) -> int:
+    result = await db_session.execute(
+        text(
+            """
+            INSERT INTO crawl_runs (
+                user_id, trigger_type, status, start_dt, end_dt, scholar_count, new_pub_count, succeeded_count
+            )
+            VALUES (:user_id, 'scheduled', CAST(:status AS run_status), :start_dt, :start_dt, 2, 3, 1)
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id, "status": status, "start_dt": _days_ago(age_days)},
+    )
+    return int(result.scalar_one())
+
+
+async def _insert_result_row(db_session: AsyncSession, *, run_id: int, position: int) -> None:
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO crawl_run_scholar_results (crawl_run_id, position, scholar_id, state, outcome, debug)
+            VALUES (:run_id, :position, 'abcDEF123456', 'ok', 'success', '{"body_length": 1}'::jsonb)
+            """
+        ),
+        {"run_id": run_id, "position": position},
+    )
+
+
+async def _ids(db_session: AsyncSession, sql: str) -> set[int]:
+    result = await db_session.execute(text(sql))
+    return {int(value) for value in result.scalars().all()}
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_run_retention_keeps_latest_failed_and_active_runs(
+    db_session: AsyncSession,
+    retention_settings: None,
+) -> None:
+    user_id = await insert_user(db_session, email="retention@example.com", password="api-password")
+    old_success = await _insert_run(db_session, user_id=user_id, status="success", age_days=60)
+    old_success_same_day = await _insert_run(db_session, user_id=user_id, status="success", age_days=60)
+    failed_in_grace = await _insert_run(db_session, user_id=user_id, status="failed", age_days=60)
+    failed_expired = await _insert_run(db_session, user_id=user_id, status="partial_failure", age_days=120)
+    active = await _insert_run(db_session, user_id=user_id, status="running", age_days=200)
+    newest = await _insert_run(db_session, user_id=user_id, status="success", age_days=40)
+    for position in range(3):
+        await _insert_result_row(db_session, run_id=old_success, position=position)
+    await db_session.commit()
+
+    dry_run = await run_db_retention(db_session)
+    runs = dry_run["summary"]["tables"]["crawl_runs"]
+    assert runs["expired_rows"] == 3
+    assert runs["deleted_rows"] == 0
+    assert len(await _ids(db_session, "SELECT id FROM crawl_runs")) == 6
+
+    applied = await run_db_retention(db_session, dry_run=False)
+    runs = applied["summary"]["tables"]["crawl_runs"]
+    assert runs["deleted_rows"] == 3
+    assert runs["cascaded_rows"] == 3
+    assert runs["bytes_reclaimed"] > 0
+    assert await _ids(db_session, "SELECT id FROM crawl_runs") == {failed_in_grace, active, newest}
+    assert await _ids(db_session, "SELECT id FROM crawl_run_scholar_results") == set()
+    assert {old_success, old_success_same_day, failed_expired}.isdisjoint(
+        await _ids(db_session, "SELECT id FROM crawl_runs")
+    )
+
+    rollups = (
+        await db_session.execute(
+            text(
+                """
+                SELECT run_count, success_run_count, partial_failure_run_count, scholar_count, new_pub_count
+                FROM crawl_run_rollups
+                WHERE user_id = :user_id
+                ORDER BY period_start
+                """
+            ),
+            {"user_id": user_id},
+        )
+    ).all()
+    assert [tuple(row) for row in rollups] == [(1, 0, 1, 2, 3), (2, 2, 0, 4, 6)]
+
+    assert not await db_retention_due(db_session, interval_hours=24)
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_retention_prunes_events_jobs_and_expired_caches(
+    db_session: AsyncSession,
+    retention_settings: None,
+) -> None:
+    user_id = await insert_user(db_session, email="retention-events@example.com", password="api-password")
+    _, publication_id = await seed_publication_link_for_user(
+        db_session,
+        user_id=user_id,
+        scholar_id="retentionEv1",
+        title="Retention Paper",
+        fingerprint="f" * 64,
+    )
+    for event_type, status, age_days in (
+        ("queued", "queued", 60),
+        ("failed", "failed", 60),
+        ("attempt_started", None, 40),
+        ("resolved", "resolved", 1),
+    ):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO publication_pdf_job_events (publication_id, user_id, event_type, status, created_at)
+                VALUES (:publication_id, :user_id, :event_type, :status, :created_at)
+                """
+            ),
+            {
+                "publication_id": publication_id,
+                "user_id": user_id,
+                "event_type": event_type,
+                "status": status,
+                "created_at": _days_ago(age_days),
+            },
+        )
+    for job_name, status, age_days in (
+        ("repair_publication_links", "completed", 60),
+        ("repair_publication_links", "completed", 50),
+        ("repair_publication_links", "running", 70),
+        ("repair_publication_links", "completed", 1),
+    ):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO data_repair_jobs (job_name, status, dry_run, created_at)
+                VALUES (:job_name, :status, false, :created_at)
+                """
+            ),
+            {"job_name": job_name, "status": status, "created_at": _days_ago(age_days)},
+        )
+    for key, expires_in_seconds in (("expired", -60), ("fresh", 3600)):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO arxiv_query_cache_entries (query_fingerprint, payload, expires_at)
+                VALUES (:key, '{}'::jsonb, :expires_at)
+                """
+            ),
+            {"key": key, "expires_at": datetime.now(UTC) + timedelta(seconds=expires_in_seconds)},
+        )
+    await db_session.commit()
+
+    applied = await run_db_retention(db_session, dry_run=False)
+    tables = applied["summary"]["tables"]
+
+    assert tables["publication_pdf_job_events"]["deleted_rows"] == 2
+    events = await db_session.execute(text("SELECT event_type FROM publication_pdf_job_events ORDER BY id"))
+    assert events.scalars().all() == ["failed", "resolved"]
+
+    assert tables["data_repair_jobs"]["deleted_rows"] == 2
+    jobs = await db_session.execute(
+        text("SELECT status FROM data_repair_jobs WHERE job_name = 'repair_publication_links' ORDER BY id")
+    )
+    assert jobs.scalars().all() == ["running", "completed"]
+
+    assert tables["arxiv_query_cache_entries"]["deleted_rows"] == 1
+    cache = await db_session.execute(text("SELECT query_fingerprint FROM arxiv_query_cache_entries"))
+    assert cache.scalars().all() == ["fresh"]
+    assert applied["summary"]["deleted_rows"] == 5
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_run_retention_clears_run_references_in_batches(
+    db_session: AsyncSession,
+    retention_settings: None,
+) -> None:
+    user_id = await insert_user(db_session, email="retention-refs@example.com", password="api-password")
+    scholar_profile_id, publication_id = await seed_publication_link_for_user(
+        db_session,
+        user_id=user_id,
+        scholar_id="retentionRf1",
+        title="Retention Reference Paper",
+        fingerprint="e" * 64,
+    )
+    expired = await _insert_run(db_session, user_id=user_id, status="success", age_days=60)
+    newest = await _insert_run(db_session, user_id=user_id, status="success", age_days=40)
+    await db_session.execute(
+        text("UPDATE scholar_publications SET first_seen_run_id = :run_id WHERE publication_id = :publication_id"),
+        {"run_id": expired, "publication_id": publication_id},
+    )
+    for cstart in range(0, 1200, 100):
+        await db_session.execute(
+            text(
+                """
+                INSERT INTO scholar_page_archive_entries (
+                    scholar_profile_id, crawl_run_id, cstart, page_size, body_sha256,
+                    raw_bytes, stored_bytes, requested_url, parse_state
+                )
+                VALUES (:scholar_profile_id, :run_id, :cstart, 100, :sha, 10, 5, 'https://example.com', 'ok')
+                """
+            ),
+            {"scholar_profile_id": scholar_profile_id, "run_id": expired, "cstart": cstart, "sha": "a" * 64},
+        )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO ingestion_queue_items (user_id, scholar_profile_id, reason, last_run_id)
+            VALUES (:user_id, :scholar_profile_id, 'continuation', :run_id)
+            """
+        ),
+        {"user_id": user_id, "scholar_profile_id": scholar_profile_id, "run_id": expired},
+    )
+    await db_session.commit()
+    feed_run = await db_session.execute(
+        text("SELECT newest_run_id FROM user_publication_feed WHERE user_id = :user_id"),
+        {"user_id": user_id},
+    )
+    assert feed_run.scalar_one() == expired
+
+    applied = await run_db_retention(db_session, dry_run=False)
+    runs = applied["summary"]["tables"]["crawl_runs"]
+
+    assert runs["deleted_rows"] == 1
+    # The link, twelve archived pages and the queue item; the link's trigger clears the feed row.
+    assert runs["nullified_rows"] == 14
+    assert applied["summary"]["nullified_rows"] == 14
+    assert await _ids(db_session, "SELECT id FROM crawl_runs") == {newest}
+    for sql in (
+        "SELECT count(*) FROM scholar_publications WHERE first_seen_run_id IS NOT NULL",
+        "SELECT count(*) FROM user_publication_feed WHERE newest_run_id IS NOT NULL",
+        "SELECT count(*) FROM scholar_page_archive_entries WHERE crawl_run_id IS NOT NULL",
+        "SELECT count(*) FROM ingestion_queue_items WHERE last_run_id IS NOT NULL",
+    ):
+        assert (await db_session.execute(text(sql))).scalar_one() == 0
+    assert (await db_session.execute(text("SELECT count(*) FROM user_publication_feed"))).scalar_one() == 1
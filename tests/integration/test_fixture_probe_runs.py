@@ -163,11 +163,17 @@ async def test_fixture_probe_run_emits_failure_and_retry_summary_metrics(
     assert summary.partial_count == 0
 
     run_result = await db_session.execute(
-        text("SELECT error_log FROM crawl_runs WHERE id = :run_id"),
+        text("SELECT summary, failed_count FROM crawl_runs WHERE id = :run_id"),
         {"run_id": summary.crawl_run_id},
     )
-    error_log = run_result.scalar_one()
-    run_summary = error_log["summary"]
+    run_summary, failed_count = run_result.one()
+    assert failed_count == 1
+
+    outcomes_result = await db_session.execute(
+        text("SELECT outcome FROM crawl_run_scholar_results WHERE crawl_run_id = :run_id ORDER BY position"),
+        {"run_id": summary.crawl_run_id},
+    )
+    assert sorted(outcomes_result.scalars().all()) == ["failed", "success", "success"]
 
     assert run_summary["failed_state_counts"]["blocked_or_captcha"] == 1
     assert run_summary["failed_reason_counts"]["blocked_accounts_redirect"] == 1
@@ -1,7 +1,14 @@
+import asyncio
+import json
+from typing import Any
+
 import pytest
+from alembic.config import Config
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from alembic import command
+
 EXPECTED_TABLES = {
     "alembic_version",
     "users",
@@ -9,6 +16,8 @@ EXPECTED_TABLES = {
     "scholar_profiles",
     "publications",
     "scholar_publications",
+    "crawl_run_scholar_results",
+    "crawl_run_rollups",
     "crawl_runs",
     "ingestion_queue_items",
     "author_search_runtime_state",
@@ -18,10 +27,12 @@ EXPECTED_TABLES = {
     "data_repair_jobs",
     "publication_pdf_jobs",
     "publication_pdf_job_events",
+    "user_publication_feed",
+    "scholar_page_archive_entries",
 }
 
 EXPECTED_ENUMS = {"run_status", "run_trigger_type"}
-EXPECTED_REVISION = "20260226_0024"
+EXPECTED_REVISION = "20261019_0036"
 
 
 @pytest.mark.integration
@@ -286,3 +297,157 @@ async def test_user_settings_request_delay_constraint_enforces_two_second_floor(
     )
     definition = result.scalar_one()
     assert "request_delay_seconds >= 2" in definition
+
+
+CRAWL_RUN_RESULTS_PREVIOUS_REVISION = "20261019_0031"
+
+
+async def _crawl_run_error_logs(db_session: AsyncSession) -> dict[str, Any]:
+    result = await db_session.execute(text("SELECT idempotency_key, error_log FROM crawl_runs"))
+    logs = {str(key): error_log for key, error_log in result.all()}
+    await db_session.commit()
+    return logs
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.migrations
+@pytest.mark.asyncio
+async def test_crawl_run_results_migration_moves_legacy_error_logs_and_downgrade_restores_them(
+    db_session: AsyncSession,
+    alembic_config: Config,
+) -> None:
+    await asyncio.to_thread(command.downgrade, alembic_config, CRAWL_RUN_RESULTS_PREVIOUS_REVISION)
+    try:
+        user_id = (
+            await db_session.execute(
+                text("INSERT INTO users (email, password_hash) VALUES ('migration-0032@example.com', 'x') RETURNING id")
+            )
+        ).scalar_one()
+        scholar_profile_id = (
+            await db_session.execute(
+                text(
+                    "INSERT INTO scholar_profiles (user_id, scholar_id) VALUES (:user_id, 'migScholar01') RETURNING id"
+                ),
+                {"user_id": user_id},
+            )
+        ).scalar_one()
+        summary = {"succeeded_count": 1, "failed_count": "2", "partial_count": "n/a", "alert_flags": {}}
+        legacy_log = {
+            "summary": summary,
+            "meta": {"idempotency_key": "legacy"},
+            "scholar_results": [
+                {
+                    "scholar_profile_id": scholar_profile_id,
+                    "scholar_id": "migScholar01",
+                    "state": "ok",
+                    "outcome": "success",
+                    "attempt_count": 1,
+                    "publication_count": "5",
+                    "has_more_remaining": True,
+                    "warnings": ["w1"],
+                    "debug": {"status_code": 200},
+                },
+                {
+                    "scholar_profile_id": 999999,
+                    "scholar_id": "migScholar02",
+                    "state": "network_error",
+                    "outcome": "failed",
+                    "attempt_count": "x",
+                    "continuation_cstart": 100,
+                    "has_show_more_button": "yes",
+                    "warnings": "not-a-list",
+                },
+                "malformed entry",
+            ],
+        }
+        for key, status, error_log, finished in (
+            ("legacy", "partial_failure", legacy_log, True),
+            ("terminal", "failed", {"terminal_exception": "boom"}, True),
+            ("running", "running", {}, False),
+        ):
+            await db_session.execute(
+                text(
+                    """
+                    INSERT INTO crawl_runs (user_id, trigger_type, status, end_dt, idempotency_key, error_log)
+                    VALUES (
+                        :user_id, 'manual', CAST(:status AS run_status),
+                        CASE WHEN :finished THEN now() END, :key, CAST(:error_log AS jsonb)
+                    )
+                    """
+                ),
+                {
+                    "user_id": user_id,
+                    "status": status,
+                    "finished": finished,
+                    "key": key,
+                    "error_log": json.dumps(error_log),
+                },
+            )
+        await db_session.commit()
+
+        await asyncio.to_thread(command.upgrade, alembic_config, "head")
+
+        runs = await db_session.execute(
+            text(
+                """
+                SELECT idempotency_key, succeeded_count, failed_count, partial_count, summary, error_log
+                FROM crawl_runs
+                ORDER BY id
+                """
+            )
+        )
+        assert [tuple(row) for row in runs.all()] == [
+            ("legacy", 1, 2, 0, summary, {}),
+            ("terminal", 0, 0, 0, {}, {"terminal_exception": "boom"}),
+            ("running", 0, 0, 0, {}, {}),
+        ]
+        results = await db_session.execute(
+            text(
+                """
+                SELECT position, scholar_profile_id, scholar_id, state, outcome, attempt_count, publication_count,
+                       has_more_remaining, has_show_more_button, continuation_cstart, warnings, debug
+                FROM crawl_run_scholar_results
+                ORDER BY position
+                """
+            )
+        )
+        assert [tuple(row) for row in results.all()] == [
+            (
+                0,
+                scholar_profile_id,
+                "migScholar01",
+                "ok",
+                "success",
+                1,
+                5,
+                True,
+                False,
+                None,
+                ["w1"],
+                {"status_code": 200},
+            ),
+            (1, None, "migScholar02", "network_error", "failed", 0, 0, False, False, 100, [], None),
+        ]
+        await db_session.commit()
+
+        await asyncio.to_thread(command.downgrade, alembic_config, CRAWL_RUN_RESULTS_PREVIOUS_REVISION)
+
+        logs = await _crawl_run_error_logs(db_session)
+        restored = logs["legacy"]
+        assert set(restored) == {"summary", "meta", "scholar_results"}
+        assert restored["summary"] == summary
+        assert restored["meta"] == {"idempotency_key": "legacy"}
+        first, second = restored["scholar_results"]
+        assert first["scholar_profile_id"] == scholar_profile_id
+        assert (first["publication_count"], first["has_more_remaining"], first["warnings"]) == (5, True, ["w1"])
+        assert first["debug"] == {"status_code": 200}
+        assert (second["scholar_profile_id"], second["scholar_id"], second["attempt_count"]) == (0, "migScholar02", 0)
+        assert (second["continuation_cstart"], second["debug"]) == (100, None)
+        assert "state_reason" not in second
+        assert logs["terminal"]["terminal_exception"] == "boom"
+        assert logs["terminal"]["scholar_results"] == []
+        assert logs["running"] == {}
+    finally:
+        await db_session.rollback()
+        await asyncio.to_thread(command.upgrade, alembic_config, "head")
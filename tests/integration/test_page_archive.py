@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.runtime_deps import get_scholar_source
+from app.main import app
+from app.services.dbops import run_page_archive_prune, run_page_archive_reparse
+from app.services.ingestion import page_archive
+from app.services.scholar.source import FetchResult
+from app.settings import settings
+from tests.integration.helpers import (
+    api_csrf_headers,
+    insert_user,
+    login_user,
+    wait_for_run_complete,
+)
+
+SCHOLAR_ID = "pageArchiv01"
+
+PROFILE_HTML = f"""
+<html>
+  <body>
+    <div id="gsc_prf_in">Archived Scholar</div>
+    <span id="gsc_a_nn">Articles 1-2</span>
+    <table>
+      <tbody id="gsc_a_b">
+        <tr class="gsc_a_tr">
+          <td class="gsc_a_t">
+            <a class="gsc_a_at" href="/citations?view_op=view_citation&amp;citation_for_view={SCHOLAR_ID}:arc111"
+            >Archived Paper One</a>
+            <div class="gs_gray">A Author</div>
+            <div class="gs_gray">Venue One</div>
+          </td>
+          <td class="gsc_a_c"><a class="gsc_a_ac">3</a></td>
+          <td class="gsc_a_y"><span class="gsc_a_h">2023</span></td>
+        </tr>
+        <tr class="gsc_a_tr">
+          <td class="gsc_a_t">
+            <a class="gsc_a_at" href="/citations?view_op=view_citation&amp;citation_for_view={SCHOLAR_ID}:arc222"
+            >Archived Paper Two</a>
+            <div class="gs_gray">B Author</div>
+            <div class="gs_gray">Venue Two</div>
+          </td>
+          <td class="gsc_a_c"><a class="gsc_a_ac">1</a></td>
+          <td class="gsc_a_y"><span class="gsc_a_h">2024</span></td>
+        </tr>
+      </tbody>
+    </table>
+  </body>
+</html>
+"""
+
+
+class _StaticScholarSource:
+    async def fetch_profile_html(self, scholar_id: str) -> FetchResult:
+        return self._result(scholar_id)
+
+    async def fetch_profile_page_html(self, scholar_id: str, *, cstart: int, pagesize: int) -> FetchResult:
+        return self._result(scholar_id)
+
+    def _result(self, scholar_id: str) -> FetchResult:
+        return FetchResult(
+            requested_url=f"https://scholar.google.com/citations?hl=en&user={scholar_id}",
+            status_code=200,
+            final_url=f"https://scholar.google.com/citations?hl=en&user={scholar_id}",
+            body=PROFILE_HTML,
+            error=None,
+        )
+
+
+@pytest.fixture
+def archive_dir(tmp_path: Path):
+    previous = (settings.ingestion_page_archive_enabled, settings.ingestion_page_archive_dir)
+    object.__setattr__(settings, "ingestion_page_archive_enabled", True)
+    object.__setattr__(settings, "ingestion_page_archive_dir", str(tmp_path))
+    yield tmp_path
+    object.__setattr__(settings, "ingestion_page_archive_enabled", previous[0])
+    object.__setattr__(settings, "ingestion_page_archive_dir", previous[1])
+
+
+async def _link_count(db_session: AsyncSession, scholar_profile_id: int) -> int:
+    result = await db_session.execute(
+        text("SELECT count(*) FROM scholar_publications WHERE scholar_profile_id = :scholar_profile_id"),
+        {"scholar_profile_id": scholar_profile_id},
+    )
+    return int(result.scalar_one())
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_archived_pages_reparse_and_prune_without_network(db_session: AsyncSession, archive_dir: Path) -> None:
+    await insert_user(db_session, email="page-archive-admin@example.com", password="admin-password", is_admin=True)
+    await insert_user(db_session, email="page-archive@example.com", password="api-password")
+
+    app.dependency_overrides[get_scholar_source] = lambda: _StaticScholarSource()
+    try:
+        with TestClient(app) as client:
+            login_user(client, email="page-archive@example.com", password="api-password")
+            headers = api_csrf_headers(client)
+            create_resp = client.post("/api/v1/scholars", json={"scholar_id": SCHOLAR_ID}, headers=headers)
+            assert create_resp.status_code == 201
+            scholar_profile_id = int(create_resp.json()["data"]["id"])
+            run_resp = client.post("/api/v1/runs/manual", headers={**headers, "Idempotency-Key": "archive-run-001"})
+            assert run_resp.status_code == 200
+            run_data = await wait_for_run_complete(client, int(run_resp.json()["data"]["run_id"]))
+            assert run_data["scholar_results"][0]["outcome"] == "success"
+
+            admin = TestClient(app)
+            login_user(admin, email="page-archive-admin@example.com", password="admin-password")
+            usage = admin.get("/api/v1/admin/db/page-archive").json()["data"]
+    finally:
+        app.dependency_overrides.pop(get_scholar_source, None)
+
+    assert usage["entry_count"] == 1
+    assert usage["blob_count"] == 1
+    assert 0 < usage["stored_bytes"] < usage["raw_bytes"]
+    assert len(page_archive.scan_blobs(archive_dir)) == 1
+
+    await db_session.execute(
+        text("DELETE FROM scholar_publications WHERE scholar_profile_id = :scholar_profile_id"),
+        {"scholar_profile_id": scholar_profile_id},
+    )
+    await db_session.commit()
+
+    dry_run = await run_page_archive_reparse(db_session, scholar_profile_ids=[scholar_profile_id])
+    assert dry_run["summary"]["state_counts"] == {"ok": 1}
+    assert dry_run["summary"]["publication_count"] == 2
+    assert await _link_count(db_session, scholar_profile_id) == 0
+
+    applied = await run_page_archive_reparse(db_session, scholar_profile_ids=[scholar_profile_id], dry_run=False)
+    assert applied["status"] == "completed"
+    assert applied["summary"]["discovered_publications"] == 2
+    assert applied["summary"]["pages_per_second"] > 0
+    assert await _link_count(db_session, scholar_profile_id) == 2
+
+    # A fresh file survives the orphan grace period even once its entry is gone.
+    pruned = await run_page_archive_prune(db_session, retention_days=0, keep_latest=0, dry_run=False)
+    assert pruned["summary"]["deleted_entries"] == 1
+    assert pruned["summary"]["orphan_blobs_deleted"] == 0
+    assert pruned["summary"]["disk_blob_count"] == 1
+
+    blob = page_archive.scan_blobs(archive_dir)[0]
+    old = time.time() - 2 * 86_400
+    os.utime(blob.path, (old, old))
+    swept = await run_page_archive_prune(db_session, retention_days=0, keep_latest=0, dry_run=False)
+    assert swept["summary"]["orphan_blobs_deleted"] == 1
+    assert swept["summary"]["bytes_reclaimed"] == blob.size_bytes
+    assert page_archive.scan_blobs(archive_dir) == []
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Publication, ScholarProfile, ScholarPublication
+from app.services.portability import import_publications_in_chunks
+from app.services.portability.publication_import import _initialize_import_counters
+from tests.integration.helpers import insert_user
+
+EXPECTED_COUNTERS = {
+    "skipped_records": 2,
+    "publications_created": 1,
+    "publications_updated": 4,
+    "links_created": 3,
+    "links_updated": 3,
+}
+
+
+async def _seed_library(db_session: AsyncSession) -> dict[str, ScholarProfile]:
+    user_id = await insert_user(db_session, email="bulk-import@example.com", password="api-password")
+    first = ScholarProfile(user_id=user_id, scholar_id="bulkImport01", display_name="First")
+    second = ScholarProfile(user_id=user_id, scholar_id="bulkImport02", display_name="Second")
+    alpha = Publication(
+        cluster_id="clusterAlpha",
+        fingerprint_sha256="a" * 64,
+        title_raw="Alpha",
+        title_normalized="alpha",
+        citation_count=0,
+    )
+    beta = Publication(fingerprint_sha256="b" * 64, title_raw="Beta", title_normalized="beta", citation_count=0)
+    gamma = Publication(
+        fingerprint_sha256="c" * 64,
+        title_raw="Gamma Ray",
+        title_normalized="gammaray",
+        citation_count=0,
+    )
+    db_session.add_all([first, second, alpha, beta, gamma])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            ScholarPublication(scholar_profile_id=first.id, publication_id=alpha.id, is_read=False),
+            ScholarPublication(scholar_profile_id=first.id, publication_id=gamma.id, is_read=False),
+        ]
+    )
+    await db_session.commit()
+    return {"bulkImport01": first, "bulkImport02": second}
+
+
+def _payload() -> list[dict[str, Any]]:
+    first, second = "bulkImport01", "bulkImport02"
+    return [
+        # Chunk 1: cluster, fingerprint and title matches, then a title match on a row renamed earlier.
+        {"scholar_id": first, "cluster_id": "clusterAlpha", "title": "Alpha Revised", "year": 2020},
+        {"scholar_id": second, "title": "Beta", "fingerprint_sha256": "b" * 64},
+        {"scholar_id": first, "title": "GAMMA RAY", "is_read": True},
+        {"scholar_id": first, "title": "ALPHA REVISED", "year": 2020, "venue_text": "Venue"},
+        # Chunk 2: a new publication reused by cluster and by fingerprint within the chunk.
+        {"scholar_id": second, "cluster_id": "clusterDelta", "title": "Delta", "author_text": "D. Author"},
+        {"scholar_id": first, "cluster_id": "clusterDelta", "title": "Delta", "author_text": "D. Author"},
+        {"scholar_id": second, "title": "Delta", "author_text": "D. Author", "is_read": True},
+        {"scholar_id": first},
+        # Chunk 3: a title match on a link committed by the previous chunk.
+        {"scholar_id": "unknownXXXXX", "title": "Nobody"},
+        {"scholar_id": first, "title": "delta", "is_read": True},
+    ]
+
+
+async def _library_state(db_session: AsyncSession) -> tuple[dict[str, tuple[Any, ...]], set[tuple[str, str, bool]]]:
+    publications = await db_session.execute(
+        select(
+            Publication.fingerprint_sha256,
+            Publication.cluster_id,
+            Publication.title_raw,
+            Publication.year,
+            Publication.venue_text,
+            Publication.author_text,
+        )
+    )
+    links = await db_session.execute(
+        select(ScholarProfile.scholar_id, Publication.title_raw, ScholarPublication.is_read)
+        .join(ScholarProfile, ScholarProfile.id == ScholarPublication.scholar_profile_id)
+        .join(Publication, Publication.id == ScholarPublication.publication_id)
+    )
+    return (
+        {row[0]: tuple(row[1:]) for row in publications.all()},
+        {(scholar_id, title, bool(is_read)) for scholar_id, title, is_read in links.all()},
+    )
+
+
+def _assert_expected_library(publications: dict[str, tuple[Any, ...]], links: set[tuple[str, str, bool]]) -> None:
+    assert len(publications) == 4
+    assert publications["a" * 64] == ("clusterAlpha", "ALPHA REVISED", 2020, "Venue", None)
+    assert publications["b" * 64] == (None, "Beta", None, None, None)
+    assert publications["c" * 64] == (None, "GAMMA RAY", None, None, None)
+    delta = next(values for values in publications.values() if values[0] == "clusterDelta")
+    assert delta == ("clusterDelta", "delta", None, None, None)
+    assert links == {
+        ("bulkImport01", "ALPHA REVISED", False),
+        ("bulkImport01", "GAMMA RAY", True),
+        ("bulkImport02", "Beta", False),
+        ("bulkImport02", "delta", True),
+        ("bulkImport01", "delta", True),
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_chunked_import_resolves_like_entry_by_entry_import(db_session: AsyncSession) -> None:
+    scholar_map = await _seed_library(db_session)
+    counters = {"skipped_records": 0}
+    _initialize_import_counters(counters)
+    committed: list[int] = []
+
+    async def _record(next_offset: int, _counters: dict[str, int]) -> None:
+        committed.append(next_offset)
+
+    await import_publications_in_chunks(
+        db_session,
+        scholar_map=scholar_map,
+        publications=_payload(),
+        counters=counters,
+        chunk_size=4,
+        on_chunk_imported=_record,
+    )
+
+    assert counters == EXPECTED_COUNTERS
+    assert committed == [4, 8, 10]
+    _assert_expected_library(*await _library_state(db_session))
+    feed_rows = await db_session.execute(text("SELECT count(*) FROM user_publication_feed"))
+    assert int(feed_rows.scalar_one()) == 4
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_chunked_import_resumes_after_last_committed_chunk(db_session: AsyncSession) -> None:
+    scholar_map = await _seed_library(db_session)
+    counters = {"skipped_records": 0}
+    _initialize_import_counters(counters)
+    checkpoints: list[tuple[int, dict[str, int]]] = []
+
+    async def _interrupt(next_offset: int, snapshot: dict[str, int]) -> None:
+        if checkpoints:
+            raise RuntimeError("worker stopped")
+        checkpoints.append((next_offset, snapshot))
+
+    with pytest.raises(RuntimeError, match="worker stopped"):
+        await import_publications_in_chunks(
+            db_session,
+            scholar_map=scholar_map,
+            publications=_payload(),
+            counters=counters,
+            chunk_size=4,
+            on_chunk_imported=_interrupt,
+        )
+
+    # The second chunk rolls back with its checkpoint; the first one is durable.
+    await db_session.rollback()
+    for profile in scholar_map.values():
+        await db_session.refresh(profile)
+    next_offset, snapshot = checkpoints[-1]
+    assert next_offset == 4
+    resumed = await import_publications_in_chunks(
+        db_session,
+        scholar_map=scholar_map,
+        publications=_payload(),
+        counters=dict(snapshot),
+        start_offset=next_offset,
+        chunk_size=4,
+    )
+
+    assert resumed == EXPECTED_COUNTERS
+    _assert_expected_library(*await _library_state(db_session))
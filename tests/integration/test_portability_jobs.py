@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import DataRepairJob, Publication, ScholarProfile
+from app.main import app
+from app.services.portability import (
+    PORTABILITY_IMPORT_JOB_NAME,
+    PortabilityJobConflictError,
+    create_portability_job,
+    read_ndjson_export,
+    resume_stale_portability_jobs,
+)
+from app.services.portability import jobs as portability_jobs
+from app.settings import settings
+from tests.integration.helpers import api_csrf_headers, insert_user, login_user
+
+ACTIVE_JOB_STATUSES = {"planned", "running"}
+
+
+@pytest.fixture
+def portability_job_dir(tmp_path: Path) -> Iterator[Path]:
+    previous = settings.portability_job_dir
+    object.__setattr__(settings, "portability_job_dir", str(tmp_path))
+    try:
+        yield tmp_path
+    finally:
+        object.__setattr__(settings, "portability_job_dir", previous)
+
+
+def _ndjson(records: list[tuple[str, dict[str, Any]]]) -> bytes:
+    return b"".join(json.dumps({"type": record_type, **record}).encode() + b"\n" for record_type, record in records)
+
+
+def _export_records(publication_count: int) -> list[tuple[str, dict[str, Any]]]:
+    records: list[tuple[str, dict[str, Any]]] = [
+        ("header", {"schema_version": 1, "exported_at": "2026-10-19T00:00:00+00:00"}),
+        ("scholar", {"scholar_id": "jobScholar01", "display_name": "Job Scholar"}),
+    ]
+    records.extend(
+        ("publication", {"scholar_id": "jobScholar01", "title": f"Job Paper {index}", "year": 2000 + index})
+        for index in range(publication_count)
+    )
+    return records
+
+
+async def _wait_for_job(client: TestClient, path: str, *, max_retries: int = 150) -> dict[str, Any]:
+    for _ in range(max_retries):
+        response = client.get(path)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        if data["status"] not in ACTIVE_JOB_STATUSES:
+            return data
+        await asyncio.sleep(0.1)
+    raise AssertionError(f"Job at {path} did not finish.")
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_import_job_spools_upload_and_reports_progress(
+    db_session: AsyncSession,
+    portability_job_dir: Path,
+) -> None:
+    await insert_user(db_session, email="api-import-job@example.com", password="api-password")
+
+    with TestClient(app) as client:
+        login_user(client, email="api-import-job@example.com", password="api-password")
+        response = client.post(
+            "/api/v1/scholars/import-jobs",
+            content=gzip.compress(_ndjson(_export_records(5))),
+            headers={**api_csrf_headers(client), "Content-Type": "application/gzip"},
+        )
+        assert response.status_code == 202
+        created = response.json()["data"]
+        assert (created["kind"], created["status"]) == ("import", "running")
+
+        job = await _wait_for_job(client, f"/api/v1/scholars/import-jobs/{created['id']}")
+        assert client.get(f"/api/v1/scholars/export-jobs/{created['id']}").status_code == 404
+
+    assert job["status"] == "completed", job["error"]
+    assert (job["rows_total"], job["rows_done"], job["eta_seconds"]) == (5, 5, 0)
+    assert job["rows_per_second"] > 0
+    assert job["counters"]["scholars_created"] == 1
+    assert job["counters"]["publications_created"] == 5
+    assert job["counters"]["links_created"] == 5
+    assert list(portability_job_dir.iterdir()) == []
+    titles = await db_session.execute(select(Publication.title_raw).order_by(Publication.title_raw))
+    assert list(titles.scalars().all()) == [f"Job Paper {index}" for index in range(5)]
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_import_job_rejects_oversized_and_malformed_uploads(
+    db_session: AsyncSession,
+    portability_job_dir: Path,
+) -> None:
+    await insert_user(db_session, email="api-import-job-bad@example.com", password="api-password")
+    previous_max_bytes = settings.portability_upload_max_bytes
+    object.__setattr__(settings, "portability_upload_max_bytes", 64)
+    try:
+        with TestClient(app) as client:
+            login_user(client, email="api-import-job-bad@example.com", password="api-password")
+            headers = api_csrf_headers(client)
+            too_large = client.post("/api/v1/scholars/import-jobs", content=b"x" * 65, headers=headers)
+            assert too_large.status_code == 413
+            assert too_large.json()["error"]["code"] == "import_upload_too_large"
+
+            malformed = client.post(
+                "/api/v1/scholars/import-jobs", content=b'{"type": "header"}\n[]\n', headers=headers
+            )
+            assert malformed.status_code == 202
+            job = await _wait_for_job(client, f"/api/v1/scholars/import-jobs/{malformed.json()['data']['id']}")
+    finally:
+        object.__setattr__(settings, "portability_upload_max_bytes", previous_max_bytes)
+
+    assert job["status"] == "failed"
+    assert job["error"] == "Line 2 is not a JSON object."
+    assert list(portability_job_dir.iterdir()) == []
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_export_job_writes_downloadable_ndjson(
+    db_session: AsyncSession,
+    portability_job_dir: Path,
+) -> None:
+    await insert_user(db_session, email="api-export-job@example.com", password="api-password")
+
+    with TestClient(app) as client:
+        login_user(client, email="api-export-job@example.com", password="api-password")
+        headers = api_csrf_headers(client)
+        imported = client.post(
+            "/api/v1/scholars/import",
+            json=read_ndjson_export(_ndjson(_export_records(3)).splitlines()),
+            headers=headers,
+        )
+        assert imported.status_code == 200
+        streamed = read_ndjson_export(client.get("/api/v1/scholars/export", params={"format": "ndjson"}).iter_lines())
+
+        response = client.post("/api/v1/scholars/export-jobs", params={"gzip": "true"}, headers=headers)
+        assert response.status_code == 202
+        job_id = response.json()["data"]["id"]
+        job = await _wait_for_job(client, f"/api/v1/scholars/export-jobs/{job_id}")
+        download = client.get(f"/api/v1/scholars/export-jobs/{job_id}/download")
+
+    assert job["status"] == "completed", job["error"]
+    assert (job["rows_total"], job["rows_done"], job["download_ready"]) == (4, 4, True)
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/gzip"
+    exported = read_ndjson_export(gzip.decompress(download.content).splitlines())
+    assert exported["scholars"] == streamed["scholars"]
+    assert exported["publications"] == streamed["publications"]
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_stale_import_job_resumes_after_last_committed_chunk(
+    db_session: AsyncSession,
+    portability_job_dir: Path,
+) -> None:
+    user_id = await insert_user(db_session, email="api-import-resume@example.com", password="api-password")
+    stale_at = datetime.now(UTC) - timedelta(minutes=10)
+    job = DataRepairJob(
+        job_name=PORTABILITY_IMPORT_JOB_NAME,
+        scope={"user_id": user_id},
+        dry_run=False,
+        status="running",
+        started_at=stale_at,
+        summary={
+            "phase": "importing",
+            "worker_token": "lost-worker",
+            "attempt": 1,
+            "rows_total": 4,
+            "rows_done": 2,
+            "next_offset": 2,
+            "counters": {
+                "scholars_created": 1,
+                "scholars_updated": 0,
+                "skipped_records": 0,
+                "publications_created": 2,
+                "publications_updated": 0,
+                "links_created": 2,
+                "links_updated": 0,
+            },
+        },
+    )
+    interrupted_upload = DataRepairJob(
+        job_name=PORTABILITY_IMPORT_JOB_NAME,
+        scope={"user_id": user_id + 1, "file": "import-missing.upload"},
+        dry_run=False,
+        status="planned",
+        summary={"phase": "uploading"},
+    )
+    db_session.add_all([job, interrupted_upload])
+    await db_session.flush()
+    job.scope = {"user_id": user_id, "file": f"import-{job.id}.upload"}
+    await db_session.commit()
+    await db_session.execute(update(DataRepairJob).values(updated_at=stale_at))
+    await db_session.commit()
+    (portability_job_dir / f"import-{job.id}.upload").write_bytes(_ndjson(_export_records(4)))
+
+    with pytest.raises(PortabilityJobConflictError):
+        await create_portability_job(
+            db_session,
+            user_id=user_id,
+            job_name=PORTABILITY_IMPORT_JOB_NAME,
+            requested_by=None,
+        )
+
+    assert await resume_stale_portability_jobs(db_session) == 1
+    await asyncio.gather(*portability_jobs._background_tasks)
+
+    await db_session.refresh(job)
+    await db_session.refresh(interrupted_upload)
+    assert job.status == "completed", job.error_text
+    assert (job.summary["attempt"], job.summary["rows_done"], job.summary["next_offset"]) == (2, 4, 4)
+    assert job.summary["counters"]["scholars_created"] == 1
+    assert job.summary["counters"]["publications_created"] == 4
+    assert job.summary["counters"]["links_created"] == 4
+    assert (interrupted_upload.status, interrupted_upload.error_text) == (
+        "failed",
+        "Interrupted before the job started.",
+    )
+    # Entries before the checkpoint belong to the lost attempt and are not replayed.
+    titles = await db_session.execute(select(Publication.title_raw).order_by(Publication.title_raw))
+    assert list(titles.scalars().all()) == ["Job Paper 2", "Job Paper 3"]
+    profiles = await db_session.execute(select(ScholarProfile.scholar_id).where(ScholarProfile.user_id == user_id))
+    assert list(profiles.scalars().all()) == ["jobScholar01"]
+    assert list(portability_job_dir.iterdir()) == []
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_slow_upload_keeps_job_fresh_and_only_planned_jobs_start(
+    db_session: AsyncSession,
+    portability_job_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user_id = await insert_user(db_session, email="api-import-heartbeat@example.com", password="api-password")
+    job = await create_portability_job(
+        db_session,
+        user_id=user_id,
+        job_name=PORTABILITY_IMPORT_JOB_NAME,
+        requested_by=None,
+    )
+    stale_at = datetime.now(UTC) - timedelta(minutes=10)
+    await db_session.execute(update(DataRepairJob).where(DataRepairJob.id == job.id).values(updated_at=stale_at))
+    await db_session.commit()
+    monkeypatch.setattr(portability_jobs, "_HEARTBEAT_INTERVAL_SECONDS", 0.01)
+
+    async def _slow_chunks() -> AsyncIterator[bytes]:
+        for record in _export_records(2):
+            await asyncio.sleep(0.05)
+            yield _ndjson([record])
+
+    await portability_jobs.spool_import_upload(job, _slow_chunks(), max_bytes=1_000_000)
+    await db_session.refresh(job)
+    assert job.updated_at > stale_at
+    assert await resume_stale_portability_jobs(db_session) == 0
+
+    await portability_jobs.fail_portability_job(db_session, job=job, error_text="Upload was interrupted.")
+    with pytest.raises(PortabilityJobConflictError, match="interrupted before it started"):
+        await portability_jobs.start_portability_job(db_session, job=job)
+    await db_session.refresh(job)
+    assert (job.status, job.started_at) == ("failed", None)
+    assert not portability_jobs._background_tasks
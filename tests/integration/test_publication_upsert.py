@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import CrawlRun, Publication, RunStatus, RunTriggerType, ScholarProfile
+from app.services.ingestion import publication_upsert
+from app.services.ingestion.fingerprints import build_publication_fingerprint
+from app.services.scholar.parser_types import PublicationCandidate
+from tests.integration.helpers import insert_user
+
+
+def _candidate(title: str, *, cluster_id: str | None, citation_count: int = 0) -> PublicationCandidate:
+    return PublicationCandidate(
+        title=title,
+        title_url=f"/citations?view_op=view_citation&citation_for_view=batchUpsert01:{cluster_id or 'none'}",
+        cluster_id=cluster_id,
+        year=2024,
+        citation_count=citation_count,
+        authors_text="A Author, B Author",
+        venue_text="Journal of Batches",
+        pdf_url=None,
+    )
+
+
+async def _seed_scholar_and_run(db_session: AsyncSession) -> tuple[ScholarProfile, CrawlRun]:
+    user_id = await insert_user(db_session, email="batch-upsert@example.com", password="api-password")
+    scholar = ScholarProfile(user_id=user_id, scholar_id="batchUpsert01", display_name="Batch Upsert")
+    run = CrawlRun(
+        user_id=user_id,
+        trigger_type=RunTriggerType.MANUAL,
+        status=RunStatus.RUNNING,
+        scholar_count=1,
+        new_pub_count=0,
+    )
+    db_session.add_all([scholar, run])
+    await db_session.commit()
+    return scholar, run
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_batch_upsert_matches_existing_rows_and_links_new_ones(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scholar, run = await _seed_scholar_and_run(db_session)
+    existing_candidate = _candidate("Existing Fingerprint Match", cluster_id=None)
+    existing = Publication(
+        fingerprint_sha256=build_publication_fingerprint(existing_candidate),
+        title_raw="Existing Fingerprint Match",
+        title_normalized="existingfingerprintmatch",
+        citation_count=1,
+    )
+    db_session.add(existing)
+    await db_session.commit()
+
+    published: list[dict[str, Any]] = []
+
+    async def _capture_publish(*, run_id: int, event_type: str, data: dict[str, Any]) -> None:
+        published.append({"run_id": run_id, "event_type": event_type, **data})
+
+    monkeypatch.setattr(publication_upsert.run_events, "publish", _capture_publish)
+
+    page = [
+        _candidate("Brand New Cluster Paper", cluster_id="clusterA", citation_count=3),
+        _candidate("Existing Fingerprint Match", cluster_id=None, citation_count=9),
+        _candidate("Brand New Cluster Paper (duplicate row)", cluster_id="clusterA", citation_count=4),
+    ]
+    discovered = await publication_upsert.upsert_profile_publications(
+        db_session,
+        run=run,
+        scholar=scholar,
+        publications=page,
+    )
+
+    assert discovered == 2
+    assert int(run.new_pub_count) == 2
+    assert [event["event_type"] for event in published] == ["publication_discovered"] * 2
+    assert [event["new_publication_count"] for event in published] == [1, 2]
+    assert published[1]["publication_id"] == existing.id
+
+    rows = await db_session.execute(
+        text("SELECT cluster_id, citation_count FROM publications ORDER BY id"),
+    )
+    assert [tuple(row) for row in rows] == [(None, 9), ("clusterA", 4)]
+    keys = await db_session.execute(
+        text("SELECT dedup_title_text, dedup_title_tokens FROM publications WHERE cluster_id = 'clusterA'"),
+    )
+    assert tuple(keys.one()) == ("brand new cluster paper", ["brand", "cluster", "new", "paper"])
+    link_count = await db_session.execute(
+        text("SELECT count(*) FROM scholar_publications WHERE scholar_profile_id = :id"),
+        {"id": scholar.id},
+    )
+    assert int(link_count.scalar_one()) == 2
+    assert scholar.baseline_completed is True
+
+    rediscovered = await publication_upsert.upsert_profile_publications(
+        db_session,
+        run=run,
+        scholar=scholar,
+        publications=page,
+    )
+    assert rediscovered == 0
+    assert len(published) == 2
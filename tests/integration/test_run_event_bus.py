@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.runs.event_bus_postgres import PostgresRunEventPublisher
+
+
+@pytest.mark.integration
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_postgres_event_bus_delivers_across_publishers(migrated_database: None) -> None:
+    ingestion_worker = PostgresRunEventPublisher()
+    api_worker = PostgresRunEventPublisher()
+    await api_worker.start()
+    try:
+        assert await api_worker.wait_listening(timeout=5.0)
+        subscription = api_worker.subscribe(42)
+
+        await ingestion_worker.publish(42, "scholar_progress", {"visited": 0, "finished": 0, "total": 2})
+        await ingestion_worker.publish(42, "scholar_progress", {"visited": 1, "finished": 0, "total": 2})
+        await ingestion_worker.publish(42, "publication_discovered", {"publication_id": 9})
+
+        first = await asyncio.wait_for(subscription.get(), timeout=5.0)
+        second = await asyncio.wait_for(subscription.get(), timeout=5.0)
+        assert (first.type, first.data) == ("scholar_progress", {"visited": 1, "finished": 0, "total": 2})
+        assert (second.type, second.data) == ("publication_discovered", {"publication_id": 9})
+
+        replay = api_worker.subscribe(42, last_event_id=first.event_id)
+        assert (await replay.get()).data == {"publication_id": 9}
+    finally:
+        await ingestion_worker.stop()
+        await api_worker.stop()
+    assert not api_worker.is_listening()
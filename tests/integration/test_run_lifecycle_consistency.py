@@ -341,28 +341,35 @@ async def test_partial_discovery_exception_keeps_new_pub_count_consistent(
         scholar_count=1,
         new_pub_count=0,
     )
-    publication = Publication(
-        fingerprint_sha256=f"{(user_id + 777):064x}",
-        title_raw="Persisted Discovery",
-        title_normalized="persisted discovery",
-        citation_count=0,
-    )
-    db_session.add_all([run, publication])
+    publications_to_link = [
+        Publication(
+            fingerprint_sha256=f"{(user_id + offset):064x}",
+            title_raw=title,
+            title_normalized=title.lower(),
+            citation_count=0,
+        )
+        for offset, title in [(777, "Persisted Discovery"), (778, "Will Fail")]
+    ]
+    db_session.add_all([run, *publications_to_link])
     await db_session.commit()
     run_id = int(run.id)
 
-    call_count = 0
+    async def _resolve_publications_stub(*_args: Any, **_kwargs: Any) -> list[Publication]:
+        return list(publications_to_link)
+
+    class _FailingPublisher:
+        def __init__(self) -> None:
+            self.call_count = 0
 
-    async def _resolve_publication_stub(*_args: Any, **_kwargs: Any) -> Publication:
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            return publication
-        raise RuntimeError("mid_page_failure")
+        async def publish(self, *_args: Any, **_kwargs: Any) -> None:
+            self.call_count += 1
+            if self.call_count > 1:
+                raise RuntimeError("mid_page_failure")
 
     from app.services.ingestion import publication_upsert
 
-    monkeypatch.setattr(publication_upsert, "resolve_publication", _resolve_publication_stub)
+    monkeypatch.setattr(publication_upsert, "resolve_publications", _resolve_publications_stub)
+    monkeypatch.setattr(publication_upsert, "run_events", _FailingPublisher())
 
     from app.db.models import ScholarProfile
     from app.services.scholar.parser_types import PublicationCandidate
@@ -372,7 +379,7 @@ async def test_partial_discovery_exception_keeps_new_pub_count_consistent(
 
     publications = [
         PublicationCandidate(
-            title="Persisted Discovery",
+            title=publication.title_raw,
             title_url=None,
             cluster_id=None,
             year=None,
@@ -380,17 +387,8 @@ async def test_partial_discovery_exception_keeps_new_pub_count_consistent(
             authors_text=None,
             venue_text=None,
             pdf_url=None,
-        ),
-        PublicationCandidate(
-            title="Will Fail",
-            title_url=None,
-            cluster_id=None,
-            year=None,
-            citation_count=0,
-            authors_text=None,
-            venue_text=None,
-            pdf_url=None,
-        ),
+        )
+        for publication in publications_to_link
     ]
 
     with pytest.raises(RuntimeError, match="mid_page_failure"):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import random
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -284,3 +285,119 @@ async def test_merge_near_duplicate_cluster_merges_non_winner_members() -> None:
 
     assert merged == 2
     assert mock_merge.await_count == 2
+
+
+def _brute_force_groups(
+    candidates: list[dedup_service._NearDuplicateCandidate],
+    after_publication_id: int | None = None,
+    **thresholds: float,
+) -> list[list[int]]:
+    parent = {candidate.publication_id: candidate.publication_id for candidate in candidates}
+    for index, left in enumerate(candidates):
+        for right in candidates[index + 1 :]:
+            if (
+                after_publication_id is not None
+                and max(left.publication_id, right.publication_id) <= after_publication_id
+            ):
+                continue
+            if dedup_service._is_near_duplicate_pair(left, right, **thresholds):
+                dedup_service._union(parent, left.publication_id, right.publication_id)
+    groups = dedup_service._grouped_candidates(candidates, parent)
+    return [[member.publication_id for member in group] for group in groups]
+
+
+@pytest.mark.parametrize("seed", [3, 17, 42])
+@pytest.mark.parametrize(
+    "thresholds",
+    [
+        {"similarity_threshold": 0.78, "min_shared_tokens": 3, "max_year_delta": 1},
+        {"similarity_threshold": 0.5, "min_shared_tokens": 2, "max_year_delta": 3},
+    ],
+)
+def test_prefix_filtered_candidates_match_all_pairs_grouping(seed: int, thresholds: dict[str, float]) -> None:
+    candidates = _random_candidates(seed)
+
+    grouped = dedup_service._cluster_candidate_groups(candidates, **thresholds)
+
+    assert [[member.publication_id for member in group] for group in grouped] == _brute_force_groups(
+        candidates, **thresholds
+    )
+    assert grouped
+
+
+@pytest.mark.parametrize("after_publication_id", [0, 150, 290])
+def test_incremental_candidates_only_pair_newer_publications(after_publication_id: int) -> None:
+    candidates = _random_candidates(42)
+    thresholds = {"similarity_threshold": 0.5, "min_shared_tokens": 2, "max_year_delta": 3}
+
+    grouped = dedup_service._cluster_candidate_groups(
+        candidates,
+        after_publication_id=after_publication_id,
+        **thresholds,
+    )
+
+    assert [[member.publication_id for member in group] for group in grouped] == _brute_force_groups(
+        candidates, after_publication_id, **thresholds
+    )
+    assert all(max(member.publication_id for member in group) > after_publication_id for group in grouped)
+
+
+def test_candidate_from_row_prefers_stored_keys() -> None:
+    candidate = dedup_service._candidate_from_row(
+        publication_id=1,
+        title="Anything at all",
+        year=None,
+        citation_count=0,
+        canonical_text="stored text",
+        tokens=["stored", "tokens"],
+    )
+    assert candidate is not None
+    assert candidate.canonical_text == "stored text"
+    assert candidate.tokens == frozenset({"stored", "tokens"})
+    assert (
+        dedup_service._candidate_from_row(
+            publication_id=2,
+            title="Anything at all",
+            year=None,
+            citation_count=0,
+            canonical_text="the",
+            tokens=[],
+        )
+        is None
+    )
+
+
+def _random_candidates(seed: int) -> list[dedup_service._NearDuplicateCandidate]:
+    rng = random.Random(seed)
+    vocabulary = [f"term{index}" for index in range(40)] + ["learning", "network", "deep", "model"]
+    candidates = []
+    for publication_id in range(1, 301):
+        size = rng.randint(1, 10)
+        words = rng.sample(vocabulary[:12], k=min(size, 4)) + rng.sample(vocabulary, k=size)
+        candidate = dedup_service._candidate_from_row(
+            publication_id=publication_id,
+            title=" ".join(words),
+            year=rng.choice([None, 2019, 2020, 2021, 2024]),
+            citation_count=rng.randint(0, 50),
+        )
+        if candidate is not None:
+            candidates.append(candidate)
+    return candidates
+
+
+def test_incremental_exact_titles_link_every_old_copy() -> None:
+    candidates = [
+        dedup_service._candidate_from_row(publication_id=1, title="Deep nets", year=2001, citation_count=1),
+        dedup_service._candidate_from_row(publication_id=2, title="Deep nets", year=2019, citation_count=1),
+        dedup_service._candidate_from_row(publication_id=3, title="Deep nets", year=2020, citation_count=1),
+    ]
+    assert all(candidate is not None for candidate in candidates)
+    thresholds = {"similarity_threshold": 0.78, "min_shared_tokens": 3, "max_year_delta": 1}
+
+    grouped = dedup_service._cluster_candidate_groups(
+        [candidate for candidate in candidates if candidate is not None],
+        after_publication_id=2,
+        **thresholds,
+    )
+
+    assert [[member.publication_id for member in group] for group in grouped] == [[1, 2, 3]]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.db.models import ScholarProfile
+from app.services.ingestion import crawl_schedule
+from app.settings import settings
+
+RUN_START = datetime(2026, 10, 1, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def adaptive_settings():
+    previous = (
+        settings.ingestion_adaptive_schedule_enabled,
+        settings.ingestion_adaptive_backoff_factor,
+        settings.ingestion_adaptive_max_interval_minutes,
+    )
+    object.__setattr__(settings, "ingestion_adaptive_schedule_enabled", True)
+    object.__setattr__(settings, "ingestion_adaptive_backoff_factor", 2.0)
+    object.__setattr__(settings, "ingestion_adaptive_max_interval_minutes", 1440)
+    yield
+    object.__setattr__(settings, "ingestion_adaptive_schedule_enabled", previous[0])
+    object.__setattr__(settings, "ingestion_adaptive_backoff_factor", previous[1])
+    object.__setattr__(settings, "ingestion_adaptive_max_interval_minutes", previous[2])
+
+
+def _scholar(*, no_change_streak: int = 0, last_change_check_dt: datetime | None = None) -> ScholarProfile:
+    return ScholarProfile(
+        user_id=1,
+        scholar_id="abcDEF123456",
+        change_check_count=0,
+        change_unchanged_count=0,
+        no_change_streak=no_change_streak,
+        last_change_check_dt=last_change_check_dt,
+    )
+
+
+@pytest.mark.parametrize(
+    ("streak", "expected"),
+    [(0, 360), (1, 720), (2, 1440), (3, 1440), (10_000, 1440)],
+)
+def test_adaptive_interval_backs_off_exponentially_up_to_ceiling(adaptive_settings, streak: int, expected: int) -> None:
+    assert crawl_schedule.adaptive_interval_minutes(base_interval_minutes=360, no_change_streak=streak) == expected
+
+
+def test_adaptive_interval_uses_base_when_disabled_or_base_exceeds_ceiling(adaptive_settings) -> None:
+    assert crawl_schedule.adaptive_interval_minutes(base_interval_minutes=2880, no_change_streak=4) == 2880
+
+    object.__setattr__(settings, "ingestion_adaptive_schedule_enabled", False)
+    assert crawl_schedule.adaptive_interval_minutes(base_interval_minutes=360, no_change_streak=4) == 360
+
+
+def test_due_scholars_keeps_unchecked_and_elapsed_profiles(adaptive_settings) -> None:
+    never_checked = _scholar()
+    fresh = _scholar(no_change_streak=0, last_change_check_dt=RUN_START)
+    backed_off = _scholar(no_change_streak=2, last_change_check_dt=RUN_START)
+
+    at_next_run = RUN_START + timedelta(minutes=360)
+    assert crawl_schedule.due_scholars(
+        [never_checked, fresh, backed_off], base_interval_minutes=360, now=at_next_run
+    ) == [never_checked, fresh]
+
+    a_day_later = RUN_START + timedelta(minutes=1440)
+    assert len(crawl_schedule.due_scholars([fresh, backed_off], base_interval_minutes=360, now=a_day_later)) == 2
+
+
+def test_record_first_page_check_extends_and_resets_streak() -> None:
+    scholar = _scholar(no_change_streak=2)
+
+    crawl_schedule.record_first_page_check(
+        scholar,
+        result_entry={"outcome": "success", "start_cstart": 0, "skipped_no_change": True},
+        checked_at=RUN_START,
+    )
+    assert (scholar.no_change_streak, scholar.change_check_count, scholar.change_unchanged_count) == (3, 1, 1)
+    assert scholar.last_change_check_dt == RUN_START
+    assert scholar.last_change_dt is None
+
+    later = RUN_START + timedelta(days=1)
+    crawl_schedule.record_first_page_check(
+        scholar,
+        result_entry={"outcome": "success", "start_cstart": 0, "skipped_no_change": False},
+        checked_at=later,
+    )
+    assert (scholar.no_change_streak, scholar.change_check_count, scholar.change_unchanged_count) == (0, 2, 1)
+    assert scholar.last_change_dt == later
+
+
+@pytest.mark.parametrize(
+    "result_entry",
+    [
+        {"outcome": "failed", "start_cstart": 0},
+        {"outcome": "success", "start_cstart": 100, "skipped_no_change": False},
+    ],
+)
+def test_record_first_page_check_ignores_failures_and_continuations(result_entry: dict) -> None:
+    scholar = _scholar(no_change_streak=2)
+
+    crawl_schedule.record_first_page_check(scholar, result_entry=result_entry, checked_at=RUN_START)
+
+    assert scholar.no_change_streak == 2
+    assert scholar.change_check_count == 0
+    assert scholar.last_change_check_dt is None
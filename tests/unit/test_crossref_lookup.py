@@ -5,6 +5,7 @@ from types import SimpleNamespace
 import pytest
 
 from app.services.crossref import application as crossref_app
+from app.settings import settings
 
 
 def _item(*, title: str, year: int | None, scholar_label: str = "Shinya Yamanaka"):
@@ -101,3 +102,21 @@ async def test_crossref_relaxed_fallback_allows_author_mismatch_for_strong_title
         email=None,
     )
     assert doi == "10.1000/author-fallback"
+
+
+@pytest.mark.asyncio
+async def test_crossref_discovery_is_skipped_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _unexpected_fetch_items(**_kwargs):
+        raise AssertionError("Crossref must not be queried when disabled.")
+
+    monkeypatch.setattr(crossref_app, "_fetch_items", _unexpected_fetch_items)
+    previous = settings.crossref_enabled
+    object.__setattr__(settings, "crossref_enabled", False)
+    try:
+        doi = await crossref_app.discover_doi_for_publication(
+            item=_item(title="Induction of Pluripotent Stem Cells from Adult Human Fibroblasts", year=2007),
+        )
+    finally:
+        object.__setattr__(settings, "crossref_enabled", previous)
+
+    assert doi is None
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from app.db.models import RunStatus
+from app.services.ingestion import enrichment as enrichment_module
+from app.services.ingestion.enrichment import EnrichmentRunner
+from app.services.openalex import client as openalex_client
+from app.services.runs.cancellation import RunCancelToken, run_cancellation
+from app.settings import settings
+
+
+def _publication(publication_id: int, title: str) -> SimpleNamespace:
+    return SimpleNamespace(id=publication_id, title_raw=title, openalex_last_attempt_at=None)
+
+
+class _FakeOpenAlexClient:
+    def __init__(self, *, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requested: list[str] = []
+
+    async def get_works_by_filter(self, filters: dict[str, str], limit: int = 50) -> list[Any]:
+        title = filters["title.search"]
+        self.requested.append(title)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if title == self.fail_on:
+                raise openalex_client.OpenAlexBudgetExhaustedError("budget")
+            return [title]
+        finally:
+            self.in_flight -= 1
+
+
+def _runner_with_stubs(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    publications: list[SimpleNamespace],
+    client: _FakeOpenAlexClient,
+) -> tuple[EnrichmentRunner, list[list[int]], list[bool]]:
+    runner = EnrichmentRunner()
+    applied: list[list[int]] = []
+    flushed: list[bool] = []
+
+    async def _load(db_session, *, run_id):
+        return 1, publications
+
+    async def _enrich_batch(db_session, *, batch, run_id, openalex_works, now, arxiv_lookup_allowed):
+        assert openalex_works == ["|".join(p.title_raw for p in batch)]
+        applied.append([p.id for p in batch])
+        return arxiv_lookup_allowed
+
+    async def _flush(db_session, *, run_id):
+        flushed.append(True)
+
+    monkeypatch.setattr(runner, "_load_unenriched_publications", _load)
+    monkeypatch.setattr(runner, "_enrich_batch", _enrich_batch)
+    monkeypatch.setattr(runner, "_flush_and_sweep_duplicates", _flush)
+    monkeypatch.setattr(openalex_client, "OpenAlexClient", lambda **_kwargs: client)
+    monkeypatch.setattr(enrichment_module, "_chunk_titles_by_url_length", lambda titles: [[t] for t in titles])
+    return runner, applied, flushed
+
+
+@pytest.fixture
+def _never_canceled(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _is_canceled(self, db_session) -> bool:
+        return self.canceled
+
+    monkeypatch.setattr(RunCancelToken, "is_canceled", _is_canceled)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_never_canceled")
+async def test_chunks_fetch_concurrently_and_apply_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    publications = [_publication(index, f"title {index}") for index in range(1, 9)]
+    client = _FakeOpenAlexClient()
+    runner, applied, flushed = _runner_with_stubs(monkeypatch, publications=publications, client=client)
+    previous = settings.openalex_enrichment_max_concurrency
+    object.__setattr__(settings, "openalex_enrichment_max_concurrency", 3)
+    try:
+        await runner.enrich_pending_publications(cast(Any, object()), run_id=5)
+    finally:
+        object.__setattr__(settings, "openalex_enrichment_max_concurrency", previous)
+
+    assert applied == [[index] for index in range(1, 9)]
+    assert client.max_in_flight == 3
+    assert flushed == [True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_never_canceled")
+async def test_budget_exhaustion_stops_remaining_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    publications = [_publication(index, f"title {index}") for index in range(1, 7)]
+    client = _FakeOpenAlexClient(fail_on="title 2")
+    runner, applied, flushed = _runner_with_stubs(monkeypatch, publications=publications, client=client)
+    previous = settings.openalex_enrichment_max_concurrency
+    object.__setattr__(settings, "openalex_enrichment_max_concurrency", 1)
+    try:
+        await runner.enrich_pending_publications(cast(Any, object()), run_id=6)
+    finally:
+        object.__setattr__(settings, "openalex_enrichment_max_concurrency", previous)
+
+    assert applied == [[1]]
+    assert flushed == [True]
+    assert len(client.requested) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_never_canceled")
+async def test_cancel_token_stops_enrichment_between_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    publications = [_publication(index, f"title {index}") for index in range(1, 6)]
+    client = _FakeOpenAlexClient()
+    runner, applied, flushed = _runner_with_stubs(monkeypatch, publications=publications, client=client)
+    apply_batch = runner._enrich_batch
+
+    async def _enrich_then_cancel(db_session, **kwargs):
+        result = await apply_batch(db_session, **kwargs)
+        assert run_cancellation.cancel(7) == 1
+        return result
+
+    monkeypatch.setattr(runner, "_enrich_batch", _enrich_then_cancel)
+
+    await runner.enrich_pending_publications(cast(Any, object()), run_id=7)
+
+    assert applied == [[1]]
+    assert flushed == []
+    assert run_cancellation.cancel(7) == 0
+
+
+class _StatusSession:
+    def __init__(self, status: Any) -> None:
+        self.status = status
+        self.queries = 0
+
+    async def execute(self, _statement: Any) -> Any:
+        self.queries += 1
+        return SimpleNamespace(scalar_one_or_none=lambda: self.status)
+
+
+@pytest.mark.asyncio
+async def test_cancel_token_rechecks_run_status_at_most_once_per_interval() -> None:
+    session = _StatusSession(RunStatus.RESOLVING)
+    token = RunCancelToken(9, status_recheck_seconds=60.0)
+
+    assert await token.is_canceled(cast(Any, session)) is False
+    assert await token.is_canceled(cast(Any, session)) is False
+    assert session.queries == 1
+
+    session.status = RunStatus.CANCELED
+    fresh = RunCancelToken(9, status_recheck_seconds=0.0)
+    assert await fresh.is_canceled(cast(Any, session)) is True
+    assert fresh.canceled
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from app.services.ingestion.fingerprints import (
-    _dedupe_publication_candidates,
     canonical_title_for_dedup,
+    dedupe_publication_candidates,
     fuzzy_titles_match,
     normalize_title,
 )
@@ -101,7 +101,7 @@ class TestDedupePublicationCandidates:
             _candidate("Title A", cluster_id="c1"),
             _candidate("Title A Copy", cluster_id="c1"),
         ]
-        result = _dedupe_publication_candidates(pubs)
+        result = dedupe_publication_candidates(pubs)
         assert len(result) == 1
         assert result[0].title == "Title A"
 
@@ -110,7 +110,7 @@ class TestDedupePublicationCandidates:
             _candidate("Attention Is All You Need"),
             _candidate("Attention Is All You Need."),
         ]
-        result = _dedupe_publication_candidates(pubs)
+        result = dedupe_publication_candidates(pubs)
         assert len(result) == 1
 
     def test_distinct_titles_preserved(self) -> None:
@@ -118,7 +118,7 @@ class TestDedupePublicationCandidates:
             _candidate("Deep Learning for NLP"),
             _candidate("Reinforcement Learning for Robotics"),
         ]
-        result = _dedupe_publication_candidates(pubs)
+        result = dedupe_publication_candidates(pubs)
         assert len(result) == 2
 
     def test_fallback_aligned_with_db_fingerprint(self) -> None:
@@ -136,7 +136,7 @@ class TestDedupePublicationCandidates:
                 venue_text="International Conference for ML",
             ),
         ]
-        result = _dedupe_publication_candidates(pubs)
+        result = dedupe_publication_candidates(pubs)
         # Both share first_author_last_name="smith" and first_venue_word="international"
         assert len(result) == 1
 
@@ -146,7 +146,7 @@ class TestDedupePublicationCandidates:
             _candidate("Comprehensive Survey on Deep Learning Methods"),  # fuzzy match (subtitle stripped)
             _candidate("Completely Different Study"),
         ]
-        result = _dedupe_publication_candidates(pubs)
+        result = dedupe_publication_candidates(pubs)
         assert len(result) == 2
         titles = [p.title for p in result]
         assert "A Comprehensive Survey on Deep Learning Methods" in titles
@@ -171,7 +171,7 @@ class TestDedupePublicationCandidates:
                 venue_text="Comput. Sci",
             ),
         ]
-        result = _dedupe_publication_candidates(pubs)
+        result = dedupe_publication_candidates(pubs)
         assert len(result) == 1
         assert result[0].title == pubs[0].title
 
@@ -182,7 +182,7 @@ class TestDedupePublicationCandidates:
             _candidate("SGD: Stochastic Gradient Descent Revisited"),
             _candidate("Attention Is All You Need"),
         ]
-        result = _dedupe_publication_candidates(pubs)
+        result = dedupe_publication_candidates(pubs)
         assert len(result) == 3
 
     def test_cross_page_dedup_via_seen_canonical(self) -> None:
@@ -197,8 +197,8 @@ class TestDedupePublicationCandidates:
             _candidate("An Entirely Different Paper"),
         ]
 
-        result1 = _dedupe_publication_candidates(page1, seen_canonical=seen)
-        result2 = _dedupe_publication_candidates(page2, seen_canonical=seen)
+        result1 = dedupe_publication_candidates(page1, seen_canonical=seen)
+        result2 = dedupe_publication_candidates(page2, seen_canonical=seen)
 
         assert len(result1) == 1
         # Noisy Adam variant from page 2 is suppressed; distinct paper survives
@@ -211,7 +211,7 @@ class TestDedupePublicationCandidates:
             _candidate("Adam: A Method for Stochastic Optimization", year=2015),
             _candidate("Adam: A method for stochastic optimization, preprint (2014)", year=2014),
         ]
-        result = _dedupe_publication_candidates(pubs)
+        result = dedupe_publication_candidates(pubs)
         assert len(result) == 1
         assert result[0].year == 2015  # first wins
 
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.http import clients as http_clients
+
+_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}"
+
+
+async def _serve_keep_alive(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            writer.write(_RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+async def local_server() -> AsyncIterator[str]:
+    server = await asyncio.start_server(_serve_keep_alive, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    http_clients.reset_http_client_stats()
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await http_clients.close_http_clients()
+        http_clients.reset_http_client_stats()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_reuses_connections_and_reports_host_stats(local_server: str) -> None:
+    client = http_clients.get_http_client(http_clients.UPSTREAM_OPENALEX)
+    assert http_clients.get_http_client(http_clients.UPSTREAM_OPENALEX) is client
+
+    for path in ("/works/a", "/works/b", "/works/c"):
+        response = await client.get(f"{local_server}{path}")
+        assert response.status_code == 200
+
+    stats = http_clients.http_client_stats()[http_clients.UPSTREAM_OPENALEX]["127.0.0.1"]
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+    assert stats["open_connections"] == 1
+    assert stats["reuse_ratio"] == pytest.approx(2 / 3, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_close_http_clients_closes_every_upstream_client(local_server: str) -> None:
+    await http_clients.start_http_clients()
+    started = {
+        name: http_clients.get_http_client(name)
+        for name in (http_clients.UPSTREAM_OPENALEX, http_clients.UPSTREAM_ARXIV, http_clients.UPSTREAM_UNPAYWALL)
+    }
+
+    await http_clients.close_http_clients()
+
+    assert all(client.is_closed for client in started.values())
+    assert http_clients.get_http_client(http_clients.UPSTREAM_ARXIV) is not started[http_clients.UPSTREAM_ARXIV]
+
+
+def test_unknown_upstream_name_is_rejected() -> None:
+    with pytest.raises(KeyError):
+        http_clients.get_http_client("scholar")
+
+
+@pytest.mark.asyncio
+async def test_clients_of_a_previous_loop_are_closed_on_that_loop() -> None:
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def _open_client():
+        return http_clients.get_http_client(http_clients.UPSTREAM_OPENALEX)
+
+    try:
+        previous = asyncio.run_coroutine_threadsafe(_open_client(), other_loop).result(timeout=5)
+
+        current = http_clients.get_http_client(http_clients.UPSTREAM_OPENALEX)
+
+        assert current is not previous
+        for _ in range(100):
+            if previous.is_closed:
+                break
+            await asyncio.sleep(0.01)
+        assert previous.is_closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(timeout=5)
+        other_loop.close()
+        await http_clients.close_http_clients()
@@ -6,44 +6,107 @@ from typing import Any, cast
 import pytest
 
 from app.services.arxiv.errors import ArxivRateLimitError
-from app.services.ingestion.enrichment import EnrichmentRunner
 from app.services.publication_identifiers import application as identifier_service
+from app.services.publication_identifiers.types import IdentifierKind
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.executed: list[Any] = []
+
+    async def execute(self, statement: Any, params: Any = None) -> None:
+        self.executed.append(params)
 
 
 @pytest.mark.asyncio
-async def test_discover_identifiers_for_enrichment_disables_arxiv_on_rate_limit(
+async def test_batched_identifier_discovery_disables_arxiv_on_rate_limit(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    runner = EnrichmentRunner()
-    publication = SimpleNamespace(id=11, author_text="Ada Lovelace")
-    calls = {"sync": 0}
+    publications = [
+        SimpleNamespace(
+            id=publication_id,
+            author_text="Ada Lovelace",
+            title_raw=f"Analytical engines and their notes volume {publication_id}",
+            year=2020,
+            citation_count=0,
+            venue_text=None,
+            pub_url=None,
+            pdf_url=None,
+        )
+        for publication_id in (11, 12, 13)
+    ]
+    arxiv_calls: list[int] = []
+    crossref_calls: list[int] = []
+
+    async def _sync_fields(db_session, *, publications):
+        _ = (db_session, publications)
+
+    async def _kinds(db_session, *, publication_ids):
+        _ = db_session
+        assert publication_ids == [11, 12, 13]
+        return {13: {IdentifierKind.DOI.value}}
 
-    async def _raise_rate_limit(db_session, *, publication, scholar_label):
-        _ = (db_session, publication, scholar_label)
+    async def _no_doi(item):
+        crossref_calls.append(item.publication_id)
+        return None
+
+    async def _arxiv(item):
+        arxiv_calls.append(item.publication_id)
         raise ArxivRateLimitError("arXiv rate limit hit (429) — stopping batch")
 
-    async def _sync_fields(db_session, *, publication):
-        _ = (db_session, publication)
-        calls["sync"] += 1
+    monkeypatch.setattr(identifier_service, "sync_identifiers_for_publications_fields", _sync_fields)
+    monkeypatch.setattr(identifier_service, "_identifier_kinds_by_publication", _kinds)
+    monkeypatch.setattr(identifier_service, "_crossref_doi_candidate", _no_doi)
+    monkeypatch.setattr(identifier_service, "_arxiv_identifier_candidate", _arxiv)
+    session = _RecordingSession()
 
-    monkeypatch.setattr(
-        identifier_service,
-        "discover_and_sync_identifiers_for_publication",
-        _raise_rate_limit,
+    allowed = await identifier_service.discover_and_sync_identifiers_for_publications(
+        cast(Any, session),
+        publications=cast(Any, publications),
+        allow_arxiv_lookup=True,
+        max_concurrency=1,
     )
-    monkeypatch.setattr(identifier_service, "sync_identifiers_for_publication_fields", _sync_fields)
 
-    async def _publish_noop(*args, **kwargs) -> None:
-        _ = (args, kwargs)
+    assert allowed is False
+    assert arxiv_calls == [11]
+    assert crossref_calls == [11]
+    assert session.executed == []
 
-    monkeypatch.setattr(runner, "_publish_identifier_update_event", _publish_noop)
 
-    result = await runner._discover_identifiers_for_enrichment(
-        cast(Any, object()),
-        publication=cast(Any, publication),
-        run_id=321,
-        allow_arxiv_lookup=True,
+@pytest.mark.asyncio
+async def test_batched_identifier_discovery_skips_lookups_when_arxiv_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    publication = SimpleNamespace(
+        id=21,
+        author_text="Ada Lovelace",
+        title_raw="Analytical engines and their notes",
+        year=2020,
+        citation_count=0,
+        venue_text=None,
+        pub_url=None,
+        pdf_url=None,
+    )
+
+    async def _sync_fields(db_session, *, publications):
+        _ = (db_session, publications)
+
+    async def _kinds(db_session, *, publication_ids):
+        _ = (db_session, publication_ids)
+        return {}
+
+    async def _unexpected_lookup(item):
+        raise AssertionError(f"unexpected lookup for {item.publication_id}")
+
+    monkeypatch.setattr(identifier_service, "sync_identifiers_for_publications_fields", _sync_fields)
+    monkeypatch.setattr(identifier_service, "_identifier_kinds_by_publication", _kinds)
+    monkeypatch.setattr(identifier_service, "_crossref_doi_candidate", _unexpected_lookup)
+    monkeypatch.setattr(identifier_service, "_arxiv_identifier_candidate", _unexpected_lookup)
+
+    allowed = await identifier_service.discover_and_sync_identifiers_for_publications(
+        cast(Any, _RecordingSession()),
+        publications=cast(Any, [publication]),
+        allow_arxiv_lookup=False,
     )
 
-    assert result is False
-    assert calls["sync"] == 1
+    assert allowed is False
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app import metrics
+
+
+def test_histogram_renders_cumulative_buckets_per_label_set() -> None:
+    registry = metrics.MetricsRegistry()
+    histogram = registry.register(
+        metrics.Histogram("test_latency_seconds", "Test latency.", labelnames=("route",), buckets=(0.1, 1.0))
+    )
+
+    histogram.observe(0.05, route="/b")
+    histogram.observe(0.1, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(3.0, route="/a")
+
+    assert registry.render().splitlines() == [
+        "# HELP test_latency_seconds Test latency.",
+        "# TYPE test_latency_seconds histogram",
+        'test_latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'test_latency_seconds_bucket{route="/a",le="1.0"} 2',
+        'test_latency_seconds_bucket{route="/a",le="+Inf"} 3',
+        'test_latency_seconds_sum{route="/a"} 3.6',
+        'test_latency_seconds_count{route="/a"} 3',
+        'test_latency_seconds_bucket{route="/b",le="0.1"} 1',
+        'test_latency_seconds_bucket{route="/b",le="1.0"} 1',
+        'test_latency_seconds_bucket{route="/b",le="+Inf"} 1',
+        'test_latency_seconds_sum{route="/b"} 0.05',
+        'test_latency_seconds_count{route="/b"} 1',
+    ]
+
+
+def test_gauge_escapes_label_values_and_clear_drops_series() -> None:
+    gauge = metrics.Gauge("test_items", "Test items.", labelnames=("status",))
+    gauge.set(3, status='say "hi"\n')
+
+    assert gauge.render()[-1] == 'test_items{status="say \\"hi\\"\\n"} 3.0'
+
+    gauge.clear()
+    assert gauge.render() == ["# HELP test_items Test items.", "# TYPE test_items gauge"]
+
+
+def test_sample_http_clients_replaces_upstream_pool_series() -> None:
+    metrics.sample_http_clients(
+        {"openalex": {"api.openalex.org": {"open_connections": 2, "requests": 10, "reuse_ratio": 0.8}}}
+    )
+    metrics.sample_http_clients(
+        {"arxiv": {"export.arxiv.org": {"open_connections": 1, "requests": 4, "reuse_ratio": 0.75}}}
+    )
+
+    body = metrics.REGISTRY.render()
+    assert 'scholarr_upstream_http_open_connections{upstream="arxiv",host="export.arxiv.org"} 1.0' in body
+    assert 'scholarr_upstream_http_requests{upstream="arxiv",host="export.arxiv.org"} 4.0' in body
+    assert 'scholarr_upstream_http_connection_reuse_ratio{upstream="arxiv",host="export.arxiv.org"} 0.75' in body
+    assert "api.openalex.org" not in body
+
+
+def test_metric_rejects_unknown_labels_and_duplicate_names() -> None:
+    registry = metrics.MetricsRegistry()
+    histogram = registry.register(metrics.Histogram("test_seconds", "Test.", labelnames=("outcome",)))
+
+    with pytest.raises(ValueError):
+        histogram.observe(1.0, status="ok")
+    with pytest.raises(ValueError):
+        registry.register(metrics.Gauge("test_seconds", "Duplicate."))
+
+
+def test_track_db_time_counts_statements_inside_the_block_only() -> None:
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with metrics.track_db_time() as db_time:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        connection.execute(text("SELECT 3"))
+
+    assert db_time.statements == 2
+    assert db_time.seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_track_db_time_follows_tasks_started_inside_the_block() -> None:
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(engine)
+
+    def _query() -> None:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    async def _handler() -> None:
+        await asyncio.to_thread(_query)
+
+    with metrics.track_db_time() as db_time:
+        await asyncio.create_task(_handler())
+
+    assert db_time.statements == 1
+
+
+def test_collect_observations_keeps_raw_values_inside_the_block_only() -> None:
+    histogram = metrics.Histogram("test_phase_seconds", "Test phase.", labelnames=("mode",))
+
+    histogram.observe(0.5, mode="inline")
+    with metrics.collect_observations() as observed:
+        histogram.observe(0.25, mode="inline")
+        histogram.observe(2.0, mode="pool")
+    histogram.observe(1.0, mode="inline")
+
+    assert observed == {"test_phase_seconds": [0.25, 2.0]}
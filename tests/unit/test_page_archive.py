@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from app.services.ingestion import page_archive
+from app.services.scholar.parser import ParsedProfilePage, ParseState
+from app.services.scholar.source import FetchResult
+
+
+def _fetch_result(body: str) -> FetchResult:
+    return FetchResult(
+        requested_url="https://scholar.google.com/citations?hl=en&user=abcDEF123456",
+        status_code=200,
+        final_url=None,
+        body=body,
+        error=None,
+    )
+
+
+def _parsed_page(state: ParseState) -> ParsedProfilePage:
+    return ParsedProfilePage(
+        state=state,
+        state_reason="",
+        profile_name=None,
+        profile_image_url=None,
+        publications=[],
+        marker_counts={},
+        warnings=[],
+        has_show_more_button=False,
+        has_operation_error_banner=False,
+        articles_range=None,
+    )
+
+
+def test_write_blob_is_content_addressed_and_round_trips(tmp_path: Path) -> None:
+    body = "<html>" + "profile row " * 500 + "</html>"
+
+    first = page_archive.write_blob(tmp_path, body)
+    second = page_archive.write_blob(tmp_path, body)
+
+    assert first == second
+    assert first.raw_bytes == len(body.encode("utf-8"))
+    assert first.stored_bytes < first.raw_bytes
+    assert page_archive.blob_path(tmp_path, first.body_sha256).parent.name == first.body_sha256[:2]
+    assert page_archive.read_blob(tmp_path, first.body_sha256) == body
+    assert [blob.body_sha256 for blob in page_archive.scan_blobs(tmp_path)] == [first.body_sha256]
+
+
+def test_delete_unreferenced_blobs_spares_referenced_and_recent_files(tmp_path: Path) -> None:
+    referenced = page_archive.write_blob(tmp_path, "<html>kept</html>")
+    orphan = page_archive.write_blob(tmp_path, "<html>orphan</html>")
+    recent_orphan = page_archive.write_blob(tmp_path, "<html>just written</html>")
+    old = time.time() - 7200
+    for blob in (referenced, orphan):
+        os.utime(page_archive.blob_path(tmp_path, blob.body_sha256), (old, old))
+
+    deleted, freed = page_archive.delete_unreferenced_blobs(
+        tmp_path,
+        referenced={referenced.body_sha256},
+        grace_seconds=3600,
+    )
+
+    assert (deleted, freed) == (1, orphan.stored_bytes)
+    remaining = {blob.body_sha256 for blob in page_archive.scan_blobs(tmp_path)}
+    assert remaining == {referenced.body_sha256, recent_orphan.body_sha256}
+
+
+def test_write_blob_reuse_refreshes_file_age_before_orphan_sweep(tmp_path: Path) -> None:
+    blob = page_archive.write_blob(tmp_path, "<html>captured again</html>")
+    old = time.time() - 7200
+    os.utime(page_archive.blob_path(tmp_path, blob.body_sha256), (old, old))
+
+    assert page_archive.write_blob(tmp_path, "<html>captured again</html>") == blob
+    # The new entry has not committed yet, so nothing references the file.
+    deleted, _freed = page_archive.delete_unreferenced_blobs(tmp_path, referenced=set(), grace_seconds=3600)
+
+    assert deleted == 0
+    assert page_archive.read_blob(tmp_path, blob.body_sha256) == "<html>captured again</html>"
+
+
+def test_should_archive_keeps_parseable_and_layout_changed_pages_only() -> None:
+    assert page_archive.should_archive(fetch_result=_fetch_result("<html/>"), parsed_page=_parsed_page(ParseState.OK))
+    assert page_archive.should_archive(
+        fetch_result=_fetch_result("<html/>"),
+        parsed_page=_parsed_page(ParseState.LAYOUT_CHANGED),
+    )
+    assert not page_archive.should_archive(
+        fetch_result=_fetch_result("<html/>"),
+        parsed_page=_parsed_page(ParseState.BLOCKED_OR_CAPTCHA),
+    )
+    assert not page_archive.should_archive(fetch_result=_fetch_result(""), parsed_page=_parsed_page(ParseState.OK))
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from app.services.scholar import parse_executor
+from app.services.scholar import parser as scholar_parser
+from app.services.scholar.parser import ScholarDomInvariantError
+from app.services.scholar.source import FetchResult
+from app.settings import settings
+
+PROFILE_URL = "https://scholar.google.com/citations?hl=en&user=amIMrIEAAAAJ"
+
+
+def _fetch_result(body: str) -> FetchResult:
+    return FetchResult(
+        requested_url=PROFILE_URL,
+        status_code=200,
+        final_url=PROFILE_URL,
+        body=body,
+        error=None,
+    )
+
+
+def _fixture_page() -> FetchResult:
+    return _fetch_result(Path("tests/fixtures/scholar/profile_ok_amIMrIEAAAAJ.html").read_text(encoding="utf-8"))
+
+
+class _BrokenExecutor(Executor):
+    def __init__(self) -> None:
+        self.shutdown_called = False
+
+    def submit(self, fn, /, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self.shutdown_called = True
+
+
+@pytest.fixture
+def executor_settings() -> Iterator[None]:
+    keys = (
+        "scholar_parse_executor_enabled",
+        "scholar_parse_executor_workers",
+        "scholar_parse_executor_min_body_chars",
+    )
+    previous = {key: getattr(settings, key) for key in keys}
+    object.__setattr__(settings, "scholar_parse_executor_enabled", True)
+    object.__setattr__(settings, "scholar_parse_executor_workers", 1)
+    object.__setattr__(settings, "scholar_parse_executor_min_body_chars", 0)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            object.__setattr__(settings, key, value)
+
+
+@pytest.mark.asyncio
+async def test_parse_runs_inline_when_executor_not_started() -> None:
+    before = parse_executor.parse_executor_stats()
+
+    parsed = await parse_executor.parse_profile_page(_fixture_page())
+
+    assert parsed == scholar_parser.parse_profile_page(_fixture_page())
+    after = parse_executor.parse_executor_stats()
+    assert after["inline_parses"] == before["inline_parses"] + 1
+    assert after["pool_parses"] == before["pool_parses"]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_parse_matches_inline_and_reraises_parser_errors(executor_settings: None) -> None:
+    await parse_executor.start_parse_executor()
+    try:
+        assert parse_executor.parse_executor_running()
+        before = parse_executor.parse_executor_stats()
+
+        parsed = await parse_executor.parse_profile_page(_fixture_page())
+
+        assert parsed == scholar_parser.parse_profile_page(_fixture_page())
+        with pytest.raises(ScholarDomInvariantError) as exc_info:
+            await parse_executor.parse_profile_page(_fetch_result("<html><body>nothing here</body></html>"))
+        assert exc_info.value.code == "layout_markers_missing"
+        after = parse_executor.parse_executor_stats()
+        assert after["pool_parses"] == before["pool_parses"] + 2
+        assert after["parse_seconds_total"] > before["parse_seconds_total"]
+    finally:
+        await parse_executor.stop_parse_executor()
+    assert not parse_executor.parse_executor_running()
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_to_inline_parse(
+    executor_settings: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    broken = _BrokenExecutor()
+    monkeypatch.setattr(parse_executor, "_executor", broken)
+    monkeypatch.setattr(parse_executor, "_pending", parse_executor.asyncio.Semaphore(1))
+    before = parse_executor.parse_executor_stats()
+
+    parsed = await parse_executor.parse_profile_page(_fixture_page())
+
+    assert parsed == scholar_parser.parse_profile_page(_fixture_page())
+    after = parse_executor.parse_executor_stats()
+    assert after["fallbacks"] == before["fallbacks"] + 1
+    assert after["inline_parses"] == before["inline_parses"] + 1
+    assert broken.shutdown_called
+    assert not parse_executor.parse_executor_running()
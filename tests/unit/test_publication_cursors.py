@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from app.services.publications.cursors import (
+    InvalidPublicationCursorError,
+    PublicationCursor,
+    decode_publication_cursor,
+    encode_publication_cursor,
+)
+
+
+@pytest.mark.parametrize(
+    ("sort_by", "sort_value"),
+    [
+        ("first_seen", datetime(2026, 3, 4, 5, 6, 7, 890123, tzinfo=UTC)),
+        ("title", "Graph networks, revisited — ünïcode"),
+        ("year", 2_147_483_647),
+        ("citations", 0),
+        ("scholar", "Ada Lovelace"),
+        ("pdf_status", 4),
+    ],
+)
+def test_publication_cursor_round_trips(sort_by: str, sort_value: datetime | int | str) -> None:
+    cursor = PublicationCursor(
+        sort_by=sort_by,
+        sort_dir="asc",
+        sort_value=sort_value,
+        publication_id=42,
+        scholar_profile_id=7,
+    )
+    token = encode_publication_cursor(cursor)
+
+    assert "=" not in token
+    assert decode_publication_cursor(token) == cursor
+
+
+def _token(payload: object) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not base64 !",
+        _token(["not", "an", "object"]),
+        _token({"v": 99, "s": "title", "d": "asc", "k": ["a", 1, 1]}),
+        _token({"v": 1, "s": "venue", "d": "asc", "k": ["a", 1, 1]}),
+        _token({"v": 1, "s": "title", "d": "sideways", "k": ["a", 1, 1]}),
+        _token({"v": 1, "s": "title", "d": "asc", "k": ["a", 1]}),
+        _token({"v": 1, "s": "year", "d": "asc", "k": ["2020", 1, 1]}),
+        _token({"v": 1, "s": "first_seen", "d": "asc", "k": ["yesterday", 1, 1]}),
+        _token({"v": 1, "s": "title", "d": "asc", "k": ["a", "1", 1]}),
+    ],
+)
+def test_invalid_publication_cursor_is_rejected(token: str) -> None:
+    with pytest.raises(InvalidPublicationCursorError):
+        decode_publication_cursor(token)
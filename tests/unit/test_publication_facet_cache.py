@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.publications import facet_cache
+from app.services.publications.counts import publication_facet_counts_query
+from app.services.publications.facet_cache import (
+    PublicationFacetCountsCache,
+    get_publication_facet_counts_for_user,
+    invalidate_publication_counts_for_user,
+)
+from app.services.publications.types import PublicationFacetCounts
+from app.settings import settings
+
+
+@pytest.fixture
+def _counting_query(monkeypatch: pytest.MonkeyPatch):
+    calls: list[dict[str, Any]] = []
+
+    async def _count(db_session, **kwargs):
+        calls.append(kwargs)
+        return PublicationFacetCounts(unread_count=len(calls), favorites_count=0, latest_count=0, total_count=0)
+
+    monkeypatch.setattr(facet_cache, "count_publication_facets_for_user", _count)
+    monkeypatch.setattr(facet_cache, "publication_facet_counts_cache", PublicationFacetCountsCache())
+    previous = settings.publication_counts_cache_ttl_seconds
+    object.__setattr__(settings, "publication_counts_cache_ttl_seconds", 60.0)
+    try:
+        yield calls
+    finally:
+        object.__setattr__(settings, "publication_counts_cache_ttl_seconds", previous)
+
+
+@pytest.mark.asyncio
+async def test_facet_counts_cache_hits_until_user_is_invalidated(_counting_query: list[dict[str, Any]]) -> None:
+    session = cast(Any, object())
+    first = await get_publication_facet_counts_for_user(session, user_id=1, latest_run_id=4)
+    second = await get_publication_facet_counts_for_user(
+        session,
+        user_id=1,
+        latest_run_id=4,
+        snapshot_before=datetime.now(UTC),
+    )
+    other_user = await get_publication_facet_counts_for_user(session, user_id=2, latest_run_id=4)
+    assert first == second
+    assert other_user.unread_count == 2
+
+    invalidate_publication_counts_for_user(1)
+    refreshed = await get_publication_facet_counts_for_user(session, user_id=1, latest_run_id=4)
+    assert refreshed.unread_count == 3
+    assert await get_publication_facet_counts_for_user(session, user_id=2, latest_run_id=4) == other_user
+    assert len(_counting_query) == 3
+
+
+@pytest.mark.asyncio
+async def test_facet_counts_cache_keys_on_latest_run_and_pinned_snapshot(
+    _counting_query: list[dict[str, Any]],
+) -> None:
+    session = cast(Any, object())
+    snapshot = datetime(2026, 1, 1, tzinfo=UTC)
+    await get_publication_facet_counts_for_user(session, user_id=1, latest_run_id=4)
+    await get_publication_facet_counts_for_user(session, user_id=1, latest_run_id=5)
+    await get_publication_facet_counts_for_user(
+        session, user_id=1, latest_run_id=5, snapshot_before=snapshot, pinned_snapshot=True
+    )
+    await get_publication_facet_counts_for_user(
+        session, user_id=1, latest_run_id=5, snapshot_before=snapshot, pinned_snapshot=True
+    )
+    assert [call["latest_run_id"] for call in _counting_query] == [4, 5, 5]
+
+
+@pytest.mark.asyncio
+async def test_facet_counts_cache_disabled_with_zero_ttl(_counting_query: list[dict[str, Any]]) -> None:
+    object.__setattr__(settings, "publication_counts_cache_ttl_seconds", 0.0)
+    session = cast(Any, object())
+    await get_publication_facet_counts_for_user(session, user_id=1, latest_run_id=None)
+    await get_publication_facet_counts_for_user(session, user_id=1, latest_run_id=None)
+    assert len(_counting_query) == 2
+
+
+def test_facet_counts_query_is_single_filtered_aggregate() -> None:
+    sql = str(
+        publication_facet_counts_query(
+            user_id=1,
+            latest_run_id=3,
+            scholar_profile_id=None,
+            favorite_only=True,
+            search="graph",
+            snapshot_before=None,
+        ).compile(dialect=postgresql.dialect())
+    )
+    assert sql.count("FILTER (WHERE") == 4
+    assert sql.count("SELECT") == 1
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.publications.search import (
+    SEARCH_MAX_TERMS,
+    SNIPPET_START,
+    SNIPPET_STOP,
+    _snippet_html,
+    publication_search_clause,
+    search_terms,
+)
+
+
+def test_search_terms_split_on_punctuation_and_dedupe() -> None:
+    assert search_terms("  Graph-Neural  networks, graph_NETWORKS! ") == ["graph", "neural", "networks"]
+    assert search_terms("Ünïcode Straße") == ["ünïcode", "straße"]
+    assert search_terms("%%") == []
+    assert search_terms(None) == []
+    assert len(search_terms(" ".join(f"w{index}" for index in range(20)))) == SEARCH_MAX_TERMS
+
+
+def test_search_clause_uses_prefix_tsquery_and_falls_back_without_words() -> None:
+    dialect = postgresql.dialect()
+    full_text = publication_search_clause("graph nets", scholar_profile_ids=(3,))
+    assert full_text is not None
+    compiled = full_text.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    assert "search_vector @@ to_tsquery(" in str(compiled)
+    assert "'graph:* & nets:*'" in str(compiled)
+    assert "scholar_profiles.id IN (3)" in str(compiled)
+
+    fallback = publication_search_clause("%%")
+    assert fallback is not None
+    assert "ILIKE" in str(fallback.compile(dialect=dialect))
+    assert publication_search_clause("   ".strip()) is None
+
+
+def test_snippet_html_escapes_text_before_marking_matches() -> None:
+    headline = f"{SNIPPET_START}Graph{SNIPPET_STOP} <script> & co"
+    assert _snippet_html(headline) == "<mark>Graph</mark> &lt;script&gt; &amp; co"
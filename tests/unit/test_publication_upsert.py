@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from app.db.models import Publication
+from app.services.ingestion.publication_upsert import (
+    PublicationIndex,
+    candidate_keys,
+    plan_publication_resolution,
+)
+from app.services.scholar.parser_types import PublicationCandidate
+
+
+def _candidate(
+    title: str,
+    *,
+    cluster_id: str | None = None,
+    year: int | None = 2024,
+    citation_count: int | None = 0,
+) -> PublicationCandidate:
+    return PublicationCandidate(
+        title=title,
+        title_url=None,
+        cluster_id=cluster_id,
+        year=year,
+        citation_count=citation_count,
+        authors_text="A Author",
+        venue_text="Venue",
+        pdf_url=None,
+    )
+
+
+def _stored(publication_id: int, candidate: PublicationCandidate, *, cluster_id: str | None = None) -> Publication:
+    keys = candidate_keys(candidate)
+    return Publication(
+        id=publication_id,
+        cluster_id=cluster_id,
+        fingerprint_sha256=keys.fingerprint,
+        title_raw=candidate.title,
+        title_normalized=candidate.title.lower(),
+        canonical_title_hash=keys.canonical_title_hash,
+        citation_count=0,
+    )
+
+
+def test_index_prefers_cluster_then_fingerprint_then_canonical_hash() -> None:
+    candidate = _candidate("Graph Networks", cluster_id="c1")
+    by_cluster = _stored(3, _candidate("Unrelated Title"), cluster_id="c1")
+    by_fingerprint = _stored(2, candidate)
+    index = PublicationIndex([by_fingerprint, by_cluster])
+
+    assert index.match(candidate_keys(candidate)) is by_cluster
+    assert index.match(candidate_keys(_candidate("Graph Networks"))) is by_fingerprint
+
+
+def test_index_canonical_hash_collision_resolves_to_lowest_id() -> None:
+    older = _stored(5, _candidate("Deep Learning", year=2019))
+    newer = _stored(9, _candidate("Deep Learning", year=2020))
+    index = PublicationIndex([newer, older])
+
+    assert index.match(candidate_keys(_candidate("Deep Learning", year=2021))) is older
+
+
+def test_plan_merges_same_page_duplicates_into_one_pending_row() -> None:
+    candidates = [
+        _candidate("Attention Is All You Need", cluster_id="abc", citation_count=10),
+        _candidate("Attention Is All You Need", cluster_id="abc", citation_count=12),
+        _candidate("Another Paper", citation_count=None),
+    ]
+    resolved, pending = plan_publication_resolution(
+        index=PublicationIndex(),
+        candidates=candidates,
+        keys=[candidate_keys(candidate) for candidate in candidates],
+    )
+
+    assert len(pending) == 2
+    assert resolved[0] is resolved[1]
+    assert resolved[0].citation_count == 12
+    assert resolved[2].citation_count == 0
+
+
+def test_plan_updates_existing_rows_and_backfills_cluster_id() -> None:
+    candidate = _candidate("Existing Paper", cluster_id="new-cluster", citation_count=42)
+    existing = _stored(1, _candidate("Existing Paper"))
+    index = PublicationIndex([existing])
+
+    resolved, pending = plan_publication_resolution(
+        index=index,
+        candidates=[candidate],
+        keys=[candidate_keys(candidate)],
+    )
+
+    assert pending == []
+    assert resolved == [existing]
+    assert existing.cluster_id == "new-cluster"
+    assert existing.citation_count == 42
+    assert index.match(candidate_keys(_candidate("Other title", cluster_id="new-cluster"))) is existing
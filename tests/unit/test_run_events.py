@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.runs.events import (
+    EVENT_EVENTS_DROPPED,
+    EVENT_SCHOLAR_PROGRESS,
+    RunEventPublisher,
+    format_sse_event,
+    parse_last_event_id,
+)
+
+
+async def _drain(subscription) -> list[tuple[str, dict]]:
+    events = []
+    while subscription.pending_count():
+        event = await subscription.get()
+        events.append((event.type, event.data))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_pending_scholar_progress_is_coalesced_to_latest_snapshot() -> None:
+    publisher = RunEventPublisher()
+    subscription = publisher.subscribe(7)
+
+    await publisher.publish(7, EVENT_SCHOLAR_PROGRESS, {"visited": 1, "finished": 0, "total": 3})
+    await publisher.publish(7, "publication_discovered", {"publication_id": 11})
+    await publisher.publish(7, EVENT_SCHOLAR_PROGRESS, {"visited": 2, "finished": 1, "total": 3})
+
+    assert await _drain(subscription) == [
+        ("publication_discovered", {"publication_id": 11}),
+        (EVENT_SCHOLAR_PROGRESS, {"visited": 2, "finished": 1, "total": 3}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_full_subscriber_drops_to_latest_snapshot_instead_of_disconnecting() -> None:
+    publisher = RunEventPublisher(subscriber_queue_size=3)
+    subscription = publisher.subscribe(7)
+
+    await publisher.publish(7, EVENT_SCHOLAR_PROGRESS, {"visited": 1, "finished": 0, "total": 2})
+    for publication_id in range(1, 4):
+        await publisher.publish(7, "publication_discovered", {"publication_id": publication_id})
+
+    assert publisher.has_subscribers(7)
+    assert subscription.dropped_events == 3
+    assert await _drain(subscription) == [
+        (EVENT_EVENTS_DROPPED, {"dropped": 3}),
+        (EVENT_SCHOLAR_PROGRESS, {"visited": 1, "finished": 0, "total": 2}),
+        ("publication_discovered", {"publication_id": 3}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_replays_only_newer_events() -> None:
+    publisher = RunEventPublisher()
+    first = publisher.subscribe(7)
+    await publisher.publish(7, "publication_discovered", {"publication_id": 1})
+    await publisher.publish(7, EVENT_SCHOLAR_PROGRESS, {"visited": 1, "finished": 1, "total": 1})
+    seen = await first.get()
+    publisher.unsubscribe(7, first)
+    await publisher.publish(7, "publication_discovered", {"publication_id": 2})
+
+    resumed = publisher.subscribe(7, last_event_id=seen.event_id)
+
+    assert await _drain(resumed) == [
+        ("publication_discovered", {"publication_id": 2}),
+        (EVENT_SCHOLAR_PROGRESS, {"visited": 1, "finished": 1, "total": 1}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replay_past_the_ring_buffer_reports_the_gap() -> None:
+    publisher = RunEventPublisher(replay_size=2)
+    subscription = publisher.subscribe(7)
+    for publication_id in range(1, 5):
+        await publisher.publish(7, "publication_discovered", {"publication_id": publication_id})
+    first = await subscription.get()
+
+    resumed = publisher.subscribe(7, last_event_id=first.event_id)
+
+    assert await _drain(resumed) == [
+        (EVENT_EVENTS_DROPPED, {"dropped": None}),
+        ("publication_discovered", {"publication_id": 3}),
+        ("publication_discovered", {"publication_id": 4}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sse_frames_carry_increasing_event_ids() -> None:
+    publisher = RunEventPublisher()
+    subscription = publisher.subscribe(7)
+    await publisher.publish(7, "publication_discovered", {"publication_id": 1})
+    await publisher.publish(7, "publication_discovered", {"publication_id": 2})
+    first = await subscription.get()
+    second = await subscription.get()
+
+    assert second.event_id > first.event_id
+    assert format_sse_event(first) == (
+        f'id: {first.event_id}\nevent: publication_discovered\ndata: {{"publication_id": 1}}\n\n'
+    )
+    assert parse_last_event_id(str(first.event_id)) == first.event_id
+    assert parse_last_event_id("not-a-number") is None
+    assert parse_last_event_id(None) is None
+
+
+@pytest.mark.asyncio
+async def test_postgres_outbox_coalesces_progress_before_notify(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.services.runs.event_bus_postgres import PostgresRunEventPublisher
+
+    publisher = PostgresRunEventPublisher()
+    subscription = publisher.subscribe(7)
+    notified: list[tuple[str, dict]] = []
+
+    async def _notify(event) -> None:
+        if event.type == "publication_failed":
+            raise ConnectionError("database unavailable")
+        notified.append((event.type, event.data))
+
+    async def _close_notify_connection() -> None:
+        return None
+
+    monkeypatch.setattr(publisher, "_notify", _notify)
+    monkeypatch.setattr(publisher, "_close_notify_connection", _close_notify_connection)
+
+    for visited in (1, 2, 3):
+        await publisher.publish(7, EVENT_SCHOLAR_PROGRESS, {"visited": visited, "finished": 0, "total": 3})
+    await publisher.publish(7, "publication_discovered", {"publication_id": 11})
+    await publisher.publish(7, "publication_failed", {"publication_id": 12})
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert notified == [
+        (EVENT_SCHOLAR_PROGRESS, {"visited": 3, "finished": 0, "total": 3}),
+        ("publication_discovered", {"publication_id": 11}),
+    ]
+    # A failed NOTIFY still reaches this process's own subscribers.
+    assert await _drain(subscription) == [("publication_failed", {"publication_id": 12})]
+    await publisher.stop()
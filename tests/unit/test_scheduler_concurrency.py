@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.services.ingestion import scheduler as scheduler_module
+from app.services.ingestion.scheduler import SchedulerService
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _scheduler(*, max_concurrent_runs: int) -> SchedulerService:
+    return SchedulerService(
+        enabled=True,
+        tick_seconds=60,
+        network_error_retries=0,
+        retry_backoff_seconds=0.0,
+        max_pages_per_scholar=1,
+        page_size=100,
+        continuation_queue_enabled=False,
+        continuation_base_delay_seconds=60,
+        continuation_max_delay_seconds=600,
+        continuation_max_attempts=1,
+        queue_batch_size=1,
+        max_concurrent_runs=max_concurrent_runs,
+    )
+
+
+def _candidate(user_id: int, *, interval_minutes: int = 60) -> scheduler_module._AutoRunCandidate:
+    return scheduler_module._AutoRunCandidate(
+        user_id=user_id,
+        run_interval_minutes=interval_minutes,
+        request_delay_seconds=2,
+        cooldown_until=None,
+        cooldown_reason=None,
+    )
+
+
+def _stub_tick_inputs(
+    monkeypatch: pytest.MonkeyPatch,
+    scheduler: SchedulerService,
+    *,
+    candidates: list[scheduler_module._AutoRunCandidate],
+    last_run_starts: dict[int, datetime],
+    users_with_due_scholars: set[int] | None = None,
+) -> None:
+    async def _noop() -> None:
+        return None
+
+    async def _not_due() -> bool:
+        return False
+
+    async def _load_users_with_due_scholars(
+        due_candidates: list[scheduler_module._AutoRunCandidate],
+        *,
+        now: datetime,
+    ) -> set[int]:
+        if users_with_due_scholars is None:
+            return {candidate.user_id for candidate in due_candidates}
+        return users_with_due_scholars
+
+    async def _load_candidates() -> list[scheduler_module._AutoRunCandidate]:
+        return candidates
+
+    async def _load_last_run_starts(_user_ids: list[int]) -> dict[int, datetime]:
+        return last_run_starts
+
+    monkeypatch.setattr(scheduler, "_drain_pdf_queue", _noop)
+    monkeypatch.setattr(scheduler, "_resume_portability_jobs", _noop)
+    monkeypatch.setattr(scheduler, "_apply_db_retention", _noop)
+    monkeypatch.setattr(scheduler, "_db_retention_due", _not_due)
+    monkeypatch.setattr(scheduler, "_load_candidates", _load_candidates)
+    monkeypatch.setattr(scheduler, "_load_last_run_starts", _load_last_run_starts)
+    monkeypatch.setattr(scheduler, "_load_users_with_due_scholars", _load_users_with_due_scholars)
+
+
+@pytest.mark.asyncio
+async def test_due_candidates_use_fair_share_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    scheduler = _scheduler(max_concurrent_runs=4)
+    last_run_starts = {
+        1: NOW - timedelta(minutes=90),
+        2: NOW - timedelta(minutes=300),
+        3: NOW - timedelta(minutes=10),
+        5: NOW - timedelta(minutes=500),
+    }
+    _stub_tick_inputs(monkeypatch, scheduler, candidates=[], last_run_starts=last_run_starts)
+    scheduler._run_tasks[5] = asyncio.create_task(asyncio.sleep(0))
+
+    due = await scheduler._due_candidates(
+        [_candidate(1), _candidate(2), _candidate(3), _candidate(4), _candidate(5)],
+        now=NOW,
+    )
+
+    assert [candidate.user_id for candidate in due] == [4, 2, 1]
+    await scheduler._run_tasks.pop(5)
+
+
+@pytest.mark.asyncio
+async def test_due_candidates_skip_users_without_due_scholars(monkeypatch: pytest.MonkeyPatch) -> None:
+    scheduler = _scheduler(max_concurrent_runs=4)
+    _stub_tick_inputs(
+        monkeypatch,
+        scheduler,
+        candidates=[],
+        last_run_starts={1: NOW - timedelta(minutes=90)},
+        users_with_due_scholars={2},
+    )
+    monkeypatch.setattr(scheduler_module.crawl_schedule, "adaptive_schedule_enabled", lambda: True)
+
+    due = await scheduler._due_candidates([_candidate(1), _candidate(2)], now=NOW)
+
+    assert [candidate.user_id for candidate in due] == [2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tick_respects_cap_and_records_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    scheduler = _scheduler(max_concurrent_runs=2)
+    _stub_tick_inputs(
+        monkeypatch,
+        scheduler,
+        candidates=[_candidate(1), _candidate(2), _candidate(3)],
+        last_run_starts={},
+    )
+    release = asyncio.Event()
+    started: list[int] = []
+
+    async def _run_candidate(candidate: scheduler_module._AutoRunCandidate) -> bool:
+        started.append(candidate.user_id)
+        await release.wait()
+        return True
+
+    monkeypatch.setattr(scheduler, "_run_candidate", _run_candidate)
+
+    await scheduler._tick_once()
+    await asyncio.sleep(0)
+
+    assert started == [1, 2]
+    metrics = scheduler.last_tick_metrics
+    assert metrics is not None
+    assert (metrics.due_count, metrics.started_count, metrics.deferred_count, metrics.in_flight_count) == (3, 2, 1, 2)
+
+    await scheduler._tick_once()
+    assert scheduler.last_tick_metrics is not None
+    assert scheduler.last_tick_metrics.due_count == 1
+    assert scheduler.last_tick_metrics.started_count == 0
+
+    release.set()
+    await asyncio.gather(*scheduler._run_tasks.values())
+    await asyncio.sleep(0)
+    assert scheduler._run_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_sequential_tick_runs_every_due_candidate_inline(monkeypatch: pytest.MonkeyPatch) -> None:
+    scheduler = _scheduler(max_concurrent_runs=1)
+    _stub_tick_inputs(
+        monkeypatch,
+        scheduler,
+        candidates=[_candidate(1), _candidate(2)],
+        last_run_starts={1: datetime.now(UTC) - timedelta(minutes=5)},
+    )
+    ran: list[int] = []
+
+    async def _run_candidate(candidate: scheduler_module._AutoRunCandidate) -> bool:
+        ran.append(candidate.user_id)
+        return True
+
+    monkeypatch.setattr(scheduler, "_run_candidate", _run_candidate)
+
+    await scheduler._tick_once()
+
+    assert ran == [2]
+    assert scheduler.last_tick_metrics is not None
+    assert scheduler.last_tick_metrics.deferred_count == 0
+    assert scheduler._run_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_db_retention_runs_beside_ticks_one_pass_at_a_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    scheduler = _scheduler(max_concurrent_runs=1)
+    _stub_tick_inputs(monkeypatch, scheduler, candidates=[_candidate(1)], last_run_starts={})
+    release = asyncio.Event()
+    passes: list[int] = []
+    ran: list[int] = []
+
+    async def _apply_db_retention() -> None:
+        passes.append(len(passes))
+        await release.wait()
+
+    async def _due() -> bool:
+        return True
+
+    async def _run_candidate(candidate: scheduler_module._AutoRunCandidate) -> bool:
+        ran.append(candidate.user_id)
+        return True
+
+    monkeypatch.setattr(scheduler, "_apply_db_retention", _apply_db_retention)
+    monkeypatch.setattr(scheduler, "_db_retention_due", _due)
+    monkeypatch.setattr(scheduler, "_run_candidate", _run_candidate)
+
+    await scheduler._tick_once()
+    await asyncio.sleep(0)
+    await scheduler._tick_once()
+    await asyncio.sleep(0)
+
+    assert passes == [0]
+    assert ran == [1, 1]
+    retention_task = scheduler._retention_task
+    assert retention_task is not None
+
+    release.set()
+    await retention_task
+    await asyncio.sleep(0)
+    assert scheduler._retention_task is None
+
+
+@pytest.mark.asyncio
+async def test_db_retention_pass_takes_a_run_slot(monkeypatch: pytest.MonkeyPatch) -> None:
+    scheduler = _scheduler(max_concurrent_runs=2)
+    scheduler._session_budget = 2
+    _stub_tick_inputs(
+        monkeypatch,
+        scheduler,
+        candidates=[_candidate(1), _candidate(2)],
+        last_run_starts={},
+    )
+    release = asyncio.Event()
+    started: list[int] = []
+
+    async def _hold() -> None:
+        await release.wait()
+
+    async def _run_candidate(candidate: scheduler_module._AutoRunCandidate) -> bool:
+        started.append(candidate.user_id)
+        await release.wait()
+        return True
+
+    monkeypatch.setattr(scheduler, "_run_candidate", _run_candidate)
+    scheduler._retention_task = asyncio.create_task(_hold())
+
+    await scheduler._tick_once()
+    await asyncio.sleep(0)
+
+    assert started == [1]
+    assert scheduler.last_tick_metrics is not None
+    assert scheduler.last_tick_metrics.deferred_count == 1
+
+    release.set()
+    await asyncio.gather(scheduler._retention_task, *scheduler._run_tasks.values())
+
+
+@pytest.mark.asyncio
+async def test_sequential_tick_counts_only_started_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    scheduler = _scheduler(max_concurrent_runs=1)
+    _stub_tick_inputs(
+        monkeypatch,
+        scheduler,
+        candidates=[_candidate(1), _candidate(2)],
+        last_run_starts={},
+    )
+
+    async def _run_candidate(candidate: scheduler_module._AutoRunCandidate) -> bool:
+        # The first user's run is skipped (for example locked by a manual run).
+        return candidate.user_id != 1
+
+    monkeypatch.setattr(scheduler, "_run_candidate", _run_candidate)
+
+    await scheduler._tick_once()
+
+    assert scheduler.last_tick_metrics is not None
+    assert (scheduler.last_tick_metrics.due_count, scheduler.last_tick_metrics.started_count) == (2, 1)
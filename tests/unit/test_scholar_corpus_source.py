@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.services.scholar.corpus_source import (
+    REPLAY_MISS_ERROR,
+    RecordingScholarSource,
+    ReplayScholarSource,
+    profile_page_name,
+)
+from app.services.scholar.source import FetchResult
+
+REGRESSION_FIXTURE_DIR = Path("tests/fixtures/scholar/regression")
+
+
+class _ScriptedSource:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int]] = []
+
+    async def fetch_profile_html(self, scholar_id: str) -> FetchResult:
+        return await self.fetch_profile_page_html(scholar_id, cstart=0, pagesize=100)
+
+    async def fetch_profile_page_html(self, scholar_id: str, *, cstart: int, pagesize: int) -> FetchResult:
+        self.calls.append((scholar_id, cstart))
+        url = f"https://scholar.google.com/citations?hl=en&user={scholar_id}&cstart={cstart}"
+        if cstart >= 100:
+            return FetchResult(requested_url=url, status_code=429, final_url=url, body="slow down", error=None)
+        return FetchResult(requested_url=url, status_code=200, final_url=url, body=f"<html>{cstart}</html>", error=None)
+
+    async def fetch_author_search_html(self, query: str, *, start: int) -> FetchResult:
+        url = f"https://scholar.google.com/citations?view_op=search_authors&mauthors={query}"
+        return FetchResult(requested_url=url, status_code=200, final_url=url, body=f"<html>{query}</html>", error=None)
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_regression_fixtures_without_sidecars() -> None:
+    source = ReplayScholarSource(REGRESSION_FIXTURE_DIR)
+
+    result = await source.fetch_profile_html("P1RwlvoAAAAJ")
+
+    assert result.status_code == 200
+    assert result.error is None
+    assert result.body == (REGRESSION_FIXTURE_DIR / "profile_P1RwlvoAAAAJ.html").read_text(encoding="utf-8")
+    assert result.final_url == result.requested_url
+
+
+@pytest.mark.asyncio
+async def test_replay_reports_missing_pages_as_fetch_errors(tmp_path: Path) -> None:
+    result = await ReplayScholarSource(tmp_path).fetch_profile_page_html("abcDEF123456", cstart=100, pagesize=100)
+
+    assert result.status_code is None
+    assert result.body == ""
+    assert result.error is not None and result.error.startswith(REPLAY_MISS_ERROR)
+
+
+@pytest.mark.asyncio
+async def test_recorded_corpus_replays_pages_statuses_and_searches(tmp_path: Path) -> None:
+    inner = _ScriptedSource()
+    recorder = RecordingScholarSource(inner, tmp_path)
+    recorded = [
+        await recorder.fetch_profile_html("abcDEF123456"),
+        await recorder.fetch_profile_page_html("abcDEF123456", cstart=100, pagesize=100),
+        await recorder.fetch_author_search_html("Ada Lovelace", start=0),
+    ]
+
+    replay = ReplayScholarSource(tmp_path)
+    replayed = [
+        await replay.fetch_profile_html("abcDEF123456"),
+        await replay.fetch_profile_page_html("abcDEF123456", cstart=100, pagesize=100),
+        await replay.fetch_author_search_html("Ada Lovelace", start=0),
+    ]
+
+    assert [(r.status_code, r.body) for r in replayed] == [(r.status_code, r.body) for r in recorded]
+    assert (tmp_path / profile_page_name("abcDEF123456", cstart=100)).with_suffix(".json").is_file()
+    assert not (tmp_path / profile_page_name("abcDEF123456", cstart=0)).with_suffix(".json").exists()
+    assert inner.calls == [("abcDEF123456", 0), ("abcDEF123456", 100)]
+
+
+def test_profile_page_name_rejects_path_like_scholar_ids() -> None:
+    with pytest.raises(ValueError):
+        profile_page_name("../etc", cstart=0)
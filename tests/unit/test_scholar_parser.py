@@ -10,6 +10,8 @@ from app.services.scholar.parser import (
     parse_author_search_page,
     parse_profile_page,
 )
+from app.services.scholar.parser_utils import lower_chunked
+from app.services.scholar.profile_rows import scan_profile_page
 from app.services.scholar.source import FetchResult
 
 
@@ -363,6 +365,57 @@ def test_parse_profile_page_regression_fixture_blocked_redirect() -> None:
     assert len(parsed.publications) == 0
 
 
+def test_scan_profile_page_collects_rows_and_metadata_in_one_pass() -> None:
+    html = """
+    <html>
+      <head>
+        <meta property="og:image" content="/citations/images/avatar.png">
+        <style>.gsc_a_tr { color: red; }</style>
+      </head>
+      <div id="gsc_prf_in">Ada <b>Lovelace</b></div>
+      <table><tbody id="gsc_a_b">
+        <TR CLASS="gsc_a_tr">
+          <td class="gsc_a_t">
+            <a class="gsc_a_at" href="/citations?view_op=view_citation&amp;citation_for_view=abc:def">Notes &amp; <i>Sketches</i></a>
+            <div class="gs_gray">A Lovelace, C Babbage</div>
+            <div class="gs_gray">Scientific Memoirs 3, 1843</div>
+          </td>
+          <td class="gsc_a_c"><a class="gsc_a_ac">1,204</a></td>
+          <td class="gsc_a_y"><span class="gsc_a_h">2015</span></td>
+        </TR>
+      </tbody></table>
+      <span id="gsc_a_nn">Articles 1&ndash;1</span>
+      <button id="gsc_bpf_more" class="gs_btn">Show more</button>
+    </html>
+    """
+
+    scan = scan_profile_page(html)
+
+    assert scan.profile_name == "Ada Lovelace"
+    assert scan.profile_image_url == "https://scholar.google.com/citations/images/avatar.png"
+    assert scan.articles_range == "Articles 1\u20131"
+    assert scan.has_show_more_button is True
+    assert scan.marker_counts["gsc_a_tr"] == 2
+    assert scan.warnings == []
+    assert "color: red" not in scan.visible_text
+    [publication] = scan.publications
+    assert publication.title == "Notes & Sketches"
+    assert publication.cluster_id == "cfv:abc:def"
+    assert publication.citation_count == 1204
+    assert publication.year == 2015
+    assert publication.authors_text == "A Lovelace, C Babbage"
+    assert publication.venue_text == "Scientific Memoirs 3, 1843"
+
+
+def test_lower_chunked_matches_str_lower_for_marker_counts() -> None:
+    value = "\u03a3\u0130 GSC_A_TR caf\u00c9 " * 5000
+
+    lowered = lower_chunked(value, chunk_size=7)
+
+    assert len(lowered) == len(value.lower())
+    assert lowered.count("gsc_a_tr") == value.lower().count("gsc_a_tr") == 5000
+
+
 def test_parse_author_search_page_extracts_candidates_with_image() -> None:
     html = """
     <html>
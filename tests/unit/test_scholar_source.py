@@ -1,13 +1,18 @@
+import httpx
 import pytest
 
+from app.services.scholar import http_client as scholar_http_client
 from app.services.scholar import rate_limit as scholar_rate_limit
 from app.services.scholar.source import FetchResult, LiveScholarSource, _build_profile_url
 from app.settings import settings
 
 
-def _request_header(request, name: str) -> str | None:
-    headers = {key.lower(): value for key, value in request.header_items()}
-    return headers.get(name.lower())
+def _request_header(request: httpx.Request, name: str) -> str | None:
+    return request.headers.get(name)
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
 
 def test_build_profile_url_includes_pagesize_for_initial_page() -> None:
@@ -44,7 +49,11 @@ async def test_live_scholar_source_applies_global_throttle(monkeypatch: pytest.M
     )
 
     source = LiveScholarSource(min_interval_seconds=7.0)
-    monkeypatch.setattr(source, "_fetch_sync", lambda _url: expected_result)
+
+    async def _fake_fetch(_url: str) -> FetchResult:
+        return expected_result
+
+    monkeypatch.setattr(source, "_fetch", _fake_fetch)
 
     result = await source.fetch_profile_page_html(
         "abcDEF123456",
@@ -123,3 +132,68 @@ def test_build_request_includes_cookie_when_configured() -> None:
         assert _request_header(request, "Cookie") == "SID=abc123"
     finally:
         object.__setattr__(settings, "scholar_http_cookie", previous_cookie)
+
+
+@pytest.mark.asyncio
+async def test_fetch_follows_redirects_and_reports_final_url() -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/start":
+            return httpx.Response(302, headers={"Location": "https://example.test/final"})
+        return httpx.Response(200, text="<html>caf\u00e9</html>")
+
+    async with _mock_client(_handler) as client:
+        source = LiveScholarSource(client=client)
+        result = await source._fetch("https://example.test/start")
+
+    assert result.status_code == 200
+    assert result.final_url == "https://example.test/final"
+    assert result.body == "<html>caf\u00e9</html>"
+    assert result.error is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_keeps_body_and_status_for_http_errors() -> None:
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, text="Too Many Requests")
+
+    async with _mock_client(_handler) as client:
+        source = LiveScholarSource(client=client)
+        result = await source._fetch("https://example.test/page")
+
+    assert result.status_code == 429
+    assert result.body == "Too Many Requests"
+    assert result.error == "HTTP Error 429: Too Many Requests"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("exc", "expected_fragment"),
+    [
+        (httpx.ConnectError("[Errno -2] Name or service not known"), "name or service not known"),
+        (httpx.ReadTimeout("timed out"), "timed out"),
+    ],
+)
+async def test_fetch_maps_transport_errors_to_network_results(exc: Exception, expected_fragment: str) -> None:
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        raise exc
+
+    async with _mock_client(_handler) as client:
+        source = LiveScholarSource(client=client)
+        result = await source._fetch("https://example.test/page")
+
+    assert result.status_code is None
+    assert result.final_url is None
+    assert result.error is not None
+    assert expected_fragment in result.error.lower()
+
+
+@pytest.mark.asyncio
+async def test_live_scholar_sources_share_one_pooled_client() -> None:
+    await scholar_http_client.close_scholar_http_client()
+    try:
+        first = LiveScholarSource()._http_client()
+        second = LiveScholarSource()._http_client()
+        assert first is second
+    finally:
+        await scholar_http_client.close_scholar_http_client()
+    assert first.is_closed
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from app.services.unpaywall import rate_limit
+from app.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_settings() -> Iterator[None]:
+    keys = ("unpaywall_rate_limit_burst", "unpaywall_per_host_concurrency", "unpaywall_landing_page_max_concurrency")
+    previous = {key: getattr(settings, key) for key in keys}
+    object.__setattr__(settings, "unpaywall_rate_limit_burst", 2)
+    object.__setattr__(settings, "unpaywall_per_host_concurrency", 1)
+    object.__setattr__(settings, "unpaywall_landing_page_max_concurrency", 1)
+    rate_limit.reset_unpaywall_rate_limits()
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            object.__setattr__(settings, key, value)
+        rate_limit.reset_unpaywall_rate_limits()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces_each_host_independently() -> None:
+    started = time.monotonic()
+    for _ in range(2):
+        await rate_limit.wait_for_unpaywall_slot(min_interval_seconds=0.2, url="https://a.example.org/x")
+    burst_seconds = time.monotonic() - started
+
+    await rate_limit.wait_for_unpaywall_slot(min_interval_seconds=0.2, url="https://b.example.org/y")
+    other_host_seconds = time.monotonic() - started
+
+    await rate_limit.wait_for_unpaywall_slot(min_interval_seconds=0.2, url="https://a.example.org/z")
+    paced_seconds = time.monotonic() - started
+
+    assert burst_seconds < 0.1
+    assert other_host_seconds < 0.1
+    assert paced_seconds >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_host_slot_limits_in_flight_requests_per_host() -> None:
+    in_flight: dict[str, int] = {"a": 0, "b": 0}
+    peaks: dict[str, int] = {"a": 0, "b": 0}
+
+    async def _request(host: str) -> None:
+        async with rate_limit.unpaywall_host_slot(f"https://{host}.example.org/page"):
+            in_flight[host] += 1
+            peaks[host] = max(peaks[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+
+    await asyncio.gather(*(_request(host) for host in ("a", "a", "a", "b", "b")))
+
+    assert peaks == {"a": 1, "b": 1}
+
+
+@pytest.mark.asyncio
+async def test_landing_page_crawl_slot_caps_concurrent_crawls() -> None:
+    active = 0
+    peak = 0
+
+    async def _crawl() -> None:
+        nonlocal active, peak
+        async with rate_limit.landing_page_crawl_slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(_crawl() for _ in range(4)))
+
+    assert peak == 1
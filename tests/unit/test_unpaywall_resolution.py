@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import replace
 from datetime import UTC, datetime
 
@@ -8,6 +11,7 @@ import pytest
 from app.services.publication_identifiers.types import DisplayIdentifier
 from app.services.publications.types import PublicationListItem
 from app.services.unpaywall import application as unpaywall_app
+from app.settings import settings
 
 
 class _DummyAsyncClient:
@@ -15,11 +19,17 @@ class _DummyAsyncClient:
         self.args = args
         self.kwargs = kwargs
 
-    async def __aenter__(self):
-        return self
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return None
+@contextmanager
+def _override_settings(**overrides: object) -> Iterator[None]:
+    previous = {key: getattr(settings, key) for key in overrides}
+    for key, value in overrides.items():
+        object.__setattr__(settings, key, value)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            object.__setattr__(settings, key, value)
 
 
 def _item(publication_id: int) -> PublicationListItem:
@@ -90,7 +100,7 @@ async def test_unpaywall_resolve_prefers_direct_pdf_without_landing_crawl(monkey
 
     monkeypatch.setattr(unpaywall_app, "_resolve_item_payload", _fake_resolve_item_payload)
     monkeypatch.setattr(unpaywall_app, "resolve_pdf_from_landing_page", _fail_crawl)
-    monkeypatch.setattr("httpx.AsyncClient", _DummyAsyncClient)
+    monkeypatch.setattr(unpaywall_app, "get_http_client", _DummyAsyncClient)
     resolved = await unpaywall_app.resolve_publication_oa_metadata([_item(1)], request_email="user@example.com")
     assert resolved == {1: ("10.1016/j.cell.2007.11.019", "https://oa.example.org/article.pdf")}
 
@@ -117,7 +127,7 @@ async def test_unpaywall_resolve_crawls_landing_page_when_pdf_url_is_not_direct(
 
     monkeypatch.setattr(unpaywall_app, "_resolve_item_payload", _fake_resolve_item_payload)
     monkeypatch.setattr(unpaywall_app, "resolve_pdf_from_landing_page", _fake_crawl)
-    monkeypatch.setattr("httpx.AsyncClient", _DummyAsyncClient)
+    monkeypatch.setattr(unpaywall_app, "get_http_client", _DummyAsyncClient)
     resolved = await unpaywall_app.resolve_publication_oa_metadata([_item(2)], request_email="user@example.com")
     assert resolved == {2: ("10.1016/j.cell.2007.11.019", "https://oa.example.org/files/paper-42.pdf")}
     assert "https://oa.example.org/landing/42" in crawled_pages
@@ -131,7 +141,7 @@ async def test_unpaywall_preserves_crossref_doi_when_unpaywall_has_no_record(
         return None, True, "10.2000/crossref-only"
 
     monkeypatch.setattr(unpaywall_app, "_resolve_item_payload", _fake_resolve_item_payload)
-    monkeypatch.setattr("httpx.AsyncClient", _DummyAsyncClient)
+    monkeypatch.setattr(unpaywall_app, "get_http_client", _DummyAsyncClient)
 
     outcomes = await unpaywall_app.resolve_publication_oa_outcomes([_item(3)], request_email="user@example.com")
 
@@ -140,3 +150,67 @@ async def test_unpaywall_preserves_crossref_doi_when_unpaywall_has_no_record(
     assert outcome.pdf_url is None
     assert outcome.failure_reason == unpaywall_app.FAILURE_NO_RECORD
     assert outcome.used_crossref is True
+
+
+@pytest.mark.asyncio
+async def test_unpaywall_resolves_items_concurrently_and_keeps_target_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def _fake_resolve_item_payload(*, item, **_kwargs):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        # Later items finish first so completion order differs from input order.
+        await asyncio.sleep(0.01 * (5 - item.publication_id))
+        in_flight -= 1
+        doi = f"10.1000/item-{item.publication_id}"
+        return (
+            {"doi": doi, "best_oa_location": {"url_for_pdf": f"https://oa.example.org/{item.publication_id}.pdf"}},
+            False,
+            doi,
+        )
+
+    monkeypatch.setattr(unpaywall_app, "_resolve_item_payload", _fake_resolve_item_payload)
+    monkeypatch.setattr(unpaywall_app, "get_http_client", _DummyAsyncClient)
+
+    with _override_settings(unpaywall_max_concurrency=2):
+        outcomes = await unpaywall_app.resolve_publication_oa_outcomes(
+            [_item(publication_id) for publication_id in (1, 2, 3, 4)],
+            request_email="user@example.com",
+        )
+
+    assert list(outcomes) == [1, 2, 3, 4]
+    assert outcomes[3].pdf_url == "https://oa.example.org/3.pdf"
+    assert peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_unpaywall_crossref_budget_is_shared_across_concurrent_items(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    crossref_calls: list[int] = []
+
+    async def _no_payload(**_kwargs):
+        return None
+
+    async def _fake_discover(*, item, **_kwargs):
+        crossref_calls.append(item.publication_id)
+        await asyncio.sleep(0)
+        return None if item.publication_id == 1 else f"10.3000/found-{item.publication_id}"
+
+    monkeypatch.setattr(unpaywall_app, "_fetch_unpaywall_payload_by_doi", _no_payload)
+    monkeypatch.setattr(unpaywall_app, "discover_doi_for_publication", _fake_discover)
+    monkeypatch.setattr(unpaywall_app, "get_http_client", _DummyAsyncClient)
+    items = [replace(_item(publication_id), pub_url=None, venue_text="Cell") for publication_id in range(1, 7)]
+
+    with _override_settings(unpaywall_max_concurrency=8, crossref_enabled=True, crossref_max_lookups_per_request=2):
+        outcomes = await unpaywall_app.resolve_publication_oa_outcomes(items, request_email="user@example.com")
+
+    assert sum(1 for outcome in outcomes.values() if outcome.used_crossref) <= 2
+    assert crossref_calls == [1, 2]
+    assert outcomes[1].failure_reason == unpaywall_app.FAILURE_MISSING_DOI
+    assert outcomes[2].doi == "10.3000/found-2"
+    assert outcomes[6].used_crossref is False